@@ -0,0 +1,6 @@
+"""Micro-benchmarks for API hot paths.
+
+Run from ``apps/api`` with ``python -m benchmarks.<name>``. Benchmarks are
+not collected by pytest; they print timings to stdout for before/after
+comparisons when tuning performance-sensitive code.
+"""
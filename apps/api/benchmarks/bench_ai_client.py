@@ -0,0 +1,158 @@
+"""Benchmark chat round-trip overhead with and without cached SDK clients.
+
+Runs ``ClaudeClient.generate`` and ``OpenAIClient.generate`` against a
+local stub provider (a minimal keep-alive HTTP server answering the
+Messages and Chat Completions APIs instantly), so the numbers are pure
+client overhead. "Before" clears the client cache before every call,
+which is the pre-cache behavior of building an SDK client (and opening a
+new connection) per request; "after" reuses the cached client and its
+connection pool. Over TLS to a real provider the gap is larger, since
+every new connection also pays a TLS handshake.
+
+Usage:
+    python -m benchmarks.bench_ai_client [--iterations 200]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import time
+
+from src.models.ai_provider import AIProviderType
+from src.schemas.ai_response import AIMessage
+from src.services.ai_client import clear_ai_client_cache
+
+_MESSAGES_RESPONSE = {
+    "id": "msg_stub",
+    "type": "message",
+    "role": "assistant",
+    "model": "stub-model",
+    "content": [{"type": "text", "text": "ok"}],
+    "stop_reason": "end_turn",
+    "stop_sequence": None,
+    "usage": {"input_tokens": 1, "output_tokens": 1},
+}
+_CHAT_RESPONSE = {
+    "id": "chatcmpl-stub",
+    "object": "chat.completion",
+    "created": 0,
+    "model": "stub-model",
+    "choices": [
+        {
+            "index": 0,
+            "message": {"role": "assistant", "content": "ok"},
+            "finish_reason": "stop",
+        }
+    ],
+    "usage": {"prompt_tokens": 1, "completion_tokens": 1, "total_tokens": 2},
+}
+
+
+_connections: set[asyncio.StreamWriter] = set()
+
+
+async def _handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+    _connections.add(writer)
+    try:
+        while True:
+            request_line = await reader.readline()
+            if not request_line:
+                break
+            length = 0
+            while (line := await reader.readline()) not in (b"\r\n", b""):
+                name, _, value = line.decode().partition(":")
+                if name.lower() == "content-length":
+                    length = int(value)
+            await reader.readexactly(length)
+            path = request_line.split()[1].decode()
+            payload = _MESSAGES_RESPONSE if "messages" in path else _CHAT_RESPONSE
+            body = json.dumps(payload).encode()
+            writer.write(
+                b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n"
+                b"Connection: keep-alive\r\n"
+                + f"Content-Length: {len(body)}\r\n\r\n".encode()
+                + body
+            )
+            await writer.drain()
+    except (ConnectionError, asyncio.IncompleteReadError):
+        pass
+    finally:
+        _connections.discard(writer)
+        writer.close()
+
+
+async def _measure(client, iterations: int, *, cached: bool) -> list[float]:
+    messages = [AIMessage(role="user", content="How was my overnight glucose?")]
+    samples = []
+    for _ in range(iterations):
+        if not cached:
+            clear_ai_client_cache()
+        start = time.perf_counter()
+        await client.generate(messages, system_prompt="stub", max_tokens=16)
+        samples.append((time.perf_counter() - start) * 1000)
+    return samples
+
+
+def _report(label: str, samples: list[float]) -> None:
+    ordered = sorted(samples)
+    p99 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))]
+    print(
+        f"{label:<32} n={len(samples):<5} "
+        f"mean={statistics.fmean(samples):8.3f}ms "
+        f"p50={statistics.median(samples):8.3f}ms p99={p99:8.3f}ms"
+    )
+
+
+async def _run(iterations: int) -> None:
+    server = await asyncio.start_server(_handle, "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    base_url = f"http://127.0.0.1:{port}"
+    os.environ["ANTHROPIC_BASE_URL"] = base_url
+
+    from src.integrations.claude import ClaudeClient
+    from src.integrations.openai_client import OpenAIClient
+
+    clients = {
+        "claude": ClaudeClient(
+            api_key="sk-ant-stub",
+            model="stub-model",
+            provider_type=AIProviderType.CLAUDE_API,
+        ),
+        "openai": OpenAIClient(
+            api_key="sk-stub",
+            model="stub-model",
+            base_url=f"{base_url}/v1",
+            provider_type=AIProviderType.OPENAI_COMPATIBLE,
+        ),
+    }
+    async with server:
+        for name, client in clients.items():
+            # Warm imports and the stub server before timing
+            await _measure(client, 5, cached=True)
+            _report(
+                f"{name} before (client per call)",
+                await _measure(client, iterations, cached=False),
+            )
+            clear_ai_client_cache()
+            _report(
+                f"{name} after (cached client)",
+                await _measure(client, iterations, cached=True),
+            )
+        # Per-call clients were never closed (as before); end their
+        # connections so the server can shut down
+        for writer in list(_connections):
+            writer.close()
+        await asyncio.sleep(0.1)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--iterations", type=int, default=200)
+    args = parser.parse_args()
+    asyncio.run(_run(args.iterations))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+"""Benchmark per-request authentication overhead with and without the principal cache.
+
+Requires a migrated local Postgres (DATABASE_URL) and Redis (REDIS_URL).
+Creates a throwaway user and drives a minimal app in-process, in waves of
+concurrent requests like a dashboard load (TIR, stats, percentiles, IoB,
+pump status...). It reports p50/p99 latency for an unauthenticated
+baseline, for ``CurrentUser`` with the cache disabled, and for
+``CurrentUser`` with the cache enabled. Auth overhead is the difference
+from the baseline.
+
+Usage:
+    python -m benchmarks.bench_auth_overhead [--waves 500] [--fan-out 6]
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+import uuid
+
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import delete
+
+from src.config import settings
+from src.core.auth import CurrentUser
+from src.core.principal_cache import (
+    get_principal_cache_stats,
+    start_principal_cache,
+    stop_principal_cache,
+)
+from src.core.security import create_access_token
+from src.database import close_database, get_session_maker
+from src.models.user import User, UserRole
+
+app = FastAPI()
+
+
+@app.get("/baseline")
+async def _baseline() -> dict:
+    return {}
+
+
+@app.get("/whoami")
+async def _whoami(user: CurrentUser) -> dict:
+    return {"id": str(user.id)}
+
+
+def _percentile(samples: list[float], pct: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(pct / 100 * len(ordered)))]
+
+
+async def _run(client, path: str, token: str, waves: int, fan_out: int) -> list[float]:
+    headers = {"Authorization": f"Bearer {token}"}
+    latencies: list[float] = []
+
+    async def _one() -> None:
+        started = time.perf_counter()
+        response = await client.get(path, headers=headers)
+        latencies.append((time.perf_counter() - started) * 1000)
+        response.raise_for_status()
+
+    for _ in range(waves):
+        await asyncio.gather(*(_one() for _ in range(fan_out)))
+    return latencies
+
+
+def _report(label: str, samples: list[float], baseline: list[float]) -> None:
+    p50, p99 = _percentile(samples, 50), _percentile(samples, 99)
+    overhead = p50 - _percentile(baseline, 50)
+    print(
+        f"{label:<20} p50={p50:7.2f}ms p99={p99:7.2f}ms "
+        f"mean={statistics.fmean(samples):7.2f}ms auth p50 overhead={overhead:6.2f}ms"
+    )
+
+
+async def main(waves: int, fan_out: int) -> None:
+    session_maker = get_session_maker()
+    user_id = uuid.uuid4()
+    email = f"bench_{user_id.hex[:8]}@example.com"
+
+    async with session_maker() as db:
+        db.add(User(id=user_id, email=email, hashed_password="x"))
+        await db.commit()
+
+    await start_principal_cache()
+    for _ in range(50):  # Hits are only served once the listener subscribed
+        if get_principal_cache_stats()["subscribed"]:
+            break
+        await asyncio.sleep(0.1)
+
+    try:
+        token = create_access_token(user_id, email, UserRole.DIABETIC.value)
+        transport = ASGITransport(app=app)
+        async with AsyncClient(transport=transport, base_url="http://bench") as client:
+            await _run(client, "/whoami", token, 5, fan_out)  # Warm-up
+
+            baseline = await _run(client, "/baseline", token, waves, fan_out)
+            _report("no auth", baseline, baseline)
+
+            ttl = settings.principal_cache_ttl_seconds
+            settings.principal_cache_ttl_seconds = 0
+            uncached = await _run(client, "/whoami", token, waves, fan_out)
+            _report("auth, cache off", uncached, baseline)
+
+            settings.principal_cache_ttl_seconds = ttl or 5.0
+            cached = await _run(client, "/whoami", token, waves, fan_out)
+            label = f"auth, cache {settings.principal_cache_ttl_seconds:g}s"
+            _report(label, cached, baseline)
+            print(f"cache stats: {get_principal_cache_stats()}")
+    finally:
+        await stop_principal_cache()
+        async with session_maker() as db:
+            await db.execute(delete(User).where(User.id == user_id))
+            await db.commit()
+        await close_database()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--waves", type=int, default=500)
+    parser.add_argument("--fan-out", type=int, default=6)
+    args = parser.parse_args()
+    asyncio.run(main(args.waves, args.fan_out))
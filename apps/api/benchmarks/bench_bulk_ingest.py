@@ -0,0 +1,109 @@
+"""Benchmark pump event ingestion: per-row upserts vs. batched multi-row upserts.
+
+Requires a migrated local Postgres (DATABASE_URL). Creates a throwaway
+user, ingests N synthetic pump events both ways (plus a duplicate re-run
+to exercise the conflict path), then deletes the user and its events.
+
+Usage:
+    python -m benchmarks.bench_bulk_ingest [--events 10000] [--chunk-size 1000]
+"""
+
+import argparse
+import asyncio
+import time
+import uuid
+from datetime import UTC, datetime, timedelta
+
+from sqlalchemy import delete
+from sqlalchemy.dialects.postgresql import insert
+
+from src.database import close_database, get_session_maker
+from src.models.pump_data import PumpEvent, PumpEventType
+from src.models.user import User
+from src.services.bulk_ingest import PUMP_EVENT_CONFLICT_KEYS, ingest_pump_events
+
+
+def _rows(user_id: uuid.UUID, count: int, start: datetime) -> list[dict]:
+    now = datetime.now(UTC)
+    return [
+        {
+            "id": uuid.uuid4(),
+            "user_id": user_id,
+            "event_type": PumpEventType.BASAL,
+            "event_timestamp": start + timedelta(minutes=5 * i),
+            "units": 0.8,
+            "duration_minutes": 5,
+            "is_automated": True,
+            "received_at": now,
+            "source": "benchmark",
+        }
+        for i in range(count)
+    ]
+
+
+async def _per_row(db, rows: list[dict]) -> int:
+    stored = 0
+    for row in rows:
+        stmt = (
+            insert(PumpEvent)
+            .values(**row)
+            .on_conflict_do_nothing(index_elements=PUMP_EVENT_CONFLICT_KEYS)
+        )
+        result = await db.execute(stmt)
+        stored += max(result.rowcount, 0)
+    return stored
+
+
+async def _timed(label: str, coro) -> None:
+    start = time.perf_counter()
+    stored = await coro
+    elapsed = time.perf_counter() - start
+    print(f"{label:<32} stored={stored:<7} {elapsed:8.2f}s")
+
+
+async def main(events: int, chunk_size: int) -> None:
+    session_maker = get_session_maker()
+    user_id = uuid.uuid4()
+
+    async with session_maker() as db:
+        db.add(
+            User(
+                id=user_id,
+                email=f"bench_{user_id.hex[:8]}@example.com",
+                hashed_password="x",
+            )
+        )
+        await db.commit()
+
+    try:
+        base = datetime(2020, 1, 1, tzinfo=UTC)
+        per_row_rows = _rows(user_id, events, base)
+        bulk_rows = _rows(user_id, events, base + timedelta(days=365))
+
+        async with session_maker() as db:
+            await _timed("per-row INSERT ON CONFLICT", _per_row(db, per_row_rows))
+            await db.commit()
+
+        async with session_maker() as db:
+
+            async def _bulk(rows):
+                result = await ingest_pump_events(db, rows, chunk_size=chunk_size)
+                return result.inserted
+
+            await _timed(f"bulk (chunk={chunk_size})", _bulk(bulk_rows))
+            await _timed("bulk, all duplicates", _bulk(bulk_rows))
+            await db.commit()
+    finally:
+        async with session_maker() as db:
+            await db.execute(delete(PumpEvent).where(PumpEvent.user_id == user_id))
+            await db.execute(delete(User).where(User.id == user_id))
+            await db.commit()
+        await close_database()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--events", type=int, default=10_000)
+    parser.add_argument("--chunk-size", type=int, default=1_000)
+    args = parser.parse_args()
+    asyncio.run(main(args.events, args.chunk_size))
@@ -0,0 +1,74 @@
+"""Benchmark credential decryption with and without the key-ring cache.
+
+"Before" re-derives the PBKDF2 key on every call (the pre-cache behavior);
+"after" uses ``decrypt_credential`` with a warm key ring.
+
+Usage:
+    python -m benchmarks.bench_encryption [--iterations N]
+"""
+
+import argparse
+import statistics
+import time
+
+from cryptography.fernet import Fernet
+
+from src.config import settings
+from src.core.encryption import (
+    _derive_key_pbkdf2,
+    _get_raw_key,
+    clear_keyring_cache,
+    decrypt_credential,
+    encrypt_credential,
+)
+
+
+def _uncached_decrypt(token: str) -> str:
+    fernet = Fernet(_derive_key_pbkdf2(_get_raw_key()))
+    return fernet.decrypt(token.encode("utf-8")).decode("utf-8")
+
+
+def _measure(fn, token: str, iterations: int) -> list[float]:
+    samples = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        fn(token)
+        samples.append((time.perf_counter() - start) * 1000)
+    return samples
+
+
+def _report(label: str, samples: list[float]) -> None:
+    ordered = sorted(samples)
+    p99 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))]
+    print(
+        f"{label:<28} n={len(samples):<6} "
+        f"mean={statistics.fmean(samples):9.3f}ms "
+        f"p50={statistics.median(samples):9.3f}ms p99={p99:9.3f}ms"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--iterations", type=int, default=20)
+    args = parser.parse_args()
+
+    if not settings.encryption_key:
+        settings.encryption_key = "b" * 32
+
+    clear_keyring_cache()
+    start = time.perf_counter()
+    token = encrypt_credential("dexcom-share-password")
+    cold_ms = (time.perf_counter() - start) * 1000
+
+    print(f"cold key-ring build: {cold_ms:.1f}ms")
+    _report(
+        "before (derive per call)", _measure(_uncached_decrypt, token, args.iterations)
+    )
+    _report(
+        "after (cached key ring)",
+        _measure(decrypt_credential, token, args.iterations * 100),
+    )
+
+
+if __name__ == "__main__":
+    main()
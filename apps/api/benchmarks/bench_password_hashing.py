@@ -0,0 +1,79 @@
+"""Benchmark event-loop lag under a concurrent login burst.
+
+"Inline" runs bcrypt on the event loop, as login did before the pool.
+"Pool" awaits ``verify_password_async``. A probe task asks to wake every
+10ms; how late it wakes is the lag every other request and SSE stream in
+the worker would see. Logins refused with a 429 (pool saturated) are
+counted. No database needed.
+
+Usage:
+    python -m benchmarks.bench_password_hashing [--logins 50] [--rounds 3]
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+
+from src.core.security import (
+    PasswordHashingBusyError,
+    hash_password,
+    verify_password,
+    verify_password_async,
+)
+
+_PROBE_INTERVAL = 0.01
+
+
+async def _probe(lags: list[float], stop: asyncio.Event) -> None:
+    while not stop.is_set():
+        expected = time.perf_counter() + _PROBE_INTERVAL
+        await asyncio.sleep(_PROBE_INTERVAL)
+        lags.append(max(0.0, time.perf_counter() - expected) * 1000)
+
+
+async def _inline_login(hashed: str) -> bool:
+    return verify_password("SecurePass123", hashed)
+
+
+async def _pool_login(hashed: str) -> bool:
+    return await verify_password_async("SecurePass123", hashed)
+
+
+async def _burst(login, hashed: str, logins: int) -> None:
+    lags: list[float] = []
+    stop = asyncio.Event()
+    probe = asyncio.create_task(_probe(lags, stop))
+    await asyncio.sleep(_PROBE_INTERVAL * 2)
+
+    started = time.perf_counter()
+    results = await asyncio.gather(
+        *(login(hashed) for _ in range(logins)), return_exceptions=True
+    )
+    elapsed = time.perf_counter() - started
+    stop.set()
+    await probe
+
+    rejected = sum(isinstance(r, PasswordHashingBusyError) for r in results)
+    lags.sort()
+    p99 = lags[int(0.99 * (len(lags) - 1))]
+    print(
+        f"{login.__name__:<14} logins={logins:<4} rejected(429)={rejected:<4} "
+        f"wall={elapsed:6.2f}s loop lag p50={statistics.median(lags):7.1f}ms "
+        f"p99={p99:7.1f}ms max={lags[-1]:7.1f}ms"
+    )
+
+
+async def main(logins: int, rounds: int) -> None:
+    hashed = hash_password("SecurePass123")
+    for _ in range(rounds):
+        await _burst(_inline_login, hashed, logins)
+        await _burst(_pool_login, hashed, logins)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--logins", type=int, default=50)
+    parser.add_argument("--rounds", type=int, default=3)
+    args = parser.parse_args()
+    asyncio.run(main(args.logins, args.rounds))
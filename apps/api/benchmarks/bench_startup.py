@@ -0,0 +1,71 @@
+"""Benchmark application cold-start import time.
+
+Imports ``src.main`` in fresh interpreters (so nothing is cached in
+``sys.modules``) and reports the total import time plus the slowest
+routers from the startup profile. The embedding model is not loaded:
+it warms up in the background after the API starts serving, and its
+load time is reported at GET /api/system/startup.
+
+Usage:
+    python -m benchmarks.bench_startup [--runs 5] [--top 8]
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+
+_PROBE = """
+import json, time
+started = time.perf_counter()
+import src.main
+total_ms = (time.perf_counter() - started) * 1000
+from src.services.startup_profile import get_startup_profile
+print(json.dumps({"total_ms": total_ms, **get_startup_profile()}))
+"""
+
+
+def _run_once() -> dict:
+    output = subprocess.run(
+        [sys.executable, "-c", _PROBE],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def _report(label: str, samples: list[float]) -> None:
+    print(
+        f"{label:<32} n={len(samples):<3} "
+        f"mean={statistics.fmean(samples):9.1f}ms "
+        f"min={min(samples):9.1f}ms max={max(samples):9.1f}ms"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=8)
+    args = parser.parse_args()
+
+    # One unmeasured run warms the OS file cache and .pyc files
+    _run_once()
+    profiles = [_run_once() for _ in range(args.runs)]
+
+    _report("import src.main", [p["total_ms"] for p in profiles])
+    _report("router imports", [p["router_imports_total_ms"] for p in profiles])
+    routers = profiles[0]["router_imports_ms"]
+    slowest = sorted(
+        routers,
+        key=lambda name: (
+            -statistics.fmean(p["router_imports_ms"][name] for p in profiles)
+        ),
+    )
+    for name in slowest[: args.top]:
+        _report(f"  router {name}", [p["router_imports_ms"][name] for p in profiles])
+
+
+if __name__ == "__main__":
+    main()
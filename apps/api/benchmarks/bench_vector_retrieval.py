@@ -0,0 +1,194 @@
+"""Benchmark knowledge retrieval: full-precision vs. quantized HNSW indexes.
+
+Requires a migrated local Postgres with pgvector >= 0.7 (DATABASE_URL).
+Creates a throwaway user with a synthetic corpus of clustered 768-d
+chunks, builds any missing full/halfvec/binary HNSW indexes, and runs the
+same queries through ``build_knowledge_query`` in each mode. Recall@k is
+measured against an exact sequential scan. The user, its chunks and any
+indexes the benchmark created are removed afterwards.
+
+Usage:
+    python -m benchmarks.bench_vector_retrieval [--chunks 20000] [--queries 200]
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+import uuid
+
+import numpy as np
+from sqlalchemy import delete, func, select, text
+from sqlalchemy.dialects.postgresql import insert
+
+from src.config import settings
+from src.database import close_database, get_session_maker
+from src.models.knowledge_chunk import KnowledgeChunk
+from src.models.user import User
+from src.services.knowledge_retrieval import (
+    EMBEDDING_DIMENSIONS,
+    _candidate_count,
+    build_knowledge_query,
+)
+
+# Same definitions as migrations 048 and 051
+_INDEXES = {
+    "full": (
+        "ix_knowledge_embedding",
+        "USING hnsw (embedding vector_cosine_ops)",
+    ),
+    "halfvec": (
+        "ix_knowledge_embedding_halfvec",
+        "USING hnsw ((embedding::halfvec(768)) halfvec_cosine_ops)",
+    ),
+    "binary": (
+        "ix_knowledge_embedding_binary",
+        "USING hnsw ((binary_quantize(embedding)::bit(768)) bit_hamming_ops)",
+    ),
+}
+
+_CLUSTER_SIZE = 50
+# Spread of chunks (and queries) around their cluster centre
+_NOISE = 0.6
+
+
+def _unit(vectors: np.ndarray) -> np.ndarray:
+    return vectors / np.linalg.norm(vectors, axis=-1, keepdims=True)
+
+
+def _synthetic(
+    chunks: int, queries: int, seed: int = 35
+) -> tuple[np.ndarray, np.ndarray]:
+    rng = np.random.default_rng(seed)
+    dims = EMBEDDING_DIMENSIONS
+    centres = _unit(rng.standard_normal((max(chunks // _CLUSTER_SIZE, 1), dims)))
+
+    def _around(count: int) -> np.ndarray:
+        picked = centres[rng.integers(len(centres), size=count)]
+        noise = rng.standard_normal((count, dims)) * _NOISE / np.sqrt(dims)
+        return _unit(picked + noise).astype(np.float32)
+
+    return _around(chunks), _around(queries)
+
+
+async def _insert_corpus(session_maker, user_id: uuid.UUID, vectors) -> None:
+    rows = [
+        {
+            "user_id": user_id,
+            "trust_tier": "USER_PROVIDED",
+            "source_type": "benchmark",
+            "content": f"synthetic chunk {i}",
+            "embedding": vector,
+        }
+        for i, vector in enumerate(vectors)
+    ]
+    async with session_maker() as db:
+        for start in range(0, len(rows), 1000):
+            await db.execute(insert(KnowledgeChunk), rows[start : start + 1000])
+        await db.commit()
+
+
+async def _ensure_indexes(session_maker) -> list[str]:
+    created = []
+    async with session_maker() as db:
+        for name, using in _INDEXES.values():
+            exists = await db.scalar(select(func.to_regclass(name)))
+            if exists is None:
+                await db.execute(
+                    text(
+                        f"CREATE INDEX {name} ON knowledge_chunks {using} "
+                        "WITH (m = 16, ef_construction = 64)"
+                    )
+                )
+                created.append(name)
+        await db.execute(text("ANALYZE knowledge_chunks"))
+        await db.commit()
+    return created
+
+
+async def _search(db, user_id, query, top_k, mode) -> list[uuid.UUID]:
+    result = await db.execute(build_knowledge_query(user_id, query, top_k, mode))
+    return [chunk.id for chunk in result.scalars().all()]
+
+
+async def _exact(session_maker, user_id, queries, top_k) -> list[set[uuid.UUID]]:
+    truth = []
+    async with session_maker() as db:
+        await db.execute(text("SET LOCAL enable_indexscan = off"))
+        for query in queries:
+            truth.append(set(await _search(db, user_id, query, top_k, "full")))
+    return truth
+
+
+async def _run_mode(session_maker, user_id, queries, truth, top_k, mode) -> None:
+    ef_search = max(settings.knowledge_hnsw_ef_search, _candidate_count(top_k, mode))
+    latencies = []
+    recalls = []
+    async with session_maker() as db:
+        await db.execute(
+            select(func.set_config("hnsw.ef_search", str(ef_search), True))
+        )
+        for query, expected in zip(queries, truth, strict=True):
+            started = time.perf_counter()
+            found = await _search(db, user_id, query, top_k, mode)
+            latencies.append((time.perf_counter() - started) * 1000)
+            if expected:
+                recalls.append(len(expected.intersection(found)) / len(expected))
+
+    latencies.sort()
+    p95 = latencies[int(0.95 * (len(latencies) - 1))]
+    print(
+        f"{mode:<8} ef_search={ef_search:<5} "
+        f"mean={statistics.fmean(latencies):7.2f}ms p95={p95:7.2f}ms "
+        f"recall@{top_k}={statistics.fmean(recalls) if recalls else 0.0:.3f}"
+    )
+
+
+async def main(chunks: int, queries: int, top_k: int) -> None:
+    session_maker = get_session_maker()
+    user_id = uuid.uuid4()
+    corpus, query_vectors = _synthetic(chunks, queries)
+
+    async with session_maker() as db:
+        db.add(
+            User(
+                id=user_id,
+                email=f"bench_{user_id.hex[:8]}@example.com",
+                hashed_password="x",
+            )
+        )
+        await db.commit()
+
+    created: list[str] = []
+    try:
+        await _insert_corpus(session_maker, user_id, corpus)
+        started = time.perf_counter()
+        created = await _ensure_indexes(session_maker)
+        print(
+            f"corpus={chunks} queries={queries} "
+            f"indexes built={created or 'none'} "
+            f"({time.perf_counter() - started:.1f}s)"
+        )
+
+        truth = await _exact(session_maker, user_id, query_vectors, top_k)
+        for mode in _INDEXES:
+            await _run_mode(session_maker, user_id, query_vectors, truth, top_k, mode)
+    finally:
+        async with session_maker() as db:
+            for name in created:
+                await db.execute(text(f"DROP INDEX IF EXISTS {name}"))
+            await db.execute(
+                delete(KnowledgeChunk).where(KnowledgeChunk.user_id == user_id)
+            )
+            await db.execute(delete(User).where(User.id == user_id))
+            await db.commit()
+        await close_database()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--chunks", type=int, default=20_000)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--top-k", type=int, default=5)
+    args = parser.parse_args()
+    asyncio.run(main(args.chunks, args.queries, args.top_k))
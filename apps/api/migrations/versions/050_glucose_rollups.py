@@ -0,0 +1,277 @@
+"""Hourly and daily glucose rollups for the analytics endpoints.
+
+Creates ``glucose_rollups`` (per-user reading count, sum, sum of squares
+and a value histogram per UTC hour and day), keeps it in sync with
+``glucose_readings`` through statement-level triggers, and backfills it
+from existing readings.
+
+The triggers see every write path (sync bulk inserts, mobile push,
+retention and purge deletes) and run in the writing transaction, so the
+rollups are always exactly consistent with the raw readings.
+
+Revision ID: 050_glucose_rollups
+Revises: 049_knowledge_audit_columns
+Create Date: 2026-04-02
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "050_glucose_rollups"
+down_revision = "049_knowledge_audit_columns"
+branch_labels = None
+depends_on = None
+
+
+# Adds (sign = 1) or subtracts (sign = -1) one value histogram from another,
+# dropping bins that reach zero.
+_HISTOGRAM_MERGE = """
+CREATE OR REPLACE FUNCTION glucose_histogram_merge(
+    base jsonb, delta jsonb, delta_sign integer
+) RETURNS jsonb
+LANGUAGE sql IMMUTABLE AS $$
+    SELECT coalesce(jsonb_object_agg(bin, total), '{}'::jsonb)
+    FROM (
+        SELECT bin, sum(n) AS total
+        FROM (
+            SELECT key AS bin, value::bigint AS n FROM jsonb_each_text(base)
+            UNION ALL
+            SELECT key, delta_sign * value::bigint FROM jsonb_each_text(delta)
+        ) AS parts
+        GROUP BY bin
+        HAVING sum(n) > 0
+    ) AS merged
+$$
+"""
+
+# Aggregates a batch of readings into per-(user, period, bucket) deltas.
+_ROLLUP_DELTAS = """
+CREATE OR REPLACE FUNCTION glucose_rollup_deltas(
+    p_user_ids uuid[], p_timestamps timestamptz[], p_values integer[]
+) RETURNS TABLE (
+    user_id uuid,
+    period text,
+    bucket_start timestamptz,
+    reading_count bigint,
+    value_sum bigint,
+    value_sq_sum bigint,
+    histogram jsonb
+)
+LANGUAGE sql STABLE AS $$
+    SELECT b.uid, b.grain, b.bucket,
+           sum(b.n)::bigint,
+           sum(b.n * b.val)::bigint,
+           sum(b.n * b.val * b.val)::bigint,
+           jsonb_object_agg(b.val, b.n)
+    FROM (
+        SELECT r.uid, p.grain, date_trunc(p.grain, r.ts, 'UTC') AS bucket,
+               r.val, count(*) AS n
+        FROM unnest(p_user_ids, p_timestamps, p_values) AS r(uid, ts, val)
+        CROSS JOIN (VALUES ('hour'), ('day')) AS p(grain)
+        WHERE r.val BETWEEN 20 AND 500
+        GROUP BY 1, 2, 3, 4
+    ) AS b
+    GROUP BY b.uid, b.grain, b.bucket
+$$
+"""
+
+# Inserted readings are upserted into their buckets. Deleted readings only
+# ever decrement existing rows (never insert), so deletes cascading from a
+# user row don't try to recreate that user's rollups.
+_ROLLUP_APPLY = """
+CREATE OR REPLACE FUNCTION glucose_rollups_apply(
+    p_user_ids uuid[], p_timestamps timestamptz[], p_values integer[],
+    p_sign integer
+) RETURNS void
+LANGUAGE plpgsql AS $$
+BEGIN
+    IF p_sign > 0 THEN
+        INSERT INTO glucose_rollups AS r (
+            user_id, period, bucket_start, reading_count,
+            value_sum, value_sq_sum, histogram, updated_at
+        )
+        SELECT d.user_id, d.period, d.bucket_start, d.reading_count,
+               d.value_sum, d.value_sq_sum, d.histogram, now()
+        FROM glucose_rollup_deltas(p_user_ids, p_timestamps, p_values) AS d
+        ON CONFLICT (user_id, period, bucket_start) DO UPDATE SET
+            reading_count = r.reading_count + EXCLUDED.reading_count,
+            value_sum = r.value_sum + EXCLUDED.value_sum,
+            value_sq_sum = r.value_sq_sum + EXCLUDED.value_sq_sum,
+            histogram = glucose_histogram_merge(
+                r.histogram, EXCLUDED.histogram, 1
+            ),
+            updated_at = now();
+    ELSE
+        UPDATE glucose_rollups AS r SET
+            reading_count = r.reading_count - d.reading_count,
+            value_sum = r.value_sum - d.value_sum,
+            value_sq_sum = r.value_sq_sum - d.value_sq_sum,
+            histogram = glucose_histogram_merge(r.histogram, d.histogram, -1),
+            updated_at = now()
+        FROM glucose_rollup_deltas(p_user_ids, p_timestamps, p_values) AS d
+        WHERE r.user_id = d.user_id
+          AND r.period = d.period
+          AND r.bucket_start = d.bucket_start;
+
+        DELETE FROM glucose_rollups
+        WHERE user_id = ANY (p_user_ids) AND reading_count <= 0;
+    END IF;
+END
+$$
+"""
+
+_ON_INSERT = """
+CREATE OR REPLACE FUNCTION glucose_rollups_on_insert() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+    PERFORM glucose_rollups_apply(
+        array_agg(user_id), array_agg(reading_timestamp), array_agg(value), 1
+    )
+    FROM inserted_readings;
+    RETURN NULL;
+END
+$$
+"""
+
+_ON_DELETE = """
+CREATE OR REPLACE FUNCTION glucose_rollups_on_delete() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+    PERFORM glucose_rollups_apply(
+        array_agg(user_id), array_agg(reading_timestamp), array_agg(value), -1
+    )
+    FROM deleted_readings;
+    RETURN NULL;
+END
+$$
+"""
+
+_ON_UPDATE = """
+CREATE OR REPLACE FUNCTION glucose_rollups_on_update() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+    PERFORM glucose_rollups_apply(
+        array_agg(user_id), array_agg(reading_timestamp), array_agg(value), -1
+    )
+    FROM deleted_readings;
+    PERFORM glucose_rollups_apply(
+        array_agg(user_id), array_agg(reading_timestamp), array_agg(value), 1
+    )
+    FROM inserted_readings;
+    RETURN NULL;
+END
+$$
+"""
+
+# Transition tables may only be attached to single-event triggers
+_TRIGGERS = [
+    (
+        "trg_glucose_rollups_insert",
+        "INSERT",
+        "NEW TABLE AS inserted_readings",
+        "glucose_rollups_on_insert",
+    ),
+    (
+        "trg_glucose_rollups_delete",
+        "DELETE",
+        "OLD TABLE AS deleted_readings",
+        "glucose_rollups_on_delete",
+    ),
+    (
+        "trg_glucose_rollups_update",
+        "UPDATE",
+        "OLD TABLE AS deleted_readings NEW TABLE AS inserted_readings",
+        "glucose_rollups_on_update",
+    ),
+]
+
+_BACKFILL = """
+INSERT INTO glucose_rollups (
+    user_id, period, bucket_start, reading_count,
+    value_sum, value_sq_sum, histogram, updated_at
+)
+SELECT b.user_id, b.grain, b.bucket,
+       sum(b.n), sum(b.n * b.value), sum(b.n * b.value * b.value),
+       jsonb_object_agg(b.value, b.n), now()
+FROM (
+    SELECT g.user_id, p.grain,
+           date_trunc(p.grain, g.reading_timestamp, 'UTC') AS bucket,
+           g.value, count(*) AS n
+    FROM glucose_readings AS g
+    CROSS JOIN (VALUES ('hour'), ('day')) AS p(grain)
+    WHERE g.value BETWEEN 20 AND 500
+    GROUP BY 1, 2, 3, 4
+) AS b
+GROUP BY b.user_id, b.grain, b.bucket
+"""
+
+
+def upgrade() -> None:
+    op.create_table(
+        "glucose_rollups",
+        sa.Column(
+            "user_id",
+            sa.dialects.postgresql.UUID(as_uuid=True),
+            sa.ForeignKey("users.id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.Column("period", sa.String(8), nullable=False),
+        sa.Column("bucket_start", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("reading_count", sa.Integer(), nullable=False),
+        sa.Column("value_sum", sa.BigInteger(), nullable=False),
+        sa.Column("value_sq_sum", sa.BigInteger(), nullable=False),
+        sa.Column(
+            "histogram",
+            sa.dialects.postgresql.JSONB(),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.func.now(),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("user_id", "period", "bucket_start"),
+        sa.CheckConstraint(
+            "period IN ('hour', 'day')", name="ck_glucose_rollups_period"
+        ),
+    )
+
+    for statement in (
+        _HISTOGRAM_MERGE,
+        _ROLLUP_DELTAS,
+        _ROLLUP_APPLY,
+        _ON_INSERT,
+        _ON_DELETE,
+        _ON_UPDATE,
+    ):
+        op.execute(statement)
+
+    # Creating the triggers locks out concurrent writes to glucose_readings
+    # until this migration commits, so the backfill can't miss any rows.
+    for name, event, referencing, function in _TRIGGERS:
+        op.execute(
+            f"CREATE TRIGGER {name} AFTER {event} ON glucose_readings "
+            f"REFERENCING {referencing} "
+            f"FOR EACH STATEMENT EXECUTE FUNCTION {function}()"
+        )
+
+    op.execute(_BACKFILL)
+
+
+def downgrade() -> None:
+    for name, _event, _referencing, _function in _TRIGGERS:
+        op.execute(f"DROP TRIGGER IF EXISTS {name} ON glucose_readings")
+    op.execute("DROP FUNCTION IF EXISTS glucose_rollups_on_update()")
+    op.execute("DROP FUNCTION IF EXISTS glucose_rollups_on_delete()")
+    op.execute("DROP FUNCTION IF EXISTS glucose_rollups_on_insert()")
+    op.execute(
+        "DROP FUNCTION IF EXISTS "
+        "glucose_rollups_apply(uuid[], timestamptz[], integer[], integer)"
+    )
+    op.execute(
+        "DROP FUNCTION IF EXISTS "
+        "glucose_rollup_deltas(uuid[], timestamptz[], integer[])"
+    )
+    op.execute("DROP FUNCTION IF EXISTS glucose_histogram_merge(jsonb, jsonb, integer)")
+    op.drop_table("glucose_rollups")
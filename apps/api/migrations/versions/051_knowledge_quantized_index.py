@@ -0,0 +1,48 @@
+"""Quantized HNSW indexes for knowledge chunk embeddings.
+
+Adds two expression indexes over the quantized vectors next to the
+full-precision HNSW index from 048:
+
+- halfvec: ``embedding::halfvec(768)`` with cosine ops (half the memory)
+- binary: ``binary_quantize(embedding)::bit(768)`` with Hamming ops
+  (1/32 of the memory)
+
+Every database at this revision has all three indexes; the
+``knowledge_vector_index`` setting only picks which one retrieval
+queries use, and can be changed without a migration. The float32
+``embedding`` column is kept, so quantized modes re-rank the index's
+candidates by exact cosine distance.
+
+Requires pgvector >= 0.7 (halfvec, bit and binary_quantize).
+
+Revision ID: 051_knowledge_quantized_index
+Revises: 050_glucose_rollups
+Create Date: 2026-04-06
+"""
+
+from alembic import op
+
+revision = "051_knowledge_quantized_index"
+down_revision = "050_glucose_rollups"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_knowledge_embedding_halfvec "
+        "ON knowledge_chunks "
+        "USING hnsw ((embedding::halfvec(768)) halfvec_cosine_ops) "
+        "WITH (m = 16, ef_construction = 64)"
+    )
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_knowledge_embedding_binary "
+        "ON knowledge_chunks "
+        "USING hnsw ((binary_quantize(embedding)::bit(768)) bit_hamming_ops) "
+        "WITH (m = 16, ef_construction = 64)"
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS ix_knowledge_embedding_binary")
+    op.execute("DROP INDEX IF EXISTS ix_knowledge_embedding_halfvec")
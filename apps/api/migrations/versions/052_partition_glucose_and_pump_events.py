@@ -0,0 +1,209 @@
+"""Partition glucose_readings and pump_events by month.
+
+Rebuilds both tables as native range-partitioned tables on their
+timestamp column, with one partition per UTC month (named
+``<table>_pYYYYMM``) plus a ``<table>_default`` partition. The default
+partition catches rows outside every month partition, such as an old
+backfill. Partitions are created from the oldest stored row through
+three months ahead. After that, the scheduler's partition-maintenance
+job keeps future months created (src/services/partitions.py), and
+retention drops whole expired months.
+
+Partitioned tables need the partition key in every unique constraint,
+so the primary key becomes ``(id, <timestamp>)``. The existing unique
+indexes already include the timestamp, so upserts are unaffected. The
+glucose rollup triggers from 050 are re-created on the new table after
+the copy, so existing rollups are not counted twice.
+
+The copy holds an exclusive lock on each table until the migration
+commits. Run it in a maintenance window on large installations.
+
+Revision ID: 052_partition_glucose_and_pump_events
+Revises: 051_knowledge_quantized_index
+Create Date: 2026-04-09
+"""
+
+from datetime import UTC, datetime
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = "052_partition_glucose_and_pump_events"
+down_revision = "051_knowledge_quantized_index"
+branch_labels = None
+depends_on = None
+
+_PREMAKE_MONTHS = 3
+
+# table -> (timestamp column, [(index name, columns, unique)])
+_TABLES = {
+    "glucose_readings": (
+        "reading_timestamp",
+        [
+            ("ix_glucose_readings_user_id", "user_id", False),
+            ("ix_glucose_readings_user_timestamp", "user_id, reading_timestamp", False),
+            ("ix_glucose_readings_user_reading", "user_id, reading_timestamp", True),
+        ],
+    ),
+    "pump_events": (
+        "event_timestamp",
+        [
+            ("ix_pump_events_user_id", "user_id", False),
+            ("ix_pump_events_user_timestamp", "user_id, event_timestamp", False),
+            (
+                "ix_pump_events_user_event_unique",
+                "user_id, event_timestamp, event_type",
+                True,
+            ),
+        ],
+    ),
+}
+
+# Same triggers as 050_glucose_rollups
+_ROLLUP_TRIGGERS = [
+    (
+        "trg_glucose_rollups_insert",
+        "INSERT",
+        "NEW TABLE AS inserted_readings",
+        "glucose_rollups_on_insert",
+    ),
+    (
+        "trg_glucose_rollups_delete",
+        "DELETE",
+        "OLD TABLE AS deleted_readings",
+        "glucose_rollups_on_delete",
+    ),
+    (
+        "trg_glucose_rollups_update",
+        "UPDATE",
+        "OLD TABLE AS deleted_readings NEW TABLE AS inserted_readings",
+        "glucose_rollups_on_update",
+    ),
+]
+
+
+def _add_months(year: int, month: int, count: int) -> tuple[int, int]:
+    index = year * 12 + (month - 1) + count
+    return index // 12, index % 12 + 1
+
+
+def _set_aside(table: str) -> str:
+    """Rename ``table`` and its constraints/indexes out of the way."""
+    old = f"{table}_old"
+    op.execute(f"ALTER TABLE {table} RENAME TO {old}")
+    op.execute(
+        f"""
+        DO $$
+        DECLARE r record;
+        BEGIN
+            FOR r IN
+                SELECT conname FROM pg_constraint
+                WHERE conrelid = '{old}'::regclass AND contype IN ('p', 'f')
+            LOOP
+                EXECUTE format(
+                    'ALTER TABLE {old} RENAME CONSTRAINT %I TO %I',
+                    r.conname, r.conname || '_old'
+                );
+            END LOOP;
+            FOR r IN
+                SELECT indexname FROM pg_indexes
+                WHERE tablename = '{old}' AND schemaname = current_schema()
+                  AND indexname NOT LIKE '%\\_old' ESCAPE '\\'
+            LOOP
+                EXECUTE format(
+                    'ALTER INDEX %I RENAME TO %I', r.indexname, r.indexname || '_old'
+                );
+            END LOOP;
+        END
+        $$
+        """
+    )
+    return old
+
+
+def _partition(table: str) -> None:
+    ts_column, indexes = _TABLES[table]
+    old = _set_aside(table)
+    if table == "glucose_readings":
+        for name, *_ in _ROLLUP_TRIGGERS:
+            op.execute(f"DROP TRIGGER IF EXISTS {name} ON {old}")
+
+    op.execute(
+        f"CREATE TABLE {table} (LIKE {old} INCLUDING DEFAULTS INCLUDING CONSTRAINTS) "
+        f"PARTITION BY RANGE ({ts_column})"
+    )
+    op.execute(f"ALTER TABLE {table} ADD PRIMARY KEY (id, {ts_column})")
+    op.execute(
+        f"ALTER TABLE {table} ADD CONSTRAINT {table}_user_id_fkey "
+        "FOREIGN KEY (user_id) REFERENCES users (id) ON DELETE CASCADE"
+    )
+
+    oldest = (
+        op.get_bind()
+        .execute(sa.text(f"SELECT min({ts_column}) FROM {old}"))
+        .scalar()
+    )
+    now = datetime.now(UTC)
+    year, month = (oldest.year, oldest.month) if oldest else (now.year, now.month)
+    last = _add_months(now.year, now.month, _PREMAKE_MONTHS)
+    while (year, month) <= last:
+        next_year, next_month = _add_months(year, month, 1)
+        op.execute(
+            f"CREATE TABLE {table}_p{year:04d}{month:02d} PARTITION OF {table} "
+            f"FOR VALUES FROM ('{year:04d}-{month:02d}-01 00:00:00+00') "
+            f"TO ('{next_year:04d}-{next_month:02d}-01 00:00:00+00')"
+        )
+        year, month = next_year, next_month
+    op.execute(f"CREATE TABLE {table}_default PARTITION OF {table} DEFAULT")
+
+    op.execute(f"INSERT INTO {table} SELECT * FROM {old}")
+    for name, columns, unique in indexes:
+        op.execute(
+            f"CREATE {'UNIQUE ' if unique else ''}INDEX {name} ON {table} ({columns})"
+        )
+    op.execute(f"DROP TABLE {old}")
+
+
+def _unpartition(table: str) -> None:
+    ts_column, indexes = _TABLES[table]
+    old = _set_aside(table)
+    if table == "glucose_readings":
+        for name, *_ in _ROLLUP_TRIGGERS:
+            op.execute(f"DROP TRIGGER IF EXISTS {name} ON {old}")
+
+    op.execute(
+        f"CREATE TABLE {table} (LIKE {old} INCLUDING DEFAULTS INCLUDING CONSTRAINTS)"
+    )
+    op.execute(f"ALTER TABLE {table} ADD PRIMARY KEY (id)")
+    op.execute(
+        f"ALTER TABLE {table} ADD CONSTRAINT {table}_user_id_fkey "
+        "FOREIGN KEY (user_id) REFERENCES users (id) ON DELETE CASCADE"
+    )
+    op.execute(f"INSERT INTO {table} SELECT * FROM {old}")
+    for name, columns, unique in indexes:
+        op.execute(
+            f"CREATE {'UNIQUE ' if unique else ''}INDEX {name} ON {table} ({columns})"
+        )
+    # Dropping the parent drops every partition with it
+    op.execute(f"DROP TABLE {old}")
+
+
+def _create_rollup_triggers() -> None:
+    for name, event, referencing, function in _ROLLUP_TRIGGERS:
+        op.execute(
+            f"CREATE TRIGGER {name} AFTER {event} ON glucose_readings "
+            f"REFERENCING {referencing} "
+            f"FOR EACH STATEMENT EXECUTE FUNCTION {function}()"
+        )
+
+
+def upgrade() -> None:
+    for table in _TABLES:
+        _partition(table)
+    _create_rollup_triggers()
+
+
+def downgrade() -> None:
+    for table in _TABLES:
+        _unpartition(table)
+    _create_rollup_triggers()
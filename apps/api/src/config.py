@@ -25,11 +25,20 @@ class Settings(BaseSettings):
     # Redis
     redis_url: str = "redis://localhost:6379/0"
 
+    # SSE event hub: "memory" (single worker) or "redis" (multi-worker pub/sub)
+    event_hub_backend: str = "memory"
+    # Recent events kept per (channel, user) for Last-Event-ID replay, and how
+    # long an idle user's buffer is kept after their last stream closes
+    sse_replay_buffer_size: int = Field(default=50, ge=1)
+    sse_replay_window_minutes: int = Field(default=60, ge=1)
+
     # Security
     secret_key: str = _INSECURE_DEFAULT_SECRET
     encryption_key: str = (
         ""  # Separate key for credential encryption; falls back to secret_key
     )
+    # Retired encryption keys, still accepted for decryption during rotation
+    encryption_key_previous: list[str] = []
     jwt_algorithm: str = "HS256"
     jwt_cookie_name: str = "glycemicgpt_session"
 
@@ -64,6 +73,10 @@ class Settings(BaseSettings):
     dexcom_sync_interval_minutes: int = 5  # Sync every 5 minutes
     dexcom_sync_enabled: bool = True  # Enable/disable automatic sync
     dexcom_max_readings_per_sync: int = 12  # Max readings to fetch per sync (1 hour)
+    # Blocking Share API calls run in a dedicated, bounded thread pool
+    dexcom_client_max_workers: int = Field(default=4, ge=1)
+    # Cached Share sessions unused for this long are dropped
+    dexcom_session_idle_minutes: int = Field(default=60, ge=1)
 
     # Tandem Sync Configuration (Story 3.4)
     tandem_sync_interval_minutes: int = 60  # Sync every hour
@@ -73,6 +86,34 @@ class Settings(BaseSettings):
     # Predictive Alert Engine (Story 6.2)
     alert_check_interval_minutes: int = 5  # Run alert engine every 5 minutes
     alert_check_enabled: bool = True  # Enable/disable automatic alert checking
+    # Users are evaluated in set-based batches of this size, each batch with
+    # its own session and timeout
+    alert_check_batch_size: int = Field(default=500, ge=1)
+    alert_check_batch_timeout_seconds: float = Field(default=120, gt=0)
+    # Telegram delivery of the new alerts runs after evaluation, per user,
+    # with its own timeout (so a slow send can't cancel a committed batch)
+    alert_delivery_user_timeout_seconds: float = Field(default=30, gt=0)
+
+    # Scheduler fan-out: per-user sync/alert jobs run concurrently up to this cap
+    scheduler_max_concurrency: int = Field(default=8, ge=1)
+    # Per-integration start rate (users/second, 0 = unlimited) and per-user timeout
+    dexcom_sync_rate_per_second: float = Field(default=5.0, ge=0)
+    dexcom_sync_user_timeout_seconds: float = Field(default=60, gt=0)
+    tandem_sync_rate_per_second: float = Field(default=1.0, ge=0)
+    tandem_sync_user_timeout_seconds: float = Field(default=300, gt=0)
+
+    # Scheduled daily briefs: users with a delivery config get their brief
+    # once their local delivery time has passed (checked every N minutes,
+    # caught up for up to grace_minutes after a missed check)
+    daily_brief_schedule_enabled: bool = True
+    daily_brief_check_interval_minutes: int = Field(default=15, ge=1)
+    daily_brief_grace_minutes: int = Field(default=120, ge=1)
+    # Briefs generated at once, AI calls started per second per provider
+    # endpoint (0 = unlimited), per-user timeout and bulk metrics batch size
+    daily_brief_max_concurrency: int = Field(default=4, ge=1)
+    daily_brief_ai_rate_per_second: float = Field(default=0.5, ge=0)
+    daily_brief_user_timeout_seconds: float = Field(default=120, gt=0)
+    daily_brief_metrics_batch_size: int = Field(default=200, ge=1)
 
     # Alert Escalation (Story 6.7)
     escalation_check_interval_minutes: int = 1  # Check every 1 minute
@@ -81,6 +122,20 @@ class Settings(BaseSettings):
     # Data Retention (Story 9.3)
     data_retention_enabled: bool = True
     data_retention_check_interval_hours: int = 24  # Run daily
+    # Expired rows are deleted in chunks of this many rows, each committed
+    # on its own with a pause in between; a run stops after the max runtime
+    # and the next one resumes with the rest
+    data_retention_batch_size: int = Field(default=5000, ge=1)
+    data_retention_batch_pause_seconds: float = Field(default=0.05, ge=0)
+    data_retention_max_runtime_seconds: float = Field(default=1800, gt=0)
+
+    # Monthly partitions of glucose_readings / pump_events (migration 052):
+    # the maintenance job keeps this many future months created; expired
+    # months are removed whole, "drop"ped or "detach"ed (kept for archiving)
+    partition_maintenance_enabled: bool = True
+    partition_maintenance_interval_hours: int = Field(default=24, ge=1)
+    partition_premake_months: int = Field(default=3, ge=1)
+    partition_expired_action: str = "drop"
 
     # Telegram Bot (Story 7.1)
     telegram_bot_token: str = ""
@@ -96,6 +151,46 @@ class Settings(BaseSettings):
     ai_sidecar_url: str = "http://ai-sidecar:3456"
     ai_sidecar_api_key: str = ""  # SIDECAR_API_KEY for inter-service auth
 
+    # Chat context: DB sessions held at once by concurrent section builders
+    diabetes_context_max_sessions: int = Field(default=8, ge=1)
+
+    # Embedding: model calls run on a dedicated pool of this size; concurrent
+    # query embeddings are coalesced within the window (up to max batch size)
+    # and cached in an LRU of this many queries (0 disables the cache)
+    embedding_max_workers: int = Field(default=1, ge=1)
+    embedding_batch_window_ms: float = Field(default=5.0, ge=0)
+    embedding_max_batch_size: int = Field(default=32, ge=1)
+    embedding_query_cache_size: int = Field(default=1024, ge=0)
+
+    # Knowledge vector index used by retrieval queries (all three are built
+    # by migrations 048/051): "full" (HNSW over the float32 vectors),
+    # "halfvec" (float16) or "binary" (1 bit per dimension). Quantized
+    # modes fetch top_k * rerank_factor candidates from the compact index
+    # and re-rank them by exact cosine distance.
+    # hnsw.ef_search is raised to at least the candidate count.
+    knowledge_vector_index: str = "full"
+    knowledge_rerank_factor: int = Field(default=8, ge=1)
+    knowledge_hnsw_ef_search: int = Field(default=40, ge=1, le=1000)
+
+    # AI response cache for briefs and analyses: "memory" (per worker),
+    # "redis" (shared across workers) or "off"
+    llm_cache_backend: str = "memory"
+    llm_cache_ttl_seconds: int = Field(default=3600, ge=1)
+    llm_cache_max_entries: int = Field(default=1000, ge=1)
+
+    # Authenticated principal cache: the user row for a verified token is
+    # reused for this long per worker (0 disables), up to this many tokens
+    principal_cache_ttl_seconds: float = Field(default=5.0, ge=0)
+    principal_cache_max_entries: int = Field(default=10000, ge=1)
+
+    # Password hashing: bcrypt runs on a pool of this many threads, with at
+    # most this many more calls waiting; further calls get a 429
+    password_hash_max_workers: int = Field(default=2, ge=1)
+    password_hash_max_queue: int = Field(default=16, ge=0)
+
+    # API key last_used_at touches are batched and written this often
+    api_key_usage_flush_seconds: float = Field(default=30.0, gt=0)
+
     # Device & API key limits (Story 28.7)
     max_devices_per_user: int = Field(default=10, ge=1)
     debug_device_limit: int = Field(default=50, ge=1)
@@ -13,6 +13,12 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.config import settings
+from src.core.principal_cache import (
+    cache_principal,
+    get_cached_principal,
+    principal_cache_generation,
+    principal_cache_key,
+)
 from src.core.security import TokenData, decode_access_token
 from src.core.token_blacklist import is_token_blacklisted
 from src.database import get_db
@@ -70,6 +76,13 @@ async def get_current_user(
         except (KeyError, ValueError):
             raise credentials_exception
 
+        # Recently verified principals skip the blacklist and user lookups
+        cache_key = principal_cache_key(session_token, token_data.jti)
+        user = await get_cached_principal(db, cache_key)
+        if user is not None:
+            return user
+        generation = principal_cache_generation()
+
         if token_data.jti and await is_token_blacklisted(token_data.jti):
             raise credentials_exception
 
@@ -82,6 +95,7 @@ async def get_current_user(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="User account is disabled",
             )
+        cache_principal(cache_key, user, generation)
         return user
 
     # --- Path 3: X-API-Key header ---
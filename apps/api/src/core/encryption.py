@@ -7,13 +7,23 @@ Story 28.1: Uses a separate ENCRYPTION_KEY when available, falling back to secre
 Story 28.5: Uses PBKDF2 for key derivation (600K iterations) instead of raw SHA-256.
             Backward-compatible: tries PBKDF2 first, falls back to legacy SHA-256 derivation,
             and re-encrypts with PBKDF2 on successful legacy decryption.
+
+Derived keys are cached per process in a ``_KeyRing`` keyed by the raw key
+material, so PBKDF2 runs once per key instead of on every encrypt/decrypt.
+Changing ENCRYPTION_KEY (or ENCRYPTION_KEY_PREVIOUS) produces a new cache key
+and the key ring is rebuilt on next use. Async callers should await
+``ensure_encryption_keys()`` first so a cold derivation runs in a worker
+thread rather than on the event loop.
 """
 
+import asyncio
 import base64
 import hashlib
 import logging
+import threading
+from dataclasses import dataclass
 
-from cryptography.fernet import Fernet, InvalidToken
+from cryptography.fernet import Fernet, InvalidToken, MultiFernet
 
 from src.config import settings
 
@@ -26,6 +36,28 @@ _PBKDF2_ITERATIONS = 600_000
 # (ENCRYPTION_KEY or SECRET_KEY) should already have high entropy.
 _PBKDF2_SALT = b"glycemicgpt-credential-encryption-v2"
 
+# A handful of entries covers the current key plus any retired keys and
+# settings overrides in tests; raw keys are never evicted mid-rotation.
+_KEYRING_CACHE_SIZE = 8
+
+
+@dataclass(frozen=True)
+class _KeyRing:
+    """Fernet instances derived from one set of raw keys.
+
+    Attributes:
+        current: PBKDF2 keys, newest first. Encrypts with the first key and
+            decrypts with any of them (key rotation).
+        legacy: SHA-256 keys for credentials stored before Story 28.5.
+    """
+
+    current: MultiFernet
+    legacy: MultiFernet
+
+
+_keyring_cache: dict[tuple[str, ...], _KeyRing] = {}
+_keyring_lock = threading.Lock()
+
 
 def _get_raw_key() -> str:
     """Return the raw key material for encryption.
@@ -35,6 +67,16 @@ def _get_raw_key() -> str:
     return settings.encryption_key if settings.encryption_key else settings.secret_key
 
 
+def _get_raw_keys() -> tuple[str, ...]:
+    """Return the active raw key followed by any retired keys.
+
+    Retired keys (ENCRYPTION_KEY_PREVIOUS) are only used for decryption.
+    """
+    raw_key = _get_raw_key()
+    previous = tuple(k for k in settings.encryption_key_previous if k and k != raw_key)
+    return (raw_key, *previous)
+
+
 def _derive_key_pbkdf2(raw_key: str) -> bytes:
     """Derive a Fernet-compatible key using PBKDF2-HMAC-SHA256.
 
@@ -63,6 +105,57 @@ def _derive_key_legacy(raw_key: str) -> bytes:
     return base64.urlsafe_b64encode(key_bytes)
 
 
+def _build_keyring(raw_keys: tuple[str, ...]) -> _KeyRing:
+    """Derive every key for ``raw_keys`` (slow: one PBKDF2 run per key)."""
+    return _KeyRing(
+        current=MultiFernet([Fernet(_derive_key_pbkdf2(k)) for k in raw_keys]),
+        legacy=MultiFernet([Fernet(_derive_key_legacy(k)) for k in raw_keys]),
+    )
+
+
+def _get_keyring() -> _KeyRing:
+    """Return the cached key ring for the configured keys, deriving if needed.
+
+    Derivation happens under a lock so concurrent cold callers (worker
+    threads from ``ensure_encryption_keys``) only pay for PBKDF2 once.
+    """
+    raw_keys = _get_raw_keys()
+    keyring = _keyring_cache.get(raw_keys)
+    if keyring is not None:
+        return keyring
+
+    with _keyring_lock:
+        keyring = _keyring_cache.get(raw_keys)
+        if keyring is None:
+            keyring = _build_keyring(raw_keys)
+            if len(_keyring_cache) >= _KEYRING_CACHE_SIZE:
+                _keyring_cache.clear()
+            _keyring_cache[raw_keys] = keyring
+        return keyring
+
+
+def is_keyring_ready() -> bool:
+    """Return True if keys for the current settings are already derived."""
+    return _get_raw_keys() in _keyring_cache
+
+
+async def ensure_encryption_keys() -> None:
+    """Derive the configured keys in a worker thread if not yet cached.
+
+    A no-op once the key ring is warm, so hot paths can await it
+    unconditionally before calling ``encrypt_credential``/``decrypt_credential``.
+    """
+    if is_keyring_ready():
+        return
+    await asyncio.to_thread(_get_keyring)
+
+
+def clear_keyring_cache() -> None:
+    """Drop all derived keys (used by tests and key rotation tooling)."""
+    with _keyring_lock:
+        _keyring_cache.clear()
+
+
 def encrypt_credential(plaintext: str) -> str:
     """Encrypt a credential string using PBKDF2-derived key.
 
@@ -72,17 +165,17 @@ def encrypt_credential(plaintext: str) -> str:
     Returns:
         The encrypted value as a base64-encoded string
     """
-    fernet = Fernet(_derive_key_pbkdf2(_get_raw_key()))
-    encrypted = fernet.encrypt(plaintext.encode("utf-8"))
+    encrypted = _get_keyring().current.encrypt(plaintext.encode("utf-8"))
     return encrypted.decode("utf-8")
 
 
 def decrypt_credential(encrypted: str) -> str:
     """Decrypt an encrypted credential string.
 
-    Tries PBKDF2-derived key first. If that fails, falls back to the
-    legacy SHA-256 derivation for backward compatibility. On successful
-    legacy decryption, the caller should re-encrypt with the new method.
+    Tries PBKDF2-derived keys first (current, then retired). If that fails,
+    falls back to the legacy SHA-256 derivation for backward compatibility.
+    On successful legacy decryption, the caller should re-encrypt with the
+    new method.
 
     Args:
         encrypted: The encrypted credential as a base64-encoded string
@@ -93,20 +186,18 @@ def decrypt_credential(encrypted: str) -> str:
     Raises:
         ValueError: If decryption fails with both key derivation methods
     """
-    raw_key = _get_raw_key()
+    keyring = _get_keyring()
+    token = encrypted.encode("utf-8")
 
-    # Try PBKDF2 key first (new method)
+    # Try PBKDF2 keys first (new method)
     try:
-        fernet = Fernet(_derive_key_pbkdf2(raw_key))
-        decrypted = fernet.decrypt(encrypted.encode("utf-8"))
-        return decrypted.decode("utf-8")
+        return keyring.current.decrypt(token).decode("utf-8")
     except InvalidToken:
-        pass  # PBKDF2 key didn't work; try legacy derivation
+        pass  # PBKDF2 keys didn't work; try legacy derivation
 
-    # Fall back to legacy SHA-256 key
+    # Fall back to legacy SHA-256 keys
     try:
-        fernet = Fernet(_derive_key_legacy(raw_key))
-        decrypted = fernet.decrypt(encrypted.encode("utf-8"))
+        decrypted = keyring.legacy.decrypt(token)
         logger.warning(
             "Decrypted credential using legacy SHA-256 key derivation; "
             "re-encryption with PBKDF2 recommended"
@@ -0,0 +1,290 @@
+"""Short-TTL cache of authenticated principals for get_current_user.
+
+A dashboard load fires several authenticated requests at once, and each
+one would check the token blacklist in Redis and load the user row. The
+user row for a verified token is kept per worker for
+``principal_cache_ttl_seconds`` (LRU-bounded), keyed by the token's JTI.
+Verified API keys are cached the same way with their key row, keyed by
+the key's SHA-256 hash (raw keys are never stored). A hit skips the
+lookups and merges the cached rows into the request's session without a
+SELECT, so handlers can still modify and commit them.
+
+Entries are dropped as soon as they may be stale:
+- blacklisting a token (logout, password change, refresh) drops its entry
+- committing any change to a user row (password, role, deactivation,
+  profile) drops that user's entries, API keys included
+- committing any change to an API key row (revocation) drops that key
+
+Invalidations are broadcast to every worker over Redis pub/sub. Outside
+tests, cache hits are only served while this worker's listener is
+subscribed, and the cache is cleared whenever it (re)subscribes, so a
+missed invalidation can't keep a revoked principal alive.
+"""
+
+import asyncio
+import contextlib
+import hashlib
+import time
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any
+
+import redis.asyncio as aioredis
+from sqlalchemy import event, inspect
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, make_transient_to_detached
+
+from src.config import settings
+from src.logging_config import get_logger
+from src.models.api_key import ApiKey
+from src.models.user import User
+
+logger = get_logger(__name__)
+
+_REDIS_CHANNEL = "glycemicgpt:principal_invalidations"
+_LISTENER_RETRY_SECONDS = 5
+# session.info keys collecting rows changed by a flush, until commit
+_CHANGED_USERS_KEY = "principal_cache_changed_users"
+_CHANGED_API_KEYS_KEY = "principal_cache_changed_api_keys"
+
+
+@dataclass
+class _Entry:
+    user: User
+    expires_at: float
+    api_key: ApiKey | None = None
+
+
+_entries: OrderedDict[str, _Entry] = OrderedDict()
+# Bumped by every invalidation; a load that started before one isn't cached
+_generation = 0
+_stats = {"hits": 0, "misses": 0, "invalidations": 0}
+
+_redis: aioredis.Redis | None = None
+_listener: asyncio.Task | None = None
+_subscribed = False
+_pending_publishes: set[asyncio.Task] = set()
+
+
+def _uses_redis() -> bool:
+    return not settings.testing
+
+
+def _enabled() -> bool:
+    if settings.principal_cache_ttl_seconds <= 0:
+        return False
+    return _subscribed or not _uses_redis()
+
+
+def principal_cache_key(token: str, jti: str | None) -> str:
+    """Cache key for a token: its JTI, or a digest of the token itself."""
+    return jti or hashlib.sha256(token.encode()).hexdigest()
+
+
+def principal_cache_generation() -> int:
+    """Take before loading a principal; pass to ``cache_principal``."""
+    return _generation
+
+
+def _lookup(key: str) -> _Entry | None:
+    entry = _entries.get(key) if _enabled() else None
+    if entry is None or entry.expires_at <= time.monotonic():
+        if entry is not None:
+            _entries.pop(key, None)
+        _stats["misses"] += 1
+        return None
+    _entries.move_to_end(key)
+    _stats["hits"] += 1
+    return entry
+
+
+async def get_cached_principal(db: AsyncSession, key: str) -> User | None:
+    """Return the cached user for ``key``, attached to ``db``, or None."""
+    entry = _lookup(key)
+    if entry is None:
+        return None
+    return await db.merge(entry.user, load=False)
+
+
+async def get_cached_api_key(
+    db: AsyncSession, key_hash: str
+) -> tuple[ApiKey, User] | None:
+    """Return the cached key row and owner for ``key_hash``, attached to ``db``."""
+    entry = _lookup(key_hash)
+    if entry is None or entry.api_key is None:
+        return None
+    api_key = await db.merge(entry.api_key, load=False)
+    return api_key, await db.merge(entry.user, load=False)
+
+
+def _snapshot(row: Any) -> Any:
+    """Detached copy of a row's column values, safe to share across sessions."""
+    model = type(row)
+    copy = model(
+        **{attr.key: getattr(row, attr.key) for attr in inspect(model).column_attrs}
+    )
+    make_transient_to_detached(copy)
+    return copy
+
+
+def cache_principal(
+    key: str, user: User, generation: int, api_key: ApiKey | None = None
+) -> None:
+    """Cache an active user (and the API key it authenticated with) for ``key``.
+
+    Skipped if any invalidation happened since ``generation`` was taken,
+    since the rows may predate it.
+    """
+    if not _enabled() or not user.is_active or generation != _generation:
+        return
+    _entries[key] = _Entry(
+        user=_snapshot(user),
+        expires_at=time.monotonic() + settings.principal_cache_ttl_seconds,
+        api_key=_snapshot(api_key) if api_key is not None else None,
+    )
+    _entries.move_to_end(key)
+    while len(_entries) > settings.principal_cache_max_entries:
+        _entries.popitem(last=False)
+
+
+def _drop(kind: str, value: str) -> None:
+    global _generation
+    _generation += 1
+    _stats["invalidations"] += 1
+    if kind == "token":
+        _entries.pop(value, None)
+        return
+    stale = [key for key, entry in _entries.items() if str(entry.user.id) == value]
+    for key in stale:
+        del _entries[key]
+
+
+def clear_principal_cache() -> None:
+    """Drop every cached principal."""
+    global _generation
+    _generation += 1
+    _entries.clear()
+
+
+def _get_redis() -> aioredis.Redis:
+    global _redis
+    if _redis is None:
+        _redis = aioredis.from_url(
+            settings.redis_url,
+            decode_responses=True,
+            socket_connect_timeout=2,
+        )
+    return _redis
+
+
+async def _publish(kind: str, value: str) -> None:
+    try:
+        await _get_redis().publish(_REDIS_CHANNEL, f"{kind}:{value}")
+    except aioredis.RedisError as e:
+        logger.warning("Principal cache invalidation publish failed", error=str(e))
+
+
+def _invalidate(kind: str, value: str) -> None:
+    _drop(kind, value)
+    if not _uses_redis():
+        return
+    try:
+        task = asyncio.get_running_loop().create_task(_publish(kind, value))
+    except RuntimeError:
+        return  # No event loop (e.g. a sync script): nothing to notify
+    _pending_publishes.add(task)
+    task.add_done_callback(_pending_publishes.discard)
+
+
+def invalidate_token(key: str) -> None:
+    """Drop the cached principal for a JTI or API key hash on every worker."""
+    _invalidate("token", key)
+
+
+def invalidate_user(user_id: uuid.UUID | str) -> None:
+    """Drop every cached principal of a user on every worker."""
+    _invalidate("user", str(user_id))
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_changed_rows(session: Session, flush_context: Any) -> None:
+    for obj in (*session.dirty, *session.deleted):
+        if isinstance(obj, User) and obj.id is not None:
+            session.info.setdefault(_CHANGED_USERS_KEY, set()).add(str(obj.id))
+        elif isinstance(obj, ApiKey) and obj.key_hash:
+            session.info.setdefault(_CHANGED_API_KEYS_KEY, set()).add(obj.key_hash)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_changed_rows(session: Session) -> None:
+    for user_id in session.info.pop(_CHANGED_USERS_KEY, ()):
+        invalidate_user(user_id)
+    for key_hash in session.info.pop(_CHANGED_API_KEYS_KEY, ()):
+        invalidate_token(key_hash)
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _forget_changed_rows(session: Session, previous_transaction: Any) -> None:
+    session.info.pop(_CHANGED_USERS_KEY, None)
+    session.info.pop(_CHANGED_API_KEYS_KEY, None)
+
+
+async def _listen() -> None:
+    """Apply invalidations from other workers, reconnecting on error."""
+    global _subscribed
+    while True:
+        try:
+            pubsub = _get_redis().pubsub(ignore_subscribe_messages=True)
+            await pubsub.subscribe(_REDIS_CHANNEL)
+            # Invalidations sent while unsubscribed were missed
+            clear_principal_cache()
+            _subscribed = True
+            try:
+                async for message in pubsub.listen():
+                    kind, _, value = str(message["data"]).partition(":")
+                    if kind in ("token", "user") and value:
+                        _drop(kind, value)
+            finally:
+                _subscribed = False
+                await pubsub.aclose()
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning("Principal cache listener error; reconnecting", error=str(e))
+            await asyncio.sleep(_LISTENER_RETRY_SECONDS)
+
+
+async def start_principal_cache() -> None:
+    """Start the Redis invalidation listener."""
+    global _listener
+    if _uses_redis() and _listener is None:
+        _listener = asyncio.create_task(_listen())
+
+
+async def stop_principal_cache() -> None:
+    """Stop the listener, flush pending invalidations and close Redis."""
+    global _listener, _redis
+    if _listener is not None:
+        _listener.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await _listener
+        _listener = None
+    if _pending_publishes:
+        await asyncio.gather(*_pending_publishes, return_exceptions=True)
+    if _redis is not None:
+        await _redis.aclose()
+        _redis = None
+    clear_principal_cache()
+
+
+def get_principal_cache_stats() -> dict[str, Any]:
+    """Return principal cache counters."""
+    lookups = _stats["hits"] + _stats["misses"]
+    return {
+        **_stats,
+        "hit_rate": round(_stats["hits"] / lookups, 3) if lookups else 0.0,
+        "entries": len(_entries),
+        "subscribed": _subscribed,
+        "ttl_seconds": settings.principal_cache_ttl_seconds,
+    }
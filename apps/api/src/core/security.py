@@ -1,10 +1,19 @@
 """Story 2.1 & 2.2: Security utilities.
 
 Password hashing, verification, and JWT token management.
+
+Request handlers use ``hash_password_async``/``verify_password_async``,
+which run bcrypt on a dedicated thread pool so a burst of logins doesn't
+stall the event loop. The pool admits at most ``password_hash_max_workers
++ password_hash_max_queue`` jobs; beyond that the call fails fast with
+``PasswordHashingBusyError`` (answered with 429) instead of queueing.
 """
 
+import asyncio
 import re
+import threading
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from datetime import UTC, datetime, timedelta
 
 import bcrypt
@@ -52,6 +61,79 @@ def hash_password(password: str) -> str:
     return hashed.decode("utf-8")
 
 
+class PasswordHashingBusyError(Exception):
+    """The password hashing pool is saturated; the client should retry."""
+
+
+_password_executor: ThreadPoolExecutor | None = None
+# Jobs running or queued on the pool. Released from the job's own
+# completion callback (a worker thread), not when the awaiting request
+# goes away, so abandoned requests can't queue bcrypt work beyond capacity.
+_password_jobs = 0
+_password_jobs_lock = threading.Lock()
+
+
+def _get_password_executor() -> ThreadPoolExecutor:
+    """Return the dedicated thread pool for bcrypt."""
+    global _password_executor
+    if _password_executor is None:
+        _password_executor = ThreadPoolExecutor(
+            max_workers=settings.password_hash_max_workers,
+            thread_name_prefix="password-hash",
+        )
+    return _password_executor
+
+
+def _release_password_job(_future: object = None) -> None:
+    global _password_jobs
+    with _password_jobs_lock:
+        _password_jobs -= 1
+
+
+async def _run_on_password_pool(func, *args):
+    global _password_jobs
+    capacity = settings.password_hash_max_workers + settings.password_hash_max_queue
+    with _password_jobs_lock:
+        if _password_jobs >= capacity:
+            raise PasswordHashingBusyError
+        _password_jobs += 1
+    try:
+        future = _get_password_executor().submit(func, *args)
+    except BaseException:
+        _release_password_job()
+        raise
+    # Fires when the job finishes, or right away if a cancelled request
+    # cancels it before a worker picks it up
+    future.add_done_callback(_release_password_job)
+    return await asyncio.wrap_future(future)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """Verify a password on the password hashing pool.
+
+    Raises:
+        PasswordHashingBusyError: If the pool is saturated.
+    """
+    return await _run_on_password_pool(verify_password, plain_password, hashed_password)
+
+
+async def hash_password_async(password: str) -> str:
+    """Hash a password on the password hashing pool.
+
+    Raises:
+        PasswordHashingBusyError: If the pool is saturated.
+    """
+    return await _run_on_password_pool(hash_password, password)
+
+
+def shutdown_password_executor() -> None:
+    """Shut down the password hashing pool (called on application shutdown)."""
+    global _password_executor
+    if _password_executor is not None:
+        _password_executor.shutdown(wait=False, cancel_futures=True)
+        _password_executor = None
+
+
 # Pre-computed bcrypt hash for constant-time login responses.
 # When a login attempt targets a non-existing user, we still run bcrypt
 # against this dummy hash so the response time matches a real user lookup.
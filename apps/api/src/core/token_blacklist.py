@@ -16,6 +16,7 @@ import time
 import redis.asyncio as aioredis
 
 from src.config import settings
+from src.core.principal_cache import invalidate_token
 
 logger = logging.getLogger(__name__)
 
@@ -49,6 +50,7 @@ async def blacklist_token(jti: str, ttl_seconds: int) -> None:
         ttl_seconds: Time-to-live in seconds (should match token's remaining lifetime).
     """
     ttl_seconds = max(1, ttl_seconds)
+    invalidate_token(jti)
 
     if settings.testing:
         _test_blacklist[jti] = time.monotonic() + ttl_seconds
@@ -3,6 +3,7 @@
 Implements the BaseAIClient interface for Claude models.
 """
 
+from collections.abc import AsyncIterator
 from typing import Any
 
 import anthropic
@@ -10,14 +11,66 @@ import anthropic
 from src.logging_config import get_logger
 from src.models.ai_provider import AIProviderType
 from src.schemas.ai_response import AIMessage, AIResponse, AIUsage
-from src.services.ai_client import BaseAIClient
+from src.services.ai_client import BaseAIClient, get_sdk_client
 
 logger = get_logger(__name__)
 
 
+def _log_generation_error(exc: Exception) -> None:
+    """Log a failed Messages API call by error type."""
+    if isinstance(exc, anthropic.AuthenticationError):
+        logger.error("Claude API authentication failed during generation")
+    elif isinstance(exc, anthropic.RateLimitError):
+        logger.warning("Claude API rate limited during generation")
+    elif isinstance(exc, anthropic.APIConnectionError):
+        logger.error("Claude API connection error during generation", error=str(exc))
+    else:
+        logger.error("Unexpected error during Claude generation", error=str(exc))
+
+
 class ClaudeClient(BaseAIClient):
     """Claude AI client using the Anthropic SDK."""
 
+    def _client(self) -> anthropic.AsyncAnthropic:
+        return get_sdk_client(
+            "anthropic",
+            self._api_key,
+            None,
+            lambda: anthropic.AsyncAnthropic(api_key=self._api_key),
+        )
+
+    def _request_kwargs(
+        self,
+        messages: list[AIMessage],
+        system_prompt: str | None,
+        max_tokens: int,
+    ) -> dict[str, Any]:
+        kwargs: dict[str, Any] = {
+            "model": self.model,
+            "max_tokens": max_tokens,
+            "messages": [{"role": m.role, "content": m.content} for m in messages],
+        }
+        if system_prompt:
+            kwargs["system"] = system_prompt
+        return kwargs
+
+    def _to_response(self, message: Any) -> AIResponse:
+        content = message.content[0].text if message.content else ""
+
+        usage = AIUsage()
+        if message.usage:
+            usage = AIUsage(
+                input_tokens=message.usage.input_tokens,
+                output_tokens=message.usage.output_tokens,
+            )
+
+        return AIResponse(
+            content=content,
+            model=message.model,
+            provider=self._provider_type or AIProviderType.CLAUDE_API,
+            usage=usage,
+        )
+
     async def generate(
         self,
         messages: list[AIMessage],
@@ -34,43 +87,37 @@ class ClaudeClient(BaseAIClient):
         Returns:
             Normalized AIResponse.
         """
-        client = anthropic.AsyncAnthropic(api_key=self._api_key)
-
-        kwargs: dict[str, Any] = {
-            "model": self.model,
-            "max_tokens": max_tokens,
-            "messages": [{"role": m.role, "content": m.content} for m in messages],
-        }
-        if system_prompt:
-            kwargs["system"] = system_prompt
+        client = self._client()
+        kwargs = self._request_kwargs(messages, system_prompt, max_tokens)
 
         try:
             response = await client.messages.create(**kwargs)
-        except anthropic.AuthenticationError:
-            logger.error("Claude API authentication failed during generation")
-            raise
-        except anthropic.RateLimitError:
-            logger.warning("Claude API rate limited during generation")
-            raise
-        except anthropic.APIConnectionError as e:
-            logger.error("Claude API connection error during generation", error=str(e))
-            raise
         except Exception as e:
-            logger.error("Unexpected error during Claude generation", error=str(e))
+            _log_generation_error(e)
             raise
 
-        content = response.content[0].text if response.content else ""
+        return self._to_response(response)
 
-        usage = AIUsage()
-        if response.usage:
-            usage = AIUsage(
-                input_tokens=response.usage.input_tokens,
-                output_tokens=response.usage.output_tokens,
-            )
+    async def generate_stream(
+        self,
+        messages: list[AIMessage],
+        system_prompt: str | None = None,
+        max_tokens: int = 1024,
+    ) -> AsyncIterator[str | AIResponse]:
+        """Stream a response from the Anthropic Messages API.
 
-        return AIResponse(
-            content=content,
-            model=response.model,
-            provider=self._provider_type or AIProviderType.CLAUDE_API,
-            usage=usage,
-        )
+        Yields text deltas as they arrive, then the completed AIResponse.
+        """
+        client = self._client()
+        kwargs = self._request_kwargs(messages, system_prompt, max_tokens)
+
+        try:
+            async with client.messages.stream(**kwargs) as stream:
+                async for text in stream.text_stream:
+                    yield text
+                message = await stream.get_final_message()
+        except Exception as e:
+            _log_generation_error(e)
+            raise
+
+        yield self._to_response(message)
@@ -1,8 +1,12 @@
 """Story 5.2: OpenAI AI client integration.
 
-Implements the BaseAIClient interface for OpenAI models.
+Implements the BaseAIClient interface for OpenAI models. Also serves
+OpenAI-compatible endpoints, including the managed subscription sidecar.
 """
 
+from collections.abc import AsyncIterator
+from typing import Any
+
 import openai
 from openai.types.chat import (
     ChatCompletionAssistantMessageParam,
@@ -14,14 +18,73 @@ from openai.types.chat import (
 from src.logging_config import get_logger
 from src.models.ai_provider import AIProviderType
 from src.schemas.ai_response import AIMessage, AIResponse, AIUsage
-from src.services.ai_client import BaseAIClient
+from src.services.ai_client import BaseAIClient, get_sdk_client
 
 logger = get_logger(__name__)
 
+# Providers known to accept ``stream_options`` (usage in the final chunk).
+# Self-hosted servers and the sidecar vary, so streams from them may
+# report no token usage.
+_STREAM_USAGE_TYPES = {AIProviderType.OPENAI_API, AIProviderType.OPENAI}
+
+
+def _log_generation_error(exc: Exception) -> None:
+    """Log a failed Chat Completions call by error type."""
+    if isinstance(exc, openai.AuthenticationError):
+        logger.error("OpenAI API authentication failed during generation")
+    elif isinstance(exc, openai.RateLimitError):
+        logger.warning("OpenAI API rate limited during generation")
+    elif isinstance(exc, openai.APIConnectionError):
+        logger.error("OpenAI API connection error during generation", error=str(exc))
+    else:
+        logger.error("Unexpected error during OpenAI generation", error=str(exc))
+
+
+def _to_openai_messages(
+    messages: list[AIMessage],
+    system_prompt: str | None,
+) -> list[ChatCompletionMessageParam]:
+    openai_messages: list[ChatCompletionMessageParam] = []
+    if system_prompt:
+        sys_msg: ChatCompletionSystemMessageParam = {
+            "role": "system",
+            "content": system_prompt,
+        }
+        openai_messages.append(sys_msg)
+    for m in messages:
+        chat_msg: ChatCompletionMessageParam
+        if m.role == "assistant":
+            chat_msg = ChatCompletionAssistantMessageParam(
+                role="assistant",
+                content=m.content,
+            )
+        else:
+            chat_msg = ChatCompletionUserMessageParam(
+                role="user",
+                content=m.content,
+            )
+        openai_messages.append(chat_msg)
+    return openai_messages
+
 
 class OpenAIClient(BaseAIClient):
     """OpenAI AI client using the OpenAI SDK."""
 
+    def _client(self) -> openai.AsyncOpenAI:
+        kwargs: dict[str, str] = {"api_key": self._api_key}
+        if self._base_url:
+            kwargs["base_url"] = self._base_url
+        return get_sdk_client(
+            "openai",
+            self._api_key,
+            self._base_url,
+            lambda: openai.AsyncOpenAI(**kwargs),
+        )
+
+    @property
+    def _provider(self) -> AIProviderType:
+        return self._provider_type or AIProviderType.OPENAI_API
+
     async def generate(
         self,
         messages: list[AIMessage],
@@ -38,49 +101,16 @@ class OpenAIClient(BaseAIClient):
         Returns:
             Normalized AIResponse.
         """
-        kwargs: dict[str, str] = {"api_key": self._api_key}
-        if self._base_url:
-            kwargs["base_url"] = self._base_url
-        client = openai.AsyncOpenAI(**kwargs)
-
-        openai_messages: list[ChatCompletionMessageParam] = []
-        if system_prompt:
-            sys_msg: ChatCompletionSystemMessageParam = {
-                "role": "system",
-                "content": system_prompt,
-            }
-            openai_messages.append(sys_msg)
-        for m in messages:
-            chat_msg: ChatCompletionMessageParam
-            if m.role == "assistant":
-                chat_msg = ChatCompletionAssistantMessageParam(
-                    role="assistant",
-                    content=m.content,
-                )
-            else:
-                chat_msg = ChatCompletionUserMessageParam(
-                    role="user",
-                    content=m.content,
-                )
-            openai_messages.append(chat_msg)
+        client = self._client()
 
         try:
             response = await client.chat.completions.create(
                 model=self.model,
-                messages=openai_messages,
+                messages=_to_openai_messages(messages, system_prompt),
                 max_tokens=max_tokens,
             )
-        except openai.AuthenticationError:
-            logger.error("OpenAI API authentication failed during generation")
-            raise
-        except openai.RateLimitError:
-            logger.warning("OpenAI API rate limited during generation")
-            raise
-        except openai.APIConnectionError as e:
-            logger.error("OpenAI API connection error during generation", error=str(e))
-            raise
         except Exception as e:
-            logger.error("Unexpected error during OpenAI generation", error=str(e))
+            _log_generation_error(e)
             raise
 
         choice = response.choices[0] if response.choices else None
@@ -96,6 +126,55 @@ class OpenAIClient(BaseAIClient):
         return AIResponse(
             content=content,
             model=response.model,
-            provider=self._provider_type or AIProviderType.OPENAI_API,
+            provider=self._provider,
+            usage=usage,
+        )
+
+    async def generate_stream(
+        self,
+        messages: list[AIMessage],
+        system_prompt: str | None = None,
+        max_tokens: int = 1024,
+    ) -> AsyncIterator[str | AIResponse]:
+        """Stream a response from the OpenAI Chat Completions API.
+
+        Yields text deltas as they arrive, then the completed AIResponse.
+        """
+        client = self._client()
+        extra: dict[str, Any] = {}
+        if self._provider in _STREAM_USAGE_TYPES:
+            extra["stream_options"] = {"include_usage": True}
+
+        parts: list[str] = []
+        model = self.model
+        usage = AIUsage()
+        try:
+            stream = await client.chat.completions.create(
+                model=self.model,
+                messages=_to_openai_messages(messages, system_prompt),
+                max_tokens=max_tokens,
+                stream=True,
+                **extra,
+            )
+            async with stream:
+                async for chunk in stream:
+                    model = chunk.model or model
+                    if chunk.usage:
+                        usage = AIUsage(
+                            input_tokens=chunk.usage.prompt_tokens,
+                            output_tokens=chunk.usage.completion_tokens or 0,
+                        )
+                    delta = chunk.choices[0].delta.content if chunk.choices else None
+                    if delta:
+                        parts.append(delta)
+                        yield delta
+        except Exception as e:
+            _log_generation_error(e)
+            raise
+
+        yield AIResponse(
+            content="".join(parts),
+            model=model,
+            provider=self._provider,
             usage=usage,
         )
@@ -11,42 +11,35 @@ from fastapi.staticfiles import StaticFiles
 from slowapi.errors import RateLimitExceeded
 
 from src.config import settings, validate_secret_key
+from src.core.encryption import ensure_encryption_keys
+from src.core.principal_cache import start_principal_cache, stop_principal_cache
+from src.core.security import PasswordHashingBusyError, shutdown_password_executor
 from src.database import close_database
 from src.logging_config import get_logger, setup_logging
 from src.middleware import CorrelationIdMiddleware
 from src.middleware.csrf import CSRFMiddleware
-from src.middleware.rate_limit import limiter, rate_limit_exceeded_handler
+from src.middleware.rate_limit import (
+    limiter,
+    password_hashing_busy_handler,
+    rate_limit_exceeded_handler,
+)
 from src.middleware.security_headers import SecurityHeadersMiddleware
-from src.routers import (
-    ai,
-    alert_api,
-    alert_stream,
-    alerts,
-    api_keys,
-    auth,
-    briefs,
-    caregivers,
-    correction_analysis,
-    device_registration,
-    disclaimer,
-    emergency_contacts,
-    escalation,
-    glucose_stream,
-    health,
-    insights,
-    integrations,
-    knowledge,
-    meal_analysis,
-    research,
-    safety,
-    system,
-    telegram,
-    treatment,
+from src.services.api_key_service import (
+    start_api_key_usage_flusher,
+    stop_api_key_usage_flusher,
 )
-from src.routers import (
-    settings as settings_router,
+from src.services.dexcom_sync import shutdown_dexcom_executor
+from src.services.embedding import (
+    shutdown_embedding_executor,
+    start_model_warmup,
+    stop_model_warmup,
 )
+from src.services.event_hub import event_hub
+from src.services.http_clients import close_http_clients, start_http_clients
+from src.services.knowledge_retrieval import warn_if_knowledge_index_missing
+from src.services.llm_cache import close_llm_cache
 from src.services.scheduler import start_scheduler, stop_scheduler
+from src.services.startup_profile import import_routers, mark_ready, startup_phase
 
 # Configure structured logging (Story 1.5)
 setup_logging(
@@ -60,23 +53,46 @@ logger = get_logger(__name__)
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan handler."""
-    # Startup
-    validate_secret_key()
+    # Startup (each step is timed in the startup profile)
+    with startup_phase("validate_secret_key"):
+        validate_secret_key()
     # Note: Migrations are run by scripts/start.sh before uvicorn starts
     logger.info("GlycemicGPT API started")
 
+    # Derive credential encryption keys off-loop before scheduled syncs need them
+    with startup_phase("encryption_keys"):
+        await ensure_encryption_keys()
+
+    # Start SSE event hub (Redis listener in multi-worker mode)
+    with startup_phase("event_hub"):
+        await event_hub.start()
+
+    # Cross-worker invalidation for cached authenticated principals
+    with startup_phase("principal_cache"):
+        await start_principal_cache()
+
+    # Batched API key last_used_at writes
+    start_api_key_usage_flusher()
+
+    # Pooled outbound HTTP clients (Telegram, sidecar, Tandem, research)
+    with startup_phase("http_clients"):
+        await start_http_clients()
+
     # Start background scheduler (Story 3.2)
-    start_scheduler()
+    with startup_phase("scheduler"):
+        start_scheduler()
     logger.info("Background scheduler started")
 
-    # Preload embedding model for RAG retrieval (Story 35.9)
-    # Model downloads ~500MB on first run, then caches in Docker volume.
-    try:
-        from src.services.embedding import preload_model
+    # Load the embedding model for RAG retrieval (Story 35.9) in the
+    # background. It downloads ~500MB on first run (then caches in the
+    # Docker volume); knowledge retrieval is skipped until it is ready.
+    start_model_warmup()
 
-        preload_model()
-    except Exception:
-        logger.warning("Embedding model preload failed", exc_info=True)
+    # Without the configured mode's vector index, retrieval scans every chunk
+    with startup_phase("knowledge_index"):
+        await warn_if_knowledge_index_missing()
+
+    mark_ready()
 
     yield
 
@@ -84,6 +100,15 @@ async def lifespan(app: FastAPI):
     logger.info("Shutting down GlycemicGPT API...")
     stop_scheduler()
     logger.info("Background scheduler stopped")
+    await stop_model_warmup()
+    shutdown_dexcom_executor()
+    shutdown_embedding_executor()
+    shutdown_password_executor()
+    await event_hub.stop()
+    await stop_principal_cache()
+    await stop_api_key_usage_flusher()
+    await close_http_clients()
+    await close_llm_cache()
     await close_database()
     logger.info("GlycemicGPT API shutdown complete")
 
@@ -105,6 +130,7 @@ if _static_dir.is_dir():
 # Rate limiting (Story 16.12)
 app.state.limiter = limiter
 app.add_exception_handler(RateLimitExceeded, rate_limit_exceeded_handler)
+app.add_exception_handler(PasswordHashingBusyError, password_hashing_busy_handler)
 
 # Middleware (order matters: last added = first executed on incoming requests)
 # Add security response headers (Story 28.13)
@@ -133,32 +159,37 @@ app.add_middleware(
     ],
 )
 
-# Include routers
-app.include_router(health.router)
-app.include_router(disclaimer.router)
-app.include_router(auth.router)
-app.include_router(system.router)
-app.include_router(integrations.router)
-app.include_router(glucose_stream.router)
-app.include_router(ai.router)
-app.include_router(briefs.router)
-app.include_router(meal_analysis.router)
-app.include_router(correction_analysis.router)
-app.include_router(safety.router)
-app.include_router(insights.router)
-app.include_router(settings_router.router)
-app.include_router(alerts.router)
-app.include_router(emergency_contacts.router)
-app.include_router(escalation.router)
-app.include_router(telegram.router)
-app.include_router(caregivers.router)
-app.include_router(device_registration.router)
-app.include_router(api_keys.router)
-app.include_router(alert_stream.router)
-app.include_router(alert_api.router)
-app.include_router(treatment.router)
-app.include_router(research.router)
-app.include_router(knowledge.router)
+# Include routers, in registration order. Each router module is imported
+# here, one at a time, so the startup profile records its import time.
+ROUTER_MODULES = (
+    "health",
+    "disclaimer",
+    "auth",
+    "system",
+    "integrations",
+    "glucose_stream",
+    "ai",
+    "briefs",
+    "meal_analysis",
+    "correction_analysis",
+    "safety",
+    "insights",
+    "settings",
+    "alerts",
+    "emergency_contacts",
+    "escalation",
+    "telegram",
+    "caregivers",
+    "device_registration",
+    "api_keys",
+    "alert_stream",
+    "alert_api",
+    "treatment",
+    "research",
+    "knowledge",
+)
+for _router_module in import_routers("src.routers", ROUTER_MODULES):
+    app.include_router(_router_module.router)
 
 
 @app.get("/")
@@ -12,6 +12,7 @@ from starlette.requests import Request
 from starlette.responses import JSONResponse
 
 from src.config import settings
+from src.core.security import PasswordHashingBusyError
 
 # Use in-memory storage during tests (no Redis dependency), otherwise Redis
 _storage_uri = (
@@ -106,3 +107,14 @@ async def rate_limit_exceeded_handler(
         status_code=429,
         content={"detail": f"Rate limit exceeded: {exc.detail}"},
     )
+
+
+async def password_hashing_busy_handler(
+    request: Request, exc: PasswordHashingBusyError
+) -> JSONResponse:
+    """Return a 429 JSON response when the password hashing pool is saturated."""
+    return JSONResponse(
+        status_code=429,
+        content={"detail": "Too many sign-in requests, please retry shortly"},
+        headers={"Retry-After": "1"},
+    )
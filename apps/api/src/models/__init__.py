@@ -22,6 +22,7 @@ from src.models.escalation_event import (
     NotificationStatus,
 )
 from src.models.glucose import GlucoseReading, TrendDirection
+from src.models.glucose_rollup import GlucoseRollup
 from src.models.insulin_config import InsulinConfig
 from src.models.integration import (
     IntegrationCredential,
@@ -73,6 +74,7 @@ __all__ = [
     "EscalationEvent",
     "EscalationTier",
     "GlucoseReading",
+    "GlucoseRollup",
     "InsulinConfig",
     "InvitationStatus",
     "IntegrationCredential",
@@ -71,6 +71,8 @@ class GlucoseReading(Base):
             "reading_timestamp",
             unique=True,
         ),
+        # Range-partitioned by month (migration 052, services/partitions.py)
+        {"postgresql_partition_by": "RANGE (reading_timestamp)"},
     )
 
     id: Mapped[uuid.UUID] = mapped_column(
@@ -92,9 +94,11 @@ class GlucoseReading(Base):
         nullable=False,
     )
 
-    # Timestamp from the CGM device (when the reading was taken)
+    # Timestamp from the CGM device (when the reading was taken). Part of
+    # the primary key because it is the partition key.
     reading_timestamp: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
+        primary_key=True,
         nullable=False,
     )
 
@@ -0,0 +1,79 @@
+"""Hourly and daily glucose rollups.
+
+Pre-aggregated per-user glucose statistics over fixed UTC buckets, so the
+analytics endpoints don't rescan weeks of raw readings. Rows are
+maintained by database triggers on ``glucose_readings`` (migration 050);
+the application only reads them.
+"""
+
+import uuid
+from datetime import datetime
+
+from sqlalchemy import BigInteger, DateTime, ForeignKey, Integer, String, func
+from sqlalchemy.dialects.postgresql import JSONB, UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.models.base import Base
+
+ROLLUP_PERIOD_HOUR = "hour"
+ROLLUP_PERIOD_DAY = "day"
+
+
+class GlucoseRollup(Base):
+    """Aggregated glucose readings for one user over one UTC bucket.
+
+    Only physiologically plausible readings (20-500 mg/dL) are counted.
+    ``histogram`` maps each mg/dL value (as a string key) to the number of
+    readings with that value; CGM values are integers, so time-in-range
+    counts for any thresholds and exact percentiles can be derived from it.
+    """
+
+    __tablename__ = "glucose_rollups"
+
+    user_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("users.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+
+    # ROLLUP_PERIOD_HOUR or ROLLUP_PERIOD_DAY
+    period: Mapped[str] = mapped_column(
+        String(8),
+        primary_key=True,
+    )
+
+    # Start of the bucket (UTC, truncated to the hour or day)
+    bucket_start: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        primary_key=True,
+    )
+
+    reading_count: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+    )
+
+    # Sum of values and of squared values, for mean and SD
+    value_sum: Mapped[int] = mapped_column(
+        BigInteger,
+        nullable=False,
+    )
+
+    value_sq_sum: Mapped[int] = mapped_column(
+        BigInteger,
+        nullable=False,
+    )
+
+    histogram: Mapped[dict[str, int]] = mapped_column(
+        JSONB,
+        nullable=False,
+    )
+
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        nullable=False,
+    )
+
+    def __repr__(self) -> str:
+        return f"<GlucoseRollup(user_id={self.user_id}, period={self.period}, bucket_start={self.bucket_start}, count={self.reading_count})>"
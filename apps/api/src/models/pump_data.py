@@ -73,6 +73,8 @@ class PumpEvent(Base):
             "event_type",
             unique=True,
         ),
+        # Range-partitioned by month (migration 052, services/partitions.py)
+        {"postgresql_partition_by": "RANGE (event_timestamp)"},
     )
 
     id: Mapped[uuid.UUID] = mapped_column(
@@ -98,8 +100,10 @@ class PumpEvent(Base):
         nullable=False,
     )
 
+    # Part of the primary key because it is the partition key
     event_timestamp: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
+        primary_key=True,
         nullable=False,
     )
 
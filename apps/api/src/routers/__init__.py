@@ -1,4 +1,4 @@
 # API Routers
-from src.routers import ai, auth, disclaimer, health, integrations, system
-
-__all__ = ["ai", "auth", "disclaimer", "health", "integrations", "system"]
+#
+# Router modules are imported individually by src.main (timed for the
+# startup profile), so this package doesn't import them eagerly.
@@ -12,6 +12,7 @@ import asyncio
 from datetime import UTC, datetime
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -20,6 +21,7 @@ from src.core.encryption import decrypt_credential, encrypt_credential
 from src.database import get_db
 from src.logging_config import get_logger
 from src.models.ai_provider import AIProviderConfig, AIProviderStatus
+from src.routers.glucose_stream import format_sse_event
 from src.schemas.ai_provider import (
     SIDECAR_PROVIDER_MAP,
     AIChatRequest,
@@ -37,7 +39,9 @@ from src.schemas.ai_provider import (
     SubscriptionConfigureRequest,
 )
 from src.schemas.auth import ErrorResponse
+from src.services.ai_client import invalidate_ai_client
 from src.services.ai_provider import mask_api_key, validate_ai_api_key
+from src.services.llm_cache import invalidate_llm_cache
 from src.services.sidecar import (
     get_sidecar_auth_status,
     get_sidecar_health,
@@ -46,7 +50,12 @@ from src.services.sidecar import (
     submit_sidecar_token,
     validate_sidecar_connection,
 )
-from src.services.telegram_chat import handle_chat_web
+from src.services.telegram_chat import (
+    ChatResult,
+    handle_chat_web,
+    prepare_chat_web,
+    stream_chat_web,
+)
 
 logger = get_logger(__name__)
 
@@ -195,6 +204,8 @@ async def configure_ai_provider(
 
     await db.commit()
     await db.refresh(config)
+    invalidate_ai_client(current_user.id)
+    await invalidate_llm_cache(current_user.id)
 
     logger.info(
         "AI provider configured successfully",
@@ -247,6 +258,8 @@ async def delete_ai_provider(
 
     await db.delete(config)
     await db.commit()
+    invalidate_ai_client(current_user.id)
+    await invalidate_llm_cache(current_user.id)
 
     logger.info(
         "AI provider configuration removed",
@@ -393,6 +406,68 @@ async def ai_chat(
     )
 
 
+@router.post(
+    "/chat/stream",
+    responses={
+        200: {
+            "description": "AI chat response as Server-Sent Events",
+            "content": {"text/event-stream": {}},
+        },
+        401: {"model": ErrorResponse, "description": "Not authenticated"},
+        403: {"model": ErrorResponse, "description": "Permission denied"},
+        404: {"model": ErrorResponse, "description": "No AI provider configured"},
+    },
+)
+async def ai_chat_stream(
+    request: AIChatRequest,
+    current_user: DiabeticOrAdminUser,
+    db: AsyncSession = Depends(get_db),
+) -> StreamingResponse:
+    """Send a message to the AI and stream the response as it is generated.
+
+    Emits ``token`` events with text deltas, then a ``done`` event with the
+    final safety-validated response (which replaces the streamed text) and
+    message IDs. Tokens stop as soon as the reply trips the dangerous
+    content check, so blocked text never reaches the browser. A provider
+    failure mid-stream ends with an ``error`` event.
+    """
+    turn = await prepare_chat_web(db, current_user.id, request.message)
+    # Release the request's connection while tokens stream; the reply is
+    # stored on a fresh session once it completes
+    await db.close()
+
+    async def event_generator():
+        try:
+            async for item in stream_chat_web(turn):
+                if isinstance(item, ChatResult):
+                    yield format_sse_event("done", _chat_done_payload(item))
+                else:
+                    yield format_sse_event("token", {"text": item})
+        except HTTPException as exc:
+            yield format_sse_event("error", {"detail": exc.detail})
+
+    return StreamingResponse(
+        event_generator(),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache, no-store, must-revalidate",
+            "X-Accel-Buffering": "no",  # Disable nginx buffering
+        },
+    )
+
+
+def _chat_done_payload(result: ChatResult) -> dict:
+    return {
+        "response": result.content,
+        "disclaimer": "Not medical advice. Consult your healthcare provider.",
+        "conversation_id": str(result.conversation_id),
+        "message_id": str(result.assistant_message_id)
+        if result.assistant_message_id
+        else None,
+        "safety_status": result.safety_status.value,
+    }
+
+
 # ── Story 35.3: Chat History Endpoints ──
 
 
@@ -554,6 +629,8 @@ async def configure_subscription_provider(
 
     await db.commit()
     await db.refresh(config)
+    invalidate_ai_client(current_user.id)
+    await invalidate_llm_cache(current_user.id)
 
     logger.info(
         "Subscription provider configured via sidecar",
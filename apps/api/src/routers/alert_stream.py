@@ -8,8 +8,9 @@ import asyncio
 import json
 import uuid as uuid_mod
 from datetime import UTC, datetime
+from typing import Annotated
 
-from fastapi import APIRouter, Request
+from fastapi import APIRouter, Header, Request
 from fastapi.responses import StreamingResponse
 
 from src.core.auth import CurrentUser
@@ -19,9 +20,13 @@ from src.models.alert import Alert
 from src.models.caregiver_link import CaregiverLink
 from src.models.user import UserRole
 from src.routers.alert_api import alert_to_dict
+from src.services.event_hub import ALERT_CHANNEL, event_hub
+from src.services.stream_events import parse_last_event_id
 
 logger = get_logger(__name__)
 
+HEARTBEAT_INTERVAL_SECONDS = 30
+
 router = APIRouter(prefix="/api/v1/alerts", tags=["alert-stream"])
 
 
@@ -88,19 +93,45 @@ async def _get_alerts_for_user(
         return [alert_to_dict(a, patient_name=patient_name) for a in alerts]
 
 
+def _alert_stream_payload(alert: dict, patient_name: str | None) -> dict:
+    """Project a hub alert payload onto the alert_to_dict() shape."""
+    d = {
+        "id": alert["id"],
+        "alert_type": alert["alert_type"],
+        "severity": alert["severity"],
+        "current_value": alert["current_value"],
+        "predicted_value": alert["predicted_value"],
+        "iob_value": alert["iob_value"],
+        "message": alert["message"],
+        "trend_rate": alert["trend_rate"],
+        "timestamp": alert["created_at"],
+        "acknowledged": alert["acknowledged"],
+    }
+    if patient_name is not None:
+        d["patient_name"] = patient_name
+    return d
+
+
 async def generate_alert_stream(
     user_id: str,
     user_role: UserRole,
     request: Request,
+    last_event_id: int | None = None,
 ) -> None:
     """Async generator that yields SSE events with alert data.
 
     For diabetic users: streams their own alerts.
     For caregiver users: streams alerts from patients with can_receive_alerts=True.
+
+    Alerts that are already active are sent on connect; after that, new
+    alerts are pushed from the event hub as the alert engine creates them,
+    with a heartbeat every 30 seconds while idle. Caregiver links are
+    resolved on connect, so link changes apply on the next reconnect.
+
+    A client reconnecting with ``Last-Event-ID`` gets only the alerts it
+    missed, replayed from the hub's buffer, when the buffer still covers
+    that ID; otherwise it gets the full snapshot.
     """
-    heartbeat_interval = 30
-    alert_poll_interval = 15
-    event_counter = 0
     delivered_alert_ids: set[str] = set()
     max_delivered_ids = 500
 
@@ -108,44 +139,49 @@ async def generate_alert_stream(
 
     logger.info("Alert SSE stream started", user_id=user_id, role=user_role.value)
 
-    try:
-        while True:
-            if await request.is_disconnected():
-                logger.info("Alert SSE client disconnected", user_id=user_id)
-                break
+    # Whose alerts this stream carries, and the label to attach to each
+    patient_names: dict[str, str | None] = {}
+    subscription = None
 
-            event_counter += 1
+    try:
+        if user_role == UserRole.CAREGIVER:
+            patients = await _get_patient_ids_for_caregiver(user_uuid)
+            patient_names = {str(pid): email for pid, email in patients}
+        else:
+            patient_names = {user_id: None}
+
+        # Subscribe before the snapshot so nothing published in between is lost
+        keys = [(ALERT_CHANNEL, owner_id) for owner_id in patient_names]
+        subscription = event_hub.subscribe(keys)
+        replayed = (
+            event_hub.replay(keys, last_event_id) if last_event_id is not None else None
+        )
 
+        # (alert, SSE event ID) pairs waiting to be sent
+        pending: list[tuple[dict, str | None]] = []
+        if replayed is not None:
+            logger.info(
+                "Alert SSE stream resumed",
+                user_id=user_id,
+                last_event_id=last_event_id,
+                replayed=len(replayed),
+            )
+            pending = [
+                (
+                    _alert_stream_payload(e.data, patient_names.get(e.user_id)),
+                    str(e.id),
+                )
+                for e in replayed
+            ]
+        else:
+            cursor = event_hub.last_event_id
+            snapshot_id = str(cursor) if cursor else None
             try:
-                all_alerts: list[dict] = []
-
-                if user_role == UserRole.CAREGIVER:
-                    patients = await _get_patient_ids_for_caregiver(user_uuid)
-                    for patient_id, patient_email in patients:
-                        patient_alerts = await _get_alerts_for_user(
-                            patient_id,
-                            patient_name=patient_email,
-                        )
-                        all_alerts.extend(patient_alerts)
-                else:
-                    all_alerts = await _get_alerts_for_user(user_uuid)
-
-                for alert in all_alerts:
-                    alert_id = alert["id"]
-                    if alert_id not in delivered_alert_ids:
-                        delivered_alert_ids.add(alert_id)
-                        # Prevent unbounded growth: trim oldest entries
-                        if len(delivered_alert_ids) > max_delivered_ids:
-                            to_remove = len(delivered_alert_ids) - max_delivered_ids
-                            for _ in range(to_remove):
-                                delivered_alert_ids.pop()
-                        event_counter += 1
-                        yield format_sse_event(
-                            event_type="alert",
-                            data=alert,
-                            event_id=str(event_counter),
-                        )
-
+                for owner_id, patient_name in patient_names.items():
+                    alerts = await _get_alerts_for_user(
+                        uuid_mod.UUID(owner_id), patient_name=patient_name
+                    )
+                    pending.extend((alert, snapshot_id) for alert in alerts)
             except Exception as e:
                 logger.error(
                     "Error fetching alerts for SSE",
@@ -153,19 +189,43 @@ async def generate_alert_stream(
                     error=str(e),
                 )
 
-            await asyncio.sleep(alert_poll_interval)
+        while True:
+            for alert, event_id in pending:
+                alert_id = alert["id"]
+                if alert_id in delivered_alert_ids:
+                    continue
+                delivered_alert_ids.add(alert_id)
+                # Prevent unbounded growth: trim oldest entries
+                if len(delivered_alert_ids) > max_delivered_ids:
+                    to_remove = len(delivered_alert_ids) - max_delivered_ids
+                    for _ in range(to_remove):
+                        delivered_alert_ids.pop()
+                yield format_sse_event(
+                    event_type="alert",
+                    data=alert,
+                    event_id=event_id,
+                )
 
             if await request.is_disconnected():
+                logger.info("Alert SSE client disconnected", user_id=user_id)
                 break
 
-            event_counter += 1
-            yield format_sse_event(
-                event_type="heartbeat",
-                data={"timestamp": datetime.now(UTC).isoformat()},
-                event_id=str(event_counter),
-            )
+            event = await subscription.get(timeout=HEARTBEAT_INTERVAL_SECONDS)
+            if event is None:
+                # No ID, so the client's resume point stays on the last alert
+                yield format_sse_event(
+                    event_type="heartbeat",
+                    data={"timestamp": datetime.now(UTC).isoformat()},
+                )
+                pending = []
+                continue
 
-            await asyncio.sleep(heartbeat_interval - alert_poll_interval)
+            pending = [
+                (
+                    _alert_stream_payload(event.data, patient_names.get(event.user_id)),
+                    str(event.id),
+                )
+            ]
 
     except asyncio.CancelledError:
         logger.info("Alert SSE stream cancelled", user_id=user_id)
@@ -173,6 +233,8 @@ async def generate_alert_stream(
         logger.error("Alert SSE stream error", user_id=user_id, error=str(e))
         raise
     finally:
+        if subscription is not None:
+            subscription.close()
         logger.info("Alert SSE stream ended", user_id=user_id)
 
 
@@ -189,11 +251,14 @@ async def generate_alert_stream(
 async def stream_alerts(
     request: Request,
     current_user: CurrentUser,
+    last_event_id: Annotated[str | None, Header()] = None,
 ) -> StreamingResponse:
     """Stream alerts via Server-Sent Events.
 
     For diabetic users: streams their own alerts.
     For caregiver users: streams alerts from patients with can_receive_alerts=True.
+
+    Send `Last-Event-ID` on reconnect to receive only missed alerts.
     """
     logger.info(
         "Alert SSE stream requested",
@@ -206,6 +271,7 @@ async def stream_alerts(
             str(current_user.id),
             current_user.role,
             request,
+            last_event_id=parse_last_event_id(last_event_id),
         ),
         media_type="text/event-stream",
         headers={
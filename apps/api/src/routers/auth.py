@@ -19,8 +19,8 @@ from src.core.security import (
     create_refresh_token,
     decode_access_token,
     decode_refresh_token,
-    hash_password,
-    verify_password,
+    hash_password_async,
+    verify_password_async,
 )
 from src.core.token_blacklist import (
     blacklist_token,
@@ -129,7 +129,7 @@ async def register_user(
     # Create new user
     user = User(
         email=request.email.lower(),
-        hashed_password=hash_password(request.password),
+        hashed_password=await hash_password_async(request.password),
         role=UserRole.DIABETIC,
         is_active=True,
         email_verified=False,
@@ -202,7 +202,7 @@ async def login(
     # Constant-time credential check: always run bcrypt even for non-existing
     # users to prevent timing-based user enumeration (CWE-208).
     if not user:
-        verify_password(body.password, _DUMMY_HASH)
+        await verify_password_async(body.password, _DUMMY_HASH)
         logger.warning(
             "Failed login attempt",
             email=body.email,
@@ -213,7 +213,7 @@ async def login(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid email or password",
         )
-    if not verify_password(body.password, user.hashed_password):
+    if not await verify_password_async(body.password, user.hashed_password):
         logger.warning(
             "Failed login attempt",
             email=body.email,
@@ -300,7 +300,7 @@ async def mobile_login(
 
     # Constant-time credential check (same pattern as web login)
     if not user:
-        verify_password(body.password, _DUMMY_HASH)
+        await verify_password_async(body.password, _DUMMY_HASH)
         logger.warning(
             "Failed mobile login attempt",
             email=body.email,
@@ -311,7 +311,7 @@ async def mobile_login(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid email or password",
         )
-    if not verify_password(body.password, user.hashed_password):
+    if not await verify_password_async(body.password, user.hashed_password):
         logger.warning(
             "Failed mobile login attempt",
             email=body.email,
@@ -618,13 +618,15 @@ async def change_password(
     Raises:
         HTTPException 400: If current password is incorrect
     """
-    if not verify_password(body.current_password, current_user.hashed_password):
+    if not await verify_password_async(
+        body.current_password, current_user.hashed_password
+    ):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Current password is incorrect",
         )
 
-    current_user.hashed_password = hash_password(body.new_password)
+    current_user.hashed_password = await hash_password_async(body.new_password)
     await db.commit()
 
     # Blacklist the current token to force re-authentication (Story 28.3)
@@ -15,7 +15,7 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.core.auth import CurrentUser, require_caregiver, require_diabetic
-from src.core.security import hash_password
+from src.core.security import hash_password_async
 from src.database import get_db
 from src.logging_config import get_logger
 from src.models.caregiver_link import CaregiverLink
@@ -234,7 +234,7 @@ async def accept_caregiver_invitation(
     and establishes the caregiver-patient link.
     No authentication required — the token acts as authorization.
     """
-    hashed_pw = hash_password(data.password)
+    hashed_pw = await hash_password_async(data.password)
 
     try:
         caregiver, _invitation = await accept_invitation(
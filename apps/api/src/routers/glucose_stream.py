@@ -9,19 +9,49 @@ import asyncio
 import json
 import uuid as uuid_mod
 from datetime import UTC, datetime
+from typing import Annotated
 
-from fastapi import APIRouter, Request
+from fastapi import APIRouter, Header, Request
 from fastapi.responses import StreamingResponse
 
 from src.core.auth import DiabeticOrAdminUser
 from src.database import get_db_session
 from src.logging_config import get_logger
-from src.services.dexcom_sync import get_latest_glucose_reading
-from src.services.iob_projection import get_iob_projection, get_user_dia
+from src.services.event_hub import (
+    ALERT_CHANNEL,
+    GLUCOSE_CHANNEL,
+    HubEvent,
+    event_hub,
+)
 from src.services.predictive_alerts import get_active_alerts
+from src.services.stream_events import (
+    alert_event_payload,
+    build_glucose_payload,
+    parse_last_event_id,
+    refresh_glucose_payload,
+)
 
 logger = get_logger(__name__)
 
+HEARTBEAT_INTERVAL_SECONDS = 30
+# Re-send the last reading (with refreshed age and IoB) this often while idle
+GLUCOSE_REFRESH_SECONDS = 60
+
+_ALERT_FIELDS = (
+    "id",
+    "alert_type",
+    "severity",
+    "current_value",
+    "predicted_value",
+    "prediction_minutes",
+    "iob_value",
+    "message",
+    "trend_rate",
+    "source",
+    "created_at",
+    "expires_at",
+)
+
 router = APIRouter(prefix="/api/v1/glucose", tags=["glucose-stream"])
 
 
@@ -45,173 +75,177 @@ def format_sse_event(event_type: str, data: dict, event_id: str | None = None) -
     return "\n".join(lines) + "\n"
 
 
+def _glucose_stream_alert(alert: dict) -> dict:
+    """Project a hub alert payload onto the glucose stream's alert fields."""
+    return {field: alert.get(field) for field in _ALERT_FIELDS}
+
+
 async def generate_glucose_stream(
     user_id: str,
     request: Request,
+    last_event_id: int | None = None,
 ) -> None:
     """Async generator that yields SSE events with glucose data.
 
-    Sends glucose updates every 60 seconds and heartbeats every 30 seconds.
+    Sends the current glucose state and active alerts on connect, then
+    waits on the event hub: new readings and alerts are pushed as soon as
+    ingestion publishes them, without polling the database. While idle,
+    a heartbeat is sent every 30 seconds and the last reading is re-sent
+    every 60 seconds with its age and IoB brought up to date (no database
+    access).
     Handles client disconnection gracefully.
 
-    Note: Creates a fresh database session for each query to avoid
-    connection pool exhaustion and stale session issues.
+    Pushed events carry their hub event ID. When the client reconnects
+    with ``Last-Event-ID`` and the hub's replay buffer still covers it,
+    only the missed events are sent (from memory) instead of the snapshot.
+    Heartbeats and idle refreshes carry no ID so they don't move the
+    client's resume point.
 
     Args:
         user_id: The authenticated user's ID
         request: The HTTP request (for disconnect detection)
+        last_event_id: Event ID the client last received, if resuming
 
     Yields:
         SSE-formatted event strings
     """
-    heartbeat_interval = 30  # seconds
-    glucose_interval = 60  # seconds
-    last_glucose_check = 0
-    event_counter = 0
     delivered_alert_ids: set[str] = set()  # Track alerts sent this connection
+    last_glucose: dict | None = None
 
     logger.info("SSE stream started", user_id=user_id)
 
-    try:
-        while True:
-            # Check if client disconnected
-            if await request.is_disconnected():
-                logger.info("SSE client disconnected", user_id=user_id)
-                break
+    # Subscribe before the snapshot so nothing published in between is lost
+    keys = [(GLUCOSE_CHANNEL, user_id), (ALERT_CHANNEL, user_id)]
+    subscription = event_hub.subscribe(keys)
+    replayed = (
+        event_hub.replay(keys, last_event_id) if last_event_id is not None else None
+    )
+
+    def render(event: HubEvent) -> str | None:
+        nonlocal last_glucose
+        if event.channel == GLUCOSE_CHANNEL:
+            last_glucose = event.data
+            return format_sse_event(
+                event_type="glucose",
+                data=refresh_glucose_payload(event.data),
+                event_id=str(event.id),
+            )
+        if event.channel == ALERT_CHANNEL:
+            alert_id = event.data["id"]
+            if alert_id in delivered_alert_ids:
+                return None
+            delivered_alert_ids.add(alert_id)
+            return format_sse_event(
+                event_type="alert",
+                data=_glucose_stream_alert(event.data),
+                event_id=str(event.id),
+            )
+        return None
 
-            current_time = asyncio.get_event_loop().time()
-            event_counter += 1
-
-            # Send glucose data every 60 seconds (or immediately on first request)
-            if (
-                current_time - last_glucose_check >= glucose_interval
-                or last_glucose_check == 0
-            ):
-                last_glucose_check = current_time
-
-                try:
-                    # Create fresh database session for each query (Issue 4 fix)
-                    async with get_db_session() as db:
-                        # Get latest glucose reading
-                        latest = await get_latest_glucose_reading(db, user_id)
-
-                        if latest:
-                            now = datetime.now(UTC)
-                            reading_time = latest.reading_timestamp
-                            if reading_time.tzinfo is None:
-                                reading_time = reading_time.replace(tzinfo=UTC)
-
-                            minutes_ago = int((now - reading_time).total_seconds() / 60)
-                            is_stale = minutes_ago > 10
-
-                            # Get IoB projection if available
-                            iob_data = None
-                            try:
-                                dia = await get_user_dia(db, user_id)
-                                projection = await get_iob_projection(
-                                    db, user_id, dia_hours=dia
-                                )
-                                if projection:
-                                    iob_data = {
-                                        "current": projection.projected_iob,
-                                        "is_stale": projection.is_stale,
-                                    }
-                            except Exception as e:
-                                logger.warning(
-                                    "Failed to get IoB projection", error=str(e)
-                                )
-
-                            glucose_event = {
-                                "value": latest.value,
-                                "trend": latest.trend.value
-                                if latest.trend
-                                else "Unknown",
-                                "trend_rate": latest.trend_rate,
-                                "reading_timestamp": latest.reading_timestamp.isoformat(),
-                                "minutes_ago": minutes_ago,
-                                "is_stale": is_stale,
-                                "iob": iob_data,
-                                "timestamp": now.isoformat(),
-                            }
-
-                            yield format_sse_event(
-                                event_type="glucose",
-                                data=glucose_event,
-                                event_id=str(event_counter),
-                            )
-                        else:
-                            # No readings available
-                            yield format_sse_event(
-                                event_type="no_data",
-                                data={
-                                    "message": "No glucose readings available",
-                                    "timestamp": datetime.now(UTC).isoformat(),
-                                },
-                                event_id=str(event_counter),
-                            )
-
-                except Exception as e:
-                    logger.error("Error fetching glucose data for SSE", error=str(e))
+    try:
+        if replayed is not None:
+            logger.info(
+                "SSE stream resumed",
+                user_id=user_id,
+                last_event_id=last_event_id,
+                replayed=len(replayed),
+            )
+            for event in replayed:
+                message = render(event)
+                if message:
+                    yield message
+        else:
+            # Initial snapshot, tagged with the hub position it reflects so a
+            # reconnect can resume from here
+            cursor = event_hub.last_event_id
+            snapshot_id = str(cursor) if cursor else None
+            try:
+                # Create fresh database session for each query (Issue 4 fix)
+                async with get_db_session() as db:
+                    last_glucose = await build_glucose_payload(db, user_id)
+
+                if last_glucose:
+                    yield format_sse_event(
+                        event_type="glucose",
+                        data=refresh_glucose_payload(last_glucose),
+                        event_id=snapshot_id,
+                    )
+                else:
+                    # No readings available
                     yield format_sse_event(
-                        event_type="error",
+                        event_type="no_data",
                         data={
-                            "message": "Failed to fetch glucose data",
+                            "message": "No glucose readings available",
                             "timestamp": datetime.now(UTC).isoformat(),
                         },
-                        event_id=str(event_counter),
+                        event_id=snapshot_id,
                     )
 
-                # Story 6.3: Check for new active alerts to deliver
-                try:
-                    async with get_db_session() as alert_db:
-                        user_uuid = uuid_mod.UUID(user_id)
-                        active_alerts = await get_active_alerts(
-                            alert_db, user_uuid, limit=10
-                        )
-                        for alert in active_alerts:
-                            alert_id_str = str(alert.id)
-                            if alert_id_str not in delivered_alert_ids:
-                                delivered_alert_ids.add(alert_id_str)
-                                event_counter += 1
-                                yield format_sse_event(
-                                    event_type="alert",
-                                    data={
-                                        "id": alert_id_str,
-                                        "alert_type": alert.alert_type.value,
-                                        "severity": alert.severity.value,
-                                        "current_value": alert.current_value,
-                                        "predicted_value": alert.predicted_value,
-                                        "prediction_minutes": alert.prediction_minutes,
-                                        "iob_value": alert.iob_value,
-                                        "message": alert.message,
-                                        "trend_rate": alert.trend_rate,
-                                        "source": alert.source,
-                                        "created_at": alert.created_at.isoformat(),
-                                        "expires_at": alert.expires_at.isoformat(),
-                                    },
-                                    event_id=str(event_counter),
-                                )
-                except Exception as e:
-                    logger.warning(
-                        "Error checking alerts for SSE",
-                        user_id=user_id,
-                        error=str(e),
+            except Exception as e:
+                logger.error("Error fetching glucose data for SSE", error=str(e))
+                yield format_sse_event(
+                    event_type="error",
+                    data={
+                        "message": "Failed to fetch glucose data",
+                        "timestamp": datetime.now(UTC).isoformat(),
+                    },
+                )
+
+            # Story 6.3: Deliver alerts that were already active on connect
+            try:
+                async with get_db_session() as alert_db:
+                    user_uuid = uuid_mod.UUID(user_id)
+                    active_alerts = await get_active_alerts(
+                        alert_db, user_uuid, limit=10
                     )
+                for alert in active_alerts:
+                    delivered_alert_ids.add(str(alert.id))
+                    yield format_sse_event(
+                        event_type="alert",
+                        data=_glucose_stream_alert(alert_event_payload(alert)),
+                        event_id=snapshot_id,
+                    )
+            except Exception as e:
+                logger.warning(
+                    "Error checking alerts for SSE",
+                    user_id=user_id,
+                    error=str(e),
+                )
 
-            # Wait for heartbeat interval then send heartbeat
-            await asyncio.sleep(heartbeat_interval)
+        loop = asyncio.get_running_loop()
+        last_glucose_sent = loop.time()
 
-            # Check for disconnect again after sleep
+        while True:
+            # Check if client disconnected
             if await request.is_disconnected():
-                logger.info("SSE client disconnected during sleep", user_id=user_id)
+                logger.info("SSE client disconnected", user_id=user_id)
                 break
 
-            event_counter += 1
-            yield format_sse_event(
-                event_type="heartbeat",
-                data={"timestamp": datetime.now(UTC).isoformat()},
-                event_id=str(event_counter),
-            )
+            event = await subscription.get(timeout=HEARTBEAT_INTERVAL_SECONDS)
+
+            if event is None:
+                # Idle: keep the connection alive and the reading age and IoB current
+                if (
+                    last_glucose is not None
+                    and loop.time() - last_glucose_sent >= GLUCOSE_REFRESH_SECONDS
+                ):
+                    last_glucose_sent = loop.time()
+                    yield format_sse_event(
+                        event_type="glucose",
+                        data=refresh_glucose_payload(last_glucose),
+                    )
+
+                yield format_sse_event(
+                    event_type="heartbeat",
+                    data={"timestamp": datetime.now(UTC).isoformat()},
+                )
+                continue
+
+            message = render(event)
+            if message:
+                if event.channel == GLUCOSE_CHANNEL:
+                    last_glucose_sent = loop.time()
+                yield message
 
     except asyncio.CancelledError:
         logger.info("SSE stream cancelled", user_id=user_id)
@@ -219,6 +253,7 @@ async def generate_glucose_stream(
         logger.error("SSE stream error", user_id=user_id, error=str(e))
         raise
     finally:
+        subscription.close()
         logger.info("SSE stream ended", user_id=user_id)
 
 
@@ -236,6 +271,7 @@ async def generate_glucose_stream(
 async def stream_glucose(
     request: Request,
     current_user: DiabeticOrAdminUser,
+    last_event_id: Annotated[str | None, Header()] = None,
 ) -> StreamingResponse:
     """Stream glucose updates via Server-Sent Events.
 
@@ -246,9 +282,13 @@ async def stream_glucose(
     - `no_data`: Sent when no glucose readings are available
     - `error`: Sent when there's an error fetching data
 
-    The stream sends glucose updates every 60 seconds to match
-    the CGM update frequency (Dexcom G6/G7 updates every 5 minutes,
-    but we check more frequently for freshness).
+    New readings and alerts are pushed as soon as they are ingested
+    (via the event hub); while idle the last reading is re-sent every
+    60 seconds with an updated age.
+
+    Reconnecting clients (EventSource does this automatically) may send
+    `Last-Event-ID`; if the missed events are still buffered, only those
+    are replayed instead of a fresh snapshot.
 
     Returns:
         StreamingResponse with SSE content type
@@ -261,7 +301,11 @@ async def stream_glucose(
 
     # Issue 1 fix: Remove CORS header - let CORS middleware handle it
     return StreamingResponse(
-        generate_glucose_stream(str(current_user.id), request),
+        generate_glucose_stream(
+            str(current_user.id),
+            request,
+            last_event_id=parse_last_event_id(last_event_id),
+        ),
         media_type="text/event-stream",
         headers={
             "Cache-Control": "no-cache, no-store, must-revalidate",
@@ -6,6 +6,7 @@ from fastapi import APIRouter, Response, status
 from fastapi.responses import JSONResponse
 
 from src.database import check_database_connection
+from src.services.embedding import get_model_status
 
 router = APIRouter(tags=["Health"])
 
@@ -61,8 +62,14 @@ async def readiness_probe() -> Response:
     Returns success if the application is ready to serve traffic.
     Checks database connectivity to ensure the service can handle requests.
     If this fails, Kubernetes will stop routing traffic to this pod.
+
+    The embedding model warms up in the background after startup and is
+    reported as ``embedding_model`` (cold, loading, ready or failed). It
+    doesn't gate readiness: until it is ready, chat answers without
+    retrieved clinical knowledge.
     """
     db_connected = await check_database_connection()
+    embedding_model = get_model_status().value
 
     if db_connected:
         return JSONResponse(
@@ -70,6 +77,7 @@ async def readiness_probe() -> Response:
             content={
                 "status": "ready",
                 "database": "connected",
+                "embedding_model": embedding_model,
             },
         )
     else:
@@ -78,5 +86,6 @@ async def readiness_probe() -> Response:
             content={
                 "status": "not_ready",
                 "database": "disconnected",
+                "embedding_model": embedding_model,
             },
         )
@@ -3,15 +3,15 @@
 API endpoints for managing third-party integrations (Dexcom, Tandem) and data sync.
 """
 
-import math
 import uuid
 import zoneinfo
+from collections import Counter
 from datetime import UTC, datetime, timedelta
 
 from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
 from pydexcom import Dexcom
 from pydexcom import errors as dexcom_errors
-from sqlalchemy import and_, case, func, select, text
+from sqlalchemy import func, select, text
 from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from tconnectsync.api.common import ApiException
@@ -75,15 +75,25 @@ from src.schemas.pump import (
     TandemUploadStatusResponse,
     TandemUploadTriggerResponse,
 )
+from src.services.bulk_ingest import bulk_insert_ignore_conflicts, ingest_pump_events
 from src.services.dexcom_sync import (
     DexcomAuthError,
     DexcomConnectionError,
     DexcomSyncError,
+    dexcom_sessions,
     get_glucose_readings,
     get_latest_glucose_reading,
+    run_dexcom_call,
     sync_dexcom_for_user,
 )
+from src.services.diabetes_context import invalidate_diabetes_context
+from src.services.glucose_rollups import (
+    GlucoseSummary,
+    summarize_glucose,
+    summarize_glucose_by_local_hour,
+)
 from src.services.iob_projection import get_iob_projection, get_user_dia
+from src.services.stream_events import publish_glucose_update
 from src.services.tandem_sync import (
     TandemAuthError,
     TandemConnectionError,
@@ -288,8 +298,9 @@ async def connect_dexcom(
     Validates the provided credentials and stores them encrypted
     in the database. If credentials already exist, they are updated.
     """
-    # Validate credentials first
-    is_valid, error_message = validate_dexcom_credentials(
+    # Validate credentials first (blocking Share login runs in the Dexcom pool)
+    is_valid, error_message = await run_dexcom_call(
+        validate_dexcom_credentials,
         request.username,
         request.password,
     )
@@ -335,6 +346,7 @@ async def connect_dexcom(
 
     await db.commit()
     await db.refresh(credential)
+    dexcom_sessions.invalidate(current_user.id)
 
     logger.info(
         "Dexcom connected successfully",
@@ -382,6 +394,7 @@ async def disconnect_dexcom(
 
     await db.delete(credential)
     await db.commit()
+    dexcom_sessions.invalidate(current_user.id)
 
     logger.info(
         "Dexcom disconnected",
@@ -875,27 +888,10 @@ async def get_time_in_range(
         else:
             now = datetime.now(UTC)
             cutoff = now - timedelta(minutes=minutes)
-        result = await db.execute(
-            select(
-                func.count().label("total"),
-                func.sum(
-                    case((GlucoseReading.value < low_threshold, 1), else_=0)
-                ).label("low_count"),
-                func.sum(
-                    case((GlucoseReading.value > high_threshold, 1), else_=0)
-                ).label("high_count"),
-            ).where(
-                GlucoseReading.user_id == current_user.id,
-                GlucoseReading.reading_timestamp >= cutoff,
-                GlucoseReading.reading_timestamp < now,
-                GlucoseReading.value >= 20,
-                GlucoseReading.value <= 500,
-            )
-        )
-        row = result.one()
-        count = row.total
-        low_count = row.low_count or 0
-        high_count = row.high_count or 0
+        summary = await summarize_glucose(db, current_user.id, cutoff, now)
+        count = summary.count
+        low_count = summary.count_where(lambda v: v < low_threshold)
+        high_count = summary.count_where(lambda v: v > high_threshold)
 
         if count == 0:
             return TimeInRangeResponse(
@@ -1000,72 +996,19 @@ async def _query_5_buckets(
     high: float,
     urgent_high: float,
 ) -> dict:
-    """Query 5-bucket TIR counts for a time window.
+    """Count readings in each of the 5 TIR buckets for a time window.
 
     Filters to physiologically plausible glucose values (20-500 mg/dL)
     to prevent sensor errors or corrupt data from skewing percentages.
     """
-    result = await db.execute(
-        select(
-            func.count().label("total"),
-            func.sum(case((GlucoseReading.value < urgent_low, 1), else_=0)).label(
-                "urgent_low_count"
-            ),
-            func.sum(
-                case(
-                    (
-                        and_(
-                            GlucoseReading.value >= urgent_low,
-                            GlucoseReading.value < low,
-                        ),
-                        1,
-                    ),
-                    else_=0,
-                )
-            ).label("low_count"),
-            func.sum(
-                case(
-                    (
-                        and_(
-                            GlucoseReading.value >= low,
-                            GlucoseReading.value <= high,
-                        ),
-                        1,
-                    ),
-                    else_=0,
-                )
-            ).label("in_range_count"),
-            func.sum(
-                case(
-                    (
-                        and_(
-                            GlucoseReading.value > high,
-                            GlucoseReading.value <= urgent_high,
-                        ),
-                        1,
-                    ),
-                    else_=0,
-                )
-            ).label("high_count"),
-            func.sum(case((GlucoseReading.value > urgent_high, 1), else_=0)).label(
-                "urgent_high_count"
-            ),
-        ).where(
-            GlucoseReading.user_id == user_id,
-            GlucoseReading.reading_timestamp >= start,
-            GlucoseReading.reading_timestamp < end,
-            GlucoseReading.value >= 20,
-            GlucoseReading.value <= 500,
-        )
-    )
-    row = result.one()
+    summary = await summarize_glucose(db, user_id, start, end)
     return {
-        "total": row.total or 0,
-        "urgent_low_count": row.urgent_low_count or 0,
-        "low_count": row.low_count or 0,
-        "in_range_count": row.in_range_count or 0,
-        "high_count": row.high_count or 0,
-        "urgent_high_count": row.urgent_high_count or 0,
+        "total": summary.count,
+        "urgent_low_count": summary.count_where(lambda v: v < urgent_low),
+        "low_count": summary.count_where(lambda v: urgent_low <= v < low),
+        "in_range_count": summary.count_where(lambda v: low <= v <= high),
+        "high_count": summary.count_where(lambda v: high < v <= urgent_high),
+        "urgent_high_count": summary.count_where(lambda v: v > urgent_high),
     }
 
 
@@ -1505,8 +1448,9 @@ async def push_pump_events(
 ) -> PumpPushResponse:
     """Accept a batch of pump events from a mobile client.
 
-    Uses PostgreSQL ON CONFLICT DO NOTHING on the existing unique index
-    (user_id, event_timestamp, event_type) for idempotent inserts.
+    Uses chunked multi-row PostgreSQL ON CONFLICT DO NOTHING inserts on the
+    existing unique index (user_id, event_timestamp, event_type) for
+    idempotent inserts; RETURNING keeps accepted/duplicate counts exact.
     """
     now = datetime.now(UTC)
     rows = []
@@ -1531,17 +1475,9 @@ async def push_pump_events(
             }
         )
 
-    stmt = (
-        pg_insert(PumpEvent)
-        .values(rows)
-        .on_conflict_do_nothing(
-            index_elements=["user_id", "event_timestamp", "event_type"],
-        )
-    )
-    result = await db.execute(stmt)
-
-    accepted = max(result.rowcount, 0)
-    duplicates = len(rows) - accepted
+    ingest = await ingest_pump_events(db, rows)
+    accepted = ingest.inserted
+    duplicates = ingest.duplicates
 
     # Store raw events for Tandem cloud upload (Story 16.6)
     raw_accepted = 0
@@ -1557,16 +1493,11 @@ async def push_pump_events(
             }
             for item in body.raw_events
         ]
-        raw_stmt = (
-            pg_insert(PumpRawEvent)
-            .values(raw_rows)
-            .on_conflict_do_nothing(
-                constraint="uq_pump_raw_event_user_seq",
-            )
+        raw_ingest = await bulk_insert_ignore_conflicts(
+            db, PumpRawEvent, raw_rows, constraint="uq_pump_raw_event_user_seq"
         )
-        raw_result = await db.execute(raw_stmt)
-        raw_accepted = max(raw_result.rowcount, 0)
-        raw_duplicates = len(raw_rows) - raw_accepted
+        raw_accepted = raw_ingest.inserted
+        raw_duplicates = raw_ingest.duplicates
 
     # Upsert pump hardware info (Story 16.6)
     if body.pump_info:
@@ -1608,6 +1539,11 @@ async def push_pump_events(
 
     await db.commit()
 
+    # New pump events change IoB on open SSE streams
+    if accepted:
+        invalidate_diabetes_context(current_user.id, "iob", "pump", "control_iq")
+        await publish_glucose_update(current_user.id)
+
     logger.info(
         "Mobile pump push",
         user_id=str(current_user.id),
@@ -1791,7 +1727,7 @@ async def trigger_tandem_upload(
 
 # --- Story 30.1: Aggregate statistics endpoints ---
 
-# Maximum rows to load into memory for percentile calculation
+# Maximum rows to load into memory for the raw percentile fallback
 _AGP_MAX_ROWS = 50_000
 # Hard safety cap for insulin units (Tandem X2/Mobi max single bolus = 25U)
 _MAX_BOLUS_UNITS = 25
@@ -1879,19 +1815,6 @@ async def _best_source(
     return None
 
 
-def _compute_percentile(data: list[float], pct: float) -> float:
-    """Compute percentile using linear interpolation (matching numpy default)."""
-    if not data:
-        return 0.0
-    sorted_data = sorted(data)
-    k = (len(sorted_data) - 1) * (pct / 100)
-    f = math.floor(k)
-    c = math.ceil(k)
-    if f == c:
-        return round(sorted_data[int(k)], 1)
-    return round(sorted_data[f] * (c - k) + sorted_data[c] * (k - f), 1)
-
-
 @router.get(
     "/glucose/stats",
     response_model=GlucoseStatsResponse,
@@ -1938,26 +1861,12 @@ async def get_glucose_stats(
         upper = None
         period_minutes = minutes
 
-    conditions = [
-        GlucoseReading.user_id == current_user.id,
-        GlucoseReading.reading_timestamp >= cutoff,
-        GlucoseReading.value >= 20,
-        GlucoseReading.value <= 500,
-    ]
-    if upper is not None:
-        conditions.append(GlucoseReading.reading_timestamp < upper)
-
-    result = await db.execute(
-        select(
-            func.count().label("total"),
-            func.avg(GlucoseReading.value).label("mean"),
-            func.stddev_pop(GlucoseReading.value).label("stddev"),
-        ).where(*conditions)
+    summary = await summarize_glucose(
+        db, current_user.id, cutoff, upper, with_histogram=False
     )
-    row = result.one()
-    count = row.total or 0
-    mean = float(row.mean) if row.mean is not None else 0.0
-    sd = float(row.stddev) if row.stddev is not None else 0.0
+    count = summary.count
+    mean = summary.mean
+    sd = summary.std_dev
 
     if count == 0:
         return GlucoseStatsResponse(
@@ -2029,54 +1938,63 @@ async def get_glucose_percentiles(
             detail=f"Invalid timezone: {tz}",
         ) from e
 
-    cutoff = datetime.now(UTC) - timedelta(days=days)
+    now = datetime.now(UTC)
+    cutoff = now - timedelta(days=days)
+    is_truncated = False
 
-    # Fetch readings with a hard row cap to prevent memory issues
-    result = await db.execute(
-        select(
-            GlucoseReading.reading_timestamp,
-            GlucoseReading.value,
-        )
-        .where(
-            GlucoseReading.user_id == current_user.id,
-            GlucoseReading.reading_timestamp >= cutoff,
-            GlucoseReading.value >= 20,
-            GlucoseReading.value <= 500,
-        )
-        .order_by(GlucoseReading.reading_timestamp)
-        .limit(_AGP_MAX_ROWS)
+    hourly = await summarize_glucose_by_local_hour(
+        db, current_user.id, cutoff, now, user_tz
     )
-    rows = result.all()
+    if hourly is None:
+        # Fractional-hour UTC offsets don't line up with hourly rollups;
+        # group raw readings instead, with a hard row cap to prevent
+        # memory issues
+        result = await db.execute(
+            select(
+                GlucoseReading.reading_timestamp,
+                GlucoseReading.value,
+            )
+            .where(
+                GlucoseReading.user_id == current_user.id,
+                GlucoseReading.reading_timestamp >= cutoff,
+                GlucoseReading.value >= 20,
+                GlucoseReading.value <= 500,
+            )
+            .order_by(GlucoseReading.reading_timestamp)
+            .limit(_AGP_MAX_ROWS)
+        )
+        rows = result.all()
+        is_truncated = len(rows) >= _AGP_MAX_ROWS
 
-    # Group values by hour in the user's timezone
-    hourly: dict[int, list[float]] = {h: [] for h in range(24)}
-    for row in rows:
-        ts = row.reading_timestamp
-        if ts.tzinfo is None:
-            ts = ts.replace(tzinfo=UTC)
-        local_ts = ts.astimezone(user_tz)
-        hourly[local_ts.hour].append(float(row.value))
+        # Group values by hour in the user's timezone
+        values: dict[int, Counter[int]] = {h: Counter() for h in range(24)}
+        for row in rows:
+            ts = row.reading_timestamp
+            if ts.tzinfo is None:
+                ts = ts.replace(tzinfo=UTC)
+            values[ts.astimezone(user_tz).hour][row.value] += 1
+        hourly = {h: GlucoseSummary.from_histogram(values[h]) for h in range(24)}
 
     buckets = []
     for h in range(24):
-        vals = hourly[h]
+        summary = hourly[h]
         buckets.append(
             AGPBucket(
                 hour=h,
-                p10=_compute_percentile(vals, 10),
-                p25=_compute_percentile(vals, 25),
-                p50=_compute_percentile(vals, 50),
-                p75=_compute_percentile(vals, 75),
-                p90=_compute_percentile(vals, 90),
-                count=len(vals),
+                p10=summary.percentile(10),
+                p25=summary.percentile(25),
+                p50=summary.percentile(50),
+                p75=summary.percentile(75),
+                p90=summary.percentile(90),
+                count=summary.count,
             )
         )
 
     return GlucosePercentilesResponse(
         buckets=buckets,
         period_days=days,
-        readings_count=len(rows),
-        is_truncated=len(rows) >= _AGP_MAX_ROWS,
+        readings_count=sum(summary.count for summary in hourly.values()),
+        is_truncated=is_truncated,
     )
 
 
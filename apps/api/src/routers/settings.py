@@ -6,7 +6,10 @@ data purge capability, settings export, analytics configuration, and pump
 profile summary.
 """
 
+from datetime import UTC, datetime
+
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import StreamingResponse
 from pydantic import ValidationError
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -61,6 +64,7 @@ from src.schemas.safety_limits import (
     SafetyLimitsUpdate,
 )
 from src.schemas.settings_export import (
+    ExportFormat,
     ExportType,
     SettingsExportRequest,
     SettingsExportResponse,
@@ -94,6 +98,7 @@ from src.services.insulin_config import (
     get_or_create_config as get_or_create_insulin_config,
 )
 from src.services.insulin_config import update_config as update_insulin_config
+from src.services.llm_cache import invalidate_llm_cache
 from src.services.plugin_declaration import (
     delete_declaration,
     get_declaration,
@@ -104,13 +109,19 @@ from src.services.safety_limits import (
     get_or_create_safety_limits,
     update_safety_limits,
 )
-from src.services.settings_export import export_user_data
+from src.services.settings_export import (
+    export_user_data,
+    stream_export_response_body,
+)
 from src.services.target_glucose_range import get_or_create_range, update_range
 
 logger = get_logger(__name__)
 
 router = APIRouter(prefix="/api/settings", tags=["settings"])
 
+_NDJSON_MEDIA_TYPE = "application/x-ndjson"
+_GZIP_MEDIA_TYPE = "application/gzip"
+
 
 @router.get(
     "/alert-thresholds",
@@ -543,6 +554,8 @@ async def purge_data(
         )
 
     deleted = await purge_all_user_data(user.id, db)
+    # Cached AI responses were generated from the purged data
+    await invalidate_llm_cache(user.id)
     total = sum(deleted.values())
 
     return DataPurgeResponse(
@@ -559,13 +572,22 @@ async def purge_data(
 @router.post(
     "/export",
     response_model=SettingsExportResponse,
+    responses={
+        200: {
+            "content": {
+                _NDJSON_MEDIA_TYPE: {},
+                _GZIP_MEDIA_TYPE: {},
+            },
+            "description": "Export as JSON, or a streamed NDJSON download",
+        }
+    },
     dependencies=[Depends(require_diabetic_or_admin)],
 )
 async def export_settings(
     body: SettingsExportRequest,
     user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
-) -> SettingsExportResponse:
+) -> SettingsExportResponse | StreamingResponse:
     """Export user settings and optionally all data as JSON.
 
     Export types:
@@ -573,9 +595,28 @@ async def export_settings(
     - all_data: Settings plus glucose readings, pump events, AI analysis,
       and audit records
 
+    Formats:
+    - json: A single JSON document (each data category is capped)
+    - ndjson / ndjson_gzip: A streamed download with one
+      ``{"category", "record"}`` object per line and no caps, ending
+      with a ``record_counts`` line
+
     Integration credentials and API keys are never included in exports.
     """
     include_data = body.export_type == ExportType.ALL_DATA
+    if body.format != ExportFormat.JSON:
+        compress = body.format == ExportFormat.NDJSON_GZIP
+        filename = f"glycemicgpt-export-{datetime.now(UTC):%Y%m%d}.ndjson"
+        if compress:
+            filename += ".gz"
+        return StreamingResponse(
+            stream_export_response_body(
+                user.id, include_data=include_data, compress=compress
+            ),
+            media_type=_GZIP_MEDIA_TYPE if compress else _NDJSON_MEDIA_TYPE,
+            headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+        )
+
     export_data = await export_user_data(user.id, db, include_data=include_data)
     return SettingsExportResponse(export_data=export_data)
 
@@ -7,7 +7,22 @@ from fastapi import APIRouter
 
 from src.core.auth import AdminUser
 from src.logging_config import get_logger
-from src.schemas.system import SystemHealthResponse, SystemStatsResponse
+from src.schemas.system import (
+    EmbeddingStatsResponse,
+    FanoutJobStats,
+    HttpClientsResponse,
+    HttpClientStats,
+    LLMCacheResponse,
+    SchedulerJobsResponse,
+    StartupProfileResponse,
+    SystemHealthResponse,
+    SystemStatsResponse,
+)
+from src.services.embedding import get_embedding_stats
+from src.services.http_clients import get_http_client_stats
+from src.services.job_fanout import get_fanout_stats
+from src.services.llm_cache import get_llm_cache_stats
+from src.services.startup_profile import get_startup_profile
 
 logger = get_logger(__name__)
 
@@ -86,3 +101,142 @@ async def get_system_stats(
         active_sessions=0,
         api_requests_today=0,
     )
+
+
+@router.get(
+    "/jobs",
+    response_model=SchedulerJobsResponse,
+    responses={
+        200: {"description": "Scheduler fan-out metrics"},
+        401: {"description": "Not authenticated"},
+        403: {"description": "Admin access required"},
+    },
+)
+async def get_scheduler_jobs(
+    admin_user: AdminUser,
+) -> SchedulerJobsResponse:
+    """Get per-cycle metrics for scheduled fan-out jobs (admin only).
+
+    Reports cycle duration, queue depth and per-user latency for the
+    Dexcom/Tandem sync and alert check jobs, for sizing
+    SCHEDULER_MAX_CONCURRENCY.
+
+    Args:
+        admin_user: The authenticated admin user
+
+    Returns:
+        SchedulerJobsResponse with one entry per job that has run
+    """
+    return SchedulerJobsResponse(
+        jobs=[FanoutJobStats(**stats) for stats in get_fanout_stats().values()]
+    )
+
+
+@router.get(
+    "/http-clients",
+    response_model=HttpClientsResponse,
+    responses={
+        200: {"description": "Outbound HTTP client pool metrics"},
+        401: {"description": "Not authenticated"},
+        403: {"description": "Admin access required"},
+    },
+)
+async def get_http_clients(
+    admin_user: AdminUser,
+) -> HttpClientsResponse:
+    """Get pool utilization for the outbound HTTP clients (admin only).
+
+    Reports open/idle connections, in-flight and waiting requests and
+    error counts for each upstream (Telegram, AI sidecar, Tandem,
+    research sources).
+
+    Args:
+        admin_user: The authenticated admin user
+
+    Returns:
+        HttpClientsResponse with one entry per client in use
+    """
+    return HttpClientsResponse(
+        clients=[HttpClientStats(**stats) for stats in get_http_client_stats().values()]
+    )
+
+
+@router.get(
+    "/llm-cache",
+    response_model=LLMCacheResponse,
+    responses={
+        200: {"description": "AI response cache metrics"},
+        401: {"description": "Not authenticated"},
+        403: {"description": "Admin access required"},
+    },
+)
+async def get_llm_cache(
+    admin_user: AdminUser,
+) -> LLMCacheResponse:
+    """Get hit/miss counters for the AI response cache (admin only).
+
+    Reports how many daily brief and analysis requests were answered
+    from the cache instead of the provider, and the tokens that saved.
+    Counters are per worker.
+
+    Args:
+        admin_user: The authenticated admin user
+
+    Returns:
+        LLMCacheResponse with totals and a breakdown per kind
+    """
+    return LLMCacheResponse(**get_llm_cache_stats())
+
+
+@router.get(
+    "/embedding",
+    response_model=EmbeddingStatsResponse,
+    responses={
+        200: {"description": "Query embedding cache and batching metrics"},
+        401: {"description": "Not authenticated"},
+        403: {"description": "Admin access required"},
+    },
+)
+async def get_embedding(
+    admin_user: AdminUser,
+) -> EmbeddingStatsResponse:
+    """Get query embedding cache and micro-batching counters (admin only).
+
+    Reports how many knowledge retrieval queries were served from the
+    query embedding cache and how well concurrent queries were coalesced
+    into model calls. Counters are per worker.
+
+    Args:
+        admin_user: The authenticated admin user
+
+    Returns:
+        EmbeddingStatsResponse with cache and batching counters
+    """
+    return EmbeddingStatsResponse(**get_embedding_stats())
+
+
+@router.get(
+    "/startup",
+    response_model=StartupProfileResponse,
+    responses={
+        200: {"description": "Startup-time profile"},
+        401: {"description": "Not authenticated"},
+        403: {"description": "Admin access required"},
+    },
+)
+async def get_startup(
+    admin_user: AdminUser,
+) -> StartupProfileResponse:
+    """Get how long this worker took to start (admin only).
+
+    Reports import time per router, each blocking startup step and
+    background warm-ups such as the embedding model, for measuring cold
+    starts and rolling restarts.
+
+    Args:
+        admin_user: The authenticated admin user
+
+    Returns:
+        StartupProfileResponse with the recorded timings
+    """
+    return StartupProfileResponse(**get_startup_profile())
@@ -12,6 +12,14 @@ class ExportType(str, enum.Enum):
     ALL_DATA = "all_data"
 
 
+class ExportFormat(str, enum.Enum):
+    """Export output format options."""
+
+    JSON = "json"
+    NDJSON = "ndjson"
+    NDJSON_GZIP = "ndjson_gzip"
+
+
 class SettingsExportRequest(BaseModel):
     """Request schema for settings export."""
 
@@ -19,6 +27,14 @@ class SettingsExportRequest(BaseModel):
         ...,
         description="Type of export: 'settings_only' or 'all_data'.",
     )
+    format: ExportFormat = Field(
+        default=ExportFormat.JSON,
+        description=(
+            "'json' returns one SettingsExportResponse document (data capped "
+            "per category); 'ndjson' and 'ndjson_gzip' stream one JSON record "
+            "per line, uncapped, as a file download."
+        ),
+    )
 
 
 class SettingsExportResponse(BaseModel):
@@ -3,6 +3,8 @@
 Pydantic schemas for system health and statistics endpoints.
 """
 
+from datetime import datetime
+
 from pydantic import BaseModel, Field
 
 
@@ -21,3 +23,126 @@ class SystemStatsResponse(BaseModel):
     total_users: int = Field(..., description="Total registered users")
     active_sessions: int = Field(..., description="Currently active sessions")
     api_requests_today: int = Field(..., description="API requests in last 24 hours")
+
+
+class FanoutJobStats(BaseModel):
+    """Metrics for the current or last cycle of a scheduled fan-out job."""
+
+    job: str = Field(..., description="Scheduler job name")
+    started_at: datetime = Field(..., description="When the cycle started")
+    running: bool = Field(..., description="Whether the cycle is still running")
+    cycle_seconds: float = Field(..., description="Wall-clock cycle duration")
+    users_total: int = Field(..., description="Users scheduled in the cycle")
+    succeeded: int = Field(..., description="Users processed without error")
+    failed: int = Field(..., description="Users that raised an unexpected error")
+    timed_out: int = Field(..., description="Users cancelled by the timeout")
+    concurrency: int = Field(..., description="Concurrency cap in effect")
+    in_flight: int = Field(..., description="Users currently being processed")
+    queue_depth: int = Field(..., description="Users waiting for a slot")
+    queue_wait_max_ms: float = Field(..., description="Longest wait for a slot")
+    latency_p50_ms: float = Field(..., description="Median per-user latency")
+    latency_p95_ms: float = Field(..., description="95th percentile latency")
+    latency_max_ms: float = Field(..., description="Slowest per-user latency")
+
+
+class SchedulerJobsResponse(BaseModel):
+    """Response schema for scheduler fan-out metrics."""
+
+    jobs: list[FanoutJobStats] = Field(default_factory=list)
+
+
+class HttpClientStats(BaseModel):
+    """Pool utilization for one outbound HTTP client."""
+
+    upstream: str = Field(..., description="Upstream the client serves")
+    http2: bool = Field(..., description="Whether HTTP/2 is offered")
+    max_connections: int = Field(..., description="Connection pool size")
+    max_concurrency_per_host: int = Field(..., description="Per-host request cap")
+    connections: int = Field(..., description="Open pooled connections")
+    idle_connections: int = Field(..., description="Idle keep-alive connections")
+    requests_total: int = Field(..., description="Requests sent since startup")
+    errors_total: int = Field(..., description="Transport errors and 5xx responses")
+    in_flight: int = Field(..., description="Requests currently in flight")
+    peak_in_flight: int = Field(..., description="Most requests in flight at once")
+    waiting: int = Field(..., description="Requests waiting for a host slot")
+    in_flight_by_host: dict[str, int] = Field(
+        default_factory=dict, description="In-flight requests per host"
+    )
+
+
+class HttpClientsResponse(BaseModel):
+    """Response schema for outbound HTTP client metrics."""
+
+    clients: list[HttpClientStats] = Field(default_factory=list)
+
+
+class LLMCacheKindStats(BaseModel):
+    """AI response cache counters for one kind of generation."""
+
+    hits: int = Field(..., description="Requests served from the cache")
+    misses: int = Field(..., description="Requests sent to the provider")
+    shared: int = Field(
+        ..., description="Requests that joined an identical in-flight call"
+    )
+    input_tokens_saved: int = Field(..., description="Prompt tokens not re-sent")
+    output_tokens_saved: int = Field(
+        ..., description="Completion tokens not re-generated"
+    )
+
+
+class LLMCacheResponse(LLMCacheKindStats):
+    """Response schema for AI response cache metrics."""
+
+    backend: str = Field(..., description="Cache backend (memory, redis or off)")
+    entries: int | None = Field(
+        None, description="Cached responses in this worker (memory backend only)"
+    )
+    max_entries: int = Field(..., description="LRU capacity")
+    ttl_seconds: int = Field(..., description="Entry lifetime")
+    provider_calls_saved: int = Field(..., description="Hits plus shared calls")
+    hit_rate: float = Field(..., description="Share of requests not sent")
+    errors_total: int = Field(..., description="Backend errors (treated as misses)")
+    by_kind: dict[str, LLMCacheKindStats] = Field(default_factory=dict)
+
+
+class EmbeddingStatsResponse(BaseModel):
+    """Response schema for query embedding cache and batching metrics."""
+
+    cache_hits: int = Field(..., description="Queries served from the cache")
+    cache_misses: int = Field(..., description="Queries sent to the model")
+    coalesced: int = Field(
+        ..., description="Misses that joined an already queued identical query"
+    )
+    batches: int = Field(..., description="Model calls for query embeddings")
+    texts_embedded: int = Field(..., description="Queries embedded by the model")
+    mean_batch_size: float = Field(..., description="Queries per model call")
+    max_batch_size: int = Field(..., description="Largest batch so far")
+    cache_entries: int = Field(..., description="Cached query embeddings")
+    cache_max_entries: int = Field(..., description="Query cache LRU capacity")
+    max_workers: int = Field(..., description="Embedding thread pool size")
+    batch_window_ms: float = Field(..., description="Micro-batch window")
+
+
+class StartupProfileResponse(BaseModel):
+    """Response schema for the startup-time profile."""
+
+    ready_at: datetime | None = Field(
+        None, description="When the API started serving (None while starting)"
+    )
+    ready_ms: float | None = Field(
+        None, description="From the start of router imports to serving"
+    )
+    router_imports_ms: dict[str, float] = Field(
+        ...,
+        description=(
+            "Import time per router module, in import order (shared "
+            "dependencies are charged to the first router importing them)"
+        ),
+    )
+    router_imports_total_ms: float = Field(..., description="All router imports")
+    phases_ms: dict[str, float] = Field(
+        ..., description="Blocking startup steps run before serving"
+    )
+    background_ms: dict[str, float] = Field(
+        ..., description="Warm-ups completed after serving started"
+    )
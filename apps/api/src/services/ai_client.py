@@ -6,16 +6,29 @@ regardless of the underlying provider (Claude, OpenAI, subscription proxy,
 or self-hosted OpenAI-compatible endpoint).
 
 Story 15.4: Subscription types auto-route through managed sidecar.
+
+SDK clients (and their HTTP connection pools) are cached and reused
+across requests, keyed by provider, base URL and a fingerprint of the API
+key. The resolved client for each user is cached too, so a chat message
+doesn't re-read the provider config and decrypt the key; configuring or
+deleting a provider invalidates it.
 """
 
 import abc
+import asyncio
+import hashlib
+import time
+import uuid
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Callable
+from typing import Any
 
 from fastapi import HTTPException, status
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.config import settings
-from src.core.encryption import decrypt_credential
+from src.core.encryption import decrypt_credential, ensure_encryption_keys
 from src.logging_config import get_logger
 from src.models.ai_provider import AIProviderConfig, AIProviderType
 from src.models.user import User
@@ -56,6 +69,84 @@ _SUBSCRIPTION_TYPES = {
     AIProviderType.CHATGPT_SUBSCRIPTION,
 }
 
+# Long-lived SDK clients kept per (sdk, base_url, key fingerprint)
+_SDK_CLIENT_CACHE_SIZE = 256
+# Resolved per-user clients kept, least recently used dropped first
+_USER_CLIENT_CACHE_SIZE = 1024
+# Resolved per-user clients are re-read from the DB after this long, which
+# bounds staleness on workers that didn't see the invalidation
+_USER_CLIENT_TTL_SECONDS = 60.0
+
+
+# ── SDK client cache ──
+
+
+_sdk_clients: OrderedDict[tuple[str, str | None, str], Any] = OrderedDict()
+_user_clients: OrderedDict[uuid.UUID, tuple["BaseAIClient", float]] = OrderedDict()
+_cache_loop: asyncio.AbstractEventLoop | None = None
+
+
+def _key_fingerprint(api_key: str) -> str:
+    return hashlib.sha256(api_key.encode()).hexdigest()
+
+
+def _check_loop() -> None:
+    """Drop cached clients created on another event loop.
+
+    SDK clients pool connections bound to the loop that opened them.
+    """
+    global _cache_loop
+    loop = asyncio.get_running_loop()
+    if _cache_loop is not loop:
+        _sdk_clients.clear()
+        _user_clients.clear()
+        _cache_loop = loop
+
+
+def get_sdk_client(
+    sdk: str,
+    api_key: str,
+    base_url: str | None,
+    factory: Callable[[], Any],
+) -> Any:
+    """Return a cached SDK client, creating it with ``factory`` on a miss.
+
+    Args:
+        sdk: SDK family (``"anthropic"`` or ``"openai"``).
+        api_key: The API key the client authenticates with.
+        base_url: Custom endpoint, or None for the SDK default.
+        factory: Builds a new client for this key and endpoint.
+    """
+    _check_loop()
+    key = (sdk, base_url, _key_fingerprint(api_key))
+    client = _sdk_clients.get(key)
+    if client is not None:
+        _sdk_clients.move_to_end(key)
+        return client
+
+    client = factory()
+    _sdk_clients[key] = client
+    if len(_sdk_clients) > _SDK_CLIENT_CACHE_SIZE:
+        # Not closed: a request may still be using it (mid-stream, or via a
+        # cached BaseAIClient). Its pool is released once nothing holds it.
+        _sdk_clients.popitem(last=False)
+    return client
+
+
+def invalidate_ai_client(user_id: uuid.UUID) -> None:
+    """Forget a user's resolved AI client after their provider changes.
+
+    The SDK client stays cached (other users may share the same key and
+    endpoint) and is evicted once unused.
+    """
+    _user_clients.pop(user_id, None)
+
+
+def clear_ai_client_cache() -> None:
+    """Drop every cached client (used by tests and benchmarks)."""
+    _sdk_clients.clear()
+    _user_clients.clear()
+
 
 class BaseAIClient(abc.ABC):
     """Abstract base class for AI provider clients.
@@ -76,6 +167,16 @@ class BaseAIClient(abc.ABC):
         self._base_url = base_url
         self._provider_type = provider_type
 
+    @property
+    def provider_type(self) -> AIProviderType | None:
+        """Configured provider type, if known."""
+        return self._provider_type
+
+    @property
+    def base_url(self) -> str | None:
+        """Custom API endpoint, if any."""
+        return self._base_url
+
     @abc.abstractmethod
     async def generate(
         self,
@@ -94,6 +195,29 @@ class BaseAIClient(abc.ABC):
             Normalized AIResponse with content, model, provider, and usage.
         """
 
+    async def generate_stream(
+        self,
+        messages: list[AIMessage],
+        system_prompt: str | None = None,
+        max_tokens: int = 1024,
+    ) -> AsyncIterator[str | AIResponse]:
+        """Generate an AI response, yielding text as it is produced.
+
+        Yields text deltas as the provider streams them, then the completed
+        AIResponse (full content, model, provider, and usage) as the final
+        item. Providers without streaming support fall back to ``generate``
+        and yield the whole response as a single delta.
+
+        Args:
+            messages: List of conversation messages.
+            system_prompt: Optional system-level instruction.
+            max_tokens: Maximum tokens in the response.
+        """
+        response = await self.generate(messages, system_prompt, max_tokens)
+        if response.content:
+            yield response.content
+        yield response
+
 
 async def get_ai_client(
     user: User,
@@ -102,7 +226,8 @@ async def get_ai_client(
     """Factory that returns the appropriate AI client for a user.
 
     Loads the user's AI provider configuration, decrypts the API key,
-    and returns a configured client instance.
+    and returns a configured client instance. The result is cached per
+    user until ``invalidate_ai_client`` runs or the TTL expires.
 
     Args:
         user: The authenticated user.
@@ -114,6 +239,26 @@ async def get_ai_client(
     Raises:
         HTTPException: 404 if no provider is configured.
     """
+    _check_loop()
+    cached = _user_clients.get(user.id)
+    if cached is not None:
+        if cached[1] > time.monotonic():
+            _user_clients.move_to_end(user.id)
+            return cached[0]
+        del _user_clients[user.id]
+
+    client = await _build_ai_client(user, db)
+    _user_clients[user.id] = (client, time.monotonic() + _USER_CLIENT_TTL_SECONDS)
+    _user_clients.move_to_end(user.id)
+    while len(_user_clients) > _USER_CLIENT_CACHE_SIZE:
+        _user_clients.popitem(last=False)
+    return client
+
+
+async def _build_ai_client(
+    user: User,
+    db: AsyncSession,
+) -> BaseAIClient:
     from src.integrations.claude import ClaudeClient
     from src.integrations.openai_client import OpenAIClient
 
@@ -131,6 +276,7 @@ async def get_ai_client(
     # Subscription types using sidecar OAuth may have no stored API key;
     # they use a placeholder key since the sidecar handles authentication.
     if config.encrypted_api_key:
+        await ensure_encryption_keys()
         api_key = decrypt_credential(config.encrypted_api_key)
     else:
         api_key = settings.ai_sidecar_api_key or "sidecar-managed"
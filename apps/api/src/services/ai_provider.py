@@ -2,11 +2,10 @@
 
 Validates API keys by making minimal test requests to each provider.
 Supports direct API keys, subscription proxies, and self-hosted endpoints.
+The provider SDKs are imported on first validation, keeping them out of
+application startup.
 """
 
-import anthropic
-import openai
-
 from src.logging_config import get_logger
 from src.models.ai_provider import AIProviderType
 
@@ -103,6 +102,8 @@ def validate_claude_api_key(api_key: str) -> tuple[bool, str | None]:
     Returns:
         Tuple of (success, error_message).
     """
+    import anthropic
+
     try:
         client = anthropic.Anthropic(
             api_key=api_key, timeout=VALIDATION_TIMEOUT_SECONDS
@@ -145,6 +146,8 @@ def validate_openai_api_key(api_key: str) -> tuple[bool, str | None]:
     Returns:
         Tuple of (success, error_message).
     """
+    import openai
+
     try:
         client = openai.OpenAI(api_key=api_key, timeout=VALIDATION_TIMEOUT_SECONDS)
         client.models.list()
@@ -188,6 +191,8 @@ def validate_openai_compatible_endpoint(
     Returns:
         Tuple of (success, error_message).
     """
+    import openai
+
     try:
         client = openai.OpenAI(
             api_key=api_key,
@@ -17,7 +17,6 @@ Phase 2: Full agentic with tool-use API calls.
 
 from __future__ import annotations
 
-import asyncio
 import json
 import uuid
 from datetime import UTC, datetime
@@ -37,7 +36,7 @@ from src.models.knowledge_chunk import KnowledgeChunk
 from src.models.research_source import ResearchSource
 from src.schemas.ai_response import AIMessage
 from src.services.ai_client import get_ai_client
-from src.services.embedding import embed_texts
+from src.services.embedding import embed_documents
 from src.services.knowledge_seed import _chunk_text
 from src.services.research_pipeline import (
     _compute_hash,
@@ -465,7 +464,7 @@ async def ai_research_source(
 
     # Embed all findings
     try:
-        embeddings = await asyncio.to_thread(embed_texts, all_texts)
+        embeddings = await embed_documents(all_texts)
     except Exception:
         logger.error("Failed to embed research findings", url=source.url, exc_info=True)
         source.last_researched_at = now
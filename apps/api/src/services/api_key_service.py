@@ -1,16 +1,34 @@
-"""Story 28.7: API key management service."""
+"""Story 28.7: API key management service.
 
+Verified keys are served from the principal cache (keyed by key hash) for
+a few seconds, so a device pushing data doesn't look up its key and owner
+on every request. ``last_used_at`` is written behind: touches are
+coalesced in memory and flushed in one bulk UPDATE every
+``api_key_usage_flush_seconds`` and at shutdown.
+"""
+
+import asyncio
+import contextlib
 import hashlib
 import hmac as _hmac
 import secrets
 import uuid
 from datetime import UTC, datetime
 
-from sqlalchemy import func, select
+from sqlalchemy import DateTime, column, func, select, update, values
+from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm.attributes import set_committed_value
 
+from src.config import settings
+from src.core.principal_cache import (
+    cache_principal,
+    get_cached_api_key,
+    principal_cache_generation,
+)
 from src.core.scopes import VALID_SCOPES
+from src.database import get_session_maker
 from src.logging_config import get_logger
 from src.models.api_key import ApiKey
 from src.models.user import User
@@ -20,6 +38,10 @@ logger = get_logger(__name__)
 _KEY_PREFIX = "ggpt_"
 _MAX_KEYS_PER_USER = 20
 
+# Pending last_used_at touches, {key_id: latest use}, until the next flush
+_pending_last_used: dict[uuid.UUID, datetime] = {}
+_flusher: asyncio.Task | None = None
+
 
 def _hash_key(raw_key: str) -> str:
     return hashlib.sha256(raw_key.encode()).hexdigest()
@@ -103,6 +125,17 @@ async def validate_api_key(
     if not raw_key.startswith(_KEY_PREFIX):
         return None
 
+    # Recently verified keys skip the key and owner lookups
+    key_hash = _hash_key(raw_key)
+    cached = await get_cached_api_key(db, key_hash)
+    if cached is not None:
+        api_key, user = cached
+        if api_key.expires_at and api_key.expires_at < datetime.now(UTC):
+            return None
+        _touch(api_key.id)
+        return api_key, user
+    generation = principal_cache_generation()
+
     prefix = raw_key[:12]
     result = await db.execute(
         select(ApiKey).where(ApiKey.prefix == prefix, ApiKey.is_active.is_(True))
@@ -111,7 +144,7 @@ async def validate_api_key(
     if api_key is None:
         return None
 
-    if not _hmac.compare_digest(_hash_key(raw_key), api_key.key_hash):
+    if not _hmac.compare_digest(key_hash, api_key.key_hash):
         return None
 
     if api_key.expires_at and api_key.expires_at < datetime.now(UTC):
@@ -125,13 +158,81 @@ async def validate_api_key(
     if user is None:
         return None
 
-    # Touch last_used_at
-    api_key.last_used_at = datetime.now(UTC)
-    await db.flush()
+    cache_principal(key_hash, user, generation, api_key=api_key)
+    _touch(api_key.id)
 
     return api_key, user
 
 
+def _touch(key_id: uuid.UUID) -> None:
+    """Record a key use; written by the next ``flush_api_key_usage``."""
+    _pending_last_used[key_id] = datetime.now(UTC)
+
+
+async def flush_api_key_usage() -> int:
+    """Write pending ``last_used_at`` touches in one UPDATE.
+
+    Never moves ``last_used_at`` backwards. Touches are put back if the
+    write fails, so they go out with the next flush.
+
+    Returns:
+        Number of keys touched.
+    """
+    if not _pending_last_used:
+        return 0
+    pending = dict(_pending_last_used)
+    _pending_last_used.clear()
+
+    touched = values(
+        column("id", UUID(as_uuid=True)),
+        column("used_at", DateTime(timezone=True)),
+        name="touched",
+    ).data(list(pending.items()))
+    try:
+        async with get_session_maker()() as db:
+            await db.execute(
+                update(ApiKey)
+                .where(ApiKey.id == touched.c.id)
+                .values(
+                    last_used_at=func.greatest(ApiKey.last_used_at, touched.c.used_at)
+                )
+            )
+            await db.commit()
+    except Exception:
+        for key_id, used_at in pending.items():
+            if _pending_last_used.get(key_id, used_at) <= used_at:
+                _pending_last_used[key_id] = used_at
+        logger.warning(
+            "Failed to flush API key usage", keys=len(pending), exc_info=True
+        )
+        return 0
+    return len(pending)
+
+
+async def _flush_periodically() -> None:
+    while True:
+        await asyncio.sleep(settings.api_key_usage_flush_seconds)
+        await flush_api_key_usage()
+
+
+def start_api_key_usage_flusher() -> None:
+    """Start the periodic ``last_used_at`` flush."""
+    global _flusher
+    if _flusher is None:
+        _flusher = asyncio.create_task(_flush_periodically())
+
+
+async def stop_api_key_usage_flusher() -> None:
+    """Stop the periodic flush and write any remaining touches."""
+    global _flusher
+    if _flusher is not None:
+        _flusher.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await _flusher
+        _flusher = None
+    await flush_api_key_usage()
+
+
 async def revoke_api_key(
     db: AsyncSession,
     key_id: uuid.UUID,
@@ -163,10 +264,19 @@ async def list_api_keys(
     db: AsyncSession,
     user_id: uuid.UUID,
 ) -> list[ApiKey]:
-    """List all API keys for a user (never includes hash or raw key)."""
+    """List all API keys for a user (never includes hash or raw key).
+
+    ``last_used_at`` includes touches not yet flushed.
+    """
     result = await db.execute(
         select(ApiKey)
         .where(ApiKey.user_id == user_id)
         .order_by(ApiKey.created_at.desc())
     )
-    return list(result.scalars().all())
+    keys = list(result.scalars().all())
+    for api_key in keys:
+        pending = _pending_last_used.get(api_key.id)
+        if pending and (api_key.last_used_at is None or pending > api_key.last_used_at):
+            # Display only: leave the row clean so this isn't written back
+            set_committed_value(api_key, "last_used_at", pending)
+    return keys
@@ -0,0 +1,282 @@
+"""Scheduled daily brief generation.
+
+Acts on each user's ``BriefDeliveryConfig``: once the configured local
+delivery time has passed, the user's brief is generated and delivered
+without waiting for ``POST /briefs/generate``. The job runs every
+``daily_brief_check_interval_minutes``; each run
+
+1. finds due users (enabled config, active account, AI provider set up,
+   no brief since the delivery time) with one query,
+2. calculates metrics for each delivery window in bulk
+   (``calculate_metrics_bulk``) instead of per user,
+3. generates briefs through ``run_fanout`` with at most
+   ``daily_brief_max_concurrency`` in flight, starting AI calls at
+   ``daily_brief_ai_rate_per_second`` per provider endpoint. Hundreds of
+   07:00 briefs are therefore spread over minutes rather than sent to the
+   provider in the same second, and
+4. delivers them via ``notify_user_of_brief`` unless the channel is web only.
+
+A user missed by one run (provider error, timeout, restart) is picked up
+by the next, up to ``daily_brief_grace_minutes`` after their delivery time.
+"""
+
+import uuid
+from dataclasses import dataclass
+from datetime import UTC, datetime, time, timedelta
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+from fastapi import HTTPException
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.config import settings
+from src.database import get_session_maker
+from src.logging_config import get_logger
+from src.models.ai_provider import AIProviderConfig, AIProviderType
+from src.models.brief_delivery_config import BriefDeliveryConfig, DeliveryChannel
+from src.models.daily_brief import DailyBrief
+from src.models.user import User
+from src.schemas.daily_brief import DailyBriefMetrics
+from src.services.daily_brief import (
+    MIN_READINGS,
+    calculate_metrics_bulk,
+    generate_daily_brief,
+)
+from src.services.job_fanout import get_rate_budget, run_fanout
+
+logger = get_logger(__name__)
+
+# Scheduled briefs cover the same period as the default manual brief
+BRIEF_HOURS = 24
+
+
+@dataclass
+class DueBrief:
+    """A user whose scheduled brief is due."""
+
+    user_id: uuid.UUID
+    channel: DeliveryChannel
+    provider_key: str
+    due_at: datetime
+    metrics: DailyBriefMetrics | None = None
+
+
+def scheduled_delivery_at(
+    now: datetime,
+    delivery_time: time,
+    tz_name: str,
+) -> datetime | None:
+    """Return the most recent delivery instant at or before ``now``, in UTC.
+
+    Args:
+        now: Current time (timezone-aware).
+        delivery_time: Local wall-clock delivery time.
+        tz_name: IANA timezone of the delivery time.
+
+    Returns:
+        The delivery instant, or None if the timezone is unknown.
+    """
+    try:
+        tz = ZoneInfo(tz_name)
+    except (ZoneInfoNotFoundError, ValueError):
+        return None
+
+    local_now = now.astimezone(tz)
+    scheduled = datetime.combine(local_now.date(), delivery_time, tzinfo=tz)
+    if scheduled > local_now:
+        scheduled = datetime.combine(
+            local_now.date() - timedelta(days=1), delivery_time, tzinfo=tz
+        )
+    return scheduled.astimezone(UTC)
+
+
+def _provider_key(provider_type: AIProviderType, base_url: str | None) -> str:
+    """Identify the upstream endpoint a user's AI calls are rate limited by."""
+    if base_url:
+        return f"{provider_type.value}:{base_url}"
+    return provider_type.value
+
+
+async def find_due_briefs(db: AsyncSession, now: datetime) -> list[DueBrief]:
+    """Return users whose scheduled brief is due at ``now``.
+
+    Delivery configs, providers and each user's latest brief are loaded
+    with one query; the per-timezone delivery time is resolved here since
+    it can't be expressed portably in SQL.
+
+    Args:
+        db: Database session.
+        now: Current time (timezone-aware).
+
+    Returns:
+        Due briefs, ordered by delivery time.
+    """
+    last_brief_at = (
+        select(func.max(DailyBrief.created_at))
+        .where(DailyBrief.user_id == BriefDeliveryConfig.user_id)
+        .correlate(BriefDeliveryConfig)
+        .scalar_subquery()
+    )
+    result = await db.execute(
+        select(
+            BriefDeliveryConfig.user_id,
+            BriefDeliveryConfig.delivery_time,
+            BriefDeliveryConfig.timezone,
+            BriefDeliveryConfig.channel,
+            AIProviderConfig.provider_type,
+            AIProviderConfig.base_url,
+            last_brief_at,
+        )
+        .join(User, User.id == BriefDeliveryConfig.user_id)
+        .join(AIProviderConfig, AIProviderConfig.user_id == BriefDeliveryConfig.user_id)
+        .where(
+            BriefDeliveryConfig.enabled.is_(True),
+            User.is_active.is_(True),
+        )
+    )
+
+    grace = timedelta(minutes=settings.daily_brief_grace_minutes)
+    due: list[DueBrief] = []
+    for (
+        user_id,
+        delivery_time,
+        tz_name,
+        channel,
+        provider_type,
+        base_url,
+        last_at,
+    ) in result.all():
+        due_at = scheduled_delivery_at(now, delivery_time, tz_name)
+        if due_at is None:
+            logger.warning(
+                "Skipping scheduled brief with unknown timezone",
+                user_id=str(user_id),
+                timezone=tz_name,
+            )
+            continue
+        if now - due_at > grace:
+            continue
+        if last_at is not None and last_at >= due_at:
+            continue
+        due.append(
+            DueBrief(
+                user_id=user_id,
+                channel=channel,
+                provider_key=_provider_key(provider_type, base_url),
+                due_at=due_at,
+            )
+        )
+    due.sort(key=lambda d: d.due_at)
+    return due
+
+
+async def _attach_metrics(db: AsyncSession, due: list[DueBrief]) -> None:
+    """Calculate metrics for due briefs, in bulk per delivery window.
+
+    Users sharing a delivery instant share the analysis period, so each
+    window is calculated with set-based queries in batches of
+    ``daily_brief_metrics_batch_size``.
+    """
+    windows: dict[datetime, list[DueBrief]] = {}
+    for item in due:
+        windows.setdefault(item.due_at, []).append(item)
+
+    size = settings.daily_brief_metrics_batch_size
+    for due_at, items in windows.items():
+        period_start = due_at - timedelta(hours=BRIEF_HOURS)
+        for i in range(0, len(items), size):
+            batch = items[i : i + size]
+            metrics = await calculate_metrics_bulk(
+                [item.user_id for item in batch], db, period_start, due_at
+            )
+            for item in batch:
+                item.metrics = metrics[item.user_id]
+
+
+async def _generate_scheduled_brief(due: DueBrief) -> bool:
+    """Generate and deliver one scheduled brief. Returns True on success."""
+    # Paced per provider endpoint before a session is opened, so waiting
+    # doesn't hold a connection
+    await get_rate_budget(
+        f"ai_brief:{due.provider_key}",
+        settings.daily_brief_ai_rate_per_second,
+    ).acquire()
+
+    try:
+        async with get_session_maker()() as db:
+            user = await db.get(User, due.user_id)
+            if user is None:
+                return False
+            brief = await generate_daily_brief(
+                user,
+                db,
+                BRIEF_HOURS,
+                metrics=due.metrics,
+                period_end=due.due_at,
+                notify=due.channel != DeliveryChannel.WEB_ONLY,
+            )
+            logger.info(
+                "Scheduled daily brief generated",
+                user_id=str(due.user_id),
+                brief_id=str(brief.id),
+                channel=due.channel.value,
+            )
+            return True
+    except HTTPException as e:
+        logger.warning(
+            "Scheduled daily brief failed for user",
+            user_id=str(due.user_id),
+            status_code=e.status_code,
+            error=str(e.detail),
+        )
+        return False
+
+
+async def generate_scheduled_briefs() -> None:
+    """Generate daily briefs for every user whose delivery time has passed.
+
+    This job is triggered by APScheduler every
+    ``daily_brief_check_interval_minutes``.
+    """
+    now = datetime.now(UTC)
+
+    # The lookup session is closed before generation fans out
+    async with get_session_maker()() as db:
+        due = await find_due_briefs(db, now)
+        if not due:
+            logger.debug("No scheduled daily briefs due")
+            return
+        await _attach_metrics(db, due)
+
+    ready = [
+        item
+        for item in due
+        if item.metrics is not None and item.metrics.readings_count >= MIN_READINGS
+    ]
+    insufficient = len(due) - len(ready)
+
+    logger.info(
+        "Found scheduled daily briefs",
+        due=len(due),
+        insufficient_data=insufficient,
+    )
+    if not ready:
+        return
+
+    outcome = await run_fanout(
+        "daily_brief",
+        ready,
+        _generate_scheduled_brief,
+        concurrency=settings.daily_brief_max_concurrency,
+        timeout_seconds=settings.daily_brief_user_timeout_seconds,
+        item_key=lambda item: item.user_id,
+    )
+    success_count = sum(outcome.results)
+
+    logger.info(
+        "Scheduled daily briefs completed",
+        success_count=success_count,
+        error_count=len(ready) - success_count,
+        insufficient_data=insufficient,
+        cycle_seconds=round(outcome.stats.cycle_seconds, 2),
+    )
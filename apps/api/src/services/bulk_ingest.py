@@ -0,0 +1,124 @@
+"""Batched multi-row upserts for glucose and pump event ingestion.
+
+Dexcom sync, Tandem sync and the mobile pump push endpoint all write rows
+that may already exist (overlapping sync windows, client retries). Instead
+of one ``INSERT ... ON CONFLICT DO NOTHING`` per row, rows are written as
+chunked multi-row inserts with ``RETURNING`` so inserted-vs-duplicate
+counts stay exact without a round-trip per row.
+"""
+
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import Any
+
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.models.base import Base
+from src.models.glucose import GlucoseReading
+from src.models.pump_data import PumpEvent
+
+# asyncpg caps a statement at 32767 bind parameters; chunks are sized to
+# stay under it regardless of how many columns a row has.
+_MAX_BIND_PARAMS = 32_000
+DEFAULT_CHUNK_SIZE = 1_000
+
+GLUCOSE_CONFLICT_KEYS = ["user_id", "reading_timestamp"]
+PUMP_EVENT_CONFLICT_KEYS = ["user_id", "event_timestamp", "event_type"]
+
+
+@dataclass(frozen=True)
+class IngestResult:
+    """Outcome of a bulk insert."""
+
+    submitted: int
+    inserted: int
+
+    @property
+    def duplicates(self) -> int:
+        """Rows skipped because they conflicted with existing rows."""
+        return self.submitted - self.inserted
+
+
+def _chunk_size(rows: Sequence[dict[str, Any]], requested: int) -> int:
+    columns = max(1, len(rows[0]))
+    return max(1, min(requested, _MAX_BIND_PARAMS // columns))
+
+
+async def bulk_insert_ignore_conflicts(
+    db: AsyncSession,
+    model: type[Base],
+    rows: Sequence[dict[str, Any]],
+    *,
+    index_elements: list[str] | None = None,
+    constraint: str | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> IngestResult:
+    """Insert rows in chunked multi-row statements, skipping conflicts.
+
+    Does not commit; callers commit alongside their other changes.
+
+    Args:
+        db: Database session
+        model: ORM model to insert into
+        rows: Column dicts; every row must have the same keys
+        index_elements: Columns of the unique index to conflict on
+        constraint: Named unique constraint to conflict on (alternative
+            to ``index_elements``)
+        chunk_size: Maximum rows per statement
+
+    Returns:
+        IngestResult with the number of rows submitted and actually inserted
+    """
+    if not rows:
+        return IngestResult(submitted=0, inserted=0)
+
+    primary_key = model.__table__.primary_key.columns.values()[0]
+    size = _chunk_size(rows, chunk_size)
+    inserted = 0
+
+    for start in range(0, len(rows), size):
+        stmt = (
+            insert(model)
+            .values(list(rows[start : start + size]))
+            .on_conflict_do_nothing(
+                index_elements=index_elements, constraint=constraint
+            )
+            .returning(primary_key)
+        )
+        result = await db.execute(stmt)
+        inserted += len(result.all())
+
+    return IngestResult(submitted=len(rows), inserted=inserted)
+
+
+async def ingest_glucose_readings(
+    db: AsyncSession,
+    rows: Sequence[dict[str, Any]],
+    *,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> IngestResult:
+    """Bulk insert glucose readings, ignoring (user, timestamp) duplicates."""
+    return await bulk_insert_ignore_conflicts(
+        db,
+        GlucoseReading,
+        rows,
+        index_elements=GLUCOSE_CONFLICT_KEYS,
+        chunk_size=chunk_size,
+    )
+
+
+async def ingest_pump_events(
+    db: AsyncSession,
+    rows: Sequence[dict[str, Any]],
+    *,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> IngestResult:
+    """Bulk insert pump events, ignoring (user, timestamp, type) duplicates."""
+    return await bulk_insert_ignore_conflicts(
+        db,
+        PumpEvent,
+        rows,
+        index_elements=PUMP_EVENT_CONFLICT_KEYS,
+        chunk_size=chunk_size,
+    )
@@ -23,6 +23,8 @@ from src.services.diabetes_context import (
     format_pump_profile_for_prompt,
     get_pump_profile_summary,
 )
+from src.services.glucose_windows import ReadingSeries, analyze_event_windows
+from src.services.llm_cache import generate_cached
 from src.services.safety_validation import log_safety_validation, validate_ai_suggestion
 
 logger = get_logger(__name__)
@@ -169,7 +171,8 @@ async def analyze_correction_outcomes(
 
     For each manual correction bolus, examines glucose readings in the
     3-hour window after the bolus to evaluate whether the correction
-    was effective, under-corrected, or over-corrected.
+    was effective, under-corrected, or over-corrected. Windows for all
+    boluses are evaluated together by the windowed analytics kernel.
 
     Args:
         user_id: User's UUID.
@@ -218,33 +221,35 @@ async def analyze_correction_outcomes(
             "correction_count": 0,
         }
 
-    for correction in corrections:
-        period = _classify_time_period(correction.event_timestamp.hour)
-        window_start = correction.event_timestamp
-        window_end = window_start + timedelta(hours=POST_CORRECTION_WINDOW_HOURS)
-
-        # Filter readings after the correction (strict lower bound excludes
-        # the reading at correction time itself)
-        readings = [
-            value for ts, value in all_readings if window_start < ts <= window_end
-        ]
+    outcomes = analyze_event_windows(
+        ReadingSeries.from_rows(all_readings),
+        [c.event_timestamp for c in corrections],
+        timedelta(hours=POST_CORRECTION_WINDOW_HOURS),
+        # Strict lower bound excludes the reading at correction time itself
+        include_start=False,
+        starting_bg=[c.bg_at_event for c in corrections],
+        units=[c.units for c in corrections],
+    )
+    counts = outcomes.count.tolist()
+    finals = outcomes.final.tolist()
+    drops = outcomes.drop.tolist()
+    isfs = outcomes.isf.tolist()
 
-        if not readings or correction.units is None or correction.units <= 0:
+    for i, correction in enumerate(corrections):
+        if not counts[i] or correction.units is None or correction.units <= 0:
             continue
 
-        starting_bg = correction.bg_at_event
-        # Use the last reading as the approximate post-correction value
-        final_glucose = readings[-1]
-        glucose_drop = starting_bg - final_glucose
+        period = _classify_time_period(correction.event_timestamp.hour)
+        # The last reading approximates the post-correction value
+        final_glucose = finals[i]
+        glucose_drop = drops[i]
 
         # Skip corrections where glucose rose (likely concurrent meal)
         if glucose_drop <= 0:
             continue
 
-        observed_isf = glucose_drop / correction.units
-
         period_data[period]["drops"].append(glucose_drop)
-        period_data[period]["isf_values"].append(observed_isf)
+        period_data[period]["isf_values"].append(isfs[i])
         period_data[period]["correction_count"] += 1
 
         # Evaluate outcome
@@ -367,7 +372,10 @@ async def generate_correction_analysis(
         days=days,
     )
 
-    ai_response = await ai_client.generate(
+    ai_response = await generate_cached(
+        ai_client,
+        user.id,
+        "correction_analysis",
         messages=[AIMessage(role="user", content=user_prompt)],
         system_prompt=SYSTEM_PROMPT,
     )
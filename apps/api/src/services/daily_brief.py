@@ -3,10 +3,13 @@
 Aggregates glucose and pump data, generates AI-powered analysis briefs.
 """
 
+import uuid
+from collections.abc import Sequence
 from datetime import UTC, datetime, timedelta
 
 from fastapi import HTTPException, status
-from sqlalchemy import func, select
+from sqlalchemy import bindparam, func, select, true
+from sqlalchemy.dialects.postgresql import ARRAY, UUID
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.logging_config import get_logger
@@ -23,6 +26,7 @@ from src.services.diabetes_context import (
     format_pump_profile_for_prompt,
     get_pump_profile_summary,
 )
+from src.services.llm_cache import generate_cached
 from src.services.safety_validation import log_safety_validation, validate_ai_suggestion
 
 logger = get_logger(__name__)
@@ -141,21 +145,11 @@ async def calculate_metrics(
 
     readings_count = len(values)
     if readings_count == 0:
-        return DailyBriefMetrics(
-            time_in_range_pct=0.0,
-            average_glucose=0.0,
-            low_count=0,
-            high_count=0,
-            readings_count=0,
-            correction_count=0,
-            total_insulin=None,
-        )
+        return _empty_metrics()
 
     in_range = sum(1 for v in values if LOW_THRESHOLD <= v <= HIGH_THRESHOLD)
     low_count = sum(1 for v in values if v < LOW_THRESHOLD)
     high_count = sum(1 for v in values if v > HIGH_THRESHOLD)
-    time_in_range_pct = (in_range / readings_count) * 100
-    average_glucose = sum(values) / readings_count
 
     # Query pump events for Control-IQ corrections
     correction_result = await db.execute(
@@ -249,6 +243,45 @@ async def calculate_metrics(
     if seed:
         basal_events.insert(0, seed)
 
+    basal_units = _integrate_basal(basal_events, period_start, period_end)
+
+    return _assemble_metrics(
+        readings_count=readings_count,
+        in_range=in_range,
+        low_count=low_count,
+        high_count=high_count,
+        glucose_sum=sum(values),
+        correction_count=correction_count,
+        bolus=(bolus_count, bolus_units),
+        manual_corrections=(manual_corr_count, manual_corr_units),
+        auto_corrections=(auto_corr_count, auto_corr_units),
+        basal_units=basal_units,
+    )
+
+
+def _empty_metrics() -> DailyBriefMetrics:
+    return DailyBriefMetrics(
+        time_in_range_pct=0.0,
+        average_glucose=0.0,
+        low_count=0,
+        high_count=0,
+        readings_count=0,
+        correction_count=0,
+        total_insulin=None,
+    )
+
+
+def _integrate_basal(
+    basal_events: Sequence[tuple[datetime, float]],
+    period_start: datetime,
+    period_end: datetime,
+) -> float:
+    """Estimate basal units delivered from rate-change events.
+
+    ``basal_events`` are ``(timestamp, rate u/hr)`` in time order, seeded
+    with the last event before the window. Each segment runs until the
+    next event or ``period_end``, clamped to the window.
+    """
     basal_units = 0.0
     for i, (event_ts, rate) in enumerate(basal_events):
         t_start = max(event_ts, period_start)
@@ -260,6 +293,27 @@ async def calculate_metrics(
         # Cap individual segment to 1 hour to handle gaps in data
         duration_hours = min(duration_hours, 1.0)
         basal_units += rate * duration_hours
+    return basal_units
+
+
+def _assemble_metrics(
+    *,
+    readings_count: int,
+    in_range: int,
+    low_count: int,
+    high_count: int,
+    glucose_sum: float,
+    correction_count: int,
+    bolus: tuple[int, float],
+    manual_corrections: tuple[int, float],
+    auto_corrections: tuple[int, float],
+    basal_units: float,
+) -> DailyBriefMetrics:
+    bolus_count, bolus_units = bolus
+    manual_corr_count, manual_corr_units = manual_corrections
+    auto_corr_count, auto_corr_units = auto_corrections
+    time_in_range_pct = (in_range / readings_count) * 100
+    average_glucose = glucose_sum / readings_count
 
     total_bolus_corr = bolus_units + manual_corr_units + auto_corr_units
     total_insulin = total_bolus_corr + basal_units
@@ -287,10 +341,168 @@ async def calculate_metrics(
     )
 
 
+def _dose_totals(
+    doses: dict[tuple[PumpEventType, bool], tuple[int, int, float]],
+    key: tuple[PumpEventType, bool],
+) -> tuple[int, float]:
+    """Return ``(count, units)`` of dosed events for one type/automation."""
+    _, with_units, units = doses.get(key, (0, 0, 0.0))
+    return with_units, units
+
+
+async def calculate_metrics_bulk(
+    user_ids: Sequence[uuid.UUID],
+    db: AsyncSession,
+    period_start: datetime,
+    period_end: datetime,
+) -> dict[uuid.UUID, DailyBriefMetrics]:
+    """Calculate ``calculate_metrics`` for many users with set-based queries.
+
+    Runs four grouped queries for the whole batch (glucose aggregates,
+    bolus/correction aggregates, seed basal rates, in-window basal events)
+    instead of seven queries per user.
+
+    Args:
+        user_ids: Users to calculate metrics for.
+        db: Database session.
+        period_start: Start of analysis period.
+        period_end: End of analysis period.
+
+    Returns:
+        Metrics keyed by user ID (every requested user is present).
+    """
+    if not user_ids:
+        return {}
+    ids = list(user_ids)
+
+    glucose_result = await db.execute(
+        select(
+            GlucoseReading.user_id,
+            func.count(),
+            func.count().filter(
+                GlucoseReading.value.between(LOW_THRESHOLD, HIGH_THRESHOLD)
+            ),
+            func.count().filter(GlucoseReading.value < LOW_THRESHOLD),
+            func.count().filter(GlucoseReading.value > HIGH_THRESHOLD),
+            func.sum(GlucoseReading.value),
+        )
+        .where(
+            GlucoseReading.user_id.in_(ids),
+            GlucoseReading.reading_timestamp >= period_start,
+            GlucoseReading.reading_timestamp < period_end,
+        )
+        .group_by(GlucoseReading.user_id)
+    )
+    glucose = {row[0]: row[1:] for row in glucose_result.all()}
+
+    # Per (user, type, automated): all events, events with units, unit sum
+    dose_result = await db.execute(
+        select(
+            PumpEvent.user_id,
+            PumpEvent.event_type,
+            PumpEvent.is_automated,
+            func.count(),
+            func.count(PumpEvent.units),
+            func.coalesce(func.sum(PumpEvent.units), 0.0),
+        )
+        .where(
+            PumpEvent.user_id.in_(ids),
+            PumpEvent.event_timestamp >= period_start,
+            PumpEvent.event_timestamp < period_end,
+            PumpEvent.event_type.in_([PumpEventType.BOLUS, PumpEventType.CORRECTION]),
+        )
+        .group_by(PumpEvent.user_id, PumpEvent.event_type, PumpEvent.is_automated)
+    )
+    doses: dict[uuid.UUID, dict[tuple[PumpEventType, bool], tuple[int, int, float]]]
+    doses = {}
+    for user_id, event_type, automated, total, with_units, units in dose_result.all():
+        doses.setdefault(user_id, {})[(event_type, automated)] = (
+            total,
+            with_units,
+            float(units or 0),
+        )
+
+    # Basal rate in effect at period_start: one index-backed LIMIT 1 per
+    # user (LATERAL), rather than a DISTINCT ON over every earlier row
+    batch_users = func.unnest(
+        bindparam("ids", ids, type_=ARRAY(UUID(as_uuid=True)))
+    ).table_valued("user_id", name="batch_users")
+    last_basal = (
+        select(PumpEvent.event_timestamp, PumpEvent.units)
+        .where(
+            PumpEvent.user_id == batch_users.c.user_id,
+            PumpEvent.event_timestamp < period_start,
+            PumpEvent.event_type == PumpEventType.BASAL,
+            PumpEvent.units.is_not(None),
+        )
+        .order_by(PumpEvent.event_timestamp.desc())
+        .limit(1)
+        .lateral("last_basal")
+    )
+    seed_result = await db.execute(
+        select(batch_users.c.user_id, last_basal.c.event_timestamp, last_basal.c.units)
+        .select_from(batch_users)
+        .join(last_basal, true())
+    )
+    basal: dict[uuid.UUID, list[tuple[datetime, float]]] = {
+        user_id: [(ts, rate)] for user_id, ts, rate in seed_result.all()
+    }
+    basal_result = await db.execute(
+        select(PumpEvent.user_id, PumpEvent.event_timestamp, PumpEvent.units)
+        .where(
+            PumpEvent.user_id.in_(ids),
+            PumpEvent.event_timestamp >= period_start,
+            PumpEvent.event_timestamp < period_end,
+            PumpEvent.event_type == PumpEventType.BASAL,
+            PumpEvent.units.is_not(None),
+        )
+        .order_by(PumpEvent.user_id, PumpEvent.event_timestamp)
+    )
+    for user_id, ts, rate in basal_result.all():
+        basal.setdefault(user_id, []).append((ts, rate))
+
+    metrics: dict[uuid.UUID, DailyBriefMetrics] = {}
+    for user_id in ids:
+        if user_id not in glucose:
+            metrics[user_id] = _empty_metrics()
+            continue
+        readings_count, in_range, low_count, high_count, glucose_sum = glucose[user_id]
+        user_doses = doses.get(user_id, {})
+
+        bolus_rows = [
+            row for (kind, _), row in user_doses.items() if kind == PumpEventType.BOLUS
+        ]
+        bolus_count = sum(row[1] for row in bolus_rows)
+        bolus_units = sum(row[2] for row in bolus_rows)
+        metrics[user_id] = _assemble_metrics(
+            readings_count=readings_count,
+            in_range=in_range,
+            low_count=low_count,
+            high_count=high_count,
+            glucose_sum=float(glucose_sum),
+            correction_count=user_doses.get(
+                (PumpEventType.CORRECTION, True), (0, 0, 0.0)
+            )[0],
+            bolus=(bolus_count, bolus_units),
+            manual_corrections=_dose_totals(
+                user_doses, (PumpEventType.CORRECTION, False)
+            ),
+            auto_corrections=_dose_totals(user_doses, (PumpEventType.CORRECTION, True)),
+            basal_units=_integrate_basal(
+                basal.get(user_id, []), period_start, period_end
+            ),
+        )
+    return metrics
+
+
 async def generate_daily_brief(
     user: User,
     db: AsyncSession,
     hours: int = 24,
+    *,
+    metrics: DailyBriefMetrics | None = None,
+    period_end: datetime | None = None,
+    notify: bool = True,
 ) -> DailyBrief:
     """Generate a daily brief for a user.
 
@@ -301,6 +513,10 @@ async def generate_daily_brief(
         user: The authenticated user.
         db: Database session.
         hours: Number of hours to analyze.
+        metrics: Metrics already calculated for the period (e.g. in bulk
+            by the brief scheduler); calculated here when omitted.
+        period_end: End of the analysis period (defaults to now).
+        notify: Whether to deliver the brief via Telegram.
 
     Returns:
         The created DailyBrief record.
@@ -308,11 +524,12 @@ async def generate_daily_brief(
     Raises:
         HTTPException: 400 if insufficient data, 404 if no AI provider.
     """
-    period_end = datetime.now(UTC)
+    period_end = period_end or datetime.now(UTC)
     period_start = period_end - timedelta(hours=hours)
 
     # Calculate metrics
-    metrics = await calculate_metrics(user.id, db, period_start, period_end)
+    if metrics is None:
+        metrics = await calculate_metrics(user.id, db, period_start, period_end)
 
     if metrics.readings_count < MIN_READINGS:
         raise HTTPException(
@@ -359,7 +576,10 @@ async def generate_daily_brief(
         hours=hours,
     )
 
-    ai_response = await ai_client.generate(
+    ai_response = await generate_cached(
+        ai_client,
+        user.id,
+        "daily_brief",
         messages=[AIMessage(role="user", content=user_prompt)],
         system_prompt=SYSTEM_PROMPT,
     )
@@ -403,14 +623,15 @@ async def generate_daily_brief(
     )
 
     # Story 7.3: Telegram delivery
-    try:
-        await notify_user_of_brief(db, user.id, brief)
-    except Exception as e:
-        logger.warning(
-            "Telegram brief delivery failed",
-            user_id=str(user.id),
-            error=str(e),
-        )
+    if notify:
+        try:
+            await notify_user_of_brief(db, user.id, brief)
+        except Exception as e:
+            logger.warning(
+                "Telegram brief delivery failed",
+                user_id=str(user.id),
+                error=str(e),
+            )
 
     return brief
 
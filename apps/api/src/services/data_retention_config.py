@@ -1,7 +1,8 @@
 """Story 9.3: Data retention configuration service.
 
 Manages user data retention settings with get-or-create pattern,
-and provides the background enforcement job that prunes expired data.
+and prunes a single user's expired data. The scheduled job for all
+users lives in ``retention_engine``.
 """
 
 import uuid
@@ -1,19 +1,32 @@
 """Story 3.2: Dexcom CGM Data Sync Service.
 
 Handles fetching glucose readings from Dexcom Share API and storing them.
+
+Share sessions are cached per user in ``dexcom_sessions`` so a sync reuses
+the existing session ID instead of logging in every 5 minutes; pydexcom
+re-authenticates on its own when the session expires (``SessionError``).
+All blocking pydexcom calls run in a dedicated, bounded thread pool so a
+slow Share response never stalls the event loop.
 """
 
+import asyncio
+import functools
+import hashlib
+import time
 import uuid
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import UTC, datetime
+from typing import Any
 
 from pydexcom import Dexcom
 from pydexcom import errors as dexcom_errors
 from sqlalchemy import select
-from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.config import settings
-from src.core.encryption import decrypt_credential
+from src.core.encryption import decrypt_credential, ensure_encryption_keys
 from src.logging_config import get_logger
 from src.models.glucose import PYDEXCOM_TREND_MAP, GlucoseReading, TrendDirection
 from src.models.integration import (
@@ -21,6 +34,9 @@ from src.models.integration import (
     IntegrationStatus,
     IntegrationType,
 )
+from src.services.bulk_ingest import ingest_glucose_readings
+from src.services.diabetes_context import invalidate_diabetes_context
+from src.services.stream_events import publish_glucose_update
 
 logger = get_logger(__name__)
 
@@ -43,6 +59,114 @@ class DexcomConnectionError(DexcomSyncError):
     pass
 
 
+_dexcom_executor: ThreadPoolExecutor | None = None
+
+
+def _get_dexcom_executor() -> ThreadPoolExecutor:
+    """Return the dedicated thread pool for blocking pydexcom calls."""
+    global _dexcom_executor
+    if _dexcom_executor is None:
+        _dexcom_executor = ThreadPoolExecutor(
+            max_workers=settings.dexcom_client_max_workers,
+            thread_name_prefix="dexcom",
+        )
+    return _dexcom_executor
+
+
+async def run_dexcom_call(fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+    """Run a blocking Dexcom Share call in the dedicated thread pool."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        _get_dexcom_executor(), functools.partial(fn, *args, **kwargs)
+    )
+
+
+def shutdown_dexcom_executor() -> None:
+    """Shut down the Dexcom thread pool (called on application shutdown)."""
+    global _dexcom_executor
+    if _dexcom_executor is not None:
+        _dexcom_executor.shutdown(wait=False, cancel_futures=True)
+        _dexcom_executor = None
+
+
+@dataclass
+class _DexcomSession:
+    """A logged-in Share client and the credentials it was created with."""
+
+    client: Dexcom
+    fingerprint: str
+    last_used: float
+
+
+def _credential_fingerprint(username: str, password: str) -> str:
+    """Hash credentials so a changed password invalidates the cached session."""
+    return hashlib.sha256(f"{username}\0{password}".encode()).hexdigest()
+
+
+class DexcomSessionPool:
+    """Per-user cache of authenticated Dexcom Share clients.
+
+    A cached client keeps its Share session ID, so subsequent syncs skip the
+    login round-trip. Entries are replaced when the user's credentials
+    change and dropped after ``dexcom_session_idle_minutes`` without use.
+    A per-user lock serializes access because pydexcom clients are not
+    safe to share between threads.
+    """
+
+    def __init__(self) -> None:
+        self._sessions: dict[uuid.UUID, _DexcomSession] = {}
+        self._locks: dict[uuid.UUID, asyncio.Lock] = {}
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+    def user_lock(self, user_id: uuid.UUID) -> asyncio.Lock:
+        """Return the lock guarding this user's client."""
+        lock = self._locks.get(user_id)
+        if lock is None:
+            lock = self._locks[user_id] = asyncio.Lock()
+        return lock
+
+    async def get_client(
+        self, user_id: uuid.UUID, username: str, password: str
+    ) -> Dexcom:
+        """Return a cached client, logging in (off-loop) only when needed.
+
+        Raises:
+            pydexcom.errors.AccountError: If the credentials are rejected.
+        """
+        now = time.monotonic()
+        self._evict_idle(now)
+        fingerprint = _credential_fingerprint(username, password)
+
+        session = self._sessions.get(user_id)
+        if session is not None and session.fingerprint == fingerprint:
+            session.last_used = now
+            return session.client
+
+        client = await run_dexcom_call(Dexcom, username=username, password=password)
+        self._sessions[user_id] = _DexcomSession(client, fingerprint, now)
+        logger.debug("Created Dexcom Share session", user_id=str(user_id))
+        return client
+
+    def invalidate(self, user_id: uuid.UUID) -> None:
+        """Drop the cached session so the next sync logs in again."""
+        self._sessions.pop(user_id, None)
+
+    def _evict_idle(self, now: float) -> None:
+        cutoff = now - settings.dexcom_session_idle_minutes * 60
+        for user_id in [
+            uid for uid, s in self._sessions.items() if s.last_used < cutoff
+        ]:
+            del self._sessions[user_id]
+            lock = self._locks.get(user_id)
+            if lock is not None and not lock.locked():
+                del self._locks[user_id]
+
+
+dexcom_sessions = DexcomSessionPool()
+
+
 def map_trend(trend_value: str | int) -> TrendDirection:
     """Map pydexcom trend value to our TrendDirection enum.
 
@@ -103,7 +227,8 @@ async def sync_dexcom_for_user(
         logger.warning("Dexcom integration is disconnected", user_id=str(user_id))
         raise DexcomSyncError("Dexcom integration is disconnected")
 
-    # Decrypt credentials
+    # Decrypt credentials (key derivation runs off-loop on a cold cache)
+    await ensure_encryption_keys()
     try:
         username = decrypt_credential(credential.encrypted_username)
         password = decrypt_credential(credential.encrypted_password)
@@ -118,53 +243,70 @@ async def sync_dexcom_for_user(
         await db.commit()
         raise DexcomSyncError("Failed to decrypt credentials") from e
 
-    # Connect to Dexcom
-    try:
-        dexcom = Dexcom(username=username, password=password)
-    except dexcom_errors.AccountError as e:
-        logger.warning(
-            "Dexcom authentication failed",
-            user_id=str(user_id),
-            error=str(e),
-        )
-        credential.status = IntegrationStatus.ERROR
-        credential.last_error = "Authentication failed - check credentials"
-        await db.commit()
-        raise DexcomAuthError("Invalid Dexcom credentials") from e
-    except Exception as e:
-        logger.error(
-            "Failed to connect to Dexcom",
-            user_id=str(user_id),
-            error=str(e),
-        )
-        credential.status = IntegrationStatus.ERROR
-        credential.last_error = f"Connection failed: {str(e)}"
-        await db.commit()
-        raise DexcomConnectionError(f"Failed to connect: {str(e)}") from e
-
-    # Fetch glucose readings
-    try:
-        readings = dexcom.get_glucose_readings(minutes=60, max_count=max_readings)
-    except dexcom_errors.SessionError as e:
-        logger.warning(
-            "Dexcom session error",
-            user_id=str(user_id),
-            error=str(e),
-        )
-        credential.status = IntegrationStatus.ERROR
-        credential.last_error = "Session error - will retry"
-        await db.commit()
-        raise DexcomConnectionError("Session error") from e
-    except Exception as e:
-        logger.error(
-            "Failed to fetch Dexcom readings",
-            user_id=str(user_id),
-            error=str(e),
-        )
-        credential.status = IntegrationStatus.ERROR
-        credential.last_error = f"Fetch failed: {str(e)}"
-        await db.commit()
-        raise DexcomSyncError(f"Failed to fetch readings: {str(e)}") from e
+    # Reuse the cached Share session; only log in when there is none
+    async with dexcom_sessions.user_lock(user_id):
+        try:
+            dexcom = await dexcom_sessions.get_client(user_id, username, password)
+        except dexcom_errors.AccountError as e:
+            logger.warning(
+                "Dexcom authentication failed",
+                user_id=str(user_id),
+                error=str(e),
+            )
+            credential.status = IntegrationStatus.ERROR
+            credential.last_error = "Authentication failed - check credentials"
+            await db.commit()
+            raise DexcomAuthError("Invalid Dexcom credentials") from e
+        except Exception as e:
+            logger.error(
+                "Failed to connect to Dexcom",
+                user_id=str(user_id),
+                error=str(e),
+            )
+            credential.status = IntegrationStatus.ERROR
+            credential.last_error = f"Connection failed: {str(e)}"
+            await db.commit()
+            raise DexcomConnectionError(f"Failed to connect: {str(e)}") from e
+
+        # Fetch glucose readings (pydexcom re-authenticates once on an
+        # expired session before raising SessionError)
+        try:
+            readings = await run_dexcom_call(
+                dexcom.get_glucose_readings, minutes=60, max_count=max_readings
+            )
+        except dexcom_errors.SessionError as e:
+            dexcom_sessions.invalidate(user_id)
+            logger.warning(
+                "Dexcom session error",
+                user_id=str(user_id),
+                error=str(e),
+            )
+            credential.status = IntegrationStatus.ERROR
+            credential.last_error = "Session error - will retry"
+            await db.commit()
+            raise DexcomConnectionError("Session error") from e
+        except dexcom_errors.AccountError as e:
+            dexcom_sessions.invalidate(user_id)
+            logger.warning(
+                "Dexcom authentication failed",
+                user_id=str(user_id),
+                error=str(e),
+            )
+            credential.status = IntegrationStatus.ERROR
+            credential.last_error = "Authentication failed - check credentials"
+            await db.commit()
+            raise DexcomAuthError("Invalid Dexcom credentials") from e
+        except Exception as e:
+            dexcom_sessions.invalidate(user_id)
+            logger.error(
+                "Failed to fetch Dexcom readings",
+                user_id=str(user_id),
+                error=str(e),
+            )
+            credential.status = IntegrationStatus.ERROR
+            credential.last_error = f"Fetch failed: {str(e)}"
+            await db.commit()
+            raise DexcomSyncError(f"Failed to fetch readings: {str(e)}") from e
 
     if not readings:
         logger.info("No new readings from Dexcom", user_id=str(user_id))
@@ -178,9 +320,9 @@ async def sync_dexcom_for_user(
             "last_reading": None,
         }
 
-    # Store readings (using upsert to handle duplicates)
+    # Store readings in one multi-row upsert (duplicates are skipped)
     now = datetime.now(UTC)
-    stored_count = 0
+    rows = []
     last_reading = None
 
     for reading in readings:
@@ -199,26 +341,19 @@ async def sync_dexcom_for_user(
         if hasattr(reading, "trend_rate"):
             trend_rate = reading.trend_rate
 
-        # Use PostgreSQL upsert (INSERT ON CONFLICT DO NOTHING)
-        stmt = (
-            insert(GlucoseReading)
-            .values(
-                id=uuid.uuid4(),
-                user_id=user_id,
-                value=reading.value,
-                reading_timestamp=reading_time,
-                trend=trend,
-                trend_rate=trend_rate,
-                received_at=now,
-                source="dexcom",
-            )
-            .on_conflict_do_nothing(index_elements=["user_id", "reading_timestamp"])
+        rows.append(
+            {
+                "id": uuid.uuid4(),
+                "user_id": user_id,
+                "value": reading.value,
+                "reading_timestamp": reading_time,
+                "trend": trend,
+                "trend_rate": trend_rate,
+                "received_at": now,
+                "source": "dexcom",
+            }
         )
 
-        result = await db.execute(stmt)
-        if result.rowcount > 0:
-            stored_count += 1
-
         # Track the most recent reading
         if last_reading is None or reading_time > last_reading["timestamp"]:
             last_reading = {
@@ -227,12 +362,20 @@ async def sync_dexcom_for_user(
                 "trend": trend.value,
             }
 
+    ingest = await ingest_glucose_readings(db, rows)
+    stored_count = ingest.inserted
+
     # Update integration status
     credential.status = IntegrationStatus.CONNECTED
     credential.last_sync_at = now
     credential.last_error = None
     await db.commit()
 
+    # Push the new reading to open SSE streams
+    if stored_count:
+        invalidate_diabetes_context(user_id, "glucose")
+        await publish_glucose_update(user_id)
+
     logger.info(
         "Dexcom sync completed",
         user_id=str(user_id),
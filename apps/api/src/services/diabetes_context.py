@@ -6,15 +6,26 @@ profile) into formatted text sections for any AI prompt.
 
 Extracted from telegram_chat.py so that daily briefs, meal analysis,
 correction analysis, and chat all share the same context pipeline.
+
+``build_diabetes_context`` runs before every chat message, so its sections
+are built concurrently, each on its own session, while the knowledge query
+is embedded. Built sections are cached per user for a short TTL, and
+ingestion and settings updates invalidate them, so a burst of chat
+messages builds the context once.
 """
 
+import asyncio
+import time
 import uuid
+from collections.abc import Awaitable, Callable
 from dataclasses import dataclass, field
 from datetime import UTC, datetime, timedelta
 
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.config import settings
+from src.database import get_db_session
 from src.logging_config import get_logger
 from src.services.alert_notifier import trend_description
 from src.services.iob_projection import get_iob_projection, get_user_dia
@@ -33,6 +44,20 @@ GLUCOSE_MAX_READINGS = 72  # ~6 hours of 5-min CGM readings
 DEFAULT_LOW_TARGET = 70.0
 DEFAULT_HIGH_TARGET = 180.0
 
+# How long a built section is reused. Ingestion invalidates the data
+# sections early; settings and the pump profile rarely change.
+SECTION_CACHE_TTL_SECONDS: dict[str, float] = {
+    "glucose": 60,
+    "iob": 60,
+    "pump": 60,
+    "control_iq": 120,
+    "settings": 300,
+    "pump_profile": 300,
+}
+_SECTION_CACHE_MAX_ENTRIES = 10_000
+
+SectionBuilder = Callable[[AsyncSession, uuid.UUID], Awaitable[str | None]]
+
 
 # ── Pump Profile Summary (structured intermediate) ──
 
@@ -287,9 +312,6 @@ async def build_pump_profile_section(
     return format_pump_profile_for_prompt(summary)
 
 
-# ── Composite context builder ──
-
-
 async def build_knowledge_section(
     db: AsyncSession,
     user_id: uuid.UUID,
@@ -317,6 +339,118 @@ async def build_knowledge_section(
     return format_knowledge_for_prompt(chunks)
 
 
+# ── Section cache ──
+
+
+@dataclass(frozen=True)
+class _CachedSection:
+    text: str | None
+    expires_at: float
+
+
+_section_cache: dict[tuple[uuid.UUID, str], _CachedSection] = {}
+# Bumped on invalidation so builds started before it aren't stored after it
+_cache_generations: dict[uuid.UUID, int] = {}
+_inflight: dict[tuple[uuid.UUID, str, int], asyncio.Task] = {}
+_session_slots: asyncio.Semaphore | None = None
+
+
+def invalidate_diabetes_context(user_id: uuid.UUID, *sections: str) -> None:
+    """Drop a user's cached context sections (all of them if none are named).
+
+    Called after new data or settings are committed so the next chat
+    message sees them. Only affects this process; other workers pick the
+    change up when their entries expire.
+    """
+    _cache_generations[user_id] = _cache_generations.get(user_id, 0) + 1
+    for name in sections or SECTION_CACHE_TTL_SECONDS:
+        _section_cache.pop((user_id, name), None)
+
+
+def clear_diabetes_context_cache() -> None:
+    """Drop every cached section (used by tests)."""
+    _section_cache.clear()
+    _cache_generations.clear()
+
+
+def _store_section(key: tuple[uuid.UUID, str], text: str | None) -> None:
+    now = time.monotonic()
+    if len(_section_cache) >= _SECTION_CACHE_MAX_ENTRIES:
+        for stale in [k for k, v in _section_cache.items() if v.expires_at <= now]:
+            del _section_cache[stale]
+        if len(_section_cache) >= _SECTION_CACHE_MAX_ENTRIES:
+            _section_cache.clear()
+    _section_cache[key] = _CachedSection(
+        text=text, expires_at=now + SECTION_CACHE_TTL_SECONDS[key[1]]
+    )
+
+
+def _get_session_slots() -> asyncio.Semaphore:
+    """Process-wide cap on sessions held by section builders."""
+    global _session_slots
+    if _session_slots is None:
+        _session_slots = asyncio.Semaphore(settings.diabetes_context_max_sessions)
+    return _session_slots
+
+
+async def _build_section_uncached(
+    name: str, builder: SectionBuilder, user_id: uuid.UUID, generation: int
+) -> str | None:
+    async with _get_session_slots(), get_db_session() as session:
+        text = await builder(session, user_id)
+    if _cache_generations.get(user_id, 0) == generation:
+        _store_section((user_id, name), text)
+    return text
+
+
+async def _get_section(
+    name: str, builder: SectionBuilder, user_id: uuid.UUID
+) -> tuple[str | None, bool]:
+    """Return ``(section, cache_hit)``, building the section if needed.
+
+    Concurrent callers for the same user and section share one build.
+    """
+    cached = _section_cache.get((user_id, name))
+    if cached is not None and cached.expires_at > time.monotonic():
+        return cached.text, True
+
+    generation = _cache_generations.get(user_id, 0)
+    key = (user_id, name, generation)
+    task = _inflight.get(key)
+    if task is None:
+        task = asyncio.create_task(
+            _build_section_uncached(name, builder, user_id, generation)
+        )
+        _inflight[key] = task
+
+        def _done(finished: asyncio.Task) -> None:
+            if _inflight.get(key) is finished:
+                del _inflight[key]
+            if not finished.cancelled():
+                finished.exception()  # Awaiters log it; don't warn twice
+
+        task.add_done_callback(_done)
+    # Shielded so one cancelled caller doesn't cancel the shared build
+    return await asyncio.shield(task), False
+
+
+# ── Composite context builder ──
+
+
+async def _timed(
+    coro: Awaitable[tuple[str | None, bool]],
+) -> tuple[str | None, bool, float]:
+    started = time.perf_counter()
+    text, cache_hit = await coro
+    return text, cache_hit, (time.perf_counter() - started) * 1000
+
+
+async def _knowledge_result(
+    db: AsyncSession, user_id: uuid.UUID, query: str
+) -> tuple[str | None, bool]:
+    return await build_knowledge_section(db, user_id, query), False
+
+
 async def build_diabetes_context(
     db: AsyncSession,
     user_id: uuid.UUID,
@@ -329,8 +463,12 @@ async def build_diabetes_context(
     clinical knowledge (when a query is provided). Each section is
     independently resilient -- if one fails, the others still populate.
 
+    The data sections are built concurrently on their own sessions (or
+    served from the section cache), while knowledge retrieval embeds the
+    query and searches on ``db``. Sections keep their fixed order.
+
     Args:
-        db: Database session.
+        db: Database session (used for knowledge retrieval).
         user_id: User's UUID.
         query: Optional user question for knowledge retrieval.
 
@@ -338,7 +476,7 @@ async def build_diabetes_context(
         A formatted string describing all available diabetes data,
         or a fallback message if no data is available.
     """
-    builders: list[tuple[str, object]] = [
+    builders: list[tuple[str, SectionBuilder]] = [
         ("glucose", build_glucose_section),
         ("iob", build_iob_section),
         ("pump", build_pump_section),
@@ -347,42 +485,48 @@ async def build_diabetes_context(
         ("pump_profile", build_pump_profile_section),
     ]
 
+    started = time.perf_counter()
+    jobs = [_timed(_get_section(name, builder, user_id)) for name, builder in builders]
+    names = [name for name, _ in builders]
+    # Knowledge retrieval section (only when a user query is provided)
+    if query:
+        jobs.append(_timed(_knowledge_result(db, user_id, query)))
+        names.append("knowledge")
+    results = await asyncio.gather(*jobs, return_exceptions=True)
+
     sections: list[str] = []
-    for name, builder in builders:
-        try:
-            section = await builder(db, user_id)
-            if section:
-                sections.append(section)
-        except Exception:
+    section_ms: dict[str, float] = {}
+    cached: list[str] = []
+    for name, result in zip(names, results, strict=True):
+        if isinstance(result, BaseException):
+            if not isinstance(result, Exception):
+                raise result
             logger.warning(
                 "Failed to build context section",
                 section=name,
                 user_id=str(user_id),
-                exc_info=True,
-            )
-
-    # Knowledge retrieval section (only when a user query is provided)
-    if query:
-        try:
-            knowledge = await build_knowledge_section(db, user_id, query)
-            if knowledge:
-                sections.append(knowledge)
-        except Exception:
-            logger.warning(
-                "Failed to build knowledge section",
-                user_id=str(user_id),
-                exc_info=True,
+                exc_info=result,
             )
+            continue
+        section, cache_hit, elapsed_ms = result
+        section_ms[name] = round(elapsed_ms, 1)
+        if cache_hit:
+            cached.append(name)
+        if section:
+            sections.append(section)
 
     if not sections:
         return "Recent diabetes data: No data available."
 
     context = "\n\n".join(sections)
-    logger.debug(
+    logger.info(
         "Diabetes context built",
         user_id=str(user_id),
         sections_count=len(sections),
         context_length=len(context),
+        total_ms=round((time.perf_counter() - started) * 1000, 1),
+        section_ms=section_ms,
+        cached_sections=cached,
     )
     return context
 
@@ -2,12 +2,34 @@
 
 Generates text embeddings using fastembed (in-process, CPU-only).
 The model downloads on first use (~500MB) and caches to disk.
+
+Model calls run on a dedicated, size-limited thread pool
+(``embedding_max_workers``) so CPU-bound embedding can't starve the
+default executor. Query embeddings (``embed_query``) are cached in an
+LRU keyed on whitespace-normalized text, and concurrent requests arriving
+within ``embedding_batch_window_ms`` are coalesced into one model call.
+Vectors are returned as read-only float32 arrays; pgvector binds them
+directly.
+
+At startup the model is loaded by a background warm-up
+(``start_model_warmup``) so the API serves requests while it downloads.
+``get_model_status`` reports progress; callers on the request path check
+``is_model_ready`` and skip embedding until the model is loaded.
 """
 
+import asyncio
+import enum
 import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+import numpy as np
 
 from src.config import settings
 from src.logging_config import get_logger
+from src.services.startup_profile import record_background_phase
 
 logger = get_logger(__name__)
 
@@ -18,6 +40,22 @@ _model_lock = threading.Lock()
 # Default model -- good balance of quality and size, runs on CPU
 DEFAULT_EMBEDDING_MODEL = "nomic-ai/nomic-embed-text-v1.5"
 
+# A failed warm-up (e.g. model download unavailable) is retried after this
+_WARMUP_RETRY_SECONDS = 300
+
+_embedding_executor: ThreadPoolExecutor | None = None
+_warmup_task: asyncio.Task | None = None
+_warmup_failed_at: float | None = None
+
+
+class ModelStatus(str, enum.Enum):
+    """Embedding model load state."""
+
+    COLD = "cold"
+    LOADING = "loading"
+    READY = "ready"
+    FAILED = "failed"
+
 
 def _get_model():
     """Get or initialize the embedding model (lazy loading)."""
@@ -37,41 +75,287 @@ def _get_model():
     return _model
 
 
-def embed_text(text: str) -> list[float]:
+def _get_embedding_executor() -> ThreadPoolExecutor:
+    """Return the dedicated thread pool for model calls."""
+    global _embedding_executor
+    if _embedding_executor is None:
+        _embedding_executor = ThreadPoolExecutor(
+            max_workers=settings.embedding_max_workers,
+            thread_name_prefix="embedding",
+        )
+    return _embedding_executor
+
+
+def shutdown_embedding_executor() -> None:
+    """Shut down the embedding thread pool (called on application shutdown)."""
+    global _embedding_executor
+    if _embedding_executor is not None:
+        _embedding_executor.shutdown(wait=False, cancel_futures=True)
+        _embedding_executor = None
+
+
+def embed_text(text: str) -> np.ndarray:
     """Embed a single text string into a vector.
 
     Args:
         text: Text to embed (should be under ~512 tokens for best results).
 
     Returns:
-        List of floats representing the embedding vector (768 dimensions).
+        float32 embedding vector (768 dimensions).
     """
-    model = _get_model()
-    embeddings = list(model.embed([text]))
-    return embeddings[0].tolist()
+    return embed_texts([text])[0]
 
 
-def embed_texts(texts: list[str]) -> list[list[float]]:
+def embed_texts(texts: list[str]) -> list[np.ndarray]:
     """Embed multiple texts in a batch.
 
     Args:
         texts: List of text strings to embed.
 
     Returns:
-        List of embedding vectors.
+        List of float32 embedding vectors.
     """
     if not texts:
         return []
     model = _get_model()
-    embeddings = list(model.embed(texts))
-    return [e.tolist() for e in embeddings]
+    return [np.asarray(e, dtype=np.float32) for e in model.embed(texts)]
+
+
+async def embed_documents(texts: list[str]) -> list[np.ndarray]:
+    """Embed documents for storage on the embedding thread pool.
+
+    Args:
+        texts: List of text strings to embed.
+
+    Returns:
+        List of float32 embedding vectors.
+    """
+    if not texts:
+        return []
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_get_embedding_executor(), embed_texts, texts)
+
+
+def _normalize(text: str) -> str:
+    return " ".join(text.split())
+
+
+class _QueryBatcher:
+    """Coalesces concurrent query embeddings into micro-batches.
+
+    The first request opens a batch window; requests arriving within it
+    (or until ``embedding_max_batch_size`` texts are queued) are embedded
+    with one model call. Requests for a text already queued or being
+    embedded share its result.
+    """
+
+    def __init__(self, loop: asyncio.AbstractEventLoop) -> None:
+        self.loop = loop
+        self._futures: dict[str, asyncio.Future[np.ndarray]] = {}
+        self._queued: list[str] = []
+        self._flush_handle: asyncio.TimerHandle | None = None
+        self._tasks: set[asyncio.Task] = set()
+
+    def submit(self, key: str) -> tuple[asyncio.Future[np.ndarray], bool]:
+        """Return the future for ``key`` and whether it was already pending."""
+        future = self._futures.get(key)
+        if future is not None:
+            return future, True
+
+        future = self.loop.create_future()
+        # Waiters handle failures; don't warn if every waiter went away
+        future.add_done_callback(lambda f: f.cancelled() or f.exception())
+        self._futures[key] = future
+        self._queued.append(key)
+        if len(self._queued) >= settings.embedding_max_batch_size:
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = self.loop.call_later(
+                settings.embedding_batch_window_ms / 1000, self._flush
+            )
+        return future, False
+
+    def _flush(self) -> None:
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        keys, self._queued = self._queued, []
+        if not keys:
+            return
+        task = self.loop.create_task(self._run(keys))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, keys: list[str]) -> None:
+        _stats["batches"] += 1
+        _stats["texts_embedded"] += len(keys)
+        _stats["max_batch_size"] = max(_stats["max_batch_size"], len(keys))
+        try:
+            vectors = await self.loop.run_in_executor(
+                _get_embedding_executor(), embed_texts, keys
+            )
+        except Exception as e:
+            for key in keys:
+                future = self._futures.pop(key)
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for key, vector in zip(keys, vectors, strict=True):
+            vector.flags.writeable = False  # Shared by waiters and the cache
+            _cache_put(key, vector)
+            future = self._futures.pop(key)
+            if not future.done():
+                future.set_result(vector)
+
+
+_query_cache: OrderedDict[str, np.ndarray] = OrderedDict()
+_batcher: _QueryBatcher | None = None
+_stats: dict[str, int] = {
+    "cache_hits": 0,
+    "cache_misses": 0,
+    "coalesced": 0,
+    "batches": 0,
+    "texts_embedded": 0,
+    "max_batch_size": 0,
+}
+
+
+def _cache_put(key: str, vector: np.ndarray) -> None:
+    if settings.embedding_query_cache_size <= 0:
+        return
+    _query_cache[key] = vector
+    _query_cache.move_to_end(key)
+    while len(_query_cache) > settings.embedding_query_cache_size:
+        _query_cache.popitem(last=False)
+
+
+def _get_batcher() -> _QueryBatcher:
+    """Return the batcher for the running loop (futures are loop-bound)."""
+    global _batcher
+    loop = asyncio.get_running_loop()
+    if _batcher is None or _batcher.loop is not loop:
+        _batcher = _QueryBatcher(loop)
+    return _batcher
+
+
+async def embed_query(text: str) -> np.ndarray:
+    """Embed a search query, using the query cache and micro-batching.
+
+    Args:
+        text: Query text to embed.
+
+    Returns:
+        Read-only float32 embedding vector.
+    """
+    key = _normalize(text)
+    cached = _query_cache.get(key)
+    if cached is not None:
+        _query_cache.move_to_end(key)
+        _stats["cache_hits"] += 1
+        return cached
+
+    _stats["cache_misses"] += 1
+    future, shared = _get_batcher().submit(key)
+    if shared:
+        _stats["coalesced"] += 1
+    # Shielded so one cancelled caller doesn't cancel a shared result
+    return await asyncio.shield(future)
+
+
+def clear_embedding_cache() -> None:
+    """Drop cached query embeddings and counters (used by tests and benchmarks)."""
+    global _batcher
+    _query_cache.clear()
+    _batcher = None
+    for name in _stats:
+        _stats[name] = 0
+
+
+def get_embedding_stats() -> dict[str, Any]:
+    """Return query cache and micro-batching counters."""
+    batches = _stats["batches"]
+    return {
+        **_stats,
+        "cache_entries": len(_query_cache),
+        "cache_max_entries": settings.embedding_query_cache_size,
+        "mean_batch_size": (
+            round(_stats["texts_embedded"] / batches, 2) if batches else 0.0
+        ),
+        "max_workers": settings.embedding_max_workers,
+        "batch_window_ms": settings.embedding_batch_window_ms,
+    }
 
 
 def preload_model() -> None:
-    """Pre-download and load the embedding model.
+    """Pre-download and load the embedding model (blocking).
 
-    Called during API startup to ensure the model is ready
-    before the first request. Downloads ~500MB on first run.
+    Downloads ~500MB on first run.
     """
     _get_model()
     logger.info("Embedding model preloaded and ready")
+
+
+def _warmup_running() -> bool:
+    return _warmup_task is not None and not _warmup_task.done()
+
+
+def get_model_status() -> ModelStatus:
+    """Return the embedding model load state."""
+    if _model is not None:
+        return ModelStatus.READY
+    if _warmup_running():
+        return ModelStatus.LOADING
+    if _warmup_failed_at is not None:
+        return ModelStatus.FAILED
+    return ModelStatus.COLD
+
+
+def is_model_ready() -> bool:
+    """Whether the model is loaded and embedding won't block on a download."""
+    return _model is not None
+
+
+async def _warm_up() -> None:
+    global _warmup_failed_at
+    started = time.perf_counter()
+    loop = asyncio.get_running_loop()
+    try:
+        await loop.run_in_executor(_get_embedding_executor(), preload_model)
+    except Exception:
+        _warmup_failed_at = time.monotonic()
+        logger.warning("Embedding model warm-up failed", exc_info=True)
+        return
+    _warmup_failed_at = None
+    record_background_phase(
+        "embedding_model_warmup", (time.perf_counter() - started) * 1000
+    )
+
+
+def start_model_warmup() -> None:
+    """Start loading the model in the background, if not loaded or loading.
+
+    Safe to call repeatedly; after a failure the warm-up is retried at
+    most every ``_WARMUP_RETRY_SECONDS``.
+    """
+    global _warmup_task
+    if _model is not None or _warmup_running():
+        return
+    if (
+        _warmup_failed_at is not None
+        and time.monotonic() - _warmup_failed_at < _WARMUP_RETRY_SECONDS
+    ):
+        return
+    _warmup_task = asyncio.get_running_loop().create_task(_warm_up())
+
+
+async def stop_model_warmup() -> None:
+    """Stop waiting for an in-progress warm-up (at shutdown).
+
+    The model load itself can't be interrupted; its thread is abandoned
+    when the embedding pool shuts down.
+    """
+    global _warmup_task
+    if _warmup_running():
+        _warmup_task.cancel()
+    _warmup_task = None
@@ -0,0 +1,373 @@
+"""In-process pub/sub hub for pushing SSE events.
+
+Ingestion (Dexcom/Tandem sync, mobile pump push) and the predictive alert
+engine publish events here; the glucose and alert SSE generators subscribe
+per user instead of polling the database on a timer, so DB load scales
+with the rate of new data rather than with the number of open streams.
+
+With ``EVENT_HUB_BACKEND=redis`` every publish goes through a Redis pub/sub
+channel and each worker's listener dispatches to its local subscribers, so
+multi-worker deployments deliver an event to every connection exactly once.
+The default ``memory`` backend dispatches directly within the process.
+
+Every event gets a stable, globally ordered integer ID derived from the
+publish time (milliseconds * 1000 plus a tie-breaking sequence), so IDs keep
+increasing across restarts. With Redis the ID is allocated and published in
+one atomic script, so all workers see the same IDs in the same order. A
+bounded ring buffer of recent events per ``(channel, user_id)`` lets a
+reconnecting stream replay exactly what it missed after its
+``Last-Event-ID`` without querying the database.
+"""
+
+import asyncio
+import contextlib
+import json
+import time
+from collections import deque
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from typing import Any
+
+import redis.asyncio as aioredis
+
+from src.config import settings
+from src.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+GLUCOSE_CHANNEL = "glucose"
+ALERT_CHANNEL = "alert"
+
+_REDIS_CHANNEL = "glycemicgpt:events"
+_REDIS_ID_KEY = "glycemicgpt:events:last_id"
+_SUBSCRIBER_QUEUE_SIZE = 100
+_LISTENER_RETRY_SECONDS = 5
+
+# Event IDs are publish time in ms * _IDS_PER_MS plus a sequence number
+_IDS_PER_MS = 1000
+
+# Allocates the next event ID (never below the caller's clock-based ID, always
+# above the last one issued) and publishes "<id> <json>" atomically, so
+# subscribers on every worker receive events in ID order.
+_PUBLISH_SCRIPT = """
+local id = tonumber(ARGV[1])
+local last = tonumber(redis.call('GET', KEYS[1]) or '0')
+if last >= id then id = last + 1 end
+local encoded = string.format('%d', id)
+redis.call('SET', KEYS[1], encoded)
+redis.call('PUBLISH', KEYS[2], encoded .. ' ' .. ARGV[2])
+return encoded
+"""
+
+SubscriptionKey = tuple[str, str]
+
+
+def _clock_event_id() -> int:
+    """Smallest event ID that may be issued at the current time."""
+    return time.time_ns() // 1_000_000 * _IDS_PER_MS
+
+
+@dataclass(frozen=True)
+class HubEvent:
+    """An event published to the hub.
+
+    Attributes:
+        channel: Event channel (``GLUCOSE_CHANNEL`` or ``ALERT_CHANNEL``).
+        user_id: The user the event belongs to (stringified UUID).
+        data: JSON-serializable payload.
+        id: Globally ordered event ID, sent to clients as the SSE ``id``.
+    """
+
+    channel: str
+    user_id: str
+    data: dict[str, Any]
+    id: int = 0
+
+    def to_json(self) -> str:
+        return json.dumps(
+            {"channel": self.channel, "user_id": self.user_id, "data": self.data}
+        )
+
+    @classmethod
+    def from_json(cls, raw: str | bytes, event_id: int = 0) -> "HubEvent":
+        payload = json.loads(raw)
+        return cls(
+            channel=payload["channel"],
+            user_id=payload["user_id"],
+            data=payload["data"],
+            id=event_id,
+        )
+
+    @classmethod
+    def from_wire(cls, raw: str | bytes) -> "HubEvent":
+        """Parse an ``"<id> <json>"`` message published by the Redis script."""
+        if isinstance(raw, bytes):
+            raw = raw.decode()
+        event_id, _, body = raw.partition(" ")
+        return cls.from_json(body, event_id=int(event_id))
+
+
+@dataclass
+class _ReplayBuffer:
+    """Recent events for one ``(channel, user_id)``.
+
+    ``floor_id`` is the newest event ID that may be missing from the buffer
+    (evicted, or published before buffering began); replay is only complete
+    for clients that have already seen it.
+    """
+
+    events: deque[HubEvent]
+    floor_id: int
+    touched: float = field(default_factory=time.monotonic)
+
+    def append(self, event: HubEvent) -> None:
+        if len(self.events) == self.events.maxlen:
+            self.floor_id = self.events[0].id
+        self.events.append(event)
+        self.touched = time.monotonic()
+
+
+class Subscription:
+    """A bounded queue of events for one SSE connection.
+
+    If a slow client lets the queue fill up, the oldest event is dropped so
+    publishers never block on a subscriber.
+    """
+
+    def __init__(self, hub: "EventHub", keys: list[SubscriptionKey]) -> None:
+        self._hub = hub
+        self.keys = keys
+        self.queue: asyncio.Queue[HubEvent] = asyncio.Queue(
+            maxsize=_SUBSCRIBER_QUEUE_SIZE
+        )
+        self.dropped = 0
+
+    def put(self, event: HubEvent) -> None:
+        if self.queue.full():
+            self.queue.get_nowait()
+            self.dropped += 1
+        self.queue.put_nowait(event)
+
+    async def get(self, timeout: float) -> HubEvent | None:
+        """Wait up to ``timeout`` seconds for the next event."""
+        try:
+            return await asyncio.wait_for(self.queue.get(), timeout)
+        except TimeoutError:
+            return None
+
+    def close(self) -> None:
+        """Unsubscribe from the hub."""
+        self._hub._unsubscribe(self)
+
+    def __enter__(self) -> "Subscription":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+
+class EventHub:
+    """Routes published events to per-user subscriptions."""
+
+    def __init__(self) -> None:
+        self._subscribers: dict[SubscriptionKey, set[Subscription]] = {}
+        self._buffers: dict[SubscriptionKey, _ReplayBuffer] = {}
+        self._last_id = 0
+        # Nothing before this hub existed was buffered (e.g. IDs a client
+        # got from the worker before a restart), so those need a snapshot
+        self._listening_since = _clock_event_id()
+        self._redis: aioredis.Redis | None = None
+        self._listener: asyncio.Task | None = None
+
+    @property
+    def uses_redis(self) -> bool:
+        return settings.event_hub_backend == "redis" and not settings.testing
+
+    @property
+    def last_event_id(self) -> int:
+        """ID of the newest event this worker has dispatched.
+
+        Streams send it with their initial snapshot so a client that
+        reconnects afterwards resumes from that point.
+        """
+        return max(self._last_id, self._listening_since)
+
+    def subscribe(self, keys: Iterable[SubscriptionKey]) -> Subscription:
+        """Subscribe to ``(channel, user_id)`` pairs.
+
+        Also starts buffering events for those keys (if not already), so
+        a later reconnect can replay what was missed.
+        """
+        self._prune_buffers()
+        subscription = Subscription(self, list(keys))
+        for key in subscription.keys:
+            self._subscribers.setdefault(key, set()).add(subscription)
+            self._buffer_for(key).touched = time.monotonic()
+        return subscription
+
+    def _unsubscribe(self, subscription: Subscription) -> None:
+        for key in subscription.keys:
+            buffer = self._buffers.get(key)
+            if buffer is not None:
+                buffer.touched = time.monotonic()
+            subscribers = self._subscribers.get(key)
+            if subscribers is None:
+                continue
+            subscribers.discard(subscription)
+            if not subscribers:
+                del self._subscribers[key]
+
+    def has_subscribers(self, channel: str, user_id: str) -> bool:
+        """Return True if anyone might receive events for this user.
+
+        Includes users whose stream recently closed (their events are still
+        buffered for replay). With the Redis backend other workers may have
+        subscribers, so this is always True; callers use it to skip
+        building payloads nobody will read.
+        """
+        key = (channel, user_id)
+        return self.uses_redis or key in self._subscribers or key in self._buffers
+
+    def subscriber_count(self) -> int:
+        """Number of distinct local subscriptions (open SSE streams)."""
+        return len({s for subs in self._subscribers.values() for s in subs})
+
+    def replay(
+        self, keys: Iterable[SubscriptionKey], after_id: int
+    ) -> list[HubEvent] | None:
+        """Return buffered events newer than ``after_id``, in ID order.
+
+        Returns None if the buffers cannot prove nothing was missed (events
+        were evicted, or were published before this worker was buffering
+        them); the caller should fall back to a full snapshot.
+        """
+        events: list[HubEvent] = []
+        for key in keys:
+            buffer = self._buffers.get(key)
+            if buffer is None or after_id < buffer.floor_id:
+                return None
+            events.extend(e for e in buffer.events if e.id > after_id)
+        events.sort(key=lambda e: e.id)
+        return events
+
+    def _buffer_for(self, key: SubscriptionKey) -> _ReplayBuffer:
+        buffer = self._buffers.get(key)
+        if buffer is None:
+            # Nothing published before now was buffered. A Redis listener
+            # has seen every event since it connected.
+            floor = self._listening_since if self.uses_redis else self.last_event_id
+            buffer = _ReplayBuffer(
+                events=deque(maxlen=settings.sse_replay_buffer_size),
+                floor_id=floor,
+            )
+            self._buffers[key] = buffer
+        return buffer
+
+    def _prune_buffers(self) -> None:
+        """Drop buffers with no subscribers that have been idle too long."""
+        cutoff = time.monotonic() - settings.sse_replay_window_minutes * 60
+        stale = [
+            key
+            for key, buffer in self._buffers.items()
+            if buffer.touched < cutoff and key not in self._subscribers
+        ]
+        for key in stale:
+            del self._buffers[key]
+
+    def _dispatch(self, event: HubEvent) -> None:
+        self._last_id = max(self._last_id, event.id)
+        key = (event.channel, event.user_id)
+        if self.uses_redis or key in self._buffers:
+            self._buffer_for(key).append(event)
+        for subscription in self._subscribers.get(key, ()):
+            subscription.put(event)
+
+    def _next_local_id(self) -> int:
+        self._last_id = max(self._last_id + 1, _clock_event_id())
+        return self._last_id
+
+    async def publish(self, channel: str, user_id: str, data: dict[str, Any]) -> None:
+        """Publish an event to every subscriber of ``(channel, user_id)``.
+
+        Falls back to local dispatch if Redis is unavailable, so at least
+        this worker's streams still receive the event.
+        """
+        event = HubEvent(channel=channel, user_id=str(user_id), data=data)
+        if self.uses_redis:
+            try:
+                await self._get_redis().eval(
+                    _PUBLISH_SCRIPT,
+                    2,
+                    _REDIS_ID_KEY,
+                    _REDIS_CHANNEL,
+                    _clock_event_id(),
+                    event.to_json(),
+                )
+                self._prune_buffers()
+                return
+            except aioredis.RedisError as e:
+                logger.warning("Event hub Redis publish failed", error=str(e))
+        self._dispatch(
+            HubEvent(
+                channel=event.channel,
+                user_id=event.user_id,
+                data=event.data,
+                id=self._next_local_id(),
+            )
+        )
+        self._prune_buffers()
+
+    def _get_redis(self) -> aioredis.Redis:
+        if self._redis is None:
+            self._redis = aioredis.from_url(
+                settings.redis_url,
+                socket_connect_timeout=2,
+            )
+        return self._redis
+
+    async def _listen(self) -> None:
+        """Relay events from Redis to local subscribers, reconnecting on error."""
+        while True:
+            try:
+                pubsub = self._get_redis().pubsub(ignore_subscribe_messages=True)
+                await pubsub.subscribe(_REDIS_CHANNEL)
+                # Events published while disconnected were never buffered
+                self._listening_since = max(self._last_id, _clock_event_id())
+                for buffer in self._buffers.values():
+                    buffer.floor_id = max(buffer.floor_id, self._listening_since)
+                try:
+                    async for message in pubsub.listen():
+                        try:
+                            self._dispatch(HubEvent.from_wire(message["data"]))
+                        except (ValueError, KeyError) as e:
+                            logger.warning("Malformed event hub message", error=str(e))
+                finally:
+                    await pubsub.aclose()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(
+                    "Event hub Redis listener error; reconnecting",
+                    error=str(e),
+                )
+                await asyncio.sleep(_LISTENER_RETRY_SECONDS)
+
+    async def start(self) -> None:
+        """Start the Redis listener when the Redis backend is enabled."""
+        if self.uses_redis and self._listener is None:
+            self._listener = asyncio.create_task(self._listen())
+            logger.info("Event hub Redis listener started")
+
+    async def stop(self) -> None:
+        """Stop the Redis listener and close the connection."""
+        if self._listener is not None:
+            self._listener.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._listener
+            self._listener = None
+        if self._redis is not None:
+            await self._redis.aclose()
+            self._redis = None
+
+
+event_hub = EventHub()
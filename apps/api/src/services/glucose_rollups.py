@@ -0,0 +1,366 @@
+"""Glucose analytics over pre-aggregated rollups.
+
+The time-in-range, stats and AGP endpoints summarize weeks of readings.
+Instead of scanning every raw reading in the window, a window is split
+into whole UTC days (read from daily rollups), whole UTC hours at either
+end (hourly rollups) and the partial hours at the very edges (raw
+readings), so the cost of a query barely grows with its length.
+
+Rollups store a histogram of exact mg/dL values, so counts for any
+thresholds and percentiles come out identical to computing them from the
+raw readings.
+"""
+
+import math
+import uuid
+import zoneinfo
+from bisect import bisect_right
+from collections import Counter
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass, field
+from datetime import UTC, datetime, timedelta, tzinfo
+from itertools import accumulate
+
+from sqlalchemy import (
+    BigInteger,
+    Integer,
+    and_,
+    func,
+    literal,
+    or_,
+    select,
+    true,
+    union_all,
+)
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.models.glucose import GlucoseReading
+from src.models.glucose_rollup import (
+    ROLLUP_PERIOD_DAY,
+    ROLLUP_PERIOD_HOUR,
+    GlucoseRollup,
+)
+
+# Readings outside this range are treated as sensor errors everywhere
+MIN_PLAUSIBLE_GLUCOSE = 20
+MAX_PLAUSIBLE_GLUCOSE = 500
+
+_HOUR = timedelta(hours=1)
+_DAY = timedelta(days=1)
+_EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+
+TimeRange = tuple[datetime, datetime | None]
+
+
+def _floor(ts: datetime, step: timedelta) -> datetime:
+    return _EPOCH + (ts - _EPOCH) // step * step
+
+
+def _ceil(ts: datetime, step: timedelta) -> datetime:
+    floored = _floor(ts, step)
+    return floored if floored == ts else floored + step
+
+
+@dataclass(frozen=True)
+class WindowPlan:
+    """How a ``[start, end)`` window is split across rollups and raw rows.
+
+    Attributes:
+        days: Ranges of whole UTC days to read from daily rollups.
+        hours: Ranges of whole UTC hours to read from hourly rollups.
+        raw: Partial-hour ranges to read from raw readings (an open end
+            means "no upper bound").
+    """
+
+    days: list[tuple[datetime, datetime]] = field(default_factory=list)
+    hours: list[tuple[datetime, datetime]] = field(default_factory=list)
+    raw: list[TimeRange] = field(default_factory=list)
+
+
+def plan_window(
+    start: datetime,
+    end: datetime | None,
+    *,
+    now: datetime | None = None,
+    use_days: bool = True,
+) -> WindowPlan:
+    """Split ``[start, end)`` into day, hour and raw segments.
+
+    Args:
+        start: Inclusive window start.
+        end: Exclusive window end, or None for no upper bound (whole hours
+            up to ``now`` come from rollups, the rest from raw readings).
+        now: Current time, used when ``end`` is None.
+        use_days: Whether to use daily rollups; when False every whole hour
+            is read from hourly rollups.
+    """
+    start = start.astimezone(UTC)
+    limit = end if end is not None else (now or datetime.now(UTC))
+    first_hour = _ceil(start, _HOUR)
+    last_hour = _floor(limit.astimezone(UTC), _HOUR)
+    if first_hour >= last_hour:
+        return WindowPlan(raw=[(start, end)])
+
+    plan = WindowPlan()
+    first_day = _ceil(first_hour, _DAY)
+    last_day = _floor(last_hour, _DAY)
+    if use_days and first_day < last_day:
+        plan.days.append((first_day, last_day))
+        for hour_range in ((first_hour, first_day), (last_day, last_hour)):
+            if hour_range[0] < hour_range[1]:
+                plan.hours.append(hour_range)
+    else:
+        plan.hours.append((first_hour, last_hour))
+
+    if start < first_hour:
+        plan.raw.append((start, first_hour))
+    if end is None or last_hour < end:
+        plan.raw.append((last_hour, end))
+    return plan
+
+
+@dataclass
+class GlucoseSummary:
+    """Aggregate of a set of glucose readings.
+
+    ``histogram`` maps each mg/dL value to its number of readings; it is
+    left empty when only count/sum/sum-of-squares were requested.
+    """
+
+    count: int = 0
+    value_sum: int = 0
+    value_sq_sum: int = 0
+    histogram: Counter[int] = field(default_factory=Counter)
+
+    @classmethod
+    def from_histogram(cls, histogram: Mapping[int, int]) -> "GlucoseSummary":
+        summary = cls(histogram=Counter(histogram))
+        for value, n in summary.histogram.items():
+            summary.count += n
+            summary.value_sum += n * value
+            summary.value_sq_sum += n * value * value
+        return summary
+
+    @property
+    def mean(self) -> float:
+        return self.value_sum / self.count if self.count else 0.0
+
+    @property
+    def std_dev(self) -> float:
+        """Population standard deviation."""
+        if not self.count:
+            return 0.0
+        # Exact integer variance numerator avoids cancellation error
+        spread = self.count * self.value_sq_sum - self.value_sum * self.value_sum
+        return math.sqrt(max(spread, 0)) / self.count
+
+    def count_where(self, predicate: Callable[[int], bool]) -> int:
+        """Number of readings whose value satisfies ``predicate``."""
+        return sum(n for value, n in self.histogram.items() if predicate(value))
+
+    def percentile(self, pct: float) -> float:
+        """Percentile using linear interpolation (matching numpy default)."""
+        if not self.count:
+            return 0.0
+        values = sorted(self.histogram)
+        # cumulative[i] = number of readings <= values[i]
+        cumulative = list(accumulate(self.histogram[v] for v in values))
+
+        def nth(index: int) -> int:
+            return values[bisect_right(cumulative, index)]
+
+        k = (self.count - 1) * (pct / 100)
+        f = math.floor(k)
+        c = math.ceil(k)
+        if f == c:
+            return round(float(nth(int(k))), 1)
+        return round(nth(f) * (c - k) + nth(c) * (k - f), 1)
+
+
+def _time_filter(column, ranges: list[TimeRange]):
+    clauses = []
+    for range_start, range_end in ranges:
+        clause = column >= range_start
+        if range_end is not None:
+            clause = and_(clause, column < range_end)
+        clauses.append(clause)
+    return or_(*clauses)
+
+
+def _rollup_filter(user_id: uuid.UUID, plan: WindowPlan):
+    segments = [
+        and_(
+            GlucoseRollup.period == period,
+            _time_filter(GlucoseRollup.bucket_start, ranges),
+        )
+        for period, ranges in (
+            (ROLLUP_PERIOD_DAY, plan.days),
+            (ROLLUP_PERIOD_HOUR, plan.hours),
+        )
+        if ranges
+    ]
+    return and_(GlucoseRollup.user_id == user_id, or_(*segments))
+
+
+def _raw_filter(user_id: uuid.UUID, plan: WindowPlan):
+    return and_(
+        GlucoseReading.user_id == user_id,
+        _time_filter(GlucoseReading.reading_timestamp, plan.raw),
+        GlucoseReading.value >= MIN_PLAUSIBLE_GLUCOSE,
+        GlucoseReading.value <= MAX_PLAUSIBLE_GLUCOSE,
+    )
+
+
+def _histogram_query(user_id: uuid.UUID, plan: WindowPlan, tz_name: str | None):
+    """Select ``(hour, bin, n)`` rows merging rollup and raw histograms.
+
+    ``hour`` is the local hour of day in ``tz_name``, or 0 if None.
+    """
+
+    def local_hour(column):
+        if tz_name is None:
+            return literal(0)
+        return func.extract("hour", func.timezone(tz_name, column)).cast(Integer)
+
+    parts = []
+    if plan.days or plan.hours:
+        bins = func.jsonb_each_text(GlucoseRollup.histogram).table_valued(
+            "key", "value", name="bins"
+        )
+        parts.append(
+            select(
+                local_hour(GlucoseRollup.bucket_start).label("hour"),
+                bins.c.key.cast(Integer).label("bin"),
+                bins.c.value.cast(BigInteger).label("n"),
+            )
+            .select_from(GlucoseRollup)
+            .join(bins, true())
+            .where(_rollup_filter(user_id, plan))
+        )
+    if plan.raw:
+        # Group in an outer query so the hour expression (which carries a
+        # bound tz parameter) isn't repeated in GROUP BY
+        raw = (
+            select(
+                local_hour(GlucoseReading.reading_timestamp).label("hour"),
+                GlucoseReading.value.label("bin"),
+            )
+            .where(_raw_filter(user_id, plan))
+            .subquery()
+        )
+        parts.append(
+            select(raw.c.hour, raw.c.bin, func.count().label("n")).group_by(
+                raw.c.hour, raw.c.bin
+            )
+        )
+    combined = union_all(*parts).subquery()
+    return select(combined.c.hour, combined.c.bin, func.sum(combined.c.n)).group_by(
+        combined.c.hour, combined.c.bin
+    )
+
+
+async def summarize_glucose(
+    db: AsyncSession,
+    user_id: uuid.UUID,
+    start: datetime,
+    end: datetime | None,
+    *,
+    with_histogram: bool = True,
+) -> GlucoseSummary:
+    """Summarize a user's plausible readings in ``[start, end)``.
+
+    Runs a single query regardless of the window length.
+
+    Args:
+        db: Database session
+        user_id: User whose readings to summarize
+        start: Inclusive window start
+        end: Exclusive window end, or None for no upper bound
+        with_histogram: Whether to build the value histogram (needed for
+            threshold counts and percentiles); without it only count,
+            sum and sum of squares are read.
+    """
+    plan = plan_window(start, end)
+
+    if with_histogram:
+        result = await db.execute(_histogram_query(user_id, plan, None))
+        return GlucoseSummary.from_histogram(
+            {bin_: int(n) for _hour, bin_, n in result.all()}
+        )
+
+    parts = []
+    if plan.days or plan.hours:
+        parts.append(
+            select(
+                GlucoseRollup.reading_count.label("n"),
+                GlucoseRollup.value_sum.label("total"),
+                GlucoseRollup.value_sq_sum.label("sq_total"),
+            ).where(_rollup_filter(user_id, plan))
+        )
+    if plan.raw:
+        parts.append(
+            select(
+                func.count().label("n"),
+                func.sum(GlucoseReading.value).label("total"),
+                func.sum(GlucoseReading.value * GlucoseReading.value).label("sq_total"),
+            ).where(_raw_filter(user_id, plan))
+        )
+    combined = union_all(*parts).subquery()
+    row = (
+        await db.execute(
+            select(
+                func.sum(combined.c.n),
+                func.sum(combined.c.total),
+                func.sum(combined.c.sq_total),
+            )
+        )
+    ).one()
+    return GlucoseSummary(
+        count=int(row[0] or 0),
+        value_sum=int(row[1] or 0),
+        value_sq_sum=int(row[2] or 0),
+    )
+
+
+def whole_hour_offsets(tz: tzinfo, start: datetime, end: datetime) -> bool:
+    """Whether ``tz`` stays a whole number of hours from UTC over a window."""
+    moment = start
+    while True:
+        offset = moment.astimezone(tz).utcoffset() or timedelta(0)
+        if offset % _HOUR:
+            return False
+        if moment >= end:
+            return True
+        moment = min(moment + _DAY, end)
+
+
+async def summarize_glucose_by_local_hour(
+    db: AsyncSession,
+    user_id: uuid.UUID,
+    start: datetime,
+    end: datetime,
+    tz: zoneinfo.ZoneInfo,
+) -> dict[int, GlucoseSummary] | None:
+    """Summarize readings in ``[start, end)`` per local hour of day (0-23).
+
+    Hourly rollups are attributed to the local hour their UTC hour starts
+    in, which is only exact when ``tz`` is a whole number of hours from
+    UTC throughout the window.
+
+    Returns:
+        A summary (with histogram) for every hour of day, or None if
+        ``tz`` has a fractional-hour offset and the caller must group raw
+        readings itself.
+    """
+    if not whole_hour_offsets(tz, start, end):
+        return None
+
+    plan = plan_window(start, end, use_days=False)
+    result = await db.execute(_histogram_query(user_id, plan, tz.key))
+    histograms: dict[int, dict[int, int]] = {hour: {} for hour in range(24)}
+    for hour, bin_, n in result.all():
+        histograms[int(hour)][bin_] = int(n)
+    return {
+        hour: GlucoseSummary.from_histogram(histogram)
+        for hour, histogram in histograms.items()
+    }
@@ -0,0 +1,158 @@
+"""Windowed glucose analytics over sorted reading arrays.
+
+Correction and meal analyses look at the readings in a fixed window after
+each bolus. Instead of filtering the full reading list once per event,
+readings are held as sorted NumPy timestamp/value arrays and every
+event's window is located with ``searchsorted`` (O(log n) per event).
+Per-window statistics (final value, peak, time to peak, drop and observed
+ISF) are then computed for all events in one vectorized pass.
+"""
+
+from collections.abc import Sequence
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+
+import numpy as np
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+_ONE_US = timedelta(microseconds=1)
+_US_PER_MINUTE = 60_000_000
+
+
+def to_epoch_us(ts: datetime) -> int:
+    """Microseconds since the Unix epoch (naive datetimes are taken as UTC)."""
+    if ts.tzinfo is None:
+        ts = ts.replace(tzinfo=UTC)
+    return (ts - _EPOCH) // _ONE_US
+
+
+@dataclass(frozen=True)
+class ReadingSeries:
+    """Glucose readings as parallel arrays sorted by timestamp.
+
+    Attributes:
+        timestamps: Reading times in microseconds since the epoch (int64).
+        values: Glucose values in mg/dL (float64).
+    """
+
+    timestamps: np.ndarray
+    values: np.ndarray
+
+    @classmethod
+    def from_rows(cls, rows: Sequence[tuple[datetime, float]]) -> "ReadingSeries":
+        """Build a series from ``(timestamp, value)`` rows in any order."""
+        timestamps = np.fromiter(
+            (to_epoch_us(ts) for ts, _ in rows), dtype=np.int64, count=len(rows)
+        )
+        values = np.fromiter(
+            (value for _, value in rows), dtype=np.float64, count=len(rows)
+        )
+        if np.any(timestamps[1:] < timestamps[:-1]):
+            order = np.argsort(timestamps, kind="stable")
+            timestamps, values = timestamps[order], values[order]
+        return cls(timestamps=timestamps, values=values)
+
+    def __len__(self) -> int:
+        return len(self.timestamps)
+
+
+@dataclass(frozen=True)
+class WindowOutcomes:
+    """Per-event statistics over each event's post-event window.
+
+    Every array has one entry per event, in event order. Entries for
+    events with no readings in their window are NaN (``count`` is 0).
+
+    Attributes:
+        count: Number of readings in the window.
+        final: Last reading in the window.
+        peak: Highest reading in the window.
+        minutes_to_peak: Minutes from the event to the (first) peak.
+        drop: Starting BG minus ``final`` (NaN without a starting BG).
+        isf: Observed insulin sensitivity, ``drop`` per unit (NaN without
+            units).
+    """
+
+    count: np.ndarray
+    final: np.ndarray
+    peak: np.ndarray
+    minutes_to_peak: np.ndarray
+    drop: np.ndarray
+    isf: np.ndarray
+
+
+def _as_float_array(items: Sequence[float | None] | None, size: int) -> np.ndarray:
+    if items is None:
+        return np.full(size, np.nan)
+    return np.array(
+        [np.nan if item is None else item for item in items], dtype=np.float64
+    )
+
+
+def analyze_event_windows(
+    series: ReadingSeries,
+    event_times: Sequence[datetime],
+    window: timedelta,
+    *,
+    include_start: bool = True,
+    starting_bg: Sequence[float | None] | None = None,
+    units: Sequence[float | None] | None = None,
+) -> WindowOutcomes:
+    """Compute post-event window statistics for every event at once.
+
+    Args:
+        series: The readings to search.
+        event_times: Event (e.g. bolus) times.
+        window: Window length after each event.
+        include_start: Whether a reading exactly at the event time belongs
+            to its window: ``[t, t + window]`` if True, ``(t, t + window]``
+            otherwise.
+        starting_bg: BG at each event, for ``drop``.
+        units: Insulin delivered at each event, for ``isf``.
+    """
+    size = len(event_times)
+    starts = np.fromiter(
+        (to_epoch_us(ts) for ts in event_times), dtype=np.int64, count=size
+    )
+    ends = starts + window // _ONE_US
+    lo = np.searchsorted(
+        series.timestamps, starts, side="left" if include_start else "right"
+    )
+    hi = np.searchsorted(series.timestamps, ends, side="right")
+    count = hi - lo
+    has_readings = count > 0
+
+    final = np.full(size, np.nan)
+    peak = np.full(size, np.nan)
+    minutes_to_peak = np.full(size, np.nan)
+    if has_readings.any():
+        final[has_readings] = series.values[hi[has_readings] - 1]
+
+        # Gather every window into a padded (events x longest window) grid
+        offsets = np.arange(count.max())
+        positions = lo[:, None] + offsets[None, :]
+        in_window = offsets[None, :] < count[:, None]
+        grid = np.where(
+            in_window,
+            series.values[np.minimum(positions, len(series) - 1)],
+            -np.inf,
+        )
+        peak_offset = grid.argmax(axis=1)
+        peak_position = lo + peak_offset
+        peak[has_readings] = grid[np.arange(size), peak_offset][has_readings]
+        minutes_to_peak[has_readings] = (
+            series.timestamps[peak_position[has_readings]] - starts[has_readings]
+        ) / _US_PER_MINUTE
+
+    drop = _as_float_array(starting_bg, size) - final
+    with np.errstate(divide="ignore", invalid="ignore"):
+        isf = drop / _as_float_array(units, size)
+
+    return WindowOutcomes(
+        count=count,
+        final=final,
+        peak=peak,
+        minutes_to_peak=minutes_to_peak,
+        drop=drop,
+        isf=isf,
+    )
@@ -0,0 +1,317 @@
+"""Shared pooled HTTP clients for outbound integrations.
+
+Telegram, the AI sidecar, Tandem's cloud and research source fetches each
+get one long-lived ``httpx.AsyncClient`` with keep-alive connection
+pooling, instead of a new client (and TCP/TLS handshake) per call. Each
+upstream has its own timeouts, pool limits and a per-host concurrency cap,
+so a burst to one host (e.g. escalation messages to every emergency
+contact) queues instead of opening unbounded connections.
+
+Clients never store cookies: they are shared by every user, so a
+Set-Cookie from one user's response must not be sent on another's
+request.
+
+Clients speak HTTP/2 where the server negotiates it and the optional
+``h2`` package is installed, and fall back to HTTP/1.1 otherwise.
+
+Clients are created on first use (or by ``start_http_clients`` at
+startup) and closed by ``close_http_clients`` at shutdown.
+``get_http_client_stats`` reports pool utilization per upstream.
+"""
+
+import asyncio
+import importlib.util
+from collections.abc import AsyncIterator, Callable
+from dataclasses import dataclass, field
+from http.cookiejar import CookieJar, DefaultCookiePolicy
+from typing import Any
+
+import httpx
+
+from src.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+TELEGRAM = "telegram"
+SIDECAR = "sidecar"
+TANDEM = "tandem"
+RESEARCH = "research"
+
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+
+@dataclass(frozen=True)
+class UpstreamConfig:
+    """Pool and timeout settings for one upstream.
+
+    Attributes:
+        timeout: Default per-request timeout in seconds (callers may
+            override it per request).
+        max_connections: Maximum open connections across all hosts.
+        max_keepalive_connections: Idle connections kept for reuse.
+        max_concurrency_per_host: Requests in flight to a single host at
+            once; further requests wait for a slot.
+        keepalive_expiry: Seconds an idle connection is kept.
+        http2: Whether to offer HTTP/2 (only used if ``h2`` is installed).
+        follow_redirects: Whether to follow redirects.
+        headers: Default headers sent with every request.
+    """
+
+    timeout: float
+    max_connections: int
+    max_keepalive_connections: int
+    max_concurrency_per_host: int
+    keepalive_expiry: float = 30.0
+    http2: bool = True
+    follow_redirects: bool = False
+    headers: dict[str, str] = field(default_factory=dict)
+
+
+UPSTREAMS: dict[str, UpstreamConfig] = {
+    TELEGRAM: UpstreamConfig(
+        timeout=10.0,
+        max_connections=20,
+        max_keepalive_connections=10,
+        max_concurrency_per_host=10,
+    ),
+    # Plain HTTP on the Docker network, so always HTTP/1.1
+    SIDECAR: UpstreamConfig(
+        timeout=10.0,
+        max_connections=10,
+        max_keepalive_connections=5,
+        max_concurrency_per_host=10,
+        http2=False,
+    ),
+    TANDEM: UpstreamConfig(
+        timeout=15.0,
+        max_connections=10,
+        max_keepalive_connections=5,
+        max_concurrency_per_host=4,
+    ),
+    RESEARCH: UpstreamConfig(
+        timeout=30.0,
+        max_connections=10,
+        max_keepalive_connections=4,
+        max_concurrency_per_host=2,
+        keepalive_expiry=10.0,
+        follow_redirects=True,
+        headers={"User-Agent": "GlycemicGPT Research Bot/1.0"},
+    ),
+}
+
+# Redirect hops followed by clients with follow_redirects enabled
+MAX_REDIRECTS = 5
+
+
+@dataclass
+class _UpstreamStats:
+    requests_total: int = 0
+    errors_total: int = 0
+    in_flight: int = 0
+    peak_in_flight: int = 0
+    waiting: int = 0
+    in_flight_by_host: dict[str, int] = field(default_factory=dict)
+
+
+class _ReleasingStream(httpx.AsyncByteStream):
+    """Response body stream that frees its host slot once closed."""
+
+    def __init__(self, stream: httpx.AsyncByteStream, release: Callable[[], None]):
+        self._stream = stream
+        self._release = release
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        async for chunk in self._stream:
+            yield chunk
+
+    async def aclose(self) -> None:
+        try:
+            await self._stream.aclose()
+        finally:
+            self._release()
+
+
+class _HostLimitedTransport(httpx.AsyncBaseTransport):
+    """Transport that caps in-flight requests per host and records stats.
+
+    A request holds its host's slot until its response body is closed,
+    which httpx does as soon as a non-streamed response has been read.
+    """
+
+    def __init__(
+        self,
+        transport: httpx.AsyncBaseTransport,
+        max_per_host: int,
+        stats: _UpstreamStats,
+    ):
+        self._transport = transport
+        self._max_per_host = max_per_host
+        self._stats = stats
+        self._host_slots: dict[str, asyncio.Semaphore] = {}
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        host = request.url.host
+        slots = self._host_slots.get(host)
+        if slots is None:
+            slots = self._host_slots[host] = asyncio.Semaphore(self._max_per_host)
+
+        stats = self._stats
+        stats.waiting += 1
+        try:
+            await slots.acquire()
+        finally:
+            stats.waiting -= 1
+        stats.requests_total += 1
+        stats.in_flight += 1
+        stats.peak_in_flight = max(stats.peak_in_flight, stats.in_flight)
+        stats.in_flight_by_host[host] = stats.in_flight_by_host.get(host, 0) + 1
+        released = False
+
+        def release() -> None:
+            nonlocal released
+            if released:
+                return
+            released = True
+            stats.in_flight -= 1
+            remaining = stats.in_flight_by_host[host] - 1
+            if remaining:
+                stats.in_flight_by_host[host] = remaining
+            else:
+                del stats.in_flight_by_host[host]
+            slots.release()
+
+        try:
+            response = await self._transport.handle_async_request(request)
+        except BaseException:
+            stats.errors_total += 1
+            release()
+            raise
+        if response.status_code >= 500:
+            stats.errors_total += 1
+        return httpx.Response(
+            status_code=response.status_code,
+            headers=response.headers,
+            stream=_ReleasingStream(response.stream, release),
+            extensions=response.extensions,
+        )
+
+    def pool_connections(self) -> tuple[int, int]:
+        """``(open, idle)`` connections in the underlying pool, if known."""
+        pool = getattr(self._transport, "_pool", None)
+        connections = getattr(pool, "connections", None)
+        if connections is None:
+            return 0, 0
+        idle = sum(1 for conn in connections if conn.is_idle())
+        return len(connections), idle
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+
+class _NoCookiesPolicy(DefaultCookiePolicy):
+    """Cookie policy that neither stores nor returns any cookie."""
+
+    def set_ok(self, cookie, request) -> bool:
+        return False
+
+    def return_ok(self, cookie, request) -> bool:
+        return False
+
+
+def build_http_client(
+    config: UpstreamConfig,
+    *,
+    transport: httpx.AsyncBaseTransport | None = None,
+) -> tuple[httpx.AsyncClient, _HostLimitedTransport]:
+    """Create a pooled client for ``config``.
+
+    ``transport`` replaces the network transport (used by tests).
+    """
+    http2 = config.http2 and _HTTP2_AVAILABLE
+    inner = transport or httpx.AsyncHTTPTransport(
+        http2=http2,
+        limits=httpx.Limits(
+            max_connections=config.max_connections,
+            max_keepalive_connections=config.max_keepalive_connections,
+            keepalive_expiry=config.keepalive_expiry,
+        ),
+    )
+    limited = _HostLimitedTransport(
+        inner, config.max_concurrency_per_host, _UpstreamStats()
+    )
+    client = httpx.AsyncClient(
+        transport=limited,
+        timeout=config.timeout,
+        follow_redirects=config.follow_redirects,
+        max_redirects=MAX_REDIRECTS,
+        headers=config.headers,
+        cookies=CookieJar(policy=_NoCookiesPolicy()),
+    )
+    return client, limited
+
+
+_clients: dict[str, tuple[httpx.AsyncClient, _HostLimitedTransport]] = {}
+_clients_loop: asyncio.AbstractEventLoop | None = None
+
+
+def get_http_client(upstream: str) -> httpx.AsyncClient:
+    """Return the shared client for ``upstream`` (one of ``UPSTREAMS``).
+
+    The client is shared: use it directly, never in ``async with``.
+    """
+    global _clients_loop
+    loop = asyncio.get_running_loop()
+    if _clients_loop is not loop:
+        # Pooled connections belong to the loop that opened them
+        _clients.clear()
+        _clients_loop = loop
+    entry = _clients.get(upstream)
+    if entry is None:
+        entry = _clients[upstream] = build_http_client(UPSTREAMS[upstream])
+    return entry[0]
+
+
+async def start_http_clients() -> None:
+    """Create every upstream's client at startup."""
+    for upstream in UPSTREAMS:
+        get_http_client(upstream)
+    logger.info(
+        "Outbound HTTP clients ready",
+        upstreams=list(UPSTREAMS),
+        http2=_HTTP2_AVAILABLE,
+    )
+
+
+async def close_http_clients() -> None:
+    """Close every client and its pooled connections."""
+    clients = list(_clients.values())
+    _clients.clear()
+    for client, _ in clients:
+        try:
+            await client.aclose()
+        except Exception:
+            logger.warning("Failed to close HTTP client", exc_info=True)
+
+
+def get_http_client_stats() -> dict[str, dict[str, Any]]:
+    """Return pool utilization for each client created so far."""
+    report = {}
+    for upstream, (_client, transport) in _clients.items():
+        config = UPSTREAMS[upstream]
+        stats = transport._stats
+        connections, idle = transport.pool_connections()
+        report[upstream] = {
+            "upstream": upstream,
+            "http2": config.http2 and _HTTP2_AVAILABLE,
+            "max_connections": config.max_connections,
+            "max_concurrency_per_host": config.max_concurrency_per_host,
+            "connections": connections,
+            "idle_connections": idle,
+            "requests_total": stats.requests_total,
+            "errors_total": stats.errors_total,
+            "in_flight": stats.in_flight,
+            "peak_in_flight": stats.peak_in_flight,
+            "waiting": stats.waiting,
+            "in_flight_by_host": dict(stats.in_flight_by_host),
+        }
+    return report
@@ -12,6 +12,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from src.logging_config import get_logger
 from src.models.insulin_config import InsulinConfig
 from src.schemas.insulin_config import InsulinConfigUpdate
+from src.services.diabetes_context import invalidate_diabetes_context
 
 logger = get_logger(__name__)
 
@@ -81,6 +82,7 @@ async def update_config(
 
     await db.commit()
     await db.refresh(config)
+    invalidate_diabetes_context(user_id, "iob", "settings")
 
     logger.info(
         "Updated insulin config",
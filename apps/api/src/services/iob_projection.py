@@ -5,15 +5,24 @@ combined with dose-summation for insulin delivered after the snapshot.
 Uses decay curves for rapid-acting insulins (Novolog/Humalog).
 """
 
+import math
 import uuid
-from dataclasses import dataclass
+from collections.abc import Sequence
+from dataclasses import dataclass, field
 from datetime import UTC, datetime, timedelta
+from typing import TYPE_CHECKING
 
 from sqlalchemy import desc, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.models.pump_data import PumpEvent, PumpEventType
 
+if TYPE_CHECKING:
+    from src.services.iob_engine import IoBCurve, IoBInputs
+
+# Bolus types whose insulin is summed on top of the pump's IoB snapshot
+_DOSE_EVENT_TYPES = [PumpEventType.BOLUS, PumpEventType.CORRECTION]
+
 
 async def get_user_dia(db: AsyncSession, user_id: uuid.UUID) -> float:
     """Get the user's configured DIA, or the default 4.0 hours.
@@ -58,11 +67,18 @@ class IoBProjection:
     stale_warning: str | None = None
     is_estimated: bool = False  # True when no pump confirmation exists
 
+    # Full IoB curve (5-minute resolution) from projected_at until decayed
+    curve: "IoBCurve | None" = field(default=None, repr=False, compare=False)
+    # What the curve was built from, to re-project IoB later without the DB
+    inputs: "IoBInputs | None" = field(default=None, repr=False, compare=False)
+
 
 # Insulin activity profile constants for rapid-acting insulin (Novolog/Humalog)
 # Based on exponential decay model with 4-hour duration of insulin action (DIA)
 INSULIN_DIA_HOURS = 4.0  # Duration of Insulin Action
 INSULIN_PEAK_HOURS = 1.0  # Time to peak activity
+# Projections whose pump confirmation is older than this are flagged stale
+IOB_STALE_MINUTES = 120
 
 
 def calculate_insulin_remaining(
@@ -226,12 +242,7 @@ async def _fetch_insulin_doses(
         select(PumpEvent.event_timestamp, PumpEvent.units)
         .where(
             PumpEvent.user_id == user_id,
-            PumpEvent.event_type.in_(
-                [
-                    PumpEventType.BOLUS,
-                    PumpEventType.CORRECTION,
-                ]
-            ),
+            PumpEvent.event_type.in_(_DOSE_EVENT_TYPES),
             PumpEvent.units.isnot(None),
             PumpEvent.units > 0,
             PumpEvent.event_timestamp >= cutoff,
@@ -310,19 +321,37 @@ async def get_iob_projection(
     else:
         post_doses = all_doses
 
-    # Step 4: Compute IoB at now, +30min, +60min
-    def _compute_at(at_time: datetime) -> float:
-        pump_component = 0.0
-        if last_confirmed_iob is not None and last_confirmed_at is not None:
-            pump_component = project_iob(
-                last_confirmed_iob, last_confirmed_at, at_time, dia_hours
-            )
-        post_component = _sum_iob_from_doses(post_doses, at_time, dia_hours)
-        return max(0.0, pump_component + post_component)
+    # Step 4: Build the IoB curve from now until the insulin has decayed
+    from src.services.iob_engine import IoBInputs, compute_iob_curve
+
+    inputs = IoBInputs(
+        dia_hours=dia_hours,
+        confirmed_iob=last_confirmed_iob,
+        confirmed_at=last_confirmed_at,
+        doses=post_doses,
+    )
+    curve = compute_iob_curve(
+        inputs, now, horizon_minutes=_curve_horizon_minutes(dia_hours)
+    )
+    return _projection_from_curve(curve, inputs)
+
+
+def _curve_horizon_minutes(dia_hours: float) -> int:
+    """Curve length covering full decay and the +60 min projection."""
+    from src.services.iob_engine import CURVE_STEP_MINUTES
+
+    step = CURVE_STEP_MINUTES
+    return max(60, math.ceil(dia_hours * 60 / step) * step)
+
 
-    current_iob = _compute_at(now)
-    iob_30 = _compute_at(now + timedelta(minutes=30))
-    iob_60 = _compute_at(now + timedelta(minutes=60))
+def _projection_from_curve(curve: "IoBCurve", inputs: "IoBInputs") -> IoBProjection:
+    """Summarize an IoB curve starting now as an IoBProjection."""
+    now = curve.start
+    last_confirmed_iob = inputs.confirmed_iob
+    last_confirmed_at = inputs.confirmed_at
+    current_iob = curve.at_offset(0)
+    iob_30 = curve.at_offset(30)
+    iob_60 = curve.at_offset(60)
 
     # Step 5: Determine if this is a fallback (no pump confirmation)
     is_estimated = last_confirmed_at is None
@@ -333,7 +362,7 @@ async def get_iob_projection(
     # Step 6: Staleness check (based on last pump confirmation)
     elapsed_since = now - last_confirmed_at
     minutes_since = int(elapsed_since.total_seconds() / 60)
-    is_stale = minutes_since > 120
+    is_stale = minutes_since > IOB_STALE_MINUTES
     stale_warning = None
     if is_stale:
         stale_warning = "IoB projection may be unreliable - data is over 2 hours old"
@@ -353,4 +382,105 @@ async def get_iob_projection(
         is_stale=is_stale,
         stale_warning=stale_warning,
         is_estimated=is_estimated,
+        curve=curve,
+        inputs=inputs,
+    )
+
+
+async def get_iob_projections(
+    db: AsyncSession,
+    user_ids: Sequence[uuid.UUID],
+    dia_by_user: dict[uuid.UUID, float] | None = None,
+) -> dict[uuid.UUID, IoBProjection]:
+    """Get IoB projections for many users with a fixed number of queries.
+
+    Batch counterpart of ``get_iob_projection``: loads DIA settings, the
+    latest pump-confirmed IoB and recent doses for all users in one query
+    each, then computes every curve in a single vectorized pass.
+
+    Args:
+        db: Database session
+        user_ids: Users to project
+        dia_by_user: Already-known DIA per user; looked up when omitted
+
+    Returns:
+        Mapping of user ID to projection; users with no IoB data are omitted
+    """
+    from src.models.insulin_config import InsulinConfig
+    from src.services.iob_engine import IoBInputs, compute_iob_curves
+
+    user_ids = list(dict.fromkeys(user_ids))
+    if not user_ids:
+        return {}
+
+    now = datetime.now(UTC)
+
+    if dia_by_user is None:
+        result = await db.execute(
+            select(InsulinConfig.user_id, InsulinConfig.dia_hours).where(
+                InsulinConfig.user_id.in_(user_ids)
+            )
+        )
+        dia_by_user = dict(result.all())
+    dias = {uid: dia_by_user.get(uid, INSULIN_DIA_HOURS) for uid in user_ids}
+    earliest = now - timedelta(hours=max(dias.values()))
+
+    # Latest confirmed IoB per user (each user's DIA window applied below)
+    result = await db.execute(
+        select(PumpEvent.user_id, PumpEvent.iob_at_event, PumpEvent.event_timestamp)
+        .distinct(PumpEvent.user_id)
+        .where(
+            PumpEvent.user_id.in_(user_ids),
+            PumpEvent.iob_at_event.isnot(None),
+            PumpEvent.event_timestamp >= earliest,
+        )
+        .order_by(PumpEvent.user_id, desc(PumpEvent.event_timestamp))
+    )
+    confirmed: dict[uuid.UUID, tuple[float, datetime]] = {}
+    for uid, iob, at in result.all():
+        if at >= now - timedelta(hours=dias[uid]):
+            confirmed[uid] = (iob, at)
+
+    result = await db.execute(
+        select(PumpEvent.user_id, PumpEvent.event_timestamp, PumpEvent.units)
+        .where(
+            PumpEvent.user_id.in_(user_ids),
+            PumpEvent.event_type.in_(_DOSE_EVENT_TYPES),
+            PumpEvent.units.isnot(None),
+            PumpEvent.units > 0,
+            PumpEvent.event_timestamp >= earliest,
+            PumpEvent.event_timestamp <= now,
+        )
+        .order_by(PumpEvent.event_timestamp)
+    )
+    doses: dict[uuid.UUID, list[tuple[datetime, float]]] = {}
+    for uid, at, units in result.all():
+        if at >= now - timedelta(hours=dias[uid]):
+            doses.setdefault(uid, []).append((at, units))
+
+    users: list[uuid.UUID] = []
+    inputs: list[IoBInputs] = []
+    for uid in user_ids:
+        confirmed_iob, confirmed_at = confirmed.get(uid, (None, None))
+        user_doses = doses.get(uid, [])
+        if confirmed_iob is None and not user_doses:
+            continue
+        if confirmed_at is not None:
+            user_doses = [(t, u) for t, u in user_doses if t > confirmed_at]
+        users.append(uid)
+        inputs.append(
+            IoBInputs(
+                dia_hours=dias[uid],
+                confirmed_iob=confirmed_iob,
+                confirmed_at=confirmed_at,
+                doses=user_doses,
+            )
+        )
+
+    curves = compute_iob_curves(
+        inputs, now, horizon_minutes=_curve_horizon_minutes(max(dias.values()))
     )
+    return {
+        uid: _projection_from_curve(curve, item)
+        for uid, item, curve in zip(users, inputs, curves, strict=True)
+    }
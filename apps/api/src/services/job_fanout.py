@@ -0,0 +1,216 @@
+"""Bounded concurrent fan-out for scheduled per-user jobs.
+
+Scheduler jobs (Dexcom/Tandem sync, alert checks) used to walk users one at
+a time with a fixed ``asyncio.sleep`` between them, so a cycle with a few
+hundred users could outlast its own interval. ``run_fanout`` processes users
+concurrently under a concurrency cap, paces job starts with a per-integration
+rate budget, enforces a per-user timeout and isolates failures so one user
+cannot abort the cycle.
+
+Each run records cycle duration, queue depth/wait and per-user latency in an
+in-process registry (``get_fanout_stats``) for sizing the concurrency cap.
+"""
+
+import asyncio
+import statistics
+import time
+from collections.abc import Awaitable, Callable, Hashable, Sequence
+from dataclasses import asdict, dataclass, field
+from datetime import UTC, datetime
+from typing import Any
+
+from src.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+
+class RateBudget:
+    """Token-bucket limiter that spaces out job starts.
+
+    Replaces the fixed per-user sleeps: up to ``burst`` jobs may start
+    immediately, after which starts are paced at ``rate_per_second``.
+    A rate of 0 disables pacing.
+    """
+
+    def __init__(self, rate_per_second: float, burst: int = 1) -> None:
+        self.rate = rate_per_second
+        self.capacity = max(1, burst)
+        self._tokens = float(self.capacity)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """Wait until a token is available and consume it."""
+        if self.rate <= 0:
+            return
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.capacity,
+                    self._tokens + (now - self._updated) * self.rate,
+                )
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+
+@dataclass
+class FanoutStats:
+    """Metrics for the most recent run of a fan-out job."""
+
+    job: str
+    started_at: datetime
+    cycle_seconds: float = 0.0
+    users_total: int = 0
+    succeeded: int = 0
+    failed: int = 0
+    timed_out: int = 0
+    concurrency: int = 0
+    running: bool = True
+    in_flight: int = 0
+    queue_depth: int = 0
+    queue_wait_max_ms: float = 0.0
+    latency_p50_ms: float = 0.0
+    latency_p95_ms: float = 0.0
+    latency_max_ms: float = 0.0
+    latencies_ms: list[float] = field(default_factory=list, repr=False)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize for logging and the admin stats endpoint."""
+        data = asdict(self)
+        data.pop("latencies_ms")
+        data["started_at"] = self.started_at.isoformat()
+        return data
+
+
+@dataclass
+class FanoutResult:
+    """Outcome of a fan-out run: per-item results plus cycle metrics."""
+
+    results: list[Any]
+    stats: FanoutStats
+
+
+_last_stats: dict[str, FanoutStats] = {}
+_rate_budgets: dict[str, RateBudget] = {}
+
+
+def get_rate_budget(name: str, rate_per_second: float, burst: int = 1) -> RateBudget:
+    """Return the shared rate budget for an upstream integration.
+
+    Budgets are shared across jobs that hit the same upstream so that,
+    for example, overlapping Tandem sync cycles don't double the request
+    rate. Changing the configured rate replaces the budget.
+    """
+    budget = _rate_budgets.get(name)
+    if budget is None or budget.rate != rate_per_second or budget.capacity != burst:
+        budget = RateBudget(rate_per_second, burst)
+        _rate_budgets[name] = budget
+    return budget
+
+
+def get_fanout_stats() -> dict[str, dict[str, Any]]:
+    """Return metrics for the current or most recent run of each fan-out job.
+
+    While a cycle is running, ``in_flight`` and ``queue_depth`` are live
+    gauges; once it finishes ``running`` is False and the totals are final.
+    """
+    return {name: stats.to_dict() for name, stats in _last_stats.items()}
+
+
+def _percentile(ordered: list[float], pct: float) -> float:
+    if not ordered:
+        return 0.0
+    index = min(len(ordered) - 1, int(round(pct * (len(ordered) - 1))))
+    return ordered[index]
+
+
+async def run_fanout(
+    job: str,
+    items: Sequence[Any],
+    worker: Callable[[Any], Awaitable[Any]],
+    *,
+    concurrency: int,
+    timeout_seconds: float,
+    rate_budget: RateBudget | None = None,
+    item_key: Callable[[Any], Hashable] = str,
+) -> FanoutResult:
+    """Run ``worker`` for every item with bounded concurrency.
+
+    Args:
+        job: Name used for logging and the metrics registry.
+        items: Items to process (typically user IDs).
+        worker: Coroutine function handling a single item. It should catch
+            and log its own expected errors; anything that escapes is
+            logged here and counted as a failure.
+        concurrency: Maximum number of workers in flight.
+        timeout_seconds: Per-item timeout; the item is cancelled and counted
+            as timed out if it takes longer.
+        rate_budget: Optional limiter applied before each item starts.
+        item_key: Renders an item for log messages.
+
+    Returns:
+        FanoutResult with successful worker results (in completion order)
+        and the cycle metrics.
+    """
+    concurrency = max(1, concurrency)
+    stats = FanoutStats(
+        job=job,
+        started_at=datetime.now(UTC),
+        users_total=len(items),
+        concurrency=concurrency,
+    )
+    stats.queue_depth = len(items)
+    _last_stats[job] = stats
+    results: list[Any] = []
+    semaphore = asyncio.Semaphore(concurrency)
+    cycle_start = time.perf_counter()
+
+    async def _run_one(item: Any) -> None:
+        async with semaphore:
+            if rate_budget is not None:
+                await rate_budget.acquire()
+            started = time.perf_counter()
+            stats.queue_depth -= 1
+            stats.in_flight += 1
+            stats.queue_wait_max_ms = max(
+                stats.queue_wait_max_ms, (started - cycle_start) * 1000
+            )
+            try:
+                result = await asyncio.wait_for(worker(item), timeout_seconds)
+                results.append(result)
+                stats.succeeded += 1
+            except TimeoutError:
+                logger.warning(
+                    "Fan-out job timed out for item",
+                    job=job,
+                    item=str(item_key(item)),
+                    timeout_seconds=timeout_seconds,
+                )
+                stats.timed_out += 1
+            except Exception as e:
+                logger.error(
+                    "Fan-out job failed for item",
+                    job=job,
+                    item=str(item_key(item)),
+                    error=str(e),
+                )
+                stats.failed += 1
+            finally:
+                stats.in_flight -= 1
+                stats.latencies_ms.append((time.perf_counter() - started) * 1000)
+
+    await asyncio.gather(*(_run_one(item) for item in items))
+
+    stats.running = False
+    stats.cycle_seconds = time.perf_counter() - cycle_start
+    ordered = sorted(stats.latencies_ms)
+    stats.latency_p50_ms = statistics.median(ordered) if ordered else 0.0
+    stats.latency_p95_ms = _percentile(ordered, 0.95)
+    stats.latency_max_ms = ordered[-1] if ordered else 0.0
+
+    logger.info("Fan-out job cycle completed", **stats.to_dict())
+    return FanoutResult(results=results, stats=stats)
@@ -2,17 +2,29 @@
 
 Retrieves relevant clinical knowledge chunks from the vector database
 using semantic similarity search with trust-tier filtering.
+
+With ``knowledge_vector_index`` set to "halfvec" or "binary" (indexes
+from migration 051), candidates come from a quantized HNSW index and are
+re-ranked by exact cosine distance on the full-precision vectors.
 """
 
-import asyncio
 import uuid
 
-from sqlalchemy import or_, select
+import numpy as np
+from pgvector.sqlalchemy import BIT, HALFVEC
+from sqlalchemy import Select, cast, func, or_, select, text
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.config import settings
+from src.database import get_session_maker
 from src.logging_config import get_logger
 from src.models.knowledge_chunk import KnowledgeChunk
-from src.services.embedding import embed_text
+from src.services.embedding import (
+    embed_query,
+    get_model_status,
+    is_model_ready,
+    start_model_warmup,
+)
 
 logger = get_logger(__name__)
 
@@ -22,6 +34,136 @@ DEFAULT_TOP_K = 5
 # Minimum similarity score to include (cosine distance; lower = more similar)
 MAX_COSINE_DISTANCE = 0.6
 
+# Must match the vector(768) column and the quantized index expressions
+EMBEDDING_DIMENSIONS = 768
+
+# HNSW index serving each knowledge_vector_index mode
+VECTOR_INDEXES = {
+    "full": "ix_knowledge_embedding",
+    "halfvec": "ix_knowledge_embedding_halfvec",
+    "binary": "ix_knowledge_embedding_binary",
+}
+
+
+async def check_knowledge_index(db: AsyncSession) -> bool:
+    """Warn if the index for the configured vector mode is missing.
+
+    Without it retrieval still works, but as a sequential scan.
+    Returns whether the index exists.
+    """
+    mode = settings.knowledge_vector_index
+    index = VECTOR_INDEXES.get(mode)
+    if index is None:
+        logger.warning(
+            "Unknown knowledge vector index mode; using full precision",
+            mode=mode,
+        )
+        index = VECTOR_INDEXES["full"]
+    exists = await db.scalar(
+        text("SELECT to_regclass(:index) IS NOT NULL"), {"index": index}
+    )
+    if not exists:
+        logger.warning(
+            "Knowledge vector index missing; retrieval will scan every chunk",
+            mode=mode,
+            index=index,
+        )
+    return bool(exists)
+
+
+async def warn_if_knowledge_index_missing() -> None:
+    """Run ``check_knowledge_index`` at startup; never fails startup."""
+    try:
+        async with get_session_maker()() as db:
+            await check_knowledge_index(db)
+    except Exception as e:
+        logger.warning("Could not check the knowledge vector index", error=str(e))
+
+
+def _candidate_count(top_k: int, mode: str) -> int:
+    """How many rows the HNSW scan must yield for ``mode``."""
+    if mode in ("halfvec", "binary"):
+        return top_k * settings.knowledge_rerank_factor
+    return top_k
+
+
+def _quantized_distance(mode: str, query_embedding: np.ndarray):
+    """Distance expression matching the quantized index for ``mode``."""
+    if mode == "halfvec":
+        return cast(
+            KnowledgeChunk.embedding, HALFVEC(EMBEDDING_DIMENSIONS)
+        ).cosine_distance(query_embedding)
+    # binary_quantize sets a bit for each positive dimension
+    return cast(
+        func.binary_quantize(KnowledgeChunk.embedding), BIT(EMBEDDING_DIMENSIONS)
+    ).hamming_distance(query_embedding > 0)
+
+
+def build_knowledge_query(
+    user_id: uuid.UUID,
+    query_embedding: np.ndarray,
+    top_k: int = DEFAULT_TOP_K,
+    mode: str | None = None,
+) -> Select[tuple[KnowledgeChunk]]:
+    """Build the similarity search for ``retrieve_knowledge``.
+
+    Args:
+        user_id: User's UUID.
+        query_embedding: The embedded query.
+        top_k: Maximum chunks to return.
+        mode: Vector index mode; defaults to ``knowledge_vector_index``.
+
+    Returns:
+        Select of KnowledgeChunk rows ordered by exact cosine distance.
+    """
+    mode = mode or settings.knowledge_vector_index
+    query_embedding = np.asarray(query_embedding, dtype=np.float32)
+    exact_distance = KnowledgeChunk.embedding.cosine_distance(query_embedding)
+    filters = (
+        # User-scoped: shared (NULL) + user-specific
+        or_(
+            KnowledgeChunk.user_id == user_id,
+            KnowledgeChunk.user_id.is_(None),
+        ),
+        # Only currently valid chunks
+        KnowledgeChunk.valid_to.is_(None),
+        # Exclude injection-flagged chunks from untrusted sources
+        or_(
+            KnowledgeChunk.injection_risk.is_(False),
+            KnowledgeChunk.trust_tier == "AUTHORITATIVE",
+        ),
+        # Must have an embedding
+        KnowledgeChunk.embedding.is_not(None),
+    )
+
+    if mode not in ("halfvec", "binary"):
+        return (
+            select(KnowledgeChunk)
+            .where(
+                *filters,
+                # Only sufficiently relevant chunks
+                exact_distance < MAX_COSINE_DISTANCE,
+            )
+            .order_by(exact_distance)
+            .limit(top_k)
+        )
+
+    # Nearest candidates by the quantized index, then exact re-ranking
+    candidates = (
+        select(KnowledgeChunk.id)
+        .where(*filters)
+        .order_by(_quantized_distance(mode, query_embedding))
+        .limit(_candidate_count(top_k, mode))
+        .subquery()
+    )
+    return (
+        select(KnowledgeChunk)
+        .join(candidates, KnowledgeChunk.id == candidates.c.id)
+        .where(exact_distance < MAX_COSINE_DISTANCE)
+        .order_by(exact_distance)
+        .limit(top_k)
+    )
+
 
 async def retrieve_knowledge(
     db: AsyncSession,
@@ -46,9 +188,20 @@ async def retrieve_knowledge(
     Returns:
         List of relevant KnowledgeChunk objects, ordered by relevance.
     """
-    # Embed the query (run in executor to avoid blocking the event loop)
+    # Until the model has loaded, answer without knowledge rather than
+    # blocking the request on the model download
+    if not is_model_ready():
+        start_model_warmup()
+        logger.info(
+            "Embedding model not ready, skipping knowledge retrieval",
+            user_id=str(user_id),
+            model_status=get_model_status().value,
+        )
+        return []
+
+    # Embed the query (cached and micro-batched on the embedding pool)
     try:
-        query_embedding = await asyncio.to_thread(embed_text, query)
+        query_embedding = await embed_query(query)
     except Exception:
         logger.warning(
             "Failed to embed query for knowledge retrieval",
@@ -57,31 +210,16 @@ async def retrieve_knowledge(
         )
         return []
 
-    # Vector similarity search with filters
+    # Vector similarity search with filters. HNSW stops after ef_search
+    # rows, before filtering, so keep it at least the candidate count.
+    mode = settings.knowledge_vector_index
+    ef_search = max(settings.knowledge_hnsw_ef_search, _candidate_count(top_k, mode))
     try:
+        await db.execute(
+            select(func.set_config("hnsw.ef_search", str(ef_search), True))
+        )
         result = await db.execute(
-            select(KnowledgeChunk)
-            .where(
-                # User-scoped: shared (NULL) + user-specific
-                or_(
-                    KnowledgeChunk.user_id == user_id,
-                    KnowledgeChunk.user_id.is_(None),
-                ),
-                # Only currently valid chunks
-                KnowledgeChunk.valid_to.is_(None),
-                # Exclude injection-flagged chunks from untrusted sources
-                or_(
-                    KnowledgeChunk.injection_risk.is_(False),
-                    KnowledgeChunk.trust_tier == "AUTHORITATIVE",
-                ),
-                # Must have an embedding
-                KnowledgeChunk.embedding.is_not(None),
-                # Only sufficiently relevant chunks
-                KnowledgeChunk.embedding.cosine_distance(query_embedding)
-                < MAX_COSINE_DISTANCE,
-            )
-            .order_by(KnowledgeChunk.embedding.cosine_distance(query_embedding))
-            .limit(top_k)
+            build_knowledge_query(user_id, query_embedding, top_k, mode)
         )
         chunks = list(result.scalars().all())
     except Exception:
@@ -4,7 +4,6 @@ Seeds the knowledge_chunks table with authoritative clinical content
 on first startup. Skipped if content already exists.
 """
 
-import asyncio
 import hashlib
 from pathlib import Path
 
@@ -13,7 +12,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.logging_config import get_logger
 from src.models.knowledge_chunk import KnowledgeChunk
-from src.services.embedding import embed_texts
+from src.services.embedding import embed_documents
 
 logger = get_logger(__name__)
 
@@ -125,10 +124,10 @@ async def seed_knowledge_base(db: AsyncSession) -> int:
         return 0
 
     # Batch embed all chunks FIRST (CPU-heavy, can take minutes on first run).
-    # Run in thread to avoid blocking the async event loop.
+    # Runs on the embedding thread pool to avoid blocking the event loop.
     logger.info("Embedding knowledge chunks", count=len(all_texts))
     try:
-        embeddings = await asyncio.to_thread(embed_texts, all_texts)
+        embeddings = await embed_documents(all_texts)
     except Exception:
         logger.error("Failed to embed knowledge chunks", exc_info=True)
         return 0
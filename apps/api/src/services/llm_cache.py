@@ -0,0 +1,347 @@
+"""Content-addressed cache for AI provider responses.
+
+Daily briefs, meal analyses and correction analyses send a prompt built
+entirely from computed metrics, so a repeated "Generate" click or a retry
+after a failed notification sends the same request again. Responses are
+cached per user under a SHA-256 digest of the provider, endpoint, model,
+system prompt, messages and token limit, with a TTL and LRU eviction.
+
+``LLM_CACHE_BACKEND`` selects ``memory`` (per worker, the default),
+``redis`` (shared across workers) or ``off``. Identical requests already
+in flight in this worker share one provider call. ``invalidate_llm_cache``
+drops a user's entries, and ``get_llm_cache_stats`` reports hits, misses
+and the provider tokens saved.
+"""
+
+import asyncio
+import hashlib
+import json
+import time
+import uuid
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from typing import Any
+
+import redis.asyncio as aioredis
+
+from src.config import settings
+from src.logging_config import get_logger
+from src.schemas.ai_response import AIMessage, AIResponse
+from src.services.ai_client import BaseAIClient
+
+logger = get_logger(__name__)
+
+_REDIS_PREFIX = "glycemicgpt:llm_cache:"
+_REDIS_LRU_KEY = "glycemicgpt:llm_cache_lru"
+
+
+def llm_cache_key(
+    ai_client: BaseAIClient,
+    messages: list[AIMessage],
+    system_prompt: str | None,
+    max_tokens: int,
+) -> str:
+    """Return the content digest identifying a generation request."""
+    provider = ai_client.provider_type
+    payload = {
+        "provider": provider.value if provider else type(ai_client).__name__,
+        "base_url": ai_client.base_url,
+        "model": ai_client.model,
+        "system": system_prompt,
+        "messages": [[m.role, m.content] for m in messages],
+        "max_tokens": max_tokens,
+    }
+    encoded = json.dumps(
+        payload, separators=(",", ":"), ensure_ascii=False, default=str
+    )
+    return hashlib.sha256(encoded.encode()).hexdigest()
+
+
+class _MemoryBackend:
+    """Per-process LRU of responses with a TTL."""
+
+    def __init__(self) -> None:
+        self._entries: OrderedDict[tuple[str, str], tuple[float, AIResponse]] = (
+            OrderedDict()
+        )
+
+    async def get(self, user_id: str, digest: str) -> AIResponse | None:
+        key = (user_id, digest)
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, response = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return response
+
+    async def set(self, user_id: str, digest: str, response: AIResponse) -> None:
+        key = (user_id, digest)
+        self._entries[key] = (
+            time.monotonic() + settings.llm_cache_ttl_seconds,
+            response,
+        )
+        self._entries.move_to_end(key)
+        while len(self._entries) > settings.llm_cache_max_entries:
+            self._entries.popitem(last=False)
+
+    async def invalidate(self, user_id: str) -> None:
+        for key in [key for key in self._entries if key[0] == user_id]:
+            del self._entries[key]
+
+    def size(self) -> int:
+        return len(self._entries)
+
+    async def close(self) -> None:
+        self._entries.clear()
+
+
+class _RedisBackend:
+    """Responses shared across workers in Redis.
+
+    Entries expire through Redis TTLs. A sorted set of entry keys scored
+    by last access bounds the cache to ``llm_cache_max_entries``, evicting
+    the least recently used.
+    """
+
+    def __init__(self) -> None:
+        self._redis: aioredis.Redis | None = None
+
+    def _get_redis(self) -> aioredis.Redis:
+        if self._redis is None:
+            self._redis = aioredis.from_url(
+                settings.redis_url,
+                socket_connect_timeout=2,
+                socket_timeout=2,
+            )
+        return self._redis
+
+    async def get(self, user_id: str, digest: str) -> AIResponse | None:
+        key = f"{_REDIS_PREFIX}{user_id}:{digest}"
+        async with self._get_redis().pipeline(transaction=False) as pipe:
+            pipe.get(key)
+            pipe.zadd(_REDIS_LRU_KEY, {key: time.time()}, xx=True)
+            value, _ = await pipe.execute()
+        if value is None:
+            return None
+        return AIResponse.model_validate_json(value)
+
+    async def set(self, user_id: str, digest: str, response: AIResponse) -> None:
+        key = f"{_REDIS_PREFIX}{user_id}:{digest}"
+        ttl = settings.llm_cache_ttl_seconds
+        now = time.time()
+        redis = self._get_redis()
+        async with redis.pipeline(transaction=False) as pipe:
+            pipe.set(key, response.model_dump_json(), ex=ttl)
+            pipe.zadd(_REDIS_LRU_KEY, {key: now})
+            pipe.zremrangebyscore(_REDIS_LRU_KEY, "-inf", now - ttl)
+            pipe.zcard(_REDIS_LRU_KEY)
+            *_, size = await pipe.execute()
+        excess = size - settings.llm_cache_max_entries
+        if excess > 0:
+            evicted = await redis.zpopmin(_REDIS_LRU_KEY, excess)
+            await redis.delete(*(member for member, _ in evicted))
+
+    async def invalidate(self, user_id: str) -> None:
+        redis = self._get_redis()
+        keys = [
+            key async for key in redis.scan_iter(match=f"{_REDIS_PREFIX}{user_id}:*")
+        ]
+        if keys:
+            await redis.delete(*keys)
+            await redis.zrem(_REDIS_LRU_KEY, *keys)
+
+    def size(self) -> int | None:
+        return None
+
+    async def close(self) -> None:
+        if self._redis is not None:
+            await self._redis.aclose()
+            self._redis = None
+
+
+@dataclass
+class _KindStats:
+    hits: int = 0
+    misses: int = 0
+    shared: int = 0
+    input_tokens_saved: int = 0
+    output_tokens_saved: int = 0
+
+
+_backend: _MemoryBackend | _RedisBackend | None = None
+_stats: dict[str, _KindStats] = {}
+_errors_total = 0
+# Bumped on invalidation so calls started before it aren't stored after it
+_generations: dict[str, int] = {}
+_inflight: dict[tuple[str, str, int], asyncio.Task] = {}
+
+
+def _enabled() -> bool:
+    return settings.llm_cache_backend != "off"
+
+
+def _get_backend() -> _MemoryBackend | _RedisBackend:
+    global _backend
+    if _backend is None:
+        if settings.llm_cache_backend == "redis" and not settings.testing:
+            _backend = _RedisBackend()
+        else:
+            _backend = _MemoryBackend()
+    return _backend
+
+
+def _record_error(action: str, error: Exception) -> None:
+    global _errors_total
+    _errors_total += 1
+    logger.warning("LLM cache unavailable", action=action, error=str(error))
+
+
+async def _generate_and_store(
+    ai_client: BaseAIClient,
+    user_key: str,
+    digest: str,
+    generation: int,
+    messages: list[AIMessage],
+    system_prompt: str | None,
+    max_tokens: int,
+) -> AIResponse:
+    response = await ai_client.generate(
+        messages=messages,
+        system_prompt=system_prompt,
+        max_tokens=max_tokens,
+    )
+    if response.content.strip() and _generations.get(user_key, 0) == generation:
+        try:
+            await _get_backend().set(user_key, digest, response)
+        except aioredis.RedisError as e:
+            _record_error("set", e)
+    return response
+
+
+async def generate_cached(
+    ai_client: BaseAIClient,
+    user_id: uuid.UUID | str,
+    kind: str,
+    messages: list[AIMessage],
+    system_prompt: str | None = None,
+    max_tokens: int = 1024,
+) -> AIResponse:
+    """Generate a response, reusing a cached one for an identical request.
+
+    Args:
+        ai_client: The user's AI client.
+        user_id: Owner of the cached entry.
+        kind: Caller label for the hit/miss counters (e.g. "daily_brief").
+        messages: List of conversation messages.
+        system_prompt: Optional system-level instruction.
+        max_tokens: Maximum tokens in the response.
+
+    Returns:
+        The provider's response, or the cached response to the same request.
+    """
+    if not _enabled():
+        return await ai_client.generate(
+            messages=messages, system_prompt=system_prompt, max_tokens=max_tokens
+        )
+
+    stats = _stats.setdefault(kind, _KindStats())
+    user_key = str(user_id)
+    digest = llm_cache_key(ai_client, messages, system_prompt, max_tokens)
+
+    try:
+        cached = await _get_backend().get(user_key, digest)
+    except aioredis.RedisError as e:
+        _record_error("get", e)
+        cached = None
+    if cached is not None:
+        stats.hits += 1
+        stats.input_tokens_saved += cached.usage.input_tokens
+        stats.output_tokens_saved += cached.usage.output_tokens
+        logger.info("LLM cache hit", user_id=user_key, kind=kind)
+        return cached
+
+    generation = _generations.get(user_key, 0)
+    key = (user_key, digest, generation)
+    task = _inflight.get(key)
+    if task is None:
+        stats.misses += 1
+        task = asyncio.create_task(
+            _generate_and_store(
+                ai_client,
+                user_key,
+                digest,
+                generation,
+                messages,
+                system_prompt,
+                max_tokens,
+            )
+        )
+        _inflight[key] = task
+
+        def _done(finished: asyncio.Task) -> None:
+            if _inflight.get(key) is finished:
+                del _inflight[key]
+            if not finished.cancelled():
+                finished.exception()  # Awaiters handle it; don't warn twice
+
+        task.add_done_callback(_done)
+        # Shielded so one cancelled caller doesn't cancel the shared call
+        return await asyncio.shield(task)
+
+    response = await asyncio.shield(task)
+    stats.shared += 1
+    stats.input_tokens_saved += response.usage.input_tokens
+    stats.output_tokens_saved += response.usage.output_tokens
+    return response
+
+
+async def invalidate_llm_cache(user_id: uuid.UUID | str) -> None:
+    """Drop every cached response for a user (e.g. after a provider change)."""
+    user_key = str(user_id)
+    _generations[user_key] = _generations.get(user_key, 0) + 1
+    if not _enabled():
+        return
+    try:
+        await _get_backend().invalidate(user_key)
+    except aioredis.RedisError as e:
+        _record_error("invalidate", e)
+
+
+async def close_llm_cache() -> None:
+    """Close the cache backend's connection (at shutdown)."""
+    global _backend
+    if _backend is not None:
+        await _backend.close()
+        _backend = None
+
+
+def clear_llm_cache() -> None:
+    """Drop cached responses and counters (used by tests and benchmarks)."""
+    global _backend, _errors_total
+    _backend = None
+    _stats.clear()
+    _generations.clear()
+    _errors_total = 0
+
+
+def get_llm_cache_stats() -> dict[str, Any]:
+    """Return hit/miss counters and tokens saved, overall and per kind."""
+    total = _KindStats()
+    for kind_stats in _stats.values():
+        for name, value in asdict(kind_stats).items():
+            setattr(total, name, getattr(total, name) + value)
+    lookups = total.hits + total.misses + total.shared
+    return {
+        "backend": settings.llm_cache_backend,
+        "entries": _backend.size() if _backend is not None else 0,
+        "max_entries": settings.llm_cache_max_entries,
+        "ttl_seconds": settings.llm_cache_ttl_seconds,
+        **asdict(total),
+        "provider_calls_saved": total.hits + total.shared,
+        "hit_rate": round((total.hits + total.shared) / lookups, 3) if lookups else 0.0,
+        "errors_total": _errors_total,
+        "by_kind": {kind: asdict(s) for kind, s in _stats.items()},
+    }
@@ -23,6 +23,8 @@ from src.services.diabetes_context import (
     format_pump_profile_for_prompt,
     get_pump_profile_summary,
 )
+from src.services.glucose_windows import ReadingSeries, analyze_event_windows
+from src.services.llm_cache import generate_cached
 from src.services.safety_validation import log_safety_validation, validate_ai_suggestion
 
 logger = get_logger(__name__)
@@ -147,7 +149,8 @@ async def analyze_post_meal_patterns(
 
     For each manual bolus event, examines glucose readings in the
     2-hour window after the bolus to detect spikes and calculate
-    average post-meal glucose levels.
+    average post-meal glucose levels. Windows for all boluses are
+    evaluated together by the windowed analytics kernel.
 
     Args:
         user_id: User's UUID.
@@ -194,22 +197,24 @@ async def analyze_post_meal_patterns(
             "bolus_count": 0,
         }
 
-    for bolus in boluses:
-        period = _classify_meal_period(bolus.event_timestamp.hour)
-        window_start = bolus.event_timestamp
-        window_end = window_start + timedelta(hours=POST_MEAL_WINDOW_HOURS)
-
-        # Filter readings within the post-meal window (already sorted by timestamp)
-        readings = [
-            value for ts, value in all_readings if window_start <= ts <= window_end
-        ]
+    outcomes = analyze_event_windows(
+        ReadingSeries.from_rows(all_readings),
+        [b.event_timestamp for b in boluses],
+        timedelta(hours=POST_MEAL_WINDOW_HOURS),
+        include_start=True,
+    )
+    counts = outcomes.count.tolist()
+    peaks = outcomes.peak.tolist()
+    finals = outcomes.final.tolist()
 
-        if not readings:
+    for i, bolus in enumerate(boluses):
+        if not counts[i]:
             continue
 
-        peak = max(readings)
-        # Use the last reading as the approximate 2hr value
-        two_hr_value = readings[-1]
+        period = _classify_meal_period(bolus.event_timestamp.hour)
+        peak = peaks[i]
+        # The last reading approximates the 2hr value
+        two_hr_value = finals[i]
 
         period_data[period]["peaks"].append(peak)
         period_data[period]["two_hr_values"].append(two_hr_value)
@@ -324,7 +329,10 @@ async def generate_meal_analysis(
         days=days,
     )
 
-    ai_response = await ai_client.generate(
+    ai_response = await generate_cached(
+        ai_client,
+        user.id,
+        "meal_analysis",
         messages=[AIMessage(role="user", content=user_prompt)],
         system_prompt=SYSTEM_PROMPT,
     )
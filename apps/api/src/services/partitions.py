@@ -0,0 +1,251 @@
+"""Monthly partition maintenance for glucose_readings and pump_events.
+
+Both tables are range-partitioned by their timestamp column (migration
+052), one partition per UTC month named ``<table>_pYYYYMM``, plus a
+``<table>_default`` partition for rows outside them. This module:
+
+- pre-creates partitions for the current month and the next
+  ``partition_premake_months`` months, so new rows never land in the
+  default partition. Rows that already landed there for a month that
+  gets a partition (e.g. a far-future timestamp) are moved into it.
+- drops (or detaches) whole month partitions once every row in them is
+  past its owner's glucose retention window, instead of deleting rows
+  one by one.
+
+Every call is a no-op on a table that is not partitioned (e.g. before
+052 runs). A transaction-level advisory lock keeps concurrent workers
+from running the same DDL; the loser skips the run.
+"""
+
+import re
+from datetime import UTC, datetime
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.config import settings
+from src.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+# table -> partition key column
+PARTITIONED_TABLES = {
+    "glucose_readings": "reading_timestamp",
+    "pump_events": "event_timestamp",
+}
+
+# Advisory lock namespace to avoid collisions with other lock users.
+_PARTITIONS_LOCK_NS = 0x50415254  # "PART" as int32
+# Don't queue DDL behind long reads (which would block every write)
+_DDL_LOCK_TIMEOUT = "5s"
+
+_PARTITION_NAME = re.compile(r"_p(\d{4})(\d{2})$")
+
+
+def month_start(moment: datetime) -> datetime:
+    """First instant of ``moment``'s UTC month."""
+    moment = moment.astimezone(UTC)
+    return datetime(moment.year, moment.month, 1, tzinfo=UTC)
+
+
+def add_months(month: datetime, count: int) -> datetime:
+    """The month start ``count`` months after (or before) ``month``."""
+    index = month.year * 12 + (month.month - 1) + count
+    return datetime(index // 12, index % 12 + 1, 1, tzinfo=UTC)
+
+
+def partition_name(table: str, month: datetime) -> str:
+    """Name of ``table``'s partition for ``month``."""
+    return f"{table}_p{month.year:04d}{month.month:02d}"
+
+
+def partition_month(name: str) -> datetime | None:
+    """The month a ``<table>_pYYYYMM`` partition covers, or None."""
+    match = _PARTITION_NAME.search(name)
+    if match is None:
+        return None
+    return datetime(int(match[1]), int(match[2]), 1, tzinfo=UTC)
+
+
+async def _try_lock(db: AsyncSession) -> bool:
+    acquired = await db.scalar(
+        text("SELECT pg_try_advisory_xact_lock(:ns, 0)"),
+        {"ns": _PARTITIONS_LOCK_NS},
+    )
+    if acquired:
+        await db.execute(text(f"SET LOCAL lock_timeout = '{_DDL_LOCK_TIMEOUT}'"))
+    return bool(acquired)
+
+
+async def _is_partitioned(db: AsyncSession, table: str) -> bool:
+    return bool(
+        await db.scalar(
+            text(
+                "SELECT EXISTS (SELECT 1 FROM pg_partitioned_table "
+                "WHERE partrelid = to_regclass(:table))"
+            ),
+            {"table": table},
+        )
+    )
+
+
+async def _partitions(db: AsyncSession, table: str) -> list[str]:
+    result = await db.execute(
+        text(
+            "SELECT c.relname FROM pg_inherits i "
+            "JOIN pg_class c ON c.oid = i.inhrelid "
+            "WHERE i.inhparent = to_regclass(:table)"
+        ),
+        {"table": table},
+    )
+    return [row[0] for row in result.all()]
+
+
+def _bounds(month: datetime) -> dict[str, datetime]:
+    return {"lower": month, "upper": add_months(month, 1)}
+
+
+async def _create_partition(
+    db: AsyncSession, table: str, column: str, month: datetime
+) -> None:
+    name = partition_name(table, month)
+    bounds = _bounds(month)
+    lower = bounds["lower"].strftime("%Y-%m-%d %H:%M:%S+00")
+    upper = bounds["upper"].strftime("%Y-%m-%d %H:%M:%S+00")
+    stray = await db.scalar(
+        text(
+            f"SELECT EXISTS (SELECT 1 FROM {table}_default "
+            f"WHERE {column} >= :lower AND {column} < :upper)"
+        ),
+        bounds,
+    )
+    if not stray:
+        await db.execute(
+            text(
+                f"CREATE TABLE {name} PARTITION OF {table} "
+                f"FOR VALUES FROM ('{lower}') TO ('{upper}')"
+            )
+        )
+        return
+
+    # The default partition already holds rows for this month, so the
+    # partition can't simply be created; move them into a standalone
+    # table and attach that. Statement-level triggers on the parent
+    # (glucose rollups) don't fire, which is right: no row is added or
+    # removed overall.
+    await db.execute(
+        text(
+            f"CREATE TABLE {name} "
+            f"(LIKE {table} INCLUDING DEFAULTS INCLUDING CONSTRAINTS)"
+        )
+    )
+    await db.execute(
+        text(
+            f"WITH moved AS (DELETE FROM {table}_default "
+            f"WHERE {column} >= :lower AND {column} < :upper RETURNING *) "
+            f"INSERT INTO {name} SELECT * FROM moved"
+        ),
+        bounds,
+    )
+    await db.execute(
+        text(
+            f"ALTER TABLE {table} ATTACH PARTITION {name} "
+            f"FOR VALUES FROM ('{lower}') TO ('{upper}')"
+        )
+    )
+
+
+async def ensure_partitions(db: AsyncSession, now: datetime | None = None) -> list[str]:
+    """Create missing partitions from this month through the premake window.
+
+    Returns the names of the partitions created.
+    """
+    if not await _try_lock(db):
+        return []
+    current = month_start(now or datetime.now(UTC))
+    created: list[str] = []
+    for table, column in PARTITIONED_TABLES.items():
+        if not await _is_partitioned(db, table):
+            continue
+        existing = set(await _partitions(db, table))
+        for offset in range(settings.partition_premake_months + 1):
+            month = add_months(current, offset)
+            if partition_name(table, month) in existing:
+                continue
+            await _create_partition(db, table, column, month)
+            created.append(partition_name(table, month))
+    await db.commit()
+    if created:
+        logger.info("Created partitions", partitions=created)
+    return created
+
+
+async def drop_expired_partitions(
+    db: AsyncSession, now: datetime | None = None
+) -> list[str]:
+    """Drop or detach month partitions whose rows have all expired.
+
+    A partition qualifies once it ends before the shortest glucose
+    retention window and none of its rows is still within its owner's
+    window. Rows of users without a retention config are never expired.
+    With ``partition_expired_action = "detach"`` the partitions are
+    detached and kept as plain tables for archiving; otherwise dropped.
+    Glucose rollups for the partition's month are deleted with it, since
+    dropping a partition doesn't fire the rollup triggers.
+
+    Returns the names of the partitions removed.
+    """
+    if not await _try_lock(db):
+        return []
+    now = now or datetime.now(UTC)
+    shortest = await db.scalar(
+        text("SELECT min(glucose_retention_days) FROM data_retention_configs")
+    )
+    if shortest is None:
+        await db.commit()
+        return []
+
+    removed: list[str] = []
+    for table, column in PARTITIONED_TABLES.items():
+        if not await _is_partitioned(db, table):
+            continue
+        for name in sorted(await _partitions(db, table)):
+            month = partition_month(name)
+            if month is None:
+                continue
+            bounds = _bounds(month)
+            if (now - bounds["upper"]).days < shortest:
+                continue
+            retained = await db.scalar(
+                text(
+                    f"SELECT EXISTS (SELECT 1 FROM {name} p "
+                    "LEFT JOIN data_retention_configs c ON c.user_id = p.user_id "
+                    "WHERE c.user_id IS NULL "
+                    f"OR p.{column} >= :now - make_interval("
+                    "days => c.glucose_retention_days))"
+                ),
+                {"now": now},
+            )
+            if retained:
+                continue
+            if settings.partition_expired_action == "detach":
+                await db.execute(text(f"ALTER TABLE {table} DETACH PARTITION {name}"))
+            else:
+                await db.execute(text(f"DROP TABLE {name}"))
+            if table == "glucose_readings":
+                await db.execute(
+                    text(
+                        "DELETE FROM glucose_rollups "
+                        "WHERE bucket_start >= :lower AND bucket_start < :upper"
+                    ),
+                    bounds,
+                )
+            removed.append(name)
+    await db.commit()
+    if removed:
+        logger.info(
+            "Removed expired partitions",
+            partitions=removed,
+            action=settings.partition_expired_action,
+        )
+    return removed
@@ -6,10 +6,11 @@ to avoid spamming the user.
 """
 
 import uuid
+from collections.abc import Sequence
 from dataclasses import dataclass
 from datetime import UTC, datetime, timedelta
 
-from sqlalchemy import and_, desc, select
+from sqlalchemy import and_, desc, insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.logging_config import get_logger
@@ -18,7 +19,12 @@ from src.models.alert_threshold import AlertThreshold
 from src.models.glucose import GlucoseReading
 from src.services.alert_notifier import notify_user_of_alerts
 from src.services.alert_threshold import get_or_create_thresholds
-from src.services.iob_projection import get_iob_projection, get_user_dia
+from src.services.iob_projection import (
+    get_iob_projection,
+    get_iob_projections,
+    get_user_dia,
+)
+from src.services.stream_events import publish_new_alerts
 
 logger = get_logger(__name__)
 
@@ -389,6 +395,44 @@ def check_iob_threshold(
     return None
 
 
+def collect_alert_candidates(
+    current_value: float,
+    trend_rate: float | None,
+    thresholds: AlertThreshold,
+    iob_value: float | None,
+) -> list[AlertCandidate]:
+    """Calculate the trajectory and collect every alert it triggers.
+
+    Args:
+        current_value: Latest glucose value.
+        trend_rate: Latest trend rate (treated as 0 if unavailable).
+        thresholds: User's configured alert thresholds.
+        iob_value: Current IoB value, if known and not stale.
+
+    Returns:
+        Threshold-crossing candidates, plus an IoB warning if applicable.
+    """
+    trend_rate = trend_rate if trend_rate is not None else 0.0
+    trajectory = calculate_trajectory(
+        current_value=current_value,
+        trend_rate=trend_rate,
+    )
+
+    candidates = check_threshold_crossings(trajectory, thresholds, iob_value)
+
+    if iob_value is not None:
+        iob_candidate = check_iob_threshold(
+            current_glucose=current_value,
+            iob_value=iob_value,
+            iob_threshold=thresholds.iob_warning,
+            trend_rate=trend_rate,
+        )
+        if iob_candidate:
+            candidates.append(iob_candidate)
+
+    return candidates
+
+
 async def has_recent_alert(
     db: AsyncSession,
     user_id: uuid.UUID,
@@ -441,25 +485,33 @@ async def create_alert(
     Returns:
         The created Alert record.
     """
-    now = datetime.now(UTC)
-    alert = Alert(
-        user_id=user_id,
-        alert_type=candidate.alert_type,
-        severity=candidate.severity,
-        current_value=candidate.current_value,
-        predicted_value=candidate.predicted_value,
-        prediction_minutes=candidate.prediction_minutes,
-        iob_value=candidate.iob_value,
-        message=candidate.message,
-        trend_rate=candidate.trend_rate,
-        source=candidate.source,
-        created_at=now,
-        expires_at=now + timedelta(minutes=ALERT_EXPIRY_MINUTES),
-    )
+    alert = Alert(**_alert_values(user_id, candidate, datetime.now(UTC)))
     db.add(alert)
     return alert
 
 
+def _alert_values(
+    user_id: uuid.UUID,
+    candidate: AlertCandidate,
+    now: datetime,
+) -> dict:
+    """Column values for persisting an alert candidate."""
+    return {
+        "user_id": user_id,
+        "alert_type": candidate.alert_type,
+        "severity": candidate.severity,
+        "current_value": candidate.current_value,
+        "predicted_value": candidate.predicted_value,
+        "prediction_minutes": candidate.prediction_minutes,
+        "iob_value": candidate.iob_value,
+        "message": candidate.message,
+        "trend_rate": candidate.trend_rate,
+        "source": candidate.source,
+        "created_at": now,
+        "expires_at": now + timedelta(minutes=ALERT_EXPIRY_MINUTES),
+    }
+
+
 async def get_active_alerts(
     db: AsyncSession,
     user_id: uuid.UUID,
@@ -575,17 +627,6 @@ async def evaluate_alerts_for_user(
         )
         return []
 
-    # Get trend rate (default to 0 if unavailable)
-    trend_rate = (
-        latest_reading.trend_rate if latest_reading.trend_rate is not None else 0.0
-    )
-
-    # Calculate trajectory
-    trajectory = calculate_trajectory(
-        current_value=float(latest_reading.value),
-        trend_rate=trend_rate,
-    )
-
     # Get user's thresholds
     thresholds = await get_or_create_thresholds(user_id, db)
 
@@ -603,19 +644,12 @@ async def evaluate_alerts_for_user(
             error=str(e),
         )
 
-    # Check threshold crossings
-    candidates = check_threshold_crossings(trajectory, thresholds, iob_value)
-
-    # Check IoB threshold
-    if iob_value is not None:
-        iob_candidate = check_iob_threshold(
-            current_glucose=float(latest_reading.value),
-            iob_value=iob_value,
-            iob_threshold=thresholds.iob_warning,
-            trend_rate=trend_rate,
-        )
-        if iob_candidate:
-            candidates.append(iob_candidate)
+    candidates = collect_alert_candidates(
+        float(latest_reading.value),
+        latest_reading.trend_rate,
+        thresholds,
+        iob_value,
+    )
 
     # Deduplicate and persist
     new_alerts: list[Alert] = []
@@ -629,6 +663,9 @@ async def evaluate_alerts_for_user(
         for alert in new_alerts:
             await db.refresh(alert)
 
+        # Push to open SSE streams
+        await publish_new_alerts(user_id, new_alerts)
+
         logger.info(
             "Created predictive alerts",
             user_id=str(user_id),
@@ -647,3 +684,136 @@ async def evaluate_alerts_for_user(
             )
 
     return new_alerts
+
+
+async def evaluate_alerts_for_users(
+    db: AsyncSession,
+    user_ids: Sequence[uuid.UUID],
+) -> dict[uuid.UUID, list[Alert]]:
+    """Run predictive alert evaluation for many users in one pass.
+
+    Batch counterpart of ``evaluate_alerts_for_user`` with the same rules
+    (staleness, thresholds, IoB escalation, deduplication), but a fixed
+    number of queries regardless of cohort size:
+    1. Latest fresh reading per user (``DISTINCT ON``)
+    2. Thresholds for those users (defaults created only for users
+       that have none)
+    3. IoB projections (``get_iob_projections``)
+    4. Recent unacknowledged alert types per user (dedup set)
+    5. One multi-row ``INSERT ... RETURNING`` for all new alerts
+
+    New alerts are pushed to open SSE streams, but Telegram delivery is
+    left to the caller (see ``scheduler.check_alerts_all_users``), so a
+    slow Telegram API can't hold up or cancel the batch after its commit.
+
+    Args:
+        db: Database session.
+        user_ids: Users to evaluate.
+
+    Returns:
+        Newly created alerts per user (users without new alerts omitted).
+    """
+    user_ids = list(dict.fromkeys(user_ids))
+    if not user_ids:
+        return {}
+
+    now = datetime.now(UTC)
+
+    # 1. Latest reading per user, if it's fresh enough to alert on
+    result = await db.execute(
+        select(
+            GlucoseReading.user_id,
+            GlucoseReading.value,
+            GlucoseReading.trend_rate,
+        )
+        .distinct(GlucoseReading.user_id)
+        .where(
+            GlucoseReading.user_id.in_(user_ids),
+            GlucoseReading.reading_timestamp
+            >= now - timedelta(minutes=GLUCOSE_STALE_MINUTES),
+        )
+        .order_by(GlucoseReading.user_id, desc(GlucoseReading.reading_timestamp))
+    )
+    latest = {row[0]: (float(row[1]), row[2]) for row in result.all()}
+    if not latest:
+        return {}
+    fresh_ids = list(latest)
+
+    # 2. Thresholds
+    result = await db.execute(
+        select(AlertThreshold).where(AlertThreshold.user_id.in_(fresh_ids))
+    )
+    thresholds_by_user = {t.user_id: t for t in result.scalars().all()}
+    for user_id in fresh_ids:
+        if user_id not in thresholds_by_user:
+            thresholds_by_user[user_id] = await get_or_create_thresholds(user_id, db)
+
+    # 3. IoB (stale projections are ignored, as in the per-user path)
+    iob_by_user: dict[uuid.UUID, float] = {}
+    try:
+        projections = await get_iob_projections(db, fresh_ids)
+        iob_by_user = {
+            user_id: projection.projected_iob
+            for user_id, projection in projections.items()
+            if not projection.is_stale
+        }
+    except Exception as e:
+        logger.warning(
+            "Failed to get IoB projections for batch alert evaluation",
+            users=len(fresh_ids),
+            error=str(e),
+        )
+
+    # 4. Alert types each user was recently alerted about
+    result = await db.execute(
+        select(Alert.user_id, Alert.alert_type)
+        .where(
+            and_(
+                Alert.user_id.in_(fresh_ids),
+                Alert.created_at >= now - timedelta(minutes=DEDUP_WINDOW_MINUTES),
+                Alert.acknowledged.is_(False),
+            )
+        )
+        .distinct()
+    )
+    recent: set[tuple[uuid.UUID, AlertType]] = {(r[0], r[1]) for r in result.all()}
+
+    rows: list[dict] = []
+    for user_id, (value, trend_rate) in latest.items():
+        candidates = collect_alert_candidates(
+            value,
+            trend_rate,
+            thresholds_by_user[user_id],
+            iob_by_user.get(user_id),
+        )
+        for candidate in candidates:
+            key = (user_id, candidate.alert_type)
+            if key in recent:
+                continue
+            recent.add(key)
+            rows.append(_alert_values(user_id, candidate, now))
+
+    if not rows:
+        return {}
+
+    # 5. Persist every new alert in one statement
+    result = await db.scalars(insert(Alert).returning(Alert), rows)
+    created = list(result.all())
+    await db.commit()
+
+    new_alerts: dict[uuid.UUID, list[Alert]] = {}
+    for alert in created:
+        new_alerts.setdefault(alert.user_id, []).append(alert)
+
+    logger.info(
+        "Created predictive alerts (batch)",
+        users_evaluated=len(fresh_ids),
+        users_alerted=len(new_alerts),
+        alert_count=len(created),
+    )
+
+    # Push to open SSE streams
+    for user_id, alerts in new_alerts.items():
+        await publish_new_alerts(user_id, alerts)
+
+    return new_alerts
@@ -5,7 +5,6 @@ detects content changes, and populates the knowledge base with
 device/insulin/CGM-specific information.
 """
 
-import asyncio
 import hashlib
 import uuid
 from datetime import UTC, datetime
@@ -18,7 +17,8 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from src.logging_config import get_logger
 from src.models.knowledge_chunk import KnowledgeChunk
 from src.models.research_source import ResearchSource
-from src.services.embedding import embed_texts
+from src.services.embedding import embed_documents
+from src.services.http_clients import RESEARCH, get_http_client
 from src.services.knowledge_seed import _chunk_text
 
 logger = get_logger(__name__)
@@ -160,68 +160,64 @@ async def fetch_source_content(url: str) -> str | None:
         return None
 
     try:
-        async with httpx.AsyncClient(
-            timeout=FETCH_TIMEOUT_SECONDS,
-            follow_redirects=True,  # Follow redirects but validate each hop
-            max_redirects=5,
-            headers={"User-Agent": "GlycemicGPT Research Bot/1.0"},
-        ) as client:
-            response = await client.get(url)
-
-            # Validate the final URL after redirects (defense against
-            # redirect-based SSRF to internal services)
-            final_url = str(response.url)
-            try:
-                _validate_research_url(final_url)
-            except ValueError:
-                logger.warning(
-                    "Research redirect target failed validation (blocked)",
-                    original_url=url,
-                    final_url=final_url,
-                )
-                return None
+        # Follows up to 5 redirects; the final URL is validated below
+        client = get_http_client(RESEARCH)
+        response = await client.get(url, timeout=FETCH_TIMEOUT_SECONDS)
 
-            response.raise_for_status()
-
-            # Check Content-Length before reading body
-            content_length = response.headers.get("content-length")
-            try:
-                if content_length and int(content_length) > MAX_CONTENT_BYTES:
-                    logger.warning(
-                        "Research source content too large (Content-Length)",
-                        url=url,
-                        size=content_length,
-                    )
-                    return None
-            except (ValueError, TypeError):
-                pass  # Malformed Content-Length header, skip check
-
-            # Check actual body size
-            if len(response.content) > MAX_CONTENT_BYTES:
-                logger.warning(
-                    "Research source content too large",
-                    url=url,
-                    size=len(response.content),
-                )
-                return None
+        # Validate the final URL after redirects (defense against
+        # redirect-based SSRF to internal services)
+        final_url = str(response.url)
+        try:
+            _validate_research_url(final_url)
+        except ValueError:
+            logger.warning(
+                "Research redirect target failed validation (blocked)",
+                original_url=url,
+                final_url=final_url,
+            )
+            return None
 
-            content_type = response.headers.get("content-type", "")
+        response.raise_for_status()
 
-            if "html" in content_type:
-                return _extract_text_from_html(response.text)
-            elif "text/plain" in content_type:
-                return response.text[:MAX_TEXT_LENGTH]
-            elif "application/pdf" in content_type:
-                # PDF extraction deferred to Story 35.11 (User Document Upload)
-                logger.info("PDF source detected, skipping for now", url=url)
-                return None
-            else:
+        # Check Content-Length before reading body
+        content_length = response.headers.get("content-length")
+        try:
+            if content_length and int(content_length) > MAX_CONTENT_BYTES:
                 logger.warning(
-                    "Unsupported content type for research source",
+                    "Research source content too large (Content-Length)",
                     url=url,
-                    content_type=content_type,
+                    size=content_length,
                 )
                 return None
+        except (ValueError, TypeError):
+            pass  # Malformed Content-Length header, skip check
+
+        # Check actual body size
+        if len(response.content) > MAX_CONTENT_BYTES:
+            logger.warning(
+                "Research source content too large",
+                url=url,
+                size=len(response.content),
+            )
+            return None
+
+        content_type = response.headers.get("content-type", "")
+
+        if "html" in content_type:
+            return _extract_text_from_html(response.text)
+        elif "text/plain" in content_type:
+            return response.text[:MAX_TEXT_LENGTH]
+        elif "application/pdf" in content_type:
+            # PDF extraction deferred to Story 35.11 (User Document Upload)
+            logger.info("PDF source detected, skipping for now", url=url)
+            return None
+        else:
+            logger.warning(
+                "Unsupported content type for research source",
+                url=url,
+                content_type=content_type,
+            )
+            return None
 
     except httpx.HTTPStatusError as e:
         logger.warning(
@@ -284,9 +280,9 @@ async def research_source(
         source.last_content_hash = new_hash
         return {"status": "updated" if not is_new else "new", "chunks": 0}
 
-    # Embed all chunks (run in thread to avoid blocking event loop)
+    # Embed all chunks (on the embedding thread pool, off the event loop)
     try:
-        embeddings = await asyncio.to_thread(embed_texts, chunks)
+        embeddings = await embed_documents(chunks)
     except Exception:
         logger.error("Failed to embed research chunks", url=source.url, exc_info=True)
         source.last_researched_at = now
@@ -0,0 +1,245 @@
+"""Set-based, chunked data retention enforcement across all users.
+
+Instead of a round of unbounded DELETEs per user, users are grouped by
+identical retention windows and each table is pruned with one DELETE per
+window, joined against ``data_retention_configs``::
+
+    DELETE FROM t WHERE pk IN (
+        SELECT pk FROM t
+        WHERE user_id IN (SELECT user_id FROM data_retention_configs
+                          WHERE <window column> = :days)
+          AND <timestamp> < :cutoff
+        LIMIT :batch FOR UPDATE SKIP LOCKED)
+
+Each chunk of ``data_retention_batch_size`` rows commits on its own, so
+locks and WAL per transaction stay bounded; a short pause between chunks
+lets replicas and autovacuum keep up. A constant cutoff per window lets
+Postgres prune partitions (glucose_readings, pump_events).
+
+Runs are resumable by construction: every committed chunk is final and
+the next run (or the next worker, thanks to SKIP LOCKED) simply picks up
+whatever expired rows are left. A run stops after
+``data_retention_max_runtime_seconds`` and reports the remaining backlog,
+along with the rows deleted and the deletion rate.
+"""
+
+import asyncio
+import time
+from dataclasses import dataclass, field
+from datetime import UTC, datetime, timedelta
+
+from sqlalchemy import delete, func, inspect, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import InstrumentedAttribute
+
+from src.config import settings
+from src.logging_config import get_logger
+from src.models.alert import Alert
+from src.models.correction_analysis import CorrectionAnalysis
+from src.models.daily_brief import DailyBrief
+from src.models.data_retention_config import DataRetentionConfig
+from src.models.escalation_event import EscalationEvent
+from src.models.glucose import GlucoseReading
+from src.models.meal_analysis import MealAnalysis
+from src.models.pump_data import PumpEvent
+from src.models.safety_log import SafetyLog
+from src.models.suggestion_response import SuggestionResponse
+
+logger = get_logger(__name__)
+
+
+@dataclass(frozen=True)
+class RetentionTarget:
+    """A table pruned by one of the retention windows."""
+
+    name: str
+    model: type
+    timestamp: InstrumentedAttribute
+    window: InstrumentedAttribute
+
+
+# Same tables and order as enforce_retention_for_user. EscalationEvent
+# must be deleted before Alert due to FK cascade
+# (escalation_events.alert_id -> alerts.id ON DELETE CASCADE).
+RETENTION_TARGETS = (
+    RetentionTarget(
+        "glucose_readings",
+        GlucoseReading,
+        GlucoseReading.reading_timestamp,
+        DataRetentionConfig.glucose_retention_days,
+    ),
+    RetentionTarget(
+        "pump_events",
+        PumpEvent,
+        PumpEvent.event_timestamp,
+        DataRetentionConfig.glucose_retention_days,
+    ),
+    RetentionTarget(
+        "daily_briefs",
+        DailyBrief,
+        DailyBrief.created_at,
+        DataRetentionConfig.analysis_retention_days,
+    ),
+    RetentionTarget(
+        "meal_analyses",
+        MealAnalysis,
+        MealAnalysis.created_at,
+        DataRetentionConfig.analysis_retention_days,
+    ),
+    RetentionTarget(
+        "correction_analyses",
+        CorrectionAnalysis,
+        CorrectionAnalysis.created_at,
+        DataRetentionConfig.analysis_retention_days,
+    ),
+    RetentionTarget(
+        "suggestion_responses",
+        SuggestionResponse,
+        SuggestionResponse.created_at,
+        DataRetentionConfig.analysis_retention_days,
+    ),
+    RetentionTarget(
+        "safety_logs",
+        SafetyLog,
+        SafetyLog.created_at,
+        DataRetentionConfig.audit_retention_days,
+    ),
+    RetentionTarget(
+        "escalation_events",
+        EscalationEvent,
+        EscalationEvent.created_at,
+        DataRetentionConfig.audit_retention_days,
+    ),
+    RetentionTarget(
+        "alerts",
+        Alert,
+        Alert.created_at,
+        DataRetentionConfig.audit_retention_days,
+    ),
+)
+
+
+@dataclass
+class RetentionReport:
+    """Outcome of one retention run."""
+
+    deleted: dict[str, int] = field(default_factory=dict)
+    # Expired rows left per table when the run hit its time budget
+    remaining: dict[str, int] = field(default_factory=dict)
+    elapsed_seconds: float = 0.0
+    completed: bool = True
+
+    @property
+    def total_deleted(self) -> int:
+        return sum(self.deleted.values())
+
+    @property
+    def rows_per_second(self) -> float:
+        if self.elapsed_seconds <= 0:
+            return 0.0
+        return round(self.total_deleted / self.elapsed_seconds, 1)
+
+
+def _expired(target: RetentionTarget, days: int, now: datetime):
+    """WHERE clause for ``target`` rows expired under a ``days`` window."""
+    users = select(DataRetentionConfig.user_id).where(target.window == days)
+    return (
+        target.model.user_id.in_(users),
+        target.timestamp < now - timedelta(days=days),
+    )
+
+
+def build_chunk_delete(target: RetentionTarget, days: int, now: datetime, limit: int):
+    """DELETE of at most ``limit`` expired ``target`` rows for one window."""
+    pk = inspect(target.model).primary_key
+    doomed = (
+        select(*pk)
+        .where(*_expired(target, days, now))
+        .limit(limit)
+        .with_for_update(skip_locked=True)
+        .correlate(None)  # Selects from the DELETE's own table
+    )
+    key = pk[0] if len(pk) == 1 else tuple_(*pk)
+    return (
+        delete(target.model)
+        .where(key.in_(doomed))
+        .execution_options(synchronize_session=False)
+    )
+
+
+async def _windows(db: AsyncSession, target: RetentionTarget) -> list[int]:
+    result = await db.execute(select(target.window).distinct().order_by(target.window))
+    return [row[0] for row in result.all()]
+
+
+async def _count_expired(
+    db: AsyncSession, target: RetentionTarget, windows: list[int], now: datetime
+) -> int:
+    total = 0
+    for days in windows:
+        total += await db.scalar(
+            select(func.count())
+            .select_from(target.model)
+            .where(*_expired(target, days, now))
+        )
+    return total
+
+
+async def enforce_retention(
+    db: AsyncSession, now: datetime | None = None
+) -> RetentionReport:
+    """Delete expired rows of every user with a retention config.
+
+    Commits after every chunk. Returns a report with rows deleted per
+    table, the deletion rate and, if the time budget ran out, the
+    remaining backlog.
+    """
+    now = now or datetime.now(UTC)
+    started = time.monotonic()
+    deadline = started + settings.data_retention_max_runtime_seconds
+    report = RetentionReport()
+
+    for target in RETENTION_TARGETS:
+        windows = await _windows(db, target)
+        report.deleted[target.name] = 0
+        target_started = time.monotonic()
+        for index, days in enumerate(windows):
+            while report.completed:
+                result = await db.execute(
+                    build_chunk_delete(
+                        target, days, now, settings.data_retention_batch_size
+                    )
+                )
+                await db.commit()
+                report.deleted[target.name] += result.rowcount
+                if result.rowcount < settings.data_retention_batch_size:
+                    break
+                if time.monotonic() >= deadline:
+                    report.completed = False
+                    break
+                await asyncio.sleep(settings.data_retention_batch_pause_seconds)
+            if not report.completed:
+                report.remaining[target.name] = await _count_expired(
+                    db, target, windows[index:], now
+                )
+                break
+
+        if report.deleted[target.name]:
+            elapsed = max(time.monotonic() - target_started, 1e-6)
+            logger.info(
+                "Retention pruned table",
+                table=target.name,
+                deleted=report.deleted[target.name],
+                windows=len(windows),
+                rows_per_second=round(report.deleted[target.name] / elapsed, 1),
+            )
+        if not report.completed:
+            # Tables not reached this run keep their whole backlog
+            for later in RETENTION_TARGETS[RETENTION_TARGETS.index(target) + 1 :]:
+                report.remaining[later.name] = await _count_expired(
+                    db, later, await _windows(db, later), now
+                )
+            break
+
+    report.elapsed_seconds = round(time.monotonic() - started, 3)
+    return report
@@ -89,6 +89,15 @@ def _check_dangerous_content(text: str) -> bool:
     return any(re.search(pattern, text) for pattern in DANGEROUS_PATTERNS)
 
 
+def contains_dangerous_content(text: str) -> bool:
+    """Return True if ``text`` would be rejected as dangerous.
+
+    Cheaper than ``validate_ai_suggestion``; used to check a streamed
+    reply as it grows.
+    """
+    return _check_dangerous_content(text)
+
+
 def _extract_carb_ratio_changes(text: str) -> list[FlaggedSuggestion]:
     """Extract and validate carb ratio change suggestions.
 
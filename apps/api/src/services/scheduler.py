@@ -1,9 +1,12 @@
 """Story 3.2 & 3.4: Background job scheduler.
 
 APScheduler-based background task scheduler for data sync jobs.
+Per-user sync jobs and batched alert checks fan out through
+``job_fanout.run_fanout``.
 """
 
 import asyncio
+import uuid
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
 
@@ -14,13 +17,16 @@ from sqlalchemy import select
 from src.config import settings
 from src.database import get_session_maker
 from src.logging_config import get_logger
+from src.models.alert import Alert
 from src.models.integration import (
     IntegrationCredential,
     IntegrationStatus,
     IntegrationType,
 )
+from src.services.alert_notifier import notify_user_of_alerts
 from src.services.dexcom_sync import DexcomSyncError, sync_dexcom_for_user
-from src.services.predictive_alerts import evaluate_alerts_for_user
+from src.services.job_fanout import get_rate_budget, run_fanout
+from src.services.predictive_alerts import evaluate_alerts_for_users
 from src.services.tandem_sync import TandemSyncError, sync_tandem_for_user
 
 logger = get_logger(__name__)
@@ -29,212 +35,229 @@ logger = get_logger(__name__)
 scheduler: AsyncIOScheduler | None = None
 
 
-async def sync_all_dexcom_users() -> None:
-    """Sync Dexcom data for all users with configured credentials.
+async def _integration_user_ids(
+    integration_types: list[IntegrationType],
+    statuses: list[IntegrationStatus],
+) -> list[uuid.UUID]:
+    """Return distinct user IDs with a matching integration credential.
 
-    This job runs on a schedule and syncs data for all users
-    who have connected their Dexcom accounts.
+    The lookup session is closed before the per-user fan-out starts so it
+    isn't held open for the whole cycle.
     """
-    logger.info("Starting scheduled Dexcom sync for all users")
-
     async with get_session_maker()() as db:
-        # Find all users with active Dexcom integration
         result = await db.execute(
-            select(IntegrationCredential).where(
-                IntegrationCredential.integration_type == IntegrationType.DEXCOM,
-                IntegrationCredential.status.in_(
-                    [
-                        IntegrationStatus.CONNECTED,
-                        IntegrationStatus.ERROR,  # Retry errors
-                    ]
-                ),
+            select(IntegrationCredential.user_id).where(
+                IntegrationCredential.integration_type.in_(integration_types),
+                IntegrationCredential.status.in_(statuses),
             )
         )
-        credentials = result.scalars().all()
+        # dict.fromkeys keeps first-seen order while deduplicating
+        return list(dict.fromkeys(row[0] for row in result.all()))
 
-        if not credentials:
-            logger.info("No users with Dexcom integration to sync")
-            return
 
-        logger.info(
-            "Found users for Dexcom sync",
-            user_count=len(credentials),
+async def _sync_dexcom_user(user_id: uuid.UUID) -> bool:
+    """Sync one Dexcom user in its own session. Returns True on success."""
+    try:
+        # Create a new session for each user to isolate errors
+        async with get_session_maker()() as user_db:
+            result = await sync_dexcom_for_user(user_db, user_id)
+            logger.debug(
+                "Dexcom sync completed for user",
+                user_id=str(user_id),
+                readings_fetched=result["readings_fetched"],
+                readings_stored=result["readings_stored"],
+            )
+            return True
+    except DexcomSyncError as e:
+        logger.warning(
+            "Scheduled Dexcom sync failed for user",
+            user_id=str(user_id),
+            error=str(e),
         )
+        return False
 
-        # Sync each user
-        success_count = 0
-        error_count = 0
 
-        for credential in credentials:
-            try:
-                # Create a new session for each user to isolate errors
-                async with get_session_maker()() as user_db:
-                    result = await sync_dexcom_for_user(user_db, credential.user_id)
-                    logger.debug(
-                        "Dexcom sync completed for user",
-                        user_id=str(credential.user_id),
-                        readings_fetched=result["readings_fetched"],
-                        readings_stored=result["readings_stored"],
-                    )
-                    success_count += 1
+async def sync_all_dexcom_users() -> None:
+    """Sync Dexcom data for all users with configured credentials.
 
-            except DexcomSyncError as e:
-                logger.warning(
-                    "Scheduled Dexcom sync failed for user",
-                    user_id=str(credential.user_id),
-                    error=str(e),
-                )
-                error_count += 1
+    This job runs on a schedule and syncs data for all users
+    who have connected their Dexcom accounts. Users are processed
+    concurrently (bounded by ``scheduler_max_concurrency``) and paced by
+    the Dexcom rate budget.
+    """
+    logger.info("Starting scheduled Dexcom sync for all users")
 
-            except Exception as e:
-                logger.error(
-                    "Unexpected error in scheduled Dexcom sync",
-                    user_id=str(credential.user_id),
-                    error=str(e),
-                )
-                error_count += 1
+    user_ids = await _integration_user_ids(
+        [IntegrationType.DEXCOM],
+        [IntegrationStatus.CONNECTED, IntegrationStatus.ERROR],  # Retry errors
+    )
 
-            # Small delay between users to avoid rate limiting
-            await asyncio.sleep(1)
+    if not user_ids:
+        logger.info("No users with Dexcom integration to sync")
+        return
+
+    logger.info(
+        "Found users for Dexcom sync",
+        user_count=len(user_ids),
+    )
+
+    outcome = await run_fanout(
+        "dexcom_sync",
+        user_ids,
+        _sync_dexcom_user,
+        concurrency=settings.scheduler_max_concurrency,
+        timeout_seconds=settings.dexcom_sync_user_timeout_seconds,
+        rate_budget=get_rate_budget("dexcom", settings.dexcom_sync_rate_per_second),
+    )
+    success_count = sum(outcome.results)
 
     logger.info(
         "Scheduled Dexcom sync completed",
         success_count=success_count,
-        error_count=error_count,
+        error_count=len(user_ids) - success_count,
+        cycle_seconds=round(outcome.stats.cycle_seconds, 2),
     )
 
 
+async def _sync_tandem_user(user_id: uuid.UUID) -> bool:
+    """Sync one Tandem user in its own session. Returns True on success."""
+    try:
+        # Create a new session for each user to isolate errors
+        async with get_session_maker()() as user_db:
+            result = await sync_tandem_for_user(user_db, user_id)
+            logger.info(
+                "Tandem sync completed for user",
+                user_id=str(user_id),
+                events_fetched=result["events_fetched"],
+                events_stored=result["events_stored"],
+            )
+            return True
+    except TandemSyncError as e:
+        logger.warning(
+            "Scheduled Tandem sync failed for user",
+            user_id=str(user_id),
+            error=str(e),
+        )
+        return False
+
+
 async def sync_all_tandem_users() -> None:
     """Sync Tandem data for all users with configured credentials.
 
     This job runs on a schedule and syncs pump data for all users
-    who have connected their Tandem t:connect accounts.
+    who have connected their Tandem t:connect accounts. Users are processed
+    concurrently (bounded by ``scheduler_max_concurrency``) and paced by
+    the Tandem rate budget.
     """
     logger.info("Starting scheduled Tandem sync for all users")
 
-    async with get_session_maker()() as db:
-        # Find all users with active Tandem integration
-        result = await db.execute(
-            select(IntegrationCredential).where(
-                IntegrationCredential.integration_type == IntegrationType.TANDEM,
-                IntegrationCredential.status.in_(
-                    [
-                        IntegrationStatus.CONNECTED,
-                        IntegrationStatus.ERROR,  # Retry errors
-                    ]
-                ),
-            )
-        )
-        credentials = result.scalars().all()
-
-        if not credentials:
-            logger.info("No users with Tandem integration to sync")
-            return
-
-        logger.info(
-            "Found users for Tandem sync",
-            user_count=len(credentials),
-        )
-
-        # Sync each user
-        success_count = 0
-        error_count = 0
-
-        for credential in credentials:
-            try:
-                # Create a new session for each user to isolate errors
-                async with get_session_maker()() as user_db:
-                    result = await sync_tandem_for_user(user_db, credential.user_id)
-                    logger.info(
-                        "Tandem sync completed for user",
-                        user_id=str(credential.user_id),
-                        events_fetched=result["events_fetched"],
-                        events_stored=result["events_stored"],
-                    )
-                    success_count += 1
+    user_ids = await _integration_user_ids(
+        [IntegrationType.TANDEM],
+        [IntegrationStatus.CONNECTED, IntegrationStatus.ERROR],  # Retry errors
+    )
 
-            except TandemSyncError as e:
-                logger.warning(
-                    "Scheduled Tandem sync failed for user",
-                    user_id=str(credential.user_id),
-                    error=str(e),
-                )
-                error_count += 1
+    if not user_ids:
+        logger.info("No users with Tandem integration to sync")
+        return
 
-            except Exception as e:
-                logger.error(
-                    "Unexpected error in scheduled Tandem sync",
-                    user_id=str(credential.user_id),
-                    error=str(e),
-                )
-                error_count += 1
+    logger.info(
+        "Found users for Tandem sync",
+        user_count=len(user_ids),
+    )
 
-            # Small delay between users to avoid rate limiting
-            await asyncio.sleep(1)
+    outcome = await run_fanout(
+        "tandem_sync",
+        user_ids,
+        _sync_tandem_user,
+        concurrency=settings.scheduler_max_concurrency,
+        timeout_seconds=settings.tandem_sync_user_timeout_seconds,
+        rate_budget=get_rate_budget("tandem", settings.tandem_sync_rate_per_second),
+    )
+    success_count = sum(outcome.results)
 
     logger.info(
         "Scheduled Tandem sync completed",
         success_count=success_count,
-        error_count=error_count,
+        error_count=len(user_ids) - success_count,
+        cycle_seconds=round(outcome.stats.cycle_seconds, 2),
     )
 
 
+async def _check_alerts_batch(
+    user_ids: list[uuid.UUID],
+) -> dict[uuid.UUID, list[Alert]]:
+    """Evaluate predictive alerts for a batch of users. Returns the new alerts."""
+    async with get_session_maker()() as batch_db:
+        return await evaluate_alerts_for_users(batch_db, user_ids)
+
+
+async def _deliver_user_alerts(item: tuple[uuid.UUID, list[Alert]]) -> int:
+    """Send one user's new alerts to Telegram. Returns the messages sent."""
+    user_id, alerts = item
+    async with get_session_maker()() as user_db:
+        return await notify_user_of_alerts(user_db, user_id, alerts)
+
+
 async def check_alerts_all_users() -> None:
     """Run predictive alert evaluation for all users with active integrations.
 
     This job runs on a schedule and evaluates alerts for all users
     who have any active glucose data integration (Dexcom or Tandem).
+    Users are evaluated in batches of ``alert_check_batch_size`` with
+    set-based queries (see ``evaluate_alerts_for_users``); batches fan out
+    under the scheduler concurrency cap. Alert evaluation only touches the
+    local database, so there is no upstream rate budget.
+
+    Story 7.2: once every batch has committed, the new alerts are sent to
+    Telegram in a second fan-out, one user per item with its own timeout,
+    so a slow delivery never cancels a batch whose alerts are already
+    stored (and deduplicated against).
     """
     logger.info("Starting scheduled alert check for all users")
 
-    async with get_session_maker()() as db:
-        result = await db.execute(
-            select(IntegrationCredential).where(
-                IntegrationCredential.integration_type.in_(
-                    [IntegrationType.DEXCOM, IntegrationType.TANDEM]
-                ),
-                IntegrationCredential.status == IntegrationStatus.CONNECTED,
-            )
-        )
-        credentials = result.scalars().all()
-
-        # Deduplicate by user_id (a user may have both Dexcom and Tandem)
-        seen_user_ids = set()
-        unique_credentials = []
-        for cred in credentials:
-            if cred.user_id not in seen_user_ids:
-                seen_user_ids.add(cred.user_id)
-                unique_credentials.append(cred)
-        credentials = unique_credentials
-
-        if not credentials:
-            logger.info("No users with active integrations for alert check")
-            return
+    # Deduplicated by user_id (a user may have both Dexcom and Tandem)
+    user_ids = await _integration_user_ids(
+        [IntegrationType.DEXCOM, IntegrationType.TANDEM],
+        [IntegrationStatus.CONNECTED],
+    )
 
-        alert_count = 0
-        error_count = 0
+    if not user_ids:
+        logger.info("No users with active integrations for alert check")
+        return
 
-        for credential in credentials:
-            try:
-                async with get_session_maker()() as user_db:
-                    new_alerts = await evaluate_alerts_for_user(
-                        user_db, credential.user_id
-                    )
-                    alert_count += len(new_alerts)
-            except Exception as e:
-                logger.error(
-                    "Alert check failed for user",
-                    user_id=str(credential.user_id),
-                    error=str(e),
-                )
-                error_count += 1
+    size = settings.alert_check_batch_size
+    batches = [user_ids[i : i + size] for i in range(0, len(user_ids), size)]
 
-            await asyncio.sleep(0.5)
+    outcome = await run_fanout(
+        "alert_check",
+        batches,
+        _check_alerts_batch,
+        concurrency=settings.scheduler_max_concurrency,
+        timeout_seconds=settings.alert_check_batch_timeout_seconds,
+        item_key=lambda batch: f"batch of {len(batch)} users",
+    )
+    new_alerts = [item for batch in outcome.results for item in batch.items()]
+
+    delivery = await run_fanout(
+        "alert_delivery",
+        new_alerts,
+        _deliver_user_alerts,
+        concurrency=settings.scheduler_max_concurrency,
+        timeout_seconds=settings.alert_delivery_user_timeout_seconds,
+        item_key=lambda item: item[0],
+    )
 
     logger.info(
         "Scheduled alert check completed",
-        alerts_created=alert_count,
-        errors=error_count,
+        users=len(user_ids),
+        batches=len(batches),
+        alerts_created=sum(len(alerts) for _, alerts in new_alerts),
+        telegram_sent=sum(delivery.results),
+        errors=outcome.stats.failed + outcome.stats.timed_out,
+        delivery_errors=delivery.stats.failed + delivery.stats.timed_out,
+        cycle_seconds=round(
+            outcome.stats.cycle_seconds + delivery.stats.cycle_seconds, 2
+        ),
     )
 
 
@@ -314,61 +337,54 @@ async def check_escalations_all_users() -> None:
 async def enforce_data_retention_all_users() -> None:
     """Enforce data retention policies for all users with configured retention settings.
 
-    This job runs daily and deletes records older than each user's
-    configured retention period.
+    This job runs daily. Whole months of glucose and pump data that have
+    expired for everyone are removed as partitions first; the remaining
+    expired rows are then deleted in committed chunks, grouped by
+    retention window (see ``retention_engine``). A run that hits its time
+    budget reports the backlog left for the next run.
     """
-    from src.models.data_retention_config import DataRetentionConfig
-    from src.services.data_retention_config import enforce_retention_for_user
+    from src.services.partitions import drop_expired_partitions
+    from src.services.retention_engine import enforce_retention
 
     logger.info("Starting scheduled data retention enforcement")
 
-    # Collect user IDs with retention configs, then close the session
-    # before iterating to avoid DetachedInstanceError
-    async with get_session_maker()() as db:
-        result = await db.execute(select(DataRetentionConfig.user_id))
-        user_ids = [row[0] for row in result.all()]
+    try:
+        async with get_session_maker()() as db:
+            await drop_expired_partitions(db)
+    except Exception as e:
+        # The chunked deletes below still enforce retention row by row
+        logger.error("Expired partition removal failed", error=str(e))
 
-    if not user_ids:
-        logger.info("No users with data retention config to enforce")
+    try:
+        async with get_session_maker()() as db:
+            report = await enforce_retention(db)
+    except Exception as e:
+        # Committed chunks are kept; the next run resumes from there
+        logger.error("Data retention enforcement failed", error=str(e))
         return
 
-    success_count = 0
-    error_count = 0
-    total_deleted = 0
-
-    for user_id in user_ids:
-        try:
-            async with get_session_maker()() as user_db:
-                # Fetch config fresh in this session
-                config_result = await user_db.execute(
-                    select(DataRetentionConfig).where(
-                        DataRetentionConfig.user_id == user_id
-                    )
-                )
-                user_config = config_result.scalar_one_or_none()
-                if user_config is None:
-                    continue
-                deleted = await enforce_retention_for_user(
-                    user_id, user_config, user_db
-                )
-                total_deleted += sum(deleted.values())
-                success_count += 1
-        except Exception as e:
-            logger.error(
-                "Data retention enforcement failed for user",
-                user_id=str(user_id),
-                error=str(e),
-            )
-            error_count += 1
-
     logger.info(
         "Scheduled data retention enforcement completed",
-        users_processed=success_count,
-        errors=error_count,
-        total_records_deleted=total_deleted,
+        completed=report.completed,
+        total_records_deleted=report.total_deleted,
+        deleted=report.deleted,
+        rows_per_second=report.rows_per_second,
+        elapsed_seconds=report.elapsed_seconds,
+        remaining_backlog=report.remaining,
     )
 
 
+async def maintain_partitions() -> None:
+    """Pre-create upcoming monthly glucose and pump event partitions."""
+    from src.services.partitions import ensure_partitions
+
+    async with get_session_maker()() as db:
+        try:
+            await ensure_partitions(db)
+        except Exception as e:
+            logger.error("Partition maintenance failed", error=str(e))
+
+
 async def cleanup_stale_devices_job() -> None:
     """Remove devices not seen in 30 days."""
     from src.services.device_service import cleanup_stale_devices
@@ -490,6 +506,24 @@ def start_scheduler() -> AsyncIOScheduler:
             interval_hours=settings.data_retention_check_interval_hours,
         )
 
+    # Add partition maintenance job if enabled
+    if settings.partition_maintenance_enabled:
+        scheduler.add_job(
+            maintain_partitions,
+            trigger=IntervalTrigger(
+                hours=settings.partition_maintenance_interval_hours
+            ),
+            id="partition_maintenance",
+            name="Partition Maintenance",
+            replace_existing=True,
+            max_instances=1,
+        )
+        logger.info(
+            "Scheduled partition maintenance job",
+            interval_hours=settings.partition_maintenance_interval_hours,
+            premake_months=settings.partition_premake_months,
+        )
+
     # Add Tandem cloud upload job if enabled (Story 16.6)
     if settings.tandem_upload_enabled:
         from src.services.tandem_upload_scheduler import run_tandem_cloud_uploads
@@ -509,6 +543,25 @@ def start_scheduler() -> AsyncIOScheduler:
             interval_minutes=settings.tandem_upload_check_interval_minutes,
         )
 
+    # Add scheduled daily brief job if enabled
+    if settings.daily_brief_schedule_enabled:
+        from src.services.brief_scheduler import generate_scheduled_briefs
+
+        scheduler.add_job(
+            generate_scheduled_briefs,
+            trigger=IntervalTrigger(
+                minutes=settings.daily_brief_check_interval_minutes
+            ),
+            id="daily_brief",
+            name="Scheduled Daily Briefs",
+            replace_existing=True,
+            max_instances=1,
+        )
+        logger.info(
+            "Scheduled daily brief job",
+            interval_minutes=settings.daily_brief_check_interval_minutes,
+        )
+
     # Add stale device cleanup job (Story 16.11)
     scheduler.add_job(
         cleanup_stale_devices_job,
@@ -2,14 +2,24 @@
 
 Collects user settings and optionally all user data into a
 structured JSON export suitable for backup or portability.
+
+Full-data exports can also be streamed as (optionally gzipped) NDJSON,
+which reads each table through a server-side cursor so memory use stays
+flat no matter how much history the user has.
 """
 
+import json
 import uuid
+import zlib
+from collections.abc import AsyncIterator, Callable
+from dataclasses import dataclass
 from datetime import UTC, datetime
+from typing import Any
 
-from sqlalchemy import select
+from sqlalchemy import Select, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.database import get_db_session
 from src.logging_config import get_logger
 from src.models.ai_provider import AIProviderConfig
 from src.models.alert import Alert
@@ -33,6 +43,13 @@ logger = get_logger(__name__)
 # Maximum records per category to prevent memory exhaustion on large datasets.
 MAX_EXPORT_RECORDS_PER_CATEGORY = 100_000
 
+# Rows fetched per server-side cursor round-trip when streaming an export
+EXPORT_STREAM_BATCH_SIZE = 2_000
+# Buffered NDJSON bytes per yielded chunk when streaming an export
+EXPORT_STREAM_CHUNK_BYTES = 64 * 1024
+# zlib window bits selecting the gzip container format
+_GZIP_WBITS = 16 + zlib.MAX_WBITS
+
 
 async def _export_settings(
     user_id: uuid.UUID,
@@ -191,6 +208,146 @@ async def _export_settings(
     return settings
 
 
+def _glucose_record(r: GlucoseReading) -> dict:
+    return {
+        "value": r.value,
+        "reading_timestamp": r.reading_timestamp.isoformat(),
+        "trend": r.trend.value,
+        "trend_rate": r.trend_rate,
+        "source": r.source,
+    }
+
+
+def _pump_event_record(e: PumpEvent) -> dict:
+    return {
+        "event_type": e.event_type.value,
+        "event_timestamp": e.event_timestamp.isoformat(),
+        "units": e.units,
+        "duration_minutes": e.duration_minutes,
+        "is_automated": e.is_automated,
+        "source": e.source,
+    }
+
+
+def _daily_brief_record(b: DailyBrief) -> dict:
+    return {
+        "period_start": b.period_start.isoformat(),
+        "period_end": b.period_end.isoformat(),
+        "ai_summary": b.ai_summary,
+        "time_in_range_pct": b.time_in_range_pct,
+        "average_glucose": b.average_glucose,
+        "readings_count": b.readings_count,
+        "created_at": b.created_at.isoformat(),
+    }
+
+
+def _meal_analysis_record(m: MealAnalysis) -> dict:
+    return {
+        "period_start": m.period_start.isoformat(),
+        "period_end": m.period_end.isoformat(),
+        "ai_analysis": m.ai_analysis,
+        "total_boluses": m.total_boluses,
+        "total_spikes": m.total_spikes,
+        "avg_post_meal_peak": m.avg_post_meal_peak,
+        "created_at": m.created_at.isoformat(),
+    }
+
+
+def _correction_analysis_record(c: CorrectionAnalysis) -> dict:
+    return {
+        "period_start": c.period_start.isoformat(),
+        "period_end": c.period_end.isoformat(),
+        "ai_analysis": c.ai_analysis,
+        "total_corrections": c.total_corrections,
+        "under_corrections": c.under_corrections,
+        "over_corrections": c.over_corrections,
+        "avg_observed_isf": c.avg_observed_isf,
+        "created_at": c.created_at.isoformat(),
+    }
+
+
+def _suggestion_response_record(sr: SuggestionResponse) -> dict:
+    return {
+        "analysis_type": sr.analysis_type,
+        "response": sr.response,
+        "reason": sr.reason,
+        "created_at": sr.created_at.isoformat(),
+    }
+
+
+def _safety_log_record(sl: SafetyLog) -> dict:
+    return {
+        "analysis_type": sl.analysis_type,
+        "status": sl.status,
+        "has_dangerous_content": sl.has_dangerous_content,
+        "created_at": sl.created_at.isoformat(),
+    }
+
+
+def _alert_record(a: Alert) -> dict:
+    return {
+        "alert_type": a.alert_type.value,
+        "severity": a.severity.value,
+        "message": a.message,
+        "acknowledged": a.acknowledged,
+        "created_at": a.created_at.isoformat(),
+    }
+
+
+@dataclass(frozen=True)
+class _DataCategory:
+    """One exported table: its key, query and record serializer."""
+
+    name: str
+    model: type
+    order_by: Any
+    serialize: Callable[[Any], dict]
+
+    def query(self, user_id: uuid.UUID) -> Select:
+        return (
+            select(self.model)
+            .where(self.model.user_id == user_id)
+            .order_by(self.order_by)
+        )
+
+
+# Export order; also the order of keys in the "data" section
+_DATA_CATEGORIES = [
+    _DataCategory(
+        "glucose_readings",
+        GlucoseReading,
+        GlucoseReading.reading_timestamp,
+        _glucose_record,
+    ),
+    _DataCategory(
+        "pump_events", PumpEvent, PumpEvent.event_timestamp, _pump_event_record
+    ),
+    _DataCategory(
+        "daily_briefs", DailyBrief, DailyBrief.period_start, _daily_brief_record
+    ),
+    _DataCategory(
+        "meal_analyses",
+        MealAnalysis,
+        MealAnalysis.period_start,
+        _meal_analysis_record,
+    ),
+    _DataCategory(
+        "correction_analyses",
+        CorrectionAnalysis,
+        CorrectionAnalysis.period_start,
+        _correction_analysis_record,
+    ),
+    _DataCategory(
+        "suggestion_responses",
+        SuggestionResponse,
+        SuggestionResponse.created_at,
+        _suggestion_response_record,
+    ),
+    _DataCategory("safety_logs", SafetyLog, SafetyLog.created_at, _safety_log_record),
+    _DataCategory("alerts", Alert, Alert.created_at, _alert_record),
+]
+
+
 async def _export_all_data(
     user_id: uuid.UUID,
     db: AsyncSession,
@@ -202,166 +359,11 @@ async def _export_all_data(
     MAX_EXPORT_RECORDS_PER_CATEGORY to prevent memory exhaustion.
     """
     data: dict = {}
-    limit = MAX_EXPORT_RECORDS_PER_CATEGORY
-
-    # Glucose readings
-    result = await db.execute(
-        select(GlucoseReading)
-        .where(GlucoseReading.user_id == user_id)
-        .order_by(GlucoseReading.reading_timestamp)
-        .limit(limit)
-    )
-    readings = result.scalars().all()
-    data["glucose_readings"] = [
-        {
-            "value": r.value,
-            "reading_timestamp": r.reading_timestamp.isoformat(),
-            "trend": r.trend.value,
-            "trend_rate": r.trend_rate,
-            "source": r.source,
-        }
-        for r in readings
-    ]
-
-    # Pump events
-    result = await db.execute(
-        select(PumpEvent)
-        .where(PumpEvent.user_id == user_id)
-        .order_by(PumpEvent.event_timestamp)
-        .limit(limit)
-    )
-    events = result.scalars().all()
-    data["pump_events"] = [
-        {
-            "event_type": e.event_type.value,
-            "event_timestamp": e.event_timestamp.isoformat(),
-            "units": e.units,
-            "duration_minutes": e.duration_minutes,
-            "is_automated": e.is_automated,
-            "source": e.source,
-        }
-        for e in events
-    ]
-
-    # Daily briefs
-    result = await db.execute(
-        select(DailyBrief)
-        .where(DailyBrief.user_id == user_id)
-        .order_by(DailyBrief.period_start)
-        .limit(limit)
-    )
-    briefs = result.scalars().all()
-    data["daily_briefs"] = [
-        {
-            "period_start": b.period_start.isoformat(),
-            "period_end": b.period_end.isoformat(),
-            "ai_summary": b.ai_summary,
-            "time_in_range_pct": b.time_in_range_pct,
-            "average_glucose": b.average_glucose,
-            "readings_count": b.readings_count,
-            "created_at": b.created_at.isoformat(),
-        }
-        for b in briefs
-    ]
-
-    # Meal analyses
-    result = await db.execute(
-        select(MealAnalysis)
-        .where(MealAnalysis.user_id == user_id)
-        .order_by(MealAnalysis.period_start)
-        .limit(limit)
-    )
-    meals = result.scalars().all()
-    data["meal_analyses"] = [
-        {
-            "period_start": m.period_start.isoformat(),
-            "period_end": m.period_end.isoformat(),
-            "ai_analysis": m.ai_analysis,
-            "total_boluses": m.total_boluses,
-            "total_spikes": m.total_spikes,
-            "avg_post_meal_peak": m.avg_post_meal_peak,
-            "created_at": m.created_at.isoformat(),
-        }
-        for m in meals
-    ]
-
-    # Correction analyses
-    result = await db.execute(
-        select(CorrectionAnalysis)
-        .where(CorrectionAnalysis.user_id == user_id)
-        .order_by(CorrectionAnalysis.period_start)
-        .limit(limit)
-    )
-    corrections = result.scalars().all()
-    data["correction_analyses"] = [
-        {
-            "period_start": c.period_start.isoformat(),
-            "period_end": c.period_end.isoformat(),
-            "ai_analysis": c.ai_analysis,
-            "total_corrections": c.total_corrections,
-            "under_corrections": c.under_corrections,
-            "over_corrections": c.over_corrections,
-            "avg_observed_isf": c.avg_observed_isf,
-            "created_at": c.created_at.isoformat(),
-        }
-        for c in corrections
-    ]
-
-    # Suggestion responses
-    result = await db.execute(
-        select(SuggestionResponse)
-        .where(SuggestionResponse.user_id == user_id)
-        .order_by(SuggestionResponse.created_at)
-        .limit(limit)
-    )
-    responses = result.scalars().all()
-    data["suggestion_responses"] = [
-        {
-            "analysis_type": sr.analysis_type,
-            "response": sr.response,
-            "reason": sr.reason,
-            "created_at": sr.created_at.isoformat(),
-        }
-        for sr in responses
-    ]
-
-    # Safety logs
-    result = await db.execute(
-        select(SafetyLog)
-        .where(SafetyLog.user_id == user_id)
-        .order_by(SafetyLog.created_at)
-        .limit(limit)
-    )
-    logs = result.scalars().all()
-    data["safety_logs"] = [
-        {
-            "analysis_type": sl.analysis_type,
-            "status": sl.status,
-            "has_dangerous_content": sl.has_dangerous_content,
-            "created_at": sl.created_at.isoformat(),
-        }
-        for sl in logs
-    ]
-
-    # Alerts
-    result = await db.execute(
-        select(Alert)
-        .where(Alert.user_id == user_id)
-        .order_by(Alert.created_at)
-        .limit(limit)
-    )
-    alerts = result.scalars().all()
-    data["alerts"] = [
-        {
-            "alert_type": a.alert_type.value,
-            "severity": a.severity.value,
-            "message": a.message,
-            "acknowledged": a.acknowledged,
-            "created_at": a.created_at.isoformat(),
-        }
-        for a in alerts
-    ]
-
+    for category in _DATA_CATEGORIES:
+        result = await db.execute(
+            category.query(user_id).limit(MAX_EXPORT_RECORDS_PER_CATEGORY)
+        )
+        data[category.name] = [category.serialize(r) for r in result.scalars().all()]
     return data
 
 
@@ -370,6 +372,14 @@ def _record_counts_from_data(data: dict) -> dict[str, int]:
     return {key: len(records) for key, records in data.items()}
 
 
+def _export_metadata(include_data: bool) -> dict:
+    return {
+        "export_date": datetime.now(UTC).isoformat(),
+        "export_type": "all_data" if include_data else "settings_only",
+        "version": "1.0",
+    }
+
+
 async def export_user_data(
     user_id: uuid.UUID,
     db: AsyncSession,
@@ -394,11 +404,7 @@ async def export_user_data(
     )
 
     export: dict = {
-        "metadata": {
-            "export_date": datetime.now(UTC).isoformat(),
-            "export_type": "all_data" if include_data else "settings_only",
-            "version": "1.0",
-        },
+        "metadata": _export_metadata(include_data),
         "settings": await _export_settings(user_id, db),
     }
 
@@ -413,3 +419,95 @@ async def export_user_data(
     )
 
     return export
+
+
+def _ndjson_line(category: str, record: dict) -> bytes:
+    return json.dumps({"category": category, "record": record}).encode() + b"\n"
+
+
+async def stream_user_data_export(
+    user_id: uuid.UUID,
+    db: AsyncSession,
+    *,
+    include_data: bool = False,
+    chunk_bytes: int = EXPORT_STREAM_CHUNK_BYTES,
+) -> AsyncIterator[bytes]:
+    """Stream an export as NDJSON, holding only one batch in memory.
+
+    Every line is ``{"category": ..., "record": {...}}``: first the
+    ``metadata``, then ``settings``, then (with ``include_data``) one line
+    per data record in the same categories and order as
+    ``export_user_data``. Data tables are read through server-side cursors
+    and are not capped. A final ``record_counts`` line marks the export
+    as complete; a stream that ends without it was cut short.
+
+    Args:
+        user_id: User's UUID.
+        db: Database session.
+        include_data: When True, include all historical data.
+        chunk_bytes: Approximate size of each yielded chunk.
+    """
+    logger.info(
+        "Streaming export initiated",
+        user_id=str(user_id),
+        include_data=include_data,
+    )
+    buffer = bytearray()
+    buffer += _ndjson_line("metadata", _export_metadata(include_data))
+    buffer += _ndjson_line("settings", await _export_settings(user_id, db))
+
+    counts: dict[str, int] = {}
+    if include_data:
+        for category in _DATA_CATEGORIES:
+            counts[category.name] = 0
+            result = await db.stream_scalars(
+                category.query(user_id).execution_options(
+                    yield_per=EXPORT_STREAM_BATCH_SIZE
+                )
+            )
+            async for record in result:
+                buffer += _ndjson_line(category.name, category.serialize(record))
+                counts[category.name] += 1
+                if len(buffer) >= chunk_bytes:
+                    yield bytes(buffer)
+                    buffer.clear()
+        buffer += _ndjson_line("record_counts", counts)
+    else:
+        buffer += _ndjson_line("record_counts", {})
+
+    yield bytes(buffer)
+    logger.info(
+        "Streaming export completed",
+        user_id=str(user_id),
+        include_data=include_data,
+        records=sum(counts.values()),
+    )
+
+
+async def gzip_stream(chunks: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
+    """Gzip-compress a byte stream incrementally."""
+    compressor = zlib.compressobj(wbits=_GZIP_WBITS)
+    async for chunk in chunks:
+        compressed = compressor.compress(chunk)
+        if compressed:
+            yield compressed
+    yield compressor.flush()
+
+
+async def stream_export_response_body(
+    user_id: uuid.UUID,
+    *,
+    include_data: bool,
+    compress: bool,
+) -> AsyncIterator[bytes]:
+    """Body of a streaming export response.
+
+    Uses its own database session, since the stream outlives the request
+    handler (and its request-scoped session).
+    """
+    async with get_db_session() as db:
+        chunks = stream_user_data_export(user_id, db, include_data=include_data)
+        if compress:
+            chunks = gzip_stream(chunks)
+        async for chunk in chunks:
+            yield chunk
@@ -7,16 +7,12 @@ internal network (http://ai-sidecar:3456 by default).
 Story 15.4: Added validate_sidecar_connection for subscription provider validation.
 """
 
-import httpx
-
 from src.config import settings
 from src.logging_config import get_logger
+from src.services.http_clients import SIDECAR, get_http_client
 
 logger = get_logger(__name__)
 
-# Timeout for sidecar requests (seconds)
-_TIMEOUT = 10.0
-
 
 def _headers() -> dict[str, str]:
     """Build request headers including optional bearer token."""
@@ -33,15 +29,15 @@ async def get_sidecar_health() -> dict | None:
     unreachable.
     """
     try:
-        async with httpx.AsyncClient(timeout=_TIMEOUT) as client:
-            # /health skips auth on the sidecar, but include headers
-            # for consistency and forward-compatibility.
-            resp = await client.get(
-                f"{settings.ai_sidecar_url}/health",
-                headers=_headers(),
-            )
-            resp.raise_for_status()
-            return resp.json()
+        client = get_http_client(SIDECAR)
+        # /health skips auth on the sidecar, but include headers
+        # for consistency and forward-compatibility.
+        resp = await client.get(
+            f"{settings.ai_sidecar_url}/health",
+            headers=_headers(),
+        )
+        resp.raise_for_status()
+        return resp.json()
     except Exception as exc:
         logger.warning("Sidecar health check failed", error=str(exc))
         return None
@@ -54,13 +50,13 @@ async def get_sidecar_auth_status() -> dict | None:
     or ``None`` if the sidecar is unreachable.
     """
     try:
-        async with httpx.AsyncClient(timeout=_TIMEOUT) as client:
-            resp = await client.get(
-                f"{settings.ai_sidecar_url}/auth/status",
-                headers=_headers(),
-            )
-            resp.raise_for_status()
-            return resp.json()
+        client = get_http_client(SIDECAR)
+        resp = await client.get(
+            f"{settings.ai_sidecar_url}/auth/status",
+            headers=_headers(),
+        )
+        resp.raise_for_status()
+        return resp.json()
     except Exception as exc:
         logger.warning("Sidecar auth status check failed", error=str(exc))
         return None
@@ -72,14 +68,14 @@ async def start_sidecar_auth(provider: str) -> dict | None:
     Returns the auth method info, or ``None`` on failure.
     """
     try:
-        async with httpx.AsyncClient(timeout=_TIMEOUT) as client:
-            resp = await client.post(
-                f"{settings.ai_sidecar_url}/auth/start",
-                headers=_headers(),
-                json={"provider": provider},
-            )
-            resp.raise_for_status()
-            return resp.json()
+        client = get_http_client(SIDECAR)
+        resp = await client.post(
+            f"{settings.ai_sidecar_url}/auth/start",
+            headers=_headers(),
+            json={"provider": provider},
+        )
+        resp.raise_for_status()
+        return resp.json()
     except Exception as exc:
         logger.warning("Sidecar auth start failed", provider=provider, error=str(exc))
         return None
@@ -92,21 +88,21 @@ async def submit_sidecar_token(provider: str, token: str) -> dict | None:
     Returns ``{"success": true, "provider": "..."}`` or ``None`` on failure.
     """
     try:
-        async with httpx.AsyncClient(timeout=_TIMEOUT) as client:
-            resp = await client.post(
-                f"{settings.ai_sidecar_url}/auth/token",
-                headers=_headers(),
-                json={"provider": provider, "token": token},
-            )
-            if resp.status_code == 400:
-                data = resp.json()
-                return {"success": False, "error": data.get("error", "Invalid token")}
-            if resp.status_code >= 400:
-                return {
-                    "success": False,
-                    "error": f"Sidecar returned HTTP {resp.status_code}",
-                }
-            return resp.json()
+        client = get_http_client(SIDECAR)
+        resp = await client.post(
+            f"{settings.ai_sidecar_url}/auth/token",
+            headers=_headers(),
+            json={"provider": provider, "token": token},
+        )
+        if resp.status_code == 400:
+            data = resp.json()
+            return {"success": False, "error": data.get("error", "Invalid token")}
+        if resp.status_code >= 400:
+            return {
+                "success": False,
+                "error": f"Sidecar returned HTTP {resp.status_code}",
+            }
+        return resp.json()
     except Exception as exc:
         logger.warning(
             "Sidecar token submission failed", provider=provider, error=str(exc)
@@ -162,14 +158,14 @@ async def revoke_sidecar_auth(provider: str) -> dict | None:
     Tells the sidecar to delete the stored token.
     """
     try:
-        async with httpx.AsyncClient(timeout=_TIMEOUT) as client:
-            resp = await client.post(
-                f"{settings.ai_sidecar_url}/auth/revoke",
-                headers=_headers(),
-                json={"provider": provider},
-            )
-            resp.raise_for_status()
-            return resp.json()
+        client = get_http_client(SIDECAR)
+        resp = await client.post(
+            f"{settings.ai_sidecar_url}/auth/revoke",
+            headers=_headers(),
+            json={"provider": provider},
+        )
+        resp.raise_for_status()
+        return resp.json()
     except Exception as exc:
         logger.warning("Sidecar auth revoke failed", provider=provider, error=str(exc))
         return None
@@ -0,0 +1,95 @@
+"""Startup-time profile for cold starts and rolling restarts.
+
+Records how long each part of application startup takes: importing each
+router module, each lifespan step before the API serves traffic, and
+background warm-ups (the embedding model) that finish afterwards. The
+profile is logged once startup completes and served at
+GET /api/system/startup.
+
+Router import times are incremental: a dependency shared by several
+routers is charged to the first router that imports it.
+"""
+
+import importlib
+import time
+from collections.abc import Iterator, Sequence
+from contextlib import contextmanager
+from datetime import UTC, datetime
+from types import ModuleType
+from typing import Any
+
+from src.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+_profile_started = time.perf_counter()
+_router_imports_ms: dict[str, float] = {}
+_phases_ms: dict[str, float] = {}
+_background_ms: dict[str, float] = {}
+_ready_ms: float | None = None
+_ready_at: datetime | None = None
+
+
+def _elapsed_ms(started: float) -> float:
+    return round((time.perf_counter() - started) * 1000, 1)
+
+
+def import_routers(package: str, names: Sequence[str]) -> list[ModuleType]:
+    """Import router modules one by one, recording each import time.
+
+    Args:
+        package: Package containing the routers (e.g. ``"src.routers"``).
+        names: Router module names, in registration order.
+
+    Returns:
+        The imported modules, in the same order.
+    """
+    modules = []
+    for name in names:
+        started = time.perf_counter()
+        modules.append(importlib.import_module(f"{package}.{name}"))
+        _router_imports_ms[name] = _elapsed_ms(started)
+    return modules
+
+
+@contextmanager
+def startup_phase(name: str) -> Iterator[None]:
+    """Time one blocking startup step."""
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        _phases_ms[name] = _elapsed_ms(started)
+
+
+def record_background_phase(name: str, duration_ms: float) -> None:
+    """Record a warm-up that completes after the API started serving."""
+    _background_ms[name] = round(duration_ms, 1)
+    logger.info("Background startup phase completed", phase=name, ms=duration_ms)
+
+
+def mark_ready() -> None:
+    """Mark the API as serving and log the startup profile."""
+    global _ready_ms, _ready_at
+    _ready_ms = _elapsed_ms(_profile_started)
+    _ready_at = datetime.now(UTC)
+    slowest = sorted(_router_imports_ms.items(), key=lambda item: -item[1])[:5]
+    logger.info(
+        "Startup profile",
+        ready_ms=_ready_ms,
+        router_imports_ms=round(sum(_router_imports_ms.values()), 1),
+        slowest_router_imports=dict(slowest),
+        phases_ms=_phases_ms,
+    )
+
+
+def get_startup_profile() -> dict[str, Any]:
+    """Return the recorded startup timings."""
+    return {
+        "ready_at": _ready_at.isoformat() if _ready_at else None,
+        "ready_ms": _ready_ms,
+        "router_imports_ms": dict(_router_imports_ms),
+        "router_imports_total_ms": round(sum(_router_imports_ms.values()), 1),
+        "phases_ms": dict(_phases_ms),
+        "background_ms": dict(_background_ms),
+    }
@@ -0,0 +1,202 @@
+"""SSE event payloads and publishing helpers.
+
+Builds the glucose and alert payloads sent over the SSE streams and
+publishes them to the event hub when new data is ingested. Payloads are
+built once per ingestion (not once per open connection) and only when a
+stream is actually listening for the user.
+"""
+
+import uuid
+from datetime import UTC, datetime
+from typing import Any
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.database import get_db_session
+from src.logging_config import get_logger
+from src.models.alert import Alert
+from src.services.event_hub import ALERT_CHANNEL, GLUCOSE_CHANNEL, event_hub
+from src.services.iob_engine import IoBInputs, compute_iob_curve
+from src.services.iob_projection import (
+    IOB_STALE_MINUTES,
+    get_iob_projection,
+    get_user_dia,
+)
+
+logger = get_logger(__name__)
+
+# A reading older than this is flagged stale on the stream
+STALE_AFTER_MINUTES = 10
+# Hub-only payload key with the IoB inputs, stripped before sending
+_IOB_INPUTS_KEY = "_iob_inputs"
+
+
+def parse_last_event_id(value: str | None) -> int | None:
+    """Parse a ``Last-Event-ID`` header; None if absent or not an event ID."""
+    if not value:
+        return None
+    try:
+        event_id = int(value.strip())
+    except ValueError:
+        return None
+    return event_id if event_id > 0 else None
+
+
+def _iob_inputs_to_json(inputs: IoBInputs) -> dict[str, Any]:
+    return {
+        "dia_hours": inputs.dia_hours,
+        "confirmed_iob": inputs.confirmed_iob,
+        "confirmed_at": (
+            inputs.confirmed_at.isoformat() if inputs.confirmed_at else None
+        ),
+        "doses": [[at.isoformat(), units] for at, units in inputs.doses],
+    }
+
+
+def _iob_inputs_from_json(data: dict[str, Any]) -> IoBInputs:
+    confirmed_at = data["confirmed_at"]
+    return IoBInputs(
+        dia_hours=data["dia_hours"],
+        confirmed_iob=data["confirmed_iob"],
+        confirmed_at=datetime.fromisoformat(confirmed_at) if confirmed_at else None,
+        doses=[(datetime.fromisoformat(at), units) for at, units in data["doses"]],
+    )
+
+
+def _project_iob(inputs: IoBInputs, now: datetime) -> dict[str, Any]:
+    """The ``iob`` payload field for ``now``, as ``get_iob_projection`` does."""
+    current = compute_iob_curve(inputs, now, horizon_minutes=0).at_offset(0)
+    is_stale = False
+    if inputs.confirmed_at is not None:
+        minutes_since = int((now - inputs.confirmed_at).total_seconds() / 60)
+        is_stale = minutes_since > IOB_STALE_MINUTES
+    return {"current": round(current, 2), "is_stale": is_stale}
+
+
+def refresh_glucose_payload(payload: dict[str, Any]) -> dict[str, Any]:
+    """Return the client copy of a glucose payload, brought up to date.
+
+    Recomputes the reading's age and, when the payload carries the IoB
+    inputs it was built from, re-projects IoB to now (no database access),
+    so IoB keeps decaying on the stream between readings. The inputs
+    themselves are not sent to the client.
+    """
+    now = datetime.now(UTC)
+    reading_time = datetime.fromisoformat(payload["reading_timestamp"])
+    if reading_time.tzinfo is None:
+        reading_time = reading_time.replace(tzinfo=UTC)
+    minutes_ago = int((now - reading_time).total_seconds() / 60)
+    refreshed = {
+        **payload,
+        "minutes_ago": minutes_ago,
+        "is_stale": minutes_ago > STALE_AFTER_MINUTES,
+        "timestamp": now.isoformat(),
+    }
+    inputs = refreshed.pop(_IOB_INPUTS_KEY, None)
+    if inputs is not None:
+        try:
+            refreshed["iob"] = _project_iob(_iob_inputs_from_json(inputs), now)
+        except Exception as e:
+            logger.warning("Failed to re-project IoB", error=str(e))
+    return refreshed
+
+
+async def build_glucose_payload(
+    db: AsyncSession, user_id: uuid.UUID | str
+) -> dict[str, Any] | None:
+    """Build the ``glucose`` hub payload for a user's latest reading.
+
+    The payload carries the IoB inputs so streams can keep IoB current;
+    send it through ``refresh_glucose_payload``.
+
+    Returns:
+        The payload, or None if the user has no readings.
+    """
+    from src.services.dexcom_sync import get_latest_glucose_reading
+
+    latest = await get_latest_glucose_reading(db, user_id)
+    if not latest:
+        return None
+
+    payload: dict[str, Any] = {
+        "value": latest.value,
+        "trend": latest.trend.value if latest.trend else "Unknown",
+        "trend_rate": latest.trend_rate,
+        "reading_timestamp": latest.reading_timestamp.isoformat(),
+        "iob": None,
+    }
+
+    # Get IoB projection if available
+    try:
+        dia = await get_user_dia(db, user_id)
+        projection = await get_iob_projection(db, user_id, dia_hours=dia)
+        if projection:
+            payload["iob"] = {
+                "current": projection.projected_iob,
+                "is_stale": projection.is_stale,
+            }
+            if projection.inputs is not None:
+                payload[_IOB_INPUTS_KEY] = _iob_inputs_to_json(projection.inputs)
+    except Exception as e:
+        logger.warning("Failed to get IoB projection", error=str(e))
+
+    return payload
+
+
+def alert_event_payload(alert: Alert) -> dict[str, Any]:
+    """Serialize an alert with every field either SSE stream may send."""
+    return {
+        "id": str(alert.id),
+        "alert_type": alert.alert_type.value,
+        "severity": alert.severity.value,
+        "current_value": alert.current_value,
+        "predicted_value": alert.predicted_value,
+        "prediction_minutes": alert.prediction_minutes,
+        "iob_value": alert.iob_value,
+        "message": alert.message,
+        "trend_rate": alert.trend_rate,
+        "source": alert.source,
+        "acknowledged": alert.acknowledged,
+        "created_at": alert.created_at.isoformat(),
+        "expires_at": alert.expires_at.isoformat(),
+    }
+
+
+async def publish_glucose_update(user_id: uuid.UUID) -> None:
+    """Publish the user's latest glucose/IoB state after new data lands.
+
+    Never raises: a failed publish must not fail ingestion.
+    """
+    if not event_hub.has_subscribers(GLUCOSE_CHANNEL, str(user_id)):
+        return
+    try:
+        async with get_db_session() as db:
+            payload = await build_glucose_payload(db, user_id)
+        if payload is not None:
+            await event_hub.publish(GLUCOSE_CHANNEL, str(user_id), payload)
+    except Exception as e:
+        logger.warning(
+            "Failed to publish glucose update",
+            user_id=str(user_id),
+            error=str(e),
+        )
+
+
+async def publish_new_alerts(user_id: uuid.UUID, alerts: list[Alert]) -> None:
+    """Publish newly created (committed) alerts to the SSE streams.
+
+    Never raises: a failed publish must not fail alert creation.
+    """
+    if not alerts or not event_hub.has_subscribers(ALERT_CHANNEL, str(user_id)):
+        return
+    try:
+        for alert in alerts:
+            await event_hub.publish(
+                ALERT_CHANNEL, str(user_id), alert_event_payload(alert)
+            )
+    except Exception as e:
+        logger.warning(
+            "Failed to publish alerts",
+            user_id=str(user_id),
+            error=str(e),
+        )
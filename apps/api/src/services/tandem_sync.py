@@ -16,7 +16,7 @@ from tconnectsync.api.common import ApiException
 from tconnectsync.api.tandemsource import TandemSourceApi
 
 from src.config import settings
-from src.core.encryption import decrypt_credential
+from src.core.encryption import decrypt_credential, ensure_encryption_keys
 from src.logging_config import get_logger
 from src.models.integration import (
     IntegrationCredential,
@@ -25,6 +25,9 @@ from src.models.integration import (
 )
 from src.models.pump_data import PumpActivityMode, PumpEvent, PumpEventType
 from src.models.pump_profile import PumpProfile
+from src.services.bulk_ingest import ingest_pump_events
+from src.services.diabetes_context import invalidate_diabetes_context
+from src.services.stream_events import publish_glucose_update
 
 logger = get_logger(__name__)
 
@@ -723,7 +726,8 @@ async def sync_tandem_for_user(
         logger.warning("Tandem integration is disconnected", user_id=str(user_id))
         raise TandemNotConfiguredError("Tandem integration is disconnected")
 
-    # Decrypt credentials
+    # Decrypt credentials (key derivation runs off-loop on a cold cache)
+    await ensure_encryption_keys()
     try:
         username = decrypt_credential(credential.encrypted_username)
         password = decrypt_credential(credential.encrypted_password)
@@ -839,6 +843,8 @@ async def sync_tandem_for_user(
         credential.last_sync_at = datetime.now(UTC)
         credential.last_error = None
         await db.commit()
+        if profiles_stored:
+            invalidate_diabetes_context(user_id, "pump_profile")
         return {
             "events_fetched": 0,
             "events_stored": 0,
@@ -846,9 +852,9 @@ async def sync_tandem_for_user(
             "last_event": None,
         }
 
-    # Store events (using upsert to handle duplicates)
+    # Normalize events into rows for a batched upsert
     now = datetime.now(UTC)
-    stored_count = 0
+    rows = []
     last_event = None
 
     for event_data in events:
@@ -923,37 +929,28 @@ async def sync_tandem_for_user(
                 except (ValueError, TypeError):
                     pass
 
-        # Use PostgreSQL upsert (INSERT ON CONFLICT DO NOTHING)
-        stmt = (
-            insert(PumpEvent)
-            .values(
-                id=uuid.uuid4(),
-                user_id=user_id,
-                event_type=parsed.event_type,
-                event_timestamp=event_time,
-                units=units,
-                duration_minutes=duration_minutes,
-                is_automated=parsed.is_automated,
-                control_iq_reason=parsed.control_iq_reason,
-                pump_activity_mode=parsed.pump_activity_mode.value
+        rows.append(
+            {
+                "id": uuid.uuid4(),
+                "user_id": user_id,
+                "event_type": parsed.event_type,
+                "event_timestamp": event_time,
+                "units": units,
+                "duration_minutes": duration_minutes,
+                "is_automated": parsed.is_automated,
+                "control_iq_reason": parsed.control_iq_reason,
+                "pump_activity_mode": parsed.pump_activity_mode.value
                 if parsed.pump_activity_mode
                 else None,
-                basal_adjustment_pct=parsed.basal_adjustment_pct,
-                iob_at_event=iob,
-                cob_at_event=cob,
-                bg_at_event=bg,
-                received_at=now,
-                source="tandem",
-            )
-            .on_conflict_do_nothing(
-                index_elements=["user_id", "event_timestamp", "event_type"]
-            )
+                "basal_adjustment_pct": parsed.basal_adjustment_pct,
+                "iob_at_event": iob,
+                "cob_at_event": cob,
+                "bg_at_event": bg,
+                "received_at": now,
+                "source": "tandem",
+            }
         )
 
-        result = await db.execute(stmt)
-        if result.rowcount > 0:
-            stored_count += 1
-
         # Track the most recent event
         if last_event is None or event_time > last_event["timestamp"]:
             last_event = {
@@ -966,12 +963,23 @@ async def sync_tandem_for_user(
                 else None,
             }
 
+    # Store all events in chunked multi-row upserts (duplicates are skipped)
+    ingest = await ingest_pump_events(db, rows)
+    stored_count = ingest.inserted
+
     # Update integration status
     credential.status = IntegrationStatus.CONNECTED
     credential.last_sync_at = now
     credential.last_error = None
     await db.commit()
 
+    if profiles_stored:
+        invalidate_diabetes_context(user_id, "pump_profile")
+    # New boluses/basal change IoB on open SSE streams
+    if stored_count:
+        invalidate_diabetes_context(user_id, "iob", "pump", "control_iq")
+        await publish_glucose_update(user_id)
+
     logger.info(
         "Tandem sync completed",
         user_id=str(user_id),
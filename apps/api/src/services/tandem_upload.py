@@ -20,7 +20,11 @@ from sqlalchemy import select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.config import settings
-from src.core.encryption import decrypt_credential, encrypt_credential
+from src.core.encryption import (
+    decrypt_credential,
+    encrypt_credential,
+    ensure_encryption_keys,
+)
 from src.logging_config import get_logger
 from src.models.integration import (
     IntegrationCredential,
@@ -29,6 +33,7 @@ from src.models.integration import (
 from src.models.pump_hardware_info import PumpHardwareInfo
 from src.models.pump_raw_event import PumpRawEvent
 from src.models.tandem_upload_state import TandemUploadState
+from src.services.http_clients import TANDEM, get_http_client
 
 logger = get_logger(__name__)
 
@@ -74,10 +79,10 @@ async def fetch_tandem_config(region: str = "US") -> dict:
 
     config_base = settings.tandem_upload_config_base
     url = f"{config_base}/configuration/mobile-urls/{region}.json"
-    async with httpx.AsyncClient(timeout=15) as client:
-        resp = await client.get(url)
-        resp.raise_for_status()
-        config = resp.json()
+    client = get_http_client(TANDEM)
+    resp = await client.get(url)
+    resp.raise_for_status()
+    config = resp.json()
 
     _config_cache[region] = (config, now)
     logger.info("Fetched Tandem endpoint config", region=region)
@@ -118,6 +123,7 @@ async def _authenticate_tandem(
     )
     credential = cred_result.scalar_one_or_none()
     region = getattr(credential, "region", "US") or "US" if credential else "US"
+    await ensure_encryption_keys()
 
     # 1. Check cached token
     if (
@@ -195,18 +201,18 @@ async def _refresh_tandem_token(refresh_token: str, region: str = "US") -> dict:
         )
         client_id = "0oa27ho9tpZE9Arjy4h7"
 
-    async with httpx.AsyncClient(timeout=15) as client:
-        resp = await client.post(
-            token_endpoint,
-            data={
-                "grant_type": "refresh_token",
-                "client_id": client_id,
-                "refresh_token": refresh_token,
-            },
-            headers={"Content-Type": "application/x-www-form-urlencoded"},
-        )
-        resp.raise_for_status()
-        return resp.json()
+    client = get_http_client(TANDEM)
+    resp = await client.post(
+        token_endpoint,
+        data={
+            "grant_type": "refresh_token",
+            "client_id": client_id,
+            "refresh_token": refresh_token,
+        },
+        headers={"Content-Type": "application/x-www-form-urlencoded"},
+    )
+    resp.raise_for_status()
+    return resp.json()
 
 
 async def _authenticate_fresh(username: str, password: str, region: str) -> dict:
@@ -288,20 +294,20 @@ async def get_last_event_uploaded(
         logger.warning("No getLastEventUploadedUrl in config, starting from 0")
         return 0
 
-    async with httpx.AsyncClient(timeout=15) as client:
-        resp = await client.get(
-            url,
-            params={
-                "serialNumber": str(serial_number),
-                "modelNumber": str(model_number),
-            },
-            headers={"Authorization": f"Bearer {access_token}"},
-        )
-        if resp.status_code == 404:
-            return 0
-        resp.raise_for_status()
-        data = resp.json()
-        return data.get("maxPumpEventIndex", 0)
+    client = get_http_client(TANDEM)
+    resp = await client.get(
+        url,
+        params={
+            "serialNumber": str(serial_number),
+            "modelNumber": str(model_number),
+        },
+        headers={"Authorization": f"Bearer {access_token}"},
+    )
+    if resp.status_code == 404:
+        return 0
+    resp.raise_for_status()
+    data = resp.json()
+    return data.get("maxPumpEventIndex", 0)
 
 
 def build_upload_payload(
@@ -378,10 +384,12 @@ async def _post_upload(
         "TDCToken": f"token {tdc_signature}",
     }
 
-    async with httpx.AsyncClient(timeout=_UPLOAD_TIMEOUT_SECONDS) as client:
-        resp = await client.post(url, content=json_bytes, headers=headers)
-        resp.raise_for_status()
-        return resp.json() if resp.content else {}
+    client = get_http_client(TANDEM)
+    resp = await client.post(
+        url, content=json_bytes, headers=headers, timeout=_UPLOAD_TIMEOUT_SECONDS
+    )
+    resp.raise_for_status()
+    return resp.json() if resp.content else {}
 
 
 async def upload_to_tandem(
@@ -12,6 +12,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from src.logging_config import get_logger
 from src.models.target_glucose_range import TargetGlucoseRange
 from src.schemas.target_glucose_range import TargetGlucoseRangeUpdate
+from src.services.diabetes_context import invalidate_diabetes_context
 
 logger = get_logger(__name__)
 
@@ -125,6 +126,7 @@ async def update_range(
 
     await db.commit()
     await db.refresh(target_range)
+    invalidate_diabetes_context(user_id, "glucose", "settings")
 
     logger.info(
         "Updated target glucose range",
@@ -9,7 +9,6 @@ import string
 import uuid
 from datetime import UTC, datetime, timedelta
 
-import httpx
 from sqlalchemy import delete, select
 from sqlalchemy.exc import IntegrityError, OperationalError
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -18,6 +17,7 @@ from src.config import settings
 from src.logging_config import get_logger
 from src.models.telegram_link import TelegramLink
 from src.models.telegram_verification import TelegramVerificationCode
+from src.services.http_clients import TELEGRAM, get_http_client
 
 logger = get_logger(__name__)
 
@@ -62,8 +62,8 @@ async def get_bot_info() -> str:
     if not settings.telegram_bot_token:
         raise TelegramBotError("Telegram bot token is not configured")
 
-    async with httpx.AsyncClient(timeout=10.0) as client:
-        response = await client.get(_get_api_url("getMe"))
+    client = get_http_client(TELEGRAM)
+    response = await client.get(_get_api_url("getMe"))
 
     if response.status_code != 200:
         raise TelegramBotError(
@@ -96,15 +96,15 @@ async def send_message(chat_id: int, text: str) -> bool:
     if not settings.telegram_bot_token:
         raise TelegramBotError("Telegram bot token is not configured")
 
-    async with httpx.AsyncClient(timeout=10.0) as client:
-        response = await client.post(
-            _get_api_url("sendMessage"),
-            json={
-                "chat_id": chat_id,
-                "text": text,
-                "parse_mode": "HTML",
-            },
-        )
+    client = get_http_client(TELEGRAM)
+    response = await client.post(
+        _get_api_url("sendMessage"),
+        json={
+            "chat_id": chat_id,
+            "text": text,
+            "parse_mode": "HTML",
+        },
+    )
 
     if response.status_code != 200:
         raise TelegramBotError(
@@ -139,11 +139,12 @@ async def get_updates(offset: int | None = None) -> list[dict]:
     if offset is not None:
         params["offset"] = offset
 
-    async with httpx.AsyncClient(timeout=15.0) as client:
-        response = await client.get(
-            _get_api_url("getUpdates"),
-            params=params,
-        )
+    client = get_http_client(TELEGRAM)
+    response = await client.get(
+        _get_api_url("getUpdates"),
+        params=params,
+        timeout=15.0,
+    )
 
     if response.status_code != 200:
         raise TelegramBotError(
@@ -13,30 +13,48 @@ Story 35.1: Context builders extracted to diabetes_context.py shared module.
 
 Story 35.3: Multi-turn conversation memory. Messages are persisted and
 the last N turns are included as context in every AI request.
+
+Web chat replies can also be streamed token by token (``stream_chat_web``).
+Either way, the completed reply is safety-validated before it is stored.
 """
 
 import html
 import uuid
+from collections.abc import AsyncIterator
 from dataclasses import dataclass
 
 from fastapi import HTTPException
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.database import get_db_session
 from src.logging_config import get_logger
 from src.models.chat_message import ChatRole
 from src.models.user import User
-from src.schemas.ai_response import AIMessage
-from src.services.ai_client import get_ai_client
+from src.schemas.ai_response import AIMessage, AIResponse
+from src.schemas.safety_validation import SafetyStatus
+from src.services.ai_client import BaseAIClient, get_ai_client
 from src.services.chat_history import (
     get_or_create_conversation,
     get_recent_messages,
     store_message,
 )
 from src.services.diabetes_context import build_diabetes_context
+from src.services.safety_validation import (
+    SAFETY_DISCLAIMER as _VALIDATION_DISCLAIMER,
+)
+from src.services.safety_validation import (
+    contains_dangerous_content,
+    log_safety_validation,
+    validate_ai_suggestion,
+)
 
 logger = get_logger(__name__)
 
+# Streamed text is forwarded this many characters behind the provider, so
+# a dangerous phrase is caught before any of it reaches the browser
+_STREAM_HOLDBACK_CHARS = 64
+
 # Telegram message length limit
 TELEGRAM_MAX_LENGTH = 4096
 
@@ -81,6 +99,7 @@ class ChatResult:
     model: str
     input_tokens: int
     output_tokens: int
+    safety_status: SafetyStatus = SafetyStatus.APPROVED
 
 
 def _build_system_prompt(diabetes_context: str) -> str:
@@ -274,16 +293,25 @@ Guidelines:
 """
 
 
-async def handle_chat_web(
+@dataclass
+class WebChatTurn:
+    """A prepared web chat exchange, ready to send to the AI provider."""
+
+    user_id: uuid.UUID
+    ai_client: BaseAIClient
+    conversation_id: uuid.UUID
+    user_text: str
+    system_prompt: str
+    messages: list[AIMessage]
+    history_turns: int
+
+
+async def prepare_chat_web(
     db: AsyncSession,
     user_id: uuid.UUID,
     text: str,
-) -> ChatResult:
-    """Process a user's AI query for the web interface.
-
-    Similar to handle_chat() but returns a ChatResult with structured
-    metadata, and raises HTTPException on errors instead of returning
-    error strings.
+) -> WebChatTurn:
+    """Resolve the AI provider and build the prompt for a web chat message.
 
     Args:
         db: Database session.
@@ -291,11 +319,10 @@ async def handle_chat_web(
         text: The user's message text.
 
     Returns:
-        ChatResult with response content, conversation_id, and message IDs.
+        WebChatTurn with the client, conversation, and prompt messages.
 
     Raises:
-        HTTPException: If user not found (404), no AI provider (404),
-            or AI provider error (502).
+        HTTPException: If user not found (404) or no AI provider (404).
     """
     result = await db.execute(select(User).where(User.id == user_id))
     user = result.scalar_one_or_none()
@@ -341,22 +368,36 @@ async def handle_chat_web(
     # Build messages array: history + current user message
     messages = history + [AIMessage(role="user", content=truncated_text)]
 
-    try:
-        ai_response = await ai_client.generate(
-            messages=messages,
-            system_prompt=system_prompt,
-            max_tokens=WEB_MAX_RESPONSE_TOKENS,
-        )
-    except Exception:
-        logger.error(
-            "AI provider error in web chat",
-            user_id=str(user_id),
-            exc_info=True,
-        )
-        raise HTTPException(
-            status_code=502,
-            detail="Unable to get a response from the AI provider",
-        )
+    return WebChatTurn(
+        user_id=user_id,
+        ai_client=ai_client,
+        conversation_id=conversation_id,
+        user_text=truncated_text,
+        system_prompt=system_prompt,
+        messages=messages,
+        history_turns=len(history) // 2,
+    )
+
+
+def _provider_error() -> HTTPException:
+    return HTTPException(
+        status_code=502,
+        detail="Unable to get a response from the AI provider",
+    )
+
+
+async def _finalize_chat_web(
+    db: AsyncSession,
+    turn: WebChatTurn,
+    ai_response: AIResponse,
+) -> ChatResult:
+    """Safety-validate a completed AI reply and persist the exchange.
+
+    Raises:
+        HTTPException: If the AI returned an empty response (502).
+    """
+    user_id = turn.user_id
+    conversation_id = turn.conversation_id
 
     content = ai_response.content.strip()
     if not content:
@@ -365,12 +406,18 @@ async def handle_chat_web(
             detail="The AI returned an empty response",
         )
 
+    # Safety validation (Story 5.6) on the completed text. The web chat
+    # response carries its own disclaimer, so the validator's notice is
+    # not stored with every message.
+    safety_result = validate_ai_suggestion(content, "web_chat")
+    content = safety_result.sanitized_text.removesuffix(_VALIDATION_DISCLAIMER)
+
     # Persist both messages (non-fatal -- still return the AI response on failure)
     user_msg_id: uuid.UUID | None = None
     assistant_msg_id: uuid.UUID | None = None
     try:
         user_msg = await store_message(
-            db, user_id, conversation_id, ChatRole.USER, truncated_text
+            db, user_id, conversation_id, ChatRole.USER, turn.user_text
         )
         assistant_msg = await store_message(
             db,
@@ -381,6 +428,10 @@ async def handle_chat_web(
             token_count=ai_response.usage.output_tokens,
             model=ai_response.model,
         )
+        await db.flush()
+        await log_safety_validation(
+            user_id, "web_chat", assistant_msg.id, safety_result, db
+        )
         await db.commit()
         user_msg_id = user_msg.id
         assistant_msg_id = assistant_msg.id
@@ -401,7 +452,8 @@ async def handle_chat_web(
         provider=ai_response.provider.value,
         input_tokens=ai_response.usage.input_tokens,
         output_tokens=ai_response.usage.output_tokens,
-        history_turns=len(history) // 2,
+        history_turns=turn.history_turns,
+        safety_status=safety_result.status.value,
     )
 
     return ChatResult(
@@ -412,9 +464,115 @@ async def handle_chat_web(
         model=ai_response.model,
         input_tokens=ai_response.usage.input_tokens,
         output_tokens=ai_response.usage.output_tokens,
+        safety_status=safety_result.status,
     )
 
 
+async def handle_chat_web(
+    db: AsyncSession,
+    user_id: uuid.UUID,
+    text: str,
+) -> ChatResult:
+    """Process a user's AI query for the web interface.
+
+    Similar to handle_chat() but returns a ChatResult with structured
+    metadata, and raises HTTPException on errors instead of returning
+    error strings.
+
+    Args:
+        db: Database session.
+        user_id: User's UUID.
+        text: The user's message text.
+
+    Returns:
+        ChatResult with response content, conversation_id, and message IDs.
+
+    Raises:
+        HTTPException: If user not found (404), no AI provider (404),
+            or AI provider error (502).
+    """
+    turn = await prepare_chat_web(db, user_id, text)
+
+    try:
+        ai_response = await turn.ai_client.generate(
+            messages=turn.messages,
+            system_prompt=turn.system_prompt,
+            max_tokens=WEB_MAX_RESPONSE_TOKENS,
+        )
+    except Exception:
+        logger.error(
+            "AI provider error in web chat",
+            user_id=str(user_id),
+            exc_info=True,
+        )
+        raise _provider_error()
+
+    return await _finalize_chat_web(db, turn, ai_response)
+
+
+async def stream_chat_web(turn: WebChatTurn) -> AsyncIterator[str | ChatResult]:
+    """Stream the AI's reply to a prepared web chat message.
+
+    Yields text deltas as the provider produces them, then the ChatResult
+    once the reply is complete. The completed text is safety-validated
+    before it is stored, so the ChatResult content (not the concatenated
+    deltas) is the final message. Persistence uses its own session, so no
+    database connection is held while tokens stream.
+
+    Deltas are held back by ``_STREAM_HOLDBACK_CHARS`` and the reply so
+    far is checked for dangerous content as it grows; once the check
+    trips, nothing more is forwarded and only the ChatResult (with the
+    blocked-content notice) follows. The held-back tail is released once
+    the completed reply passes validation.
+
+    Args:
+        turn: Exchange prepared by ``prepare_chat_web``.
+
+    Raises:
+        HTTPException: On AI provider error or empty response (502).
+    """
+    ai_response: AIResponse | None = None
+    text = ""
+    sent = 0
+    blocked = False
+    try:
+        async for item in turn.ai_client.generate_stream(
+            messages=turn.messages,
+            system_prompt=turn.system_prompt,
+            max_tokens=WEB_MAX_RESPONSE_TOKENS,
+        ):
+            if isinstance(item, AIResponse):
+                ai_response = item
+                continue
+            text += item
+            if blocked:
+                continue
+            if contains_dangerous_content(text):
+                blocked = True
+                continue
+            safe = len(text) - _STREAM_HOLDBACK_CHARS
+            if safe > sent:
+                yield text[sent:safe]
+                sent = safe
+    except Exception:
+        logger.error(
+            "AI provider error in web chat stream",
+            user_id=str(turn.user_id),
+            exc_info=True,
+        )
+        raise _provider_error()
+
+    if ai_response is None:
+        raise _provider_error()
+
+    async with get_db_session() as db:
+        result = await _finalize_chat_web(db, turn, ai_response)
+    if not blocked and result.safety_status != SafetyStatus.REJECTED:
+        if sent < len(text):
+            yield text[sent:]
+    yield result
+
+
 # ── Story 7.6: Caregiver AI chat ──
 
 _CAREGIVER_SYSTEM_PROMPT_PREFIX = """\
@@ -12,6 +12,7 @@ from src.integrations.claude import ClaudeClient
 from src.integrations.openai_client import OpenAIClient
 from src.models.ai_provider import AIProviderType
 from src.schemas.ai_response import AIMessage, AIResponse
+from src.services.ai_client import BaseAIClient
 
 
 def _user_message(content: str = "Hello") -> list[AIMessage]:
@@ -729,3 +730,255 @@ class TestAIClientFactory:
 
         assert exc_info.value.status_code == 400
         assert "Unsupported AI provider" in exc_info.value.detail
+
+
+class TestAIClientCache:
+    """SDK clients and resolved per-user clients are reused."""
+
+    @patch("src.integrations.openai_client.openai.AsyncOpenAI")
+    async def test_sdk_client_reused_across_calls(self, mock_cls):
+        mock_client = AsyncMock()
+        mock_cls.return_value = mock_client
+        mock_client.chat.completions.create.return_value = SimpleNamespace(
+            choices=[SimpleNamespace(message=SimpleNamespace(content="hi"))],
+            model="gpt-4o",
+            usage=None,
+        )
+
+        for _ in range(3):
+            client = OpenAIClient(
+                api_key="sk-test",
+                model="gpt-4o",
+                provider_type=AIProviderType.OPENAI_API,
+            )
+            await client.generate(_user_message())
+
+        mock_cls.assert_called_once()
+        assert mock_client.chat.completions.create.await_count == 3
+
+    async def test_sdk_clients_keyed_by_key_and_base_url(self):
+        from src.services.ai_client import get_sdk_client
+
+        first, again, other_key, other_url = (
+            get_sdk_client("openai", key, url, object)
+            for key, url in [
+                ("sk-a", None),
+                ("sk-a", None),
+                ("sk-b", None),
+                ("sk-a", "http://localhost:11434/v1"),
+            ]
+        )
+
+        assert first is again
+        assert len({id(first), id(other_key), id(other_url)}) == 3
+
+    async def test_factory_result_cached_until_invalidated(self):
+        from src.services.ai_client import get_ai_client, invalidate_ai_client
+
+        mock_user = SimpleNamespace(id=uuid.uuid4())
+        mock_config = SimpleNamespace(
+            provider_type=AIProviderType.CLAUDE_API,
+            encrypted_api_key="encrypted-key",
+            model_name=None,
+            base_url=None,
+        )
+        mock_db = AsyncMock()
+        mock_result = MagicMock()
+        mock_result.scalar_one_or_none.return_value = mock_config
+        mock_db.execute.return_value = mock_result
+
+        with patch(
+            "src.services.ai_client.decrypt_credential", return_value="sk-ant-key"
+        ) as mock_decrypt:
+            first = await get_ai_client(mock_user, mock_db)
+            second = await get_ai_client(mock_user, mock_db)
+            assert first is second
+            assert mock_db.execute.await_count == 1
+            assert mock_decrypt.call_count == 1
+
+            mock_config.model_name = "claude-opus-4-6"
+            invalidate_ai_client(mock_user.id)
+            third = await get_ai_client(mock_user, mock_db)
+
+        assert third.model == "claude-opus-4-6"
+        assert mock_db.execute.await_count == 2
+
+    async def test_evicted_sdk_client_is_not_closed(self):
+        """A client pushed out of the LRU may still be mid-request."""
+        from src.services.ai_client import get_sdk_client
+
+        in_use = AsyncMock()
+        get_sdk_client("openai", "sk-in-use", None, lambda: in_use)
+        with patch("src.services.ai_client._SDK_CLIENT_CACHE_SIZE", 1):
+            get_sdk_client("openai", "sk-other", None, AsyncMock)
+            again = get_sdk_client("openai", "sk-in-use", None, AsyncMock)
+
+        assert again is not in_use
+        in_use.close.assert_not_called()
+
+    async def test_user_clients_are_size_bounded(self):
+        from src.services import ai_client
+
+        async def build(user, db):
+            return MagicMock()
+
+        users = [SimpleNamespace(id=uuid.uuid4()) for _ in range(3)]
+        with (
+            patch.object(ai_client, "_USER_CLIENT_CACHE_SIZE", 2),
+            patch.object(ai_client, "_build_ai_client", side_effect=build),
+        ):
+            for user in users:
+                await ai_client.get_ai_client(user, AsyncMock())
+
+        assert list(ai_client._user_clients) == [users[1].id, users[2].id]
+
+
+class _FakeStream:
+    """Async-iterable stream context manager standing in for SDK streams."""
+
+    def __init__(self, items, *, final=None, error=None):
+        self._items = items
+        self._final = final
+        self._error = error
+        self.closed = False
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        self.closed = True
+
+    def __aiter__(self):
+        return self._iterate()
+
+    async def _iterate(self):
+        for item in self._items:
+            yield item
+        if self._error:
+            raise self._error
+
+    @property
+    def text_stream(self):
+        return self._iterate()
+
+    async def get_final_message(self):
+        return self._final
+
+
+class TestGenerateStream:
+    """Tests for BaseAIClient.generate_stream() and provider overrides."""
+
+    @patch("src.integrations.claude.anthropic.AsyncAnthropic")
+    async def test_claude_streams_text_then_response(self, mock_cls):
+        mock_client = MagicMock()
+        mock_cls.return_value = mock_client
+        stream = _FakeStream(
+            ["Hel", "lo"],
+            final=SimpleNamespace(
+                content=[SimpleNamespace(text="Hello")],
+                model="claude-sonnet-4-5-20250929",
+                usage=SimpleNamespace(input_tokens=10, output_tokens=2),
+            ),
+        )
+        mock_client.messages.stream.return_value = stream
+
+        client = ClaudeClient(
+            api_key="sk-test",
+            model="claude-sonnet-4-5-20250929",
+            provider_type=AIProviderType.CLAUDE_API,
+        )
+        items = [
+            item
+            async for item in client.generate_stream(
+                _user_message(), system_prompt="Be brief", max_tokens=50
+            )
+        ]
+
+        assert items[:2] == ["Hel", "lo"]
+        assert isinstance(items[2], AIResponse)
+        assert items[2].content == "Hello"
+        assert items[2].usage.output_tokens == 2
+        kwargs = mock_client.messages.stream.call_args.kwargs
+        assert kwargs["system"] == "Be brief"
+        assert kwargs["max_tokens"] == 50
+        assert stream.closed
+
+    @patch("src.integrations.openai_client.openai.AsyncOpenAI")
+    async def test_openai_streams_deltas_and_assembles_response(self, mock_cls):
+        def chunk(content, usage=None):
+            choices = [SimpleNamespace(delta=SimpleNamespace(content=content))]
+            return SimpleNamespace(
+                model="gpt-4o", choices=choices if content else [], usage=usage
+            )
+
+        mock_client = AsyncMock()
+        mock_cls.return_value = mock_client
+        mock_client.chat.completions.create.return_value = _FakeStream(
+            [
+                chunk("Your "),
+                chunk("glucose"),
+                chunk(None, SimpleNamespace(prompt_tokens=8, completion_tokens=2)),
+            ]
+        )
+
+        client = OpenAIClient(
+            api_key="sk-test",
+            model="gpt-4o",
+            provider_type=AIProviderType.OPENAI_API,
+        )
+        items = [item async for item in client.generate_stream(_user_message())]
+
+        assert items[:2] == ["Your ", "glucose"]
+        response = items[2]
+        assert response.content == "Your glucose"
+        assert response.model == "gpt-4o"
+        assert response.usage.input_tokens == 8
+        kwargs = mock_client.chat.completions.create.call_args.kwargs
+        assert kwargs["stream"] is True
+        assert kwargs["stream_options"] == {"include_usage": True}
+
+    @patch("src.integrations.openai_client.openai.AsyncOpenAI")
+    async def test_sidecar_stream_omits_stream_options(self, mock_cls):
+        mock_client = AsyncMock()
+        mock_cls.return_value = mock_client
+        mock_client.chat.completions.create.return_value = _FakeStream([])
+
+        client = OpenAIClient(
+            api_key="sidecar-managed",
+            model="claude-sonnet-4-5-20250929",
+            base_url="http://ai-sidecar:3456/v1",
+            provider_type=AIProviderType.CLAUDE_SUBSCRIPTION,
+        )
+        items = [item async for item in client.generate_stream(_user_message())]
+
+        assert items[0].content == ""
+        assert items[0].usage.output_tokens == 0
+        kwargs = mock_client.chat.completions.create.call_args.kwargs
+        assert "stream_options" not in kwargs
+
+    @patch("src.integrations.openai_client.openai.AsyncOpenAI")
+    async def test_openai_error_mid_stream_raises(self, mock_cls):
+        mock_client = AsyncMock()
+        mock_cls.return_value = mock_client
+        mock_client.chat.completions.create.return_value = _FakeStream(
+            [], error=RuntimeError("connection dropped")
+        )
+
+        client = OpenAIClient(api_key="sk-test", model="gpt-4o")
+        with pytest.raises(RuntimeError, match="connection dropped"):
+            async for _ in client.generate_stream(_user_message()):
+                pass
+
+    async def test_default_falls_back_to_generate(self):
+        response = AIResponse(
+            content="Whole reply", model="m", provider=AIProviderType.CLAUDE_API
+        )
+
+        class _NonStreamingClient(BaseAIClient):
+            async def generate(self, messages, system_prompt=None, max_tokens=1024):
+                return response
+
+        client = _NonStreamingClient(api_key="sk-test", model="m")
+        items = [item async for item in client.generate_stream(_user_message())]
+
+        assert items == ["Whole reply", response]
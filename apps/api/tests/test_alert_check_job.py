@@ -0,0 +1,91 @@
+"""Tests for the scheduled alert check and its Telegram delivery."""
+
+import asyncio
+import uuid
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.config import settings
+from src.services.scheduler import check_alerts_all_users
+
+
+def _session_maker():
+    @asynccontextmanager
+    async def _session():
+        yield AsyncMock()
+
+    return MagicMock(return_value=_session)
+
+
+class TestCheckAlertsAllUsers:
+    @pytest.mark.asyncio
+    async def test_delivery_outlasting_the_batch_timeout_still_sends(self):
+        """Slow Telegram sends run outside the batch timeout and all finish."""
+        users = [uuid.uuid4() for _ in range(3)]
+        new_alerts = {user_id: [MagicMock()] for user_id in users}
+        delivered: list[uuid.UUID] = []
+
+        async def slow_notify(db, user_id, alerts):
+            await asyncio.sleep(0.05)
+            delivered.append(user_id)
+            return len(alerts)
+
+        with (
+            patch.object(settings, "alert_check_batch_timeout_seconds", 0.02),
+            patch.object(settings, "alert_delivery_user_timeout_seconds", 1),
+            patch.object(settings, "scheduler_max_concurrency", 1),
+            patch(
+                "src.services.scheduler._integration_user_ids",
+                new_callable=AsyncMock,
+                return_value=users,
+            ),
+            patch("src.services.scheduler.get_session_maker", _session_maker),
+            patch(
+                "src.services.scheduler.evaluate_alerts_for_users",
+                new_callable=AsyncMock,
+                return_value=new_alerts,
+            ),
+            patch(
+                "src.services.scheduler.notify_user_of_alerts",
+                side_effect=slow_notify,
+            ),
+        ):
+            await check_alerts_all_users()
+
+        assert sorted(delivered) == sorted(users)
+
+    @pytest.mark.asyncio
+    async def test_one_slow_user_does_not_block_the_others(self):
+        """A user whose delivery times out doesn't cancel anyone else's."""
+        stuck, fine = uuid.uuid4(), uuid.uuid4()
+        delivered: list[uuid.UUID] = []
+
+        async def notify(db, user_id, alerts):
+            if user_id == stuck:
+                await asyncio.sleep(1)
+            delivered.append(user_id)
+            return 1
+
+        with (
+            patch.object(settings, "alert_delivery_user_timeout_seconds", 0.02),
+            patch(
+                "src.services.scheduler._integration_user_ids",
+                new_callable=AsyncMock,
+                return_value=[stuck, fine],
+            ),
+            patch("src.services.scheduler.get_session_maker", _session_maker),
+            patch(
+                "src.services.scheduler.evaluate_alerts_for_users",
+                new_callable=AsyncMock,
+                return_value={stuck: [MagicMock()], fine: [MagicMock()]},
+            ),
+            patch(
+                "src.services.scheduler.notify_user_of_alerts",
+                side_effect=notify,
+            ),
+        ):
+            await check_alerts_all_users()
+
+        assert delivered == [fine]
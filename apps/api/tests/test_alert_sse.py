@@ -50,17 +50,16 @@ class TestFormatSseAlertEvent:
 class TestAlertDeduplication:
     """Tests for alert deduplication in SSE stream."""
 
+    @patch("src.routers.glucose_stream.HEARTBEAT_INTERVAL_SECONDS", 0)
     @patch("src.routers.glucose_stream.get_active_alerts")
-    @patch("src.routers.glucose_stream.get_latest_glucose_reading")
     @patch(
-        "src.routers.glucose_stream.get_user_dia",
+        "src.routers.glucose_stream.build_glucose_payload",
         new_callable=AsyncMock,
-        return_value=4.0,
+        return_value=None,
     )
-    @patch("src.routers.glucose_stream.get_iob_projection")
     @patch("src.routers.glucose_stream.get_db_session")
     async def test_alert_not_sent_twice(
-        self, mock_db_session, mock_iob, mock_dia, mock_glucose, mock_alerts
+        self, mock_db_session, mock_glucose_payload, mock_alerts
     ):
         """Test that the same alert is not sent twice per connection."""
         from enum import Enum
@@ -88,10 +87,6 @@ class TestAlertDeduplication:
         # Return the same alert on every call
         mock_alerts.return_value = [mock_alert]
 
-        # No glucose reading
-        mock_glucose.return_value = None
-        mock_iob.return_value = None
-
         # Mock db session context manager
         mock_session = AsyncMock()
         mock_db_session.return_value.__aenter__ = AsyncMock(return_value=mock_session)
@@ -126,22 +121,19 @@ class TestAlertDeduplication:
             "Alert deduplication may not be working."
         )
 
+    @patch("src.routers.glucose_stream.HEARTBEAT_INTERVAL_SECONDS", 0)
     @patch("src.routers.glucose_stream.get_active_alerts")
-    @patch("src.routers.glucose_stream.get_latest_glucose_reading")
     @patch(
-        "src.routers.glucose_stream.get_user_dia",
+        "src.routers.glucose_stream.build_glucose_payload",
         new_callable=AsyncMock,
-        return_value=4.0,
+        return_value=None,
     )
-    @patch("src.routers.glucose_stream.get_iob_projection")
     @patch("src.routers.glucose_stream.get_db_session")
     async def test_no_alert_events_when_no_alerts(
-        self, mock_db_session, mock_iob, mock_dia, mock_glucose, mock_alerts
+        self, mock_db_session, mock_glucose_payload, mock_alerts
     ):
         """Test that no alert events are emitted when there are no active alerts."""
         mock_alerts.return_value = []
-        mock_glucose.return_value = None
-        mock_iob.return_value = None
 
         mock_session = AsyncMock()
         mock_db_session.return_value.__aenter__ = AsyncMock(return_value=mock_session)
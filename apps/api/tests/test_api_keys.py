@@ -256,3 +256,141 @@ class TestApiKeyExpiry:
 
         result = await validate_api_key(mock_db, raw_key)
         assert result is None
+
+
+class TestApiKeyCacheAndUsage:
+    """Verified-key cache and write-behind last_used_at."""
+
+    @pytest.fixture(autouse=True)
+    def _fresh_state(self):
+        from src.core.principal_cache import clear_principal_cache
+        from src.services import api_key_service
+
+        clear_principal_cache()
+        api_key_service._pending_last_used.clear()
+        yield
+        clear_principal_cache()
+        api_key_service._pending_last_used.clear()
+
+    def _cached_key(self, raw_key: str, **overrides):
+        from src.core.principal_cache import (
+            cache_principal,
+            principal_cache_generation,
+        )
+        from src.models.api_key import ApiKey
+        from src.models.user import User, UserRole
+
+        user = User(
+            id=uuid.uuid4(),
+            email="device@example.com",
+            hashed_password="x",
+            role=UserRole.DIABETIC,
+            is_active=True,
+        )
+        api_key = ApiKey(
+            id=uuid.uuid4(),
+            user_id=user.id,
+            name="pump",
+            prefix=raw_key[:12],
+            key_hash=_hash_key(raw_key),
+            scopes="write:pump",
+            is_active=True,
+            **overrides,
+        )
+        cache_principal(
+            _hash_key(raw_key), user, principal_cache_generation(), api_key=api_key
+        )
+        return api_key, user
+
+    @staticmethod
+    def _db() -> AsyncMock:
+        db = AsyncMock()
+        db.merge.side_effect = lambda row, load=True: row
+        return db
+
+    @pytest.mark.asyncio
+    async def test_cached_key_skips_lookups_and_defers_touch(self):
+        from src.services import api_key_service
+        from src.services.api_key_service import validate_api_key
+
+        raw_key = f"ggpt_{secrets.token_urlsafe(32)}"
+        api_key, user = self._cached_key(raw_key)
+
+        db = self._db()
+        pair = await validate_api_key(db, raw_key)
+
+        assert pair is not None
+        assert pair[0].id == api_key.id
+        assert pair[1].id == user.id
+        db.execute.assert_not_awaited()
+        db.flush.assert_not_awaited()
+        assert api_key.id in api_key_service._pending_last_used
+
+    @pytest.mark.asyncio
+    async def test_cached_key_still_expires(self):
+        from src.services.api_key_service import validate_api_key
+
+        raw_key = f"ggpt_{secrets.token_urlsafe(32)}"
+        self._cached_key(raw_key, expires_at=datetime.now(UTC) - timedelta(seconds=1))
+
+        assert await validate_api_key(self._db(), raw_key) is None
+
+    @pytest.mark.asyncio
+    async def test_flush_writes_all_touches_in_one_update(self):
+        from src.services import api_key_service
+        from src.services.api_key_service import flush_api_key_usage
+
+        for _ in range(3):
+            api_key_service._touch(uuid.uuid4())
+
+        session = AsyncMock()
+        session_maker = MagicMock()
+        session_maker.return_value.__aenter__.return_value = session
+        with patch(
+            "src.services.api_key_service.get_session_maker",
+            return_value=session_maker,
+        ):
+            assert await flush_api_key_usage() == 3
+            assert await flush_api_key_usage() == 0
+
+        session.execute.assert_awaited_once()
+        session.commit.assert_awaited_once()
+        assert api_key_service._pending_last_used == {}
+
+    @pytest.mark.asyncio
+    async def test_failed_flush_keeps_touches(self):
+        from src.services import api_key_service
+        from src.services.api_key_service import flush_api_key_usage
+
+        key_id = uuid.uuid4()
+        api_key_service._touch(key_id)
+
+        session = AsyncMock()
+        session.execute.side_effect = RuntimeError("db down")
+        session_maker = MagicMock()
+        session_maker.return_value.__aenter__.return_value = session
+        with patch(
+            "src.services.api_key_service.get_session_maker",
+            return_value=session_maker,
+        ):
+            assert await flush_api_key_usage() == 0
+
+        assert key_id in api_key_service._pending_last_used
+
+    @pytest.mark.asyncio
+    async def test_list_shows_unflushed_use(self):
+        from src.models.api_key import ApiKey
+        from src.services import api_key_service
+        from src.services.api_key_service import list_api_keys
+
+        api_key = ApiKey(id=uuid.uuid4(), name="pump", last_used_at=None)
+        api_key_service._touch(api_key.id)
+
+        result = MagicMock()
+        result.scalars.return_value.all.return_value = [api_key]
+        db = AsyncMock()
+        db.execute.return_value = result
+
+        keys = await list_api_keys(db, uuid.uuid4())
+
+        assert keys[0].last_used_at == api_key_service._pending_last_used[api_key.id]
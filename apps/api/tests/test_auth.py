@@ -1,10 +1,21 @@
 """Story 2.1, 2.2 & 2.3: Tests for user authentication."""
 
+import asyncio
+import threading
 import uuid
+from unittest.mock import patch
 
+import pytest
 from httpx import ASGITransport, AsyncClient
 
 from src.config import settings
+from src.core import security
+from src.core.security import (
+    PasswordHashingBusyError,
+    hash_password_async,
+    shutdown_password_executor,
+    verify_password_async,
+)
 from src.main import app
 
 
@@ -511,3 +522,72 @@ class TestUserLogout:
             # The cookie should be cleared in the response
             # Note: The actual cookie invalidation happens client-side
             # when the browser receives the Set-Cookie with max-age=0
+
+
+class TestPasswordHashingPool:
+    """Off-loop bcrypt with a bounded queue."""
+
+    async def test_hash_and_verify_off_loop(self):
+        hashed = await hash_password_async("SecurePass123")
+
+        assert await verify_password_async("SecurePass123", hashed)
+        assert not await verify_password_async("WrongPass123", hashed)
+        assert not await verify_password_async("SecurePass123", "not-a-hash")
+
+    async def test_saturated_pool_fails_fast(self):
+        capacity = settings.password_hash_max_workers + settings.password_hash_max_queue
+        with (
+            patch.object(security, "_password_jobs", capacity),
+            pytest.raises(PasswordHashingBusyError),
+        ):
+            await verify_password_async("SecurePass123", security._DUMMY_HASH)
+
+    async def test_cancelled_waiter_keeps_its_slot_until_bcrypt_finishes(self):
+        started, release = threading.Event(), threading.Event()
+
+        def slow_job() -> bool:
+            started.set()
+            release.wait(5)
+            return True
+
+        shutdown_password_executor()
+        with (
+            patch.object(settings, "password_hash_max_workers", 1),
+            patch.object(settings, "password_hash_max_queue", 0),
+        ):
+            try:
+                waiter = asyncio.create_task(security._run_on_password_pool(slow_job))
+                assert await asyncio.to_thread(started.wait, 5)
+                waiter.cancel()  # e.g. the client disconnected
+                with pytest.raises(asyncio.CancelledError):
+                    await waiter
+
+                # The job is still running, so the pool is still full
+                with pytest.raises(PasswordHashingBusyError):
+                    await verify_password_async("SecurePass123", security._DUMMY_HASH)
+            finally:
+                release.set()
+
+            for _ in range(500):
+                if security._password_jobs == 0:
+                    break
+                await asyncio.sleep(0.01)
+            assert await security._run_on_password_pool(lambda: True)
+        shutdown_password_executor()
+
+    async def test_login_returns_429_when_saturated(self):
+        async with AsyncClient(
+            transport=ASGITransport(app=app),
+            base_url="http://test",
+        ) as client:
+            with patch(
+                "src.routers.auth.verify_password_async",
+                side_effect=PasswordHashingBusyError,
+            ):
+                response = await client.post(
+                    "/api/auth/login",
+                    json={"email": unique_email("busy"), "password": "SecurePass123"},
+                )
+
+        assert response.status_code == 429
+        assert response.headers["Retry-After"] == "1"
@@ -0,0 +1,285 @@
+"""Tests for scheduled daily brief generation."""
+
+import uuid
+from contextlib import asynccontextmanager
+from datetime import UTC, datetime, time, timedelta
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from fastapi import HTTPException
+
+from src.config import settings
+from src.models.ai_provider import AIProviderType
+from src.models.brief_delivery_config import DeliveryChannel
+from src.schemas.daily_brief import DailyBriefMetrics
+from src.services.brief_scheduler import (
+    DueBrief,
+    _generate_scheduled_brief,
+    find_due_briefs,
+    generate_scheduled_briefs,
+    scheduled_delivery_at,
+)
+
+
+def _metrics(readings: int) -> DailyBriefMetrics:
+    return DailyBriefMetrics(
+        time_in_range_pct=80.0,
+        average_glucose=130.0,
+        low_count=0,
+        high_count=1,
+        readings_count=readings,
+        correction_count=0,
+        total_insulin=None,
+    )
+
+
+def _session_maker(db):
+    @asynccontextmanager
+    async def _session():
+        yield db
+
+    return MagicMock(return_value=_session)
+
+
+class TestScheduledDeliveryAt:
+    """Resolving a local delivery time to the latest UTC instant."""
+
+    def test_today_when_time_has_passed(self):
+        now = datetime(2026, 3, 2, 15, 0, tzinfo=UTC)  # 07:00 in Los Angeles
+        due = scheduled_delivery_at(now, time(7, 0), "America/Los_Angeles")
+        assert due == now
+
+    def test_yesterday_when_time_not_yet_reached(self):
+        now = datetime(2026, 3, 2, 14, 0, tzinfo=UTC)  # 06:00 in Los Angeles
+        due = scheduled_delivery_at(now, time(7, 0), "America/Los_Angeles")
+        assert due == datetime(2026, 3, 1, 15, 0, tzinfo=UTC)
+
+    def test_local_date_differs_from_utc_date(self):
+        now = datetime(2026, 3, 1, 22, 30, tzinfo=UTC)  # 07:30 Mar 2 in Tokyo
+        due = scheduled_delivery_at(now, time(7, 0), "Asia/Tokyo")
+        assert due == datetime(2026, 3, 1, 22, 0, tzinfo=UTC)
+
+    def test_unknown_timezone_returns_none(self):
+        now = datetime(2026, 3, 2, 15, 0, tzinfo=UTC)
+        assert scheduled_delivery_at(now, time(7, 0), "Mars/Olympus") is None
+
+
+class TestFindDueBriefs:
+    """Due filtering over the single config/provider/latest-brief query."""
+
+    async def _find(self, rows, now):
+        result = MagicMock()
+        result.all.return_value = rows
+        db = AsyncMock()
+        db.execute.return_value = result
+        due = await find_due_briefs(db, now)
+        assert db.execute.await_count == 1
+        return due
+
+    async def test_filters_by_window_grace_and_latest_brief(self):
+        now = datetime(2026, 3, 2, 7, 10, tzinfo=UTC)
+        due_user, done_user, late_user, early_user = (uuid.uuid4() for _ in range(4))
+        rows = [
+            # 07:00 passed 10 minutes ago, last brief was yesterday
+            (
+                due_user,
+                time(7, 0),
+                "UTC",
+                DeliveryChannel.TELEGRAM,
+                AIProviderType.CLAUDE_API,
+                None,
+                now - timedelta(days=1),
+            ),
+            # Already has a brief since 07:00
+            (
+                done_user,
+                time(7, 0),
+                "UTC",
+                DeliveryChannel.BOTH,
+                AIProviderType.CLAUDE_API,
+                None,
+                now - timedelta(minutes=5),
+            ),
+            # 03:00 delivery is past the grace window
+            (
+                late_user,
+                time(3, 0),
+                "UTC",
+                DeliveryChannel.BOTH,
+                AIProviderType.CLAUDE_API,
+                None,
+                None,
+            ),
+            # 08:00 isn't due yet (yesterday's is past the grace window)
+            (
+                early_user,
+                time(8, 0),
+                "UTC",
+                DeliveryChannel.BOTH,
+                AIProviderType.CLAUDE_API,
+                None,
+                None,
+            ),
+        ]
+
+        due = await self._find(rows, now)
+
+        assert [d.user_id for d in due] == [due_user]
+        assert due[0].due_at == datetime(2026, 3, 2, 7, 0, tzinfo=UTC)
+        assert due[0].channel == DeliveryChannel.TELEGRAM
+
+    async def test_provider_key_includes_base_url(self):
+        now = datetime(2026, 3, 2, 7, 10, tzinfo=UTC)
+        rows = [
+            (
+                uuid.uuid4(),
+                time(7, 0),
+                "UTC",
+                DeliveryChannel.WEB_ONLY,
+                AIProviderType.OPENAI_COMPATIBLE,
+                "http://ollama:11434/v1",
+                None,
+            ),
+        ]
+
+        due = await self._find(rows, now)
+
+        assert due[0].provider_key == "openai_compatible:http://ollama:11434/v1"
+
+    async def test_unknown_timezone_is_skipped(self):
+        now = datetime(2026, 3, 2, 7, 10, tzinfo=UTC)
+        rows = [
+            (
+                uuid.uuid4(),
+                time(7, 0),
+                "Not/AZone",
+                DeliveryChannel.BOTH,
+                AIProviderType.CLAUDE_API,
+                None,
+                None,
+            ),
+        ]
+
+        assert await self._find(rows, now) == []
+
+
+class TestGenerateScheduledBrief:
+    """The per-user fan-out worker."""
+
+    @pytest.fixture(autouse=True)
+    def _no_pacing(self):
+        with patch.object(settings, "daily_brief_ai_rate_per_second", 0):
+            yield
+
+    def _due(self, channel: DeliveryChannel) -> DueBrief:
+        return DueBrief(
+            user_id=uuid.uuid4(),
+            channel=channel,
+            provider_key="claude_api",
+            due_at=datetime(2026, 3, 2, 7, 0, tzinfo=UTC),
+            metrics=_metrics(200),
+        )
+
+    async def test_passes_precomputed_metrics_and_channel(self):
+        due = self._due(DeliveryChannel.WEB_ONLY)
+        db = AsyncMock()
+        db.get.return_value = MagicMock(id=due.user_id)
+
+        with (
+            patch(
+                "src.services.brief_scheduler.get_session_maker",
+                _session_maker(db),
+            ),
+            patch(
+                "src.services.brief_scheduler.generate_daily_brief",
+                new_callable=AsyncMock,
+            ) as mock_generate,
+        ):
+            assert await _generate_scheduled_brief(due) is True
+
+        kwargs = mock_generate.await_args.kwargs
+        assert kwargs["metrics"] is due.metrics
+        assert kwargs["period_end"] == due.due_at
+        assert kwargs["notify"] is False
+
+    async def test_provider_error_returns_false(self):
+        due = self._due(DeliveryChannel.TELEGRAM)
+        db = AsyncMock()
+        db.get.return_value = MagicMock(id=due.user_id)
+
+        with (
+            patch(
+                "src.services.brief_scheduler.get_session_maker",
+                _session_maker(db),
+            ),
+            patch(
+                "src.services.brief_scheduler.generate_daily_brief",
+                new_callable=AsyncMock,
+                side_effect=HTTPException(status_code=404, detail="No AI provider"),
+            ),
+        ):
+            assert await _generate_scheduled_brief(due) is False
+
+
+class TestGenerateScheduledBriefs:
+    """The scheduler job end to end with mocked queries."""
+
+    async def test_bulk_metrics_then_fanout_of_users_with_data(self):
+        due_at = datetime(2026, 3, 2, 7, 0, tzinfo=UTC)
+        ready, sparse = uuid.uuid4(), uuid.uuid4()
+        due = [
+            DueBrief(ready, DeliveryChannel.BOTH, "claude_api", due_at),
+            DueBrief(sparse, DeliveryChannel.BOTH, "claude_api", due_at),
+        ]
+        db = AsyncMock()
+
+        with (
+            patch(
+                "src.services.brief_scheduler.get_session_maker",
+                _session_maker(db),
+            ),
+            patch(
+                "src.services.brief_scheduler.find_due_briefs",
+                new_callable=AsyncMock,
+                return_value=due,
+            ),
+            patch(
+                "src.services.brief_scheduler.calculate_metrics_bulk",
+                new_callable=AsyncMock,
+                return_value={ready: _metrics(200), sparse: _metrics(3)},
+            ) as mock_bulk,
+            patch(
+                "src.services.brief_scheduler._generate_scheduled_brief",
+                new_callable=AsyncMock,
+                return_value=True,
+            ) as mock_worker,
+        ):
+            await generate_scheduled_briefs()
+
+        mock_bulk.assert_awaited_once()
+        args = mock_bulk.await_args.args
+        assert args[0] == [ready, sparse]
+        assert args[2:] == (due_at - timedelta(hours=24), due_at)
+        assert [c.args[0].user_id for c in mock_worker.await_args_list] == [ready]
+
+    async def test_nothing_due_skips_metrics(self):
+        db = AsyncMock()
+
+        with (
+            patch(
+                "src.services.brief_scheduler.get_session_maker",
+                _session_maker(db),
+            ),
+            patch(
+                "src.services.brief_scheduler.find_due_briefs",
+                new_callable=AsyncMock,
+                return_value=[],
+            ),
+            patch(
+                "src.services.brief_scheduler.calculate_metrics_bulk",
+                new_callable=AsyncMock,
+            ) as mock_bulk,
+        ):
+            await generate_scheduled_briefs()
+
+        mock_bulk.assert_not_awaited()
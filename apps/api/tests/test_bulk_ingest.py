@@ -0,0 +1,107 @@
+"""Tests for batched multi-row upserts used by glucose and pump ingestion."""
+
+import uuid
+from datetime import UTC, datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock
+
+from src.models.pump_data import PumpEventType
+from src.services.bulk_ingest import (
+    IngestResult,
+    _chunk_size,
+    ingest_glucose_readings,
+    ingest_pump_events,
+)
+
+
+def _event_rows(count: int) -> list[dict]:
+    user_id = uuid.uuid4()
+    start = datetime(2026, 1, 1, tzinfo=UTC)
+    return [
+        {
+            "user_id": user_id,
+            "event_type": PumpEventType.BOLUS,
+            "event_timestamp": start + timedelta(minutes=i),
+            "units": 1.0,
+        }
+        for i in range(count)
+    ]
+
+
+def _mock_db(returned_per_call: list[int]) -> AsyncMock:
+    """Session whose execute() returns RETURNING rows of the given sizes."""
+    results = []
+    for n in returned_per_call:
+        result = MagicMock()
+        result.all.return_value = [(uuid.uuid4(),) for _ in range(n)]
+        results.append(result)
+    db = AsyncMock()
+    db.execute = AsyncMock(side_effect=results)
+    return db
+
+
+class TestBulkInsert:
+    """Tests for bulk_insert_ignore_conflicts."""
+
+    async def test_empty_rows_skip_database(self):
+        """No statement is issued for an empty batch."""
+        db = AsyncMock()
+
+        result = await ingest_pump_events(db, [])
+
+        assert result == IngestResult(submitted=0, inserted=0)
+        db.execute.assert_not_called()
+
+    async def test_single_statement_for_small_batch(self):
+        """A batch under the chunk size is one multi-row statement."""
+        db = _mock_db([3])
+
+        result = await ingest_pump_events(db, _event_rows(3))
+
+        db.execute.assert_called_once()
+        sql = str(db.execute.call_args[0][0].compile())
+        assert "pump_events" in sql
+        assert "ON CONFLICT (user_id, event_timestamp, event_type) DO NOTHING" in sql
+        assert "RETURNING" in sql
+        assert result.inserted == 3
+
+    async def test_chunks_large_batches(self):
+        """Rows are split into chunk_size statements."""
+        db = _mock_db([10, 10, 5])
+
+        result = await ingest_pump_events(db, _event_rows(25), chunk_size=10)
+
+        assert db.execute.call_count == 3
+        assert result.submitted == 25
+        assert result.inserted == 25
+
+    async def test_counts_duplicates_from_returning(self):
+        """Rows not returned by RETURNING are reported as duplicates."""
+        db = _mock_db([4, 1])
+
+        result = await ingest_pump_events(db, _event_rows(10), chunk_size=5)
+
+        assert result.inserted == 5
+        assert result.duplicates == 5
+
+    def test_chunk_size_respects_bind_parameter_limit(self):
+        """Wide rows are chunked below asyncpg's bind parameter cap."""
+        rows = [{f"c{i}": i for i in range(100)}]
+
+        assert _chunk_size(rows, 1000) == 320
+        assert _chunk_size(_event_rows(1), 1000) == 1000
+
+    async def test_glucose_conflict_target(self):
+        """Glucose readings conflict on (user_id, reading_timestamp)."""
+        db = _mock_db([1])
+        row = {
+            "user_id": uuid.uuid4(),
+            "value": 120,
+            "reading_timestamp": datetime.now(UTC),
+            "received_at": datetime.now(UTC),
+            "source": "dexcom",
+        }
+
+        await ingest_glucose_readings(db, [row])
+
+        sql = str(db.execute.call_args[0][0].compile())
+        assert "ON CONFLICT (user_id, reading_timestamp) DO NOTHING" in sql
@@ -7,10 +7,12 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from httpx import ASGITransport, AsyncClient
+from sqlalchemy.dialects import postgresql
 
 from src.config import settings
 from src.main import app
 from src.models.ai_provider import AIProviderType
+from src.models.pump_data import PumpEventType
 from src.schemas.ai_response import AIResponse, AIUsage
 from src.schemas.daily_brief import DailyBriefMetrics
 from src.services.daily_brief import (
@@ -19,6 +21,7 @@ from src.services.daily_brief import (
     MIN_READINGS,
     _build_analysis_prompt,
     calculate_metrics,
+    calculate_metrics_bulk,
 )
 
 
@@ -221,6 +224,76 @@ class TestCalculateMetrics:
         assert metrics.time_in_range_pct == 50.0  # 70, 180 in range
 
 
+class TestCalculateMetricsBulk:
+    """Tests for calculate_metrics_bulk function."""
+
+    async def test_matches_per_user_metrics(self):
+        """Grouped rows produce the same metrics as calculate_metrics."""
+        user_a, user_b = uuid.uuid4(), uuid.uuid4()
+        now = datetime.now(UTC)
+        start = now - timedelta(hours=24)
+
+        # (user, count, in range, low, high, value sum)
+        glucose_result = MagicMock()
+        glucose_result.all.return_value = [(user_a, 5, 5, 0, 0, 600)]
+        # (user, type, automated, events, events with units, unit sum)
+        dose_result = MagicMock()
+        dose_result.all.return_value = [
+            (user_a, PumpEventType.BOLUS, False, 2, 2, 10.0),
+            (user_a, PumpEventType.CORRECTION, False, 1, 1, 5.0),
+            (user_a, PumpEventType.CORRECTION, True, 2, 1, 2.5),
+        ]
+        seed_result = MagicMock()
+        seed_result.all.return_value = [(user_a, start - timedelta(minutes=30), 1.0)]
+        basal_result = MagicMock()
+        basal_result.all.return_value = [(user_a, start + timedelta(hours=1), 2.0)]
+
+        mock_db = AsyncMock()
+        mock_db.execute.side_effect = [
+            glucose_result,
+            dose_result,
+            seed_result,
+            basal_result,
+        ]
+
+        metrics = await calculate_metrics_bulk([user_a, user_b], mock_db, start, now)
+
+        assert mock_db.execute.await_count == 4
+        a = metrics[user_a]
+        assert a.readings_count == 5
+        assert a.time_in_range_pct == 100.0
+        assert a.average_glucose == 120.0
+        assert a.correction_count == 2
+        assert a.insulin_breakdown is not None
+        assert a.insulin_breakdown.bolus_units == 10.0
+        assert a.insulin_breakdown.bolus_count == 2
+        assert a.insulin_breakdown.correction_units == 5.0
+        assert a.insulin_breakdown.auto_correction_units == 2.5
+        assert a.insulin_breakdown.auto_correction_count == 1
+        # 1h at 1.0 u/hr from the seed, then 1h-capped segments at 2.0 u/hr
+        assert a.insulin_breakdown.basal_units == 3.0
+        assert metrics[user_b].readings_count == 0
+        assert metrics[user_b].total_insulin is None
+
+        # Seed basal is one LIMIT 1 per user, not a scan of all history
+        seed_sql = str(
+            mock_db.execute.await_args_list[2]
+            .args[0]
+            .compile(dialect=postgresql.dialect())
+        )
+        assert "unnest" in seed_sql
+        assert "LATERAL" in seed_sql
+        assert "LIMIT" in seed_sql
+        assert "DISTINCT ON" not in seed_sql
+
+    async def test_no_users_skips_queries(self):
+        mock_db = AsyncMock()
+        now = datetime.now(UTC)
+
+        assert await calculate_metrics_bulk([], mock_db, now, now) == {}
+        mock_db.execute.assert_not_awaited()
+
+
 class TestBuildAnalysisPrompt:
     """Tests for _build_analysis_prompt."""
 
@@ -1,6 +1,8 @@
 """Story 35.1: Tests for shared diabetes context builders."""
 
+import asyncio
 import uuid
+from contextlib import ExitStack
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -9,10 +11,13 @@ from src.services.diabetes_context import (
     ProfileSegment,
     PumpProfileSummary,
     _sanitize_for_prompt,
+    build_diabetes_context,
     build_pump_profile_section,
+    clear_diabetes_context_cache,
     format_iob_for_prompt,
     format_pump_profile_for_prompt,
     get_pump_profile_summary,
+    invalidate_diabetes_context,
 )
 
 # ---------------------------------------------------------------------------
@@ -284,3 +289,159 @@ class TestFormatIobForPrompt:
         assert result is not None
         assert "3.2 units" in result
         assert "2.5u" in result
+
+
+# ---------------------------------------------------------------------------
+# build_diabetes_context: concurrency and section cache
+# ---------------------------------------------------------------------------
+
+_SECTION_BUILDERS = {
+    "glucose": "build_glucose_section",
+    "iob": "build_iob_section",
+    "pump": "build_pump_section",
+    "control_iq": "build_control_iq_section",
+    "settings": "build_settings_section",
+    "pump_profile": "build_pump_profile_section",
+}
+
+
+@pytest.fixture
+def section_builders():
+    """Patch every section builder; each returns ``[<name>]``."""
+    clear_diabetes_context_cache()
+    with ExitStack() as stack:
+        mocks = {
+            name: stack.enter_context(
+                patch(
+                    f"src.services.diabetes_context.{builder}",
+                    new_callable=AsyncMock,
+                    return_value=f"[{name}]",
+                )
+            )
+            for name, builder in _SECTION_BUILDERS.items()
+        }
+        yield mocks
+    clear_diabetes_context_cache()
+
+
+class TestBuildDiabetesContextConcurrency:
+    async def test_sections_and_knowledge_run_concurrently(self, section_builders):
+        # Every builder blocks until all seven have started
+        barrier = asyncio.Barrier(len(section_builders) + 1)
+
+        def blocking(text):
+            async def build(*_args):
+                await barrier.wait()
+                return text
+
+            return build
+
+        for name, mock in section_builders.items():
+            mock.side_effect = blocking(f"[{name}]")
+
+        with patch(
+            "src.services.diabetes_context.build_knowledge_section",
+            side_effect=blocking("[knowledge]"),
+        ):
+            context = await asyncio.wait_for(
+                build_diabetes_context(AsyncMock(), uuid.uuid4(), query="why high?"),
+                timeout=5,
+            )
+
+        # Sections keep their fixed order, knowledge last
+        assert context.split("\n\n") == [
+            "[glucose]",
+            "[iob]",
+            "[pump]",
+            "[control_iq]",
+            "[settings]",
+            "[pump_profile]",
+            "[knowledge]",
+        ]
+
+    async def test_concurrent_callers_share_one_build(self, section_builders):
+        user_id = uuid.uuid4()
+
+        await asyncio.gather(
+            build_diabetes_context(AsyncMock(), user_id),
+            build_diabetes_context(AsyncMock(), user_id),
+        )
+
+        for mock in section_builders.values():
+            assert mock.await_count == 1
+
+
+class TestDiabetesContextCache:
+    async def test_repeat_build_is_served_from_cache(self, section_builders):
+        user_id = uuid.uuid4()
+
+        first = await build_diabetes_context(AsyncMock(), user_id)
+        second = await build_diabetes_context(AsyncMock(), user_id)
+
+        assert first == second
+        for mock in section_builders.values():
+            assert mock.await_count == 1
+
+    async def test_cache_is_per_user(self, section_builders):
+        await build_diabetes_context(AsyncMock(), uuid.uuid4())
+        await build_diabetes_context(AsyncMock(), uuid.uuid4())
+
+        assert section_builders["glucose"].await_count == 2
+
+    async def test_invalidation_rebuilds_named_sections(self, section_builders):
+        user_id = uuid.uuid4()
+        await build_diabetes_context(AsyncMock(), user_id)
+
+        invalidate_diabetes_context(user_id, "glucose")
+        section_builders["glucose"].return_value = "[glucose v2]"
+        context = await build_diabetes_context(AsyncMock(), user_id)
+
+        assert "[glucose v2]" in context
+        assert section_builders["glucose"].await_count == 2
+        assert section_builders["settings"].await_count == 1
+
+    async def test_invalidation_without_names_drops_all(self, section_builders):
+        user_id = uuid.uuid4()
+        await build_diabetes_context(AsyncMock(), user_id)
+
+        invalidate_diabetes_context(user_id)
+        await build_diabetes_context(AsyncMock(), user_id)
+
+        for mock in section_builders.values():
+            assert mock.await_count == 2
+
+    async def test_failed_section_is_not_cached(self, section_builders):
+        user_id = uuid.uuid4()
+        section_builders["iob"].side_effect = [RuntimeError("DB error"), "[iob]"]
+
+        first = await build_diabetes_context(AsyncMock(), user_id)
+        second = await build_diabetes_context(AsyncMock(), user_id)
+
+        assert "[iob]" not in first
+        assert "[glucose]" in first
+        assert "[iob]" in second
+
+    async def test_build_started_before_invalidation_is_not_stored(
+        self, section_builders
+    ):
+        user_id = uuid.uuid4()
+        started = asyncio.Event()
+        release = asyncio.Event()
+
+        async def slow_glucose(*_args):
+            started.set()
+            await release.wait()
+            return "[stale glucose]"
+
+        section_builders["glucose"].side_effect = slow_glucose
+        build = asyncio.create_task(build_diabetes_context(AsyncMock(), user_id))
+        await started.wait()
+        invalidate_diabetes_context(user_id, "glucose")
+        release.set()
+        await build
+
+        section_builders["glucose"].side_effect = None
+        section_builders["glucose"].return_value = "[fresh glucose]"
+        context = await build_diabetes_context(AsyncMock(), user_id)
+
+        assert "[fresh glucose]" in context
@@ -0,0 +1,182 @@
+"""Story 35.9: Tests for the embedding service."""
+
+import asyncio
+import threading
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from src.config import settings
+from src.services import embedding
+from src.services.embedding import (
+    ModelStatus,
+    clear_embedding_cache,
+    embed_documents,
+    embed_query,
+    get_embedding_stats,
+    get_model_status,
+    start_model_warmup,
+    stop_model_warmup,
+)
+
+
+class _FakeModel:
+    """Stands in for fastembed's TextEmbedding and records each batch."""
+
+    def __init__(self) -> None:
+        self.batches: list[list[str]] = []
+        self.fail = False
+
+    def embed(self, texts):
+        self.batches.append(list(texts))
+        if self.fail:
+            raise RuntimeError("model crashed")
+        for text in texts:
+            yield np.full(4, float(len(text)), dtype=np.float32)
+
+
+@pytest.fixture
+def model():
+    fake = _FakeModel()
+    clear_embedding_cache()
+    with patch.object(embedding, "_get_model", return_value=fake):
+        yield fake
+    clear_embedding_cache()
+
+
+class TestEmbedQuery:
+    """Query cache and micro-batching."""
+
+    async def test_returns_read_only_float32_array(self, model):
+        vector = await embed_query("basal rate")
+
+        assert isinstance(vector, np.ndarray)
+        assert vector.dtype == np.float32
+        assert not vector.flags.writeable
+
+    async def test_concurrent_queries_share_one_model_call(self, model):
+        vectors = await asyncio.gather(
+            embed_query("what is a bolus"),
+            embed_query("dawn phenomenon"),
+            embed_query("what is a bolus"),
+        )
+
+        assert model.batches == [["what is a bolus", "dawn phenomenon"]]
+        assert vectors[0] is vectors[2]
+        stats = get_embedding_stats()
+        assert stats["coalesced"] == 1
+        assert stats["batches"] == 1
+
+    async def test_repeat_query_served_from_cache(self, model):
+        first = await embed_query("What is   a bolus?")
+        second = await embed_query("  What is a bolus?\n")
+
+        assert len(model.batches) == 1
+        assert second is first
+        assert get_embedding_stats()["cache_hits"] == 1
+
+    async def test_full_batch_flushes_without_waiting(self, model):
+        with (
+            patch.object(settings, "embedding_max_batch_size", 2),
+            patch.object(settings, "embedding_batch_window_ms", 10_000),
+        ):
+            await asyncio.wait_for(
+                asyncio.gather(embed_query("a"), embed_query("bb")), timeout=1
+            )
+
+        assert model.batches == [["a", "bb"]]
+
+    async def test_least_recently_used_query_is_evicted(self, model):
+        with patch.object(settings, "embedding_query_cache_size", 2):
+            await embed_query("a")
+            await embed_query("b")
+            await embed_query("a")
+            await embed_query("c")
+            await embed_query("a")
+            assert len(model.batches) == 3
+            await embed_query("b")
+            assert len(model.batches) == 4
+
+    async def test_model_error_reaches_every_waiter_and_is_not_cached(self, model):
+        model.fail = True
+
+        results = await asyncio.gather(
+            embed_query("a"), embed_query("a"), return_exceptions=True
+        )
+
+        assert all(isinstance(r, RuntimeError) for r in results)
+        model.fail = False
+        await embed_query("a")
+        assert len(model.batches) == 2
+
+
+class TestEmbedDocuments:
+    """Batch embedding for ingestion."""
+
+    async def test_embeds_on_dedicated_pool_without_caching(self, model):
+        vectors = await embed_documents(["chunk one", "chunk two"])
+
+        assert [v.dtype for v in vectors] == [np.float32, np.float32]
+        assert get_embedding_stats()["cache_entries"] == 0
+
+    async def test_empty_input(self, model):
+        assert await embed_documents([]) == []
+        assert model.batches == []
+
+
+class TestModelWarmup:
+    """Background model loading and readiness."""
+
+    @pytest.fixture(autouse=True)
+    def _reset(self):
+        with (
+            patch.object(embedding, "_model", None),
+            patch.object(embedding, "_warmup_task", None),
+            patch.object(embedding, "_warmup_failed_at", None),
+        ):
+            yield
+
+    async def test_warmup_runs_in_background_until_ready(self):
+        loaded = threading.Event()
+
+        def _load():
+            loaded.wait(timeout=5)
+            embedding._model = _FakeModel()
+
+        with patch.object(embedding, "preload_model", side_effect=_load):
+            assert get_model_status() == ModelStatus.COLD
+            start_model_warmup()
+            start_model_warmup()  # Already loading: no second task
+            await asyncio.sleep(0)
+            assert get_model_status() == ModelStatus.LOADING
+
+            loaded.set()
+            await embedding._warmup_task
+
+        assert get_model_status() == ModelStatus.READY
+
+    async def test_failed_warmup_is_not_retried_immediately(self):
+        with patch.object(
+            embedding, "preload_model", side_effect=OSError("download failed")
+        ) as preload:
+            start_model_warmup()
+            await embedding._warmup_task
+            assert get_model_status() == ModelStatus.FAILED
+
+            start_model_warmup()
+            assert preload.call_count == 1
+
+    async def test_stop_cancels_pending_wait(self):
+        release = threading.Event()
+        with patch.object(
+            embedding, "preload_model", side_effect=lambda: release.wait(timeout=5)
+        ):
+            start_model_warmup()
+            task = embedding._warmup_task
+            await stop_model_warmup()
+            release.set()
+
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        assert get_model_status() == ModelStatus.COLD
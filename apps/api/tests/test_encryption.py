@@ -0,0 +1,95 @@
+"""Tests for credential encryption key caching and rotation."""
+
+from unittest.mock import patch
+
+import pytest
+from cryptography.fernet import Fernet
+
+from src.config import settings
+from src.core import encryption
+from src.core.encryption import (
+    clear_keyring_cache,
+    decrypt_credential,
+    encrypt_credential,
+    ensure_encryption_keys,
+    is_keyring_ready,
+)
+
+
+@pytest.fixture
+def keyring_settings():
+    """Restore encryption settings and the key-ring cache after each test."""
+    original_key = settings.encryption_key
+    original_previous = settings.encryption_key_previous
+    clear_keyring_cache()
+    yield settings
+    settings.encryption_key = original_key
+    settings.encryption_key_previous = original_previous
+    clear_keyring_cache()
+
+
+class TestKeyRingCache:
+    """Tests for per-process key derivation caching."""
+
+    def test_derives_pbkdf2_once(self, keyring_settings):
+        """Repeated encrypt/decrypt calls reuse the derived key."""
+        with patch.object(
+            encryption,
+            "_derive_key_pbkdf2",
+            wraps=encryption._derive_key_pbkdf2,
+        ) as derive:
+            for _ in range(3):
+                assert decrypt_credential(encrypt_credential("secret")) == "secret"
+
+        assert derive.call_count == 1
+
+    def test_key_change_rebuilds_keyring(self, keyring_settings):
+        """Changing ENCRYPTION_KEY derives a new key ring."""
+        keyring_settings.encryption_key = "a" * 32
+        encrypt_credential("secret")
+        assert is_keyring_ready()
+
+        keyring_settings.encryption_key = "c" * 32
+        assert not is_keyring_ready()
+        encrypted = encrypt_credential("secret")
+        assert decrypt_credential(encrypted) == "secret"
+
+    async def test_ensure_encryption_keys_warms_cache(self, keyring_settings):
+        """ensure_encryption_keys derives keys so later calls are cache hits."""
+        assert not is_keyring_ready()
+        await ensure_encryption_keys()
+        assert is_keyring_ready()
+
+        with patch.object(encryption, "_build_keyring") as build:
+            await ensure_encryption_keys()
+            encrypt_credential("secret")
+        build.assert_not_called()
+
+
+class TestKeyRotation:
+    """Tests for decrypting with retired keys."""
+
+    def test_previous_key_still_decrypts(self, keyring_settings):
+        """Credentials encrypted with a retired key remain readable."""
+        keyring_settings.encryption_key = "old" * 11
+        encrypted = encrypt_credential("secret")
+
+        keyring_settings.encryption_key = "new" * 11
+        keyring_settings.encryption_key_previous = ["old" * 11]
+        assert decrypt_credential(encrypted) == "secret"
+
+    def test_rotated_out_key_fails(self, keyring_settings):
+        """Without the retired key configured, decryption fails."""
+        keyring_settings.encryption_key = "old" * 11
+        encrypted = encrypt_credential("secret")
+
+        keyring_settings.encryption_key = "new" * 11
+        with pytest.raises(ValueError):
+            decrypt_credential(encrypted)
+
+    def test_legacy_sha256_fallback(self, keyring_settings):
+        """Credentials encrypted with the pre-PBKDF2 derivation still decrypt."""
+        legacy = Fernet(encryption._derive_key_legacy(encryption._get_raw_key()))
+        encrypted = legacy.encrypt(b"secret").decode("utf-8")
+
+        assert decrypt_credential(encrypted) == "secret"
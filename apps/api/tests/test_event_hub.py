@@ -0,0 +1,324 @@
+"""Tests for the SSE event hub and push-based stream delivery."""
+
+import asyncio
+import uuid
+from datetime import UTC, datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from src.routers.glucose_stream import generate_glucose_stream
+from src.services.event_hub import (
+    ALERT_CHANNEL,
+    GLUCOSE_CHANNEL,
+    EventHub,
+    HubEvent,
+    event_hub,
+)
+from src.services.stream_events import refresh_glucose_payload
+
+
+def _alert_payload(alert_id: str) -> dict:
+    now = datetime.now(UTC)
+    return {
+        "id": alert_id,
+        "alert_type": "low_urgent",
+        "severity": "emergency",
+        "current_value": 50.0,
+        "predicted_value": None,
+        "prediction_minutes": None,
+        "iob_value": 2.5,
+        "message": "Urgent low glucose: 50 mg/dL",
+        "trend_rate": -3.0,
+        "source": "threshold",
+        "acknowledged": False,
+        "created_at": now.isoformat(),
+        "expires_at": (now + timedelta(minutes=30)).isoformat(),
+    }
+
+
+class TestEventHub:
+    """Tests for in-memory publish/subscribe."""
+
+    async def test_delivers_to_matching_subscribers(self):
+        """Events reach subscribers of the same (channel, user) only."""
+        hub = EventHub()
+        mine = hub.subscribe([(GLUCOSE_CHANNEL, "u1")])
+        other = hub.subscribe([(GLUCOSE_CHANNEL, "u2")])
+
+        await hub.publish(GLUCOSE_CHANNEL, "u1", {"value": 120})
+
+        event = await mine.get(timeout=0.1)
+        assert (event.channel, event.user_id) == (GLUCOSE_CHANNEL, "u1")
+        assert event.data == {"value": 120}
+        assert await other.get(timeout=0.01) is None
+
+    async def test_close_unsubscribes(self):
+        """Closed subscriptions no longer count as listeners."""
+        hub = EventHub()
+        with hub.subscribe([(ALERT_CHANNEL, "u1")]) as sub:
+            assert hub.subscriber_count() == 1
+
+        assert hub.subscriber_count() == 0
+        await hub.publish(ALERT_CHANNEL, "u1", {"id": "a"})
+        assert sub.queue.empty()
+
+    async def test_slow_subscriber_drops_oldest(self):
+        """A full queue drops the oldest event instead of blocking publishers."""
+        hub = EventHub()
+        sub = hub.subscribe([(GLUCOSE_CHANNEL, "u1")])
+
+        for i in range(sub.queue.maxsize + 5):
+            await hub.publish(GLUCOSE_CHANNEL, "u1", {"value": i})
+
+        assert sub.dropped == 5
+        first = await sub.get(timeout=0.1)
+        assert first.data == {"value": 5}
+
+    def test_json_roundtrip(self):
+        """Events survive the Redis wire format."""
+        event = HubEvent(ALERT_CHANNEL, "u1", {"id": "a"}, id=42)
+        assert HubEvent.from_wire(f"42 {event.to_json()}".encode()) == event
+
+    async def test_event_ids_increase(self):
+        """Event IDs are strictly increasing and clock-based."""
+        hub = EventHub()
+        sub = hub.subscribe([(GLUCOSE_CHANNEL, "u1")])
+
+        for i in range(3):
+            await hub.publish(GLUCOSE_CHANNEL, "u1", {"value": i})
+
+        ids = [(await sub.get(timeout=0.1)).id for _ in range(3)]
+        assert ids == sorted(set(ids))
+        assert ids[0] > 1_000_000_000_000_000  # ms since epoch * 1000
+        assert hub.last_event_id == ids[-1]
+
+
+class TestReplay:
+    """Tests for Last-Event-ID replay buffers."""
+
+    async def test_replays_only_missed_events_in_order(self):
+        """Events after the given ID are replayed across all keys, in order."""
+        hub = EventHub()
+        keys = [(GLUCOSE_CHANNEL, "u1"), (ALERT_CHANNEL, "u1")]
+        hub.subscribe(keys).close()
+
+        await hub.publish(GLUCOSE_CHANNEL, "u1", {"value": 1})
+        seen = hub.last_event_id
+        await hub.publish(ALERT_CHANNEL, "u1", {"id": "a"})
+        await hub.publish(GLUCOSE_CHANNEL, "u1", {"value": 2})
+        await hub.publish(GLUCOSE_CHANNEL, "u2", {"value": 3})
+
+        replayed = hub.replay(keys, seen)
+
+        assert [e.data for e in replayed] == [{"id": "a"}, {"value": 2}]
+
+    async def test_closed_stream_keeps_buffering(self):
+        """A user whose stream closed still counts as listening for replay."""
+        hub = EventHub()
+        hub.subscribe([(GLUCOSE_CHANNEL, "u1")]).close()
+
+        assert hub.has_subscribers(GLUCOSE_CHANNEL, "u1")
+        assert not hub.has_subscribers(GLUCOSE_CHANNEL, "u2")
+
+    async def test_unknown_or_evicted_history_needs_snapshot(self):
+        """Replay returns None when the buffer cannot cover the gap."""
+        hub = EventHub()
+        key = (GLUCOSE_CHANNEL, "u1")
+        assert hub.replay([key], 1) is None
+
+        with patch("src.services.event_hub.settings.sse_replay_buffer_size", 2):
+            hub.subscribe([key]).close()
+            await hub.publish(GLUCOSE_CHANNEL, "u1", {"value": 1})
+            first = hub.last_event_id
+            await hub.publish(GLUCOSE_CHANNEL, "u1", {"value": 2})
+            await hub.publish(GLUCOSE_CHANNEL, "u1", {"value": 3})
+
+        # Value 1 was evicted: a client that missed it must re-snapshot
+        assert hub.replay([key], first - 1) is None
+        assert [e.data for e in hub.replay([key], first)] == [
+            {"value": 2},
+            {"value": 3},
+        ]
+
+    async def test_ids_from_before_a_restart_need_snapshot(self):
+        """A Last-Event-ID issued before the hub started can't be replayed."""
+        before_restart = EventHub()
+        await before_restart.publish(GLUCOSE_CHANNEL, "u1", {"value": 1})
+        stale_id = before_restart.last_event_id
+
+        with patch(
+            "src.services.event_hub._clock_event_id", return_value=stale_id + 1000
+        ):
+            hub = EventHub()
+        key = (GLUCOSE_CHANNEL, "u1")
+        hub.subscribe([key]).close()
+
+        assert hub.replay([key], stale_id) is None
+        assert hub.replay([key], hub.last_event_id) == []
+
+    async def test_idle_buffers_are_pruned(self):
+        """Buffers without subscribers are dropped after the replay window."""
+        hub = EventHub()
+        hub.subscribe([(GLUCOSE_CHANNEL, "u1")]).close()
+
+        with patch("src.services.event_hub.settings.sse_replay_window_minutes", 0):
+            await hub.publish(GLUCOSE_CHANNEL, "u2", {"value": 1})
+
+        assert not hub.has_subscribers(GLUCOSE_CHANNEL, "u1")
+
+
+class TestGlucoseRefresh:
+    """Tests for refreshing a cached glucose payload's age and IoB."""
+
+    def test_refresh_recomputes_minutes_ago(self):
+        reading_time = datetime.now(UTC) - timedelta(minutes=12)
+        payload = {"value": 100, "reading_timestamp": reading_time.isoformat()}
+
+        refreshed = refresh_glucose_payload(payload)
+
+        assert refreshed["minutes_ago"] == 12
+        assert refreshed["is_stale"] is True
+        assert refreshed["value"] == 100
+
+    def test_refresh_decays_iob_without_new_readings(self):
+        """IoB keeps decaying across idle refreshes, e.g. during a CGM gap."""
+        start = datetime.now(UTC)
+        payload = {
+            "value": 100,
+            "reading_timestamp": start.isoformat(),
+            "iob": {"current": 3.0, "is_stale": False},
+            "_iob_inputs": {
+                "dia_hours": 4.0,
+                "confirmed_iob": 3.0,
+                "confirmed_at": start.isoformat(),
+                "doses": [[(start - timedelta(minutes=10)).isoformat(), 1.0]],
+            },
+        }
+
+        class _Clock(datetime):
+            current = start
+
+            @classmethod
+            def now(cls, tz=None):
+                return cls.current
+
+        refreshed = []
+        with patch("src.services.stream_events.datetime", _Clock):
+            for minutes in (1, 30, 90):
+                _Clock.current = start + timedelta(minutes=minutes)
+                refreshed.append(refresh_glucose_payload(payload))
+
+        iob = [r["iob"]["current"] for r in refreshed]
+        assert iob[0] > iob[1] > iob[2] > 0
+        assert "_iob_inputs" not in refreshed[0]
+        assert payload["iob"]["current"] == 3.0  # Cached payload untouched
+
+    def test_refresh_flags_iob_stale_after_two_hours(self):
+        start = datetime.now(UTC)
+        payload = {
+            "value": 100,
+            "reading_timestamp": start.isoformat(),
+            "iob": {"current": 1.0, "is_stale": False},
+            "_iob_inputs": {
+                "dia_hours": 4.0,
+                "confirmed_iob": 1.0,
+                "confirmed_at": (start - timedelta(minutes=121)).isoformat(),
+                "doses": [],
+            },
+        }
+
+        assert refresh_glucose_payload(payload)["iob"]["is_stale"] is True
+
+
+class TestGlucoseStreamPush:
+    """Tests for hub-driven delivery on the glucose SSE stream."""
+
+    @patch("src.routers.glucose_stream.HEARTBEAT_INTERVAL_SECONDS", 0.05)
+    @patch("src.routers.glucose_stream.get_active_alerts", new_callable=AsyncMock)
+    @patch(
+        "src.routers.glucose_stream.build_glucose_payload",
+        new_callable=AsyncMock,
+        return_value=None,
+    )
+    @patch("src.routers.glucose_stream.get_db_session")
+    async def test_pushes_published_events_once(
+        self, mock_db_session, mock_glucose_payload, mock_alerts
+    ):
+        """Published readings and alerts are streamed; repeat alerts are not."""
+        mock_alerts.return_value = []
+        mock_db_session.return_value.__aenter__ = AsyncMock(return_value=AsyncMock())
+        mock_db_session.return_value.__aexit__ = AsyncMock(return_value=False)
+        user_id = str(uuid.uuid4())
+
+        stop = asyncio.Event()
+        mock_request = MagicMock()
+        mock_request.is_disconnected = AsyncMock(side_effect=lambda: stop.is_set())
+
+        events: list[str] = []
+
+        async def consume():
+            async for event in generate_glucose_stream(user_id, mock_request):
+                events.append(event)
+
+        task = asyncio.create_task(consume())
+        await asyncio.sleep(0.01)
+
+        reading = {
+            "value": 140,
+            "trend": "Flat",
+            "trend_rate": 0.0,
+            "reading_timestamp": datetime.now(UTC).isoformat(),
+            "iob": None,
+        }
+        await event_hub.publish(GLUCOSE_CHANNEL, user_id, reading)
+        await event_hub.publish(ALERT_CHANNEL, user_id, _alert_payload("a1"))
+        await event_hub.publish(ALERT_CHANNEL, user_id, _alert_payload("a1"))
+        await asyncio.sleep(0.02)
+        stop.set()
+        await asyncio.wait_for(task, timeout=1)
+
+        assert sum("event: glucose" in e and '"value": 140' in e for e in events) == 1
+        assert sum("event: alert" in e for e in events) == 1
+        # DB was only queried for the initial snapshot
+        mock_glucose_payload.assert_awaited_once()
+        assert event_hub.subscriber_count() == 0
+
+    @patch("src.routers.glucose_stream.HEARTBEAT_INTERVAL_SECONDS", 0.05)
+    @patch("src.routers.glucose_stream.get_active_alerts", new_callable=AsyncMock)
+    @patch("src.routers.glucose_stream.build_glucose_payload", new_callable=AsyncMock)
+    @patch("src.routers.glucose_stream.get_db_session")
+    async def test_resume_replays_missed_events_without_db(
+        self, mock_db_session, mock_glucose_payload, mock_alerts
+    ):
+        """Reconnecting with Last-Event-ID replays from memory, not Postgres."""
+        user_id = str(uuid.uuid4())
+        event_hub.subscribe(
+            [(GLUCOSE_CHANNEL, user_id), (ALERT_CHANNEL, user_id)]
+        ).close()
+        reading = {
+            "value": 150,
+            "reading_timestamp": datetime.now(UTC).isoformat(),
+        }
+        await event_hub.publish(GLUCOSE_CHANNEL, user_id, reading)
+        seen = event_hub.last_event_id
+        # Published while the client was disconnected
+        await event_hub.publish(ALERT_CHANNEL, user_id, _alert_payload("a2"))
+        await event_hub.publish(GLUCOSE_CHANNEL, user_id, {**reading, "value": 160})
+        latest = event_hub.last_event_id
+
+        mock_request = MagicMock()
+        mock_request.is_disconnected = AsyncMock(return_value=True)
+
+        events = [
+            e
+            async for e in generate_glucose_stream(
+                user_id, mock_request, last_event_id=seen
+            )
+        ]
+
+        assert len(events) == 2
+        assert "event: alert" in events[0]
+        assert '"value": 160' in events[1]
+        assert f"id: {latest}" in events[1]
+        mock_glucose_payload.assert_not_awaited()
+        mock_alerts.assert_not_awaited()
+        mock_db_session.assert_not_called()
@@ -9,7 +9,7 @@ from httpx import ASGITransport, AsyncClient
 from src.config import settings
 from src.main import app
 from src.models.glucose import TrendDirection
-from src.services.dexcom_sync import map_trend
+from src.services.dexcom_sync import DexcomSessionPool, map_trend
 
 
 def unique_email(prefix: str = "test") -> str:
@@ -17,6 +17,75 @@ def unique_email(prefix: str = "test") -> str:
     return f"{prefix}_{uuid.uuid4().hex[:8]}@example.com"
 
 
+class TestDexcomSessionPool:
+    """Tests for per-user Dexcom Share session reuse."""
+
+    @patch("src.services.dexcom_sync.Dexcom")
+    async def test_reuses_session_across_syncs(self, mock_dexcom_class):
+        """A second sync with the same credentials does not log in again."""
+        pool = DexcomSessionPool()
+        user_id = uuid.uuid4()
+
+        first = await pool.get_client(user_id, "user@example.com", "pw")
+        second = await pool.get_client(user_id, "user@example.com", "pw")
+
+        assert first is second
+        mock_dexcom_class.assert_called_once_with(
+            username="user@example.com", password="pw"
+        )
+
+    @patch("src.services.dexcom_sync.Dexcom")
+    async def test_changed_password_logs_in_again(self, mock_dexcom_class):
+        """New credentials replace the cached session."""
+        mock_dexcom_class.side_effect = [MagicMock(), MagicMock()]
+        pool = DexcomSessionPool()
+        user_id = uuid.uuid4()
+
+        first = await pool.get_client(user_id, "user@example.com", "old")
+        second = await pool.get_client(user_id, "user@example.com", "new")
+
+        assert first is not second
+        assert mock_dexcom_class.call_count == 2
+
+    @patch("src.services.dexcom_sync.Dexcom")
+    async def test_invalidate_forces_login(self, mock_dexcom_class):
+        """Invalidated sessions are rebuilt on next use."""
+        pool = DexcomSessionPool()
+        user_id = uuid.uuid4()
+
+        await pool.get_client(user_id, "user@example.com", "pw")
+        pool.invalidate(user_id)
+        await pool.get_client(user_id, "user@example.com", "pw")
+
+        assert mock_dexcom_class.call_count == 2
+
+    @patch("src.services.dexcom_sync.Dexcom")
+    async def test_idle_sessions_evicted(self, mock_dexcom_class):
+        """Sessions unused past the idle window are dropped."""
+        pool = DexcomSessionPool()
+        user_id = uuid.uuid4()
+        await pool.get_client(user_id, "user@example.com", "pw")
+
+        with patch.object(settings, "dexcom_session_idle_minutes", 0):
+            pool._evict_idle(float("inf"))
+
+        assert len(pool) == 0
+
+    @patch("src.services.dexcom_sync.Dexcom")
+    async def test_login_runs_off_event_loop(self, mock_dexcom_class):
+        """The blocking login runs in the dedicated Dexcom thread pool."""
+        import threading
+
+        thread_names = []
+        mock_dexcom_class.side_effect = lambda **_: thread_names.append(
+            threading.current_thread().name
+        )
+
+        await DexcomSessionPool().get_client(uuid.uuid4(), "u", "p")
+
+        assert thread_names[0].startswith("dexcom")
+
+
 class TestTrendMapping:
     """Tests for pydexcom trend value mapping."""
 
@@ -0,0 +1,277 @@
+"""Tests for glucose rollups and the rollup-backed analytics reader.
+
+Pure tests cover window planning and the histogram math; the database
+tests check that the ``glucose_readings`` triggers keep rollups exact and
+that summaries match what a raw scan would return.
+"""
+
+import math
+import uuid
+import zoneinfo
+from datetime import UTC, datetime, timedelta
+
+import numpy as np
+import pytest
+from hypothesis import given
+from hypothesis import strategies as st
+from sqlalchemy import delete, select
+
+from src.core.security import hash_password
+from src.models.glucose import GlucoseReading, TrendDirection
+from src.models.glucose_rollup import (
+    ROLLUP_PERIOD_DAY,
+    ROLLUP_PERIOD_HOUR,
+    GlucoseRollup,
+)
+from src.models.user import User, UserRole
+from src.services.glucose_rollups import (
+    GlucoseSummary,
+    plan_window,
+    summarize_glucose,
+    summarize_glucose_by_local_hour,
+    whole_hour_offsets,
+)
+
+values = st.lists(st.integers(min_value=20, max_value=500), min_size=1, max_size=300)
+
+
+def _reference_percentile(data: list[int], pct: float) -> float:
+    """Raw-reading percentile, as the AGP endpoint computed it before rollups."""
+    if not data:
+        return 0.0
+    sorted_data = sorted(float(v) for v in data)
+    k = (len(sorted_data) - 1) * (pct / 100)
+    f = math.floor(k)
+    c = math.ceil(k)
+    if f == c:
+        return round(sorted_data[int(k)], 1)
+    return round(sorted_data[f] * (c - k) + sorted_data[c] * (k - f), 1)
+
+
+class TestPlanWindow:
+    """Windows split into whole days, whole hours and raw edges."""
+
+    def test_short_window_is_all_raw(self):
+        start = datetime(2026, 3, 1, 10, 5, tzinfo=UTC)
+        end = datetime(2026, 3, 1, 10, 55, tzinfo=UTC)
+
+        plan = plan_window(start, end)
+
+        assert plan.days == []
+        assert plan.hours == []
+        assert plan.raw == [(start, end)]
+
+    def test_multi_day_window(self):
+        start = datetime(2026, 3, 1, 10, 5, tzinfo=UTC)
+        end = datetime(2026, 3, 15, 10, 55, tzinfo=UTC)
+
+        plan = plan_window(start, end)
+
+        assert plan.days == [
+            (datetime(2026, 3, 2, tzinfo=UTC), datetime(2026, 3, 15, tzinfo=UTC))
+        ]
+        assert plan.hours == [
+            (datetime(2026, 3, 1, 11, tzinfo=UTC), datetime(2026, 3, 2, tzinfo=UTC)),
+            (datetime(2026, 3, 15, tzinfo=UTC), datetime(2026, 3, 15, 10, tzinfo=UTC)),
+        ]
+        assert plan.raw == [
+            (start, datetime(2026, 3, 1, 11, tzinfo=UTC)),
+            (datetime(2026, 3, 15, 10, tzinfo=UTC), end),
+        ]
+
+    def test_aligned_window_needs_no_raw_rows(self):
+        start = datetime(2026, 3, 1, tzinfo=UTC)
+        end = datetime(2026, 3, 8, tzinfo=UTC)
+
+        plan = plan_window(start, end)
+
+        assert plan.days == [(start, end)]
+        assert plan.hours == []
+        assert plan.raw == []
+
+    def test_open_ended_window_reads_tail_raw(self):
+        start = datetime(2026, 3, 1, 22, 30, tzinfo=UTC)
+        now = datetime(2026, 3, 2, 1, 20, tzinfo=UTC)
+
+        plan = plan_window(start, None, now=now)
+
+        assert plan.hours == [
+            (datetime(2026, 3, 1, 23, tzinfo=UTC), datetime(2026, 3, 2, 1, tzinfo=UTC))
+        ]
+        assert plan.raw[-1] == (datetime(2026, 3, 2, 1, tzinfo=UTC), None)
+
+    def test_hours_only(self):
+        start = datetime(2026, 3, 1, 10, 5, tzinfo=UTC)
+        end = datetime(2026, 3, 4, 10, 55, tzinfo=UTC)
+
+        plan = plan_window(start, end, use_days=False)
+
+        assert plan.days == []
+        assert plan.hours == [
+            (datetime(2026, 3, 1, 11, tzinfo=UTC), datetime(2026, 3, 4, 10, tzinfo=UTC))
+        ]
+
+
+class TestGlucoseSummary:
+    """Histogram summaries must match statistics over the raw values."""
+
+    @given(data=values, pct=st.sampled_from([10, 25, 50, 75, 90]))
+    def test_percentile_matches_raw(self, data, pct):
+        summary = GlucoseSummary.from_histogram({v: data.count(v) for v in set(data)})
+
+        assert summary.percentile(pct) == _reference_percentile(data, pct)
+
+    @given(data=values)
+    def test_mean_and_sd_match_raw(self, data):
+        summary = GlucoseSummary.from_histogram({v: data.count(v) for v in set(data)})
+
+        assert summary.count == len(data)
+        assert summary.mean == pytest.approx(np.mean(data))
+        assert summary.std_dev == pytest.approx(np.std(data), abs=1e-9)
+
+    def test_count_where(self):
+        summary = GlucoseSummary.from_histogram({54: 2, 70: 3, 180: 4, 181: 1})
+
+        assert summary.count_where(lambda v: v < 70) == 2
+        assert summary.count_where(lambda v: 70 <= v <= 180) == 7
+        assert summary.count_where(lambda v: v > 180) == 1
+
+    def test_empty(self):
+        summary = GlucoseSummary()
+
+        assert summary.mean == 0.0
+        assert summary.std_dev == 0.0
+        assert summary.percentile(50) == 0.0
+
+
+class TestWholeHourOffsets:
+    """Hourly rollups only map onto local hours for whole-hour offsets."""
+
+    def test_dst_zone(self):
+        tz = zoneinfo.ZoneInfo("America/Chicago")
+        start = datetime(2026, 1, 1, tzinfo=UTC)
+        assert whole_hour_offsets(tz, start, start + timedelta(days=90))
+
+    def test_fractional_zone(self):
+        tz = zoneinfo.ZoneInfo("Asia/Kolkata")
+        start = datetime(2026, 1, 1, tzinfo=UTC)
+        assert not whole_hour_offsets(tz, start, start + timedelta(days=7))
+
+
+async def _create_user(db) -> User:
+    user = User(
+        email=f"rollup_{uuid.uuid4().hex[:8]}@example.com",
+        hashed_password=hash_password("SecurePass123"),
+        role=UserRole.DIABETIC,
+    )
+    db.add(user)
+    await db.commit()
+    return user
+
+
+def _reading(user_id: uuid.UUID, ts: datetime, value: int) -> GlucoseReading:
+    return GlucoseReading(
+        user_id=user_id,
+        value=value,
+        reading_timestamp=ts,
+        trend=TrendDirection.FLAT,
+        trend_rate=0.0,
+        received_at=ts,
+        source="test",
+    )
+
+
+class TestRollupMaintenance:
+    """Triggers on glucose_readings keep rollups in step with the raw rows."""
+
+    async def test_insert_and_delete_update_rollups(self, db_session):
+        user = await _create_user(db_session)
+        hour = datetime(2026, 3, 1, 8, tzinfo=UTC)
+        db_session.add_all(
+            [
+                _reading(user.id, hour + timedelta(minutes=5), 100),
+                _reading(user.id, hour + timedelta(minutes=10), 100),
+                _reading(user.id, hour + timedelta(minutes=15), 150),
+                # Implausible values are never counted
+                _reading(user.id, hour + timedelta(minutes=20), 10),
+            ]
+        )
+        await db_session.commit()
+
+        rollups = {
+            r.period: r
+            for r in await db_session.scalars(
+                select(GlucoseRollup).where(GlucoseRollup.user_id == user.id)
+            )
+        }
+        assert set(rollups) == {ROLLUP_PERIOD_HOUR, ROLLUP_PERIOD_DAY}
+        hourly = rollups[ROLLUP_PERIOD_HOUR]
+        assert hourly.bucket_start == hour
+        assert hourly.reading_count == 3
+        assert hourly.value_sum == 350
+        assert hourly.value_sq_sum == 100 * 100 * 2 + 150 * 150
+        assert hourly.histogram == {"100": 2, "150": 1}
+        assert rollups[ROLLUP_PERIOD_DAY].bucket_start == datetime(
+            2026, 3, 1, tzinfo=UTC
+        )
+
+        await db_session.execute(
+            delete(GlucoseReading).where(
+                GlucoseReading.user_id == user.id, GlucoseReading.value == 100
+            )
+        )
+        await db_session.commit()
+        await db_session.refresh(hourly)
+        assert hourly.reading_count == 1
+        assert hourly.histogram == {"150": 1}
+
+        await db_session.execute(
+            delete(GlucoseReading).where(GlucoseReading.user_id == user.id)
+        )
+        await db_session.commit()
+        remaining = await db_session.scalars(
+            select(GlucoseRollup).where(GlucoseRollup.user_id == user.id)
+        )
+        assert remaining.all() == []
+
+    async def test_summaries_match_raw_readings(self, db_session):
+        user = await _create_user(db_session)
+        start = datetime(2026, 2, 1, 3, 17, tzinfo=UTC)
+        readings = [
+            (start + timedelta(minutes=5 * i), 60 + (i * 37) % 250)
+            for i in range(288 * 9)
+        ]
+        db_session.add_all(_reading(user.id, ts, v) for ts, v in readings)
+        await db_session.commit()
+
+        window_start = start + timedelta(hours=5, minutes=2)
+        window_end = start + timedelta(days=8, minutes=41)
+        raw = [v for ts, v in readings if window_start <= ts < window_end]
+
+        summary = await summarize_glucose(db_session, user.id, window_start, window_end)
+        totals = await summarize_glucose(
+            db_session, user.id, window_start, window_end, with_histogram=False
+        )
+
+        assert summary.count == totals.count == len(raw)
+        assert totals.mean == pytest.approx(np.mean(raw))
+        assert totals.std_dev == pytest.approx(np.std(raw))
+        assert summary.percentile(50) == _reference_percentile(raw, 50)
+        assert summary.count_where(lambda v: v < 70) == sum(v < 70 for v in raw)
+
+        tz = zoneinfo.ZoneInfo("America/Chicago")
+        by_hour = await summarize_glucose_by_local_hour(
+            db_session, user.id, window_start, window_end, tz
+        )
+        assert by_hour is not None
+        for local_hour in (0, 7, 23):
+            expected = [
+                v
+                for ts, v in readings
+                if window_start <= ts < window_end
+                and ts.astimezone(tz).hour == local_hour
+            ]
+            assert by_hour[local_hour].count == len(expected)
+            assert by_hour[local_hour].percentile(90) == _reference_percentile(
+                expected, 90
+            )
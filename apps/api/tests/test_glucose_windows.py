@@ -0,0 +1,132 @@
+"""Tests for the windowed glucose analytics kernel.
+
+Property-based tests check the vectorized window statistics against a
+brute-force scan of the readings, which is how the correction and meal
+analyses used to find each bolus's post-event readings.
+"""
+
+from datetime import UTC, datetime, timedelta
+
+import numpy as np
+import pytest
+from hypothesis import given, settings
+from hypothesis import strategies as st
+
+from src.services.glucose_windows import (
+    ReadingSeries,
+    analyze_event_windows,
+    to_epoch_us,
+)
+
+START = datetime(2026, 3, 1, tzinfo=UTC)
+WINDOW = timedelta(hours=2)
+
+# Reading/event offsets in minutes from START; readings land on whole
+# minutes so events can coincide exactly with readings
+minutes = st.integers(min_value=0, max_value=12 * 60)
+readings = st.lists(
+    st.tuples(minutes, st.integers(min_value=40, max_value=400)),
+    max_size=120,
+    unique_by=lambda r: r[0],
+)
+events = st.lists(
+    st.tuples(
+        minutes,
+        st.integers(min_value=150, max_value=300),
+        st.floats(min_value=0.5, max_value=10.0, allow_nan=False),
+    ),
+    max_size=20,
+)
+
+
+def _brute_force(rows, event_time, include_start):
+    end = event_time + WINDOW
+    return [
+        (ts, value)
+        for ts, value in rows
+        if (event_time <= ts if include_start else event_time < ts) and ts <= end
+    ]
+
+
+class TestReadingSeries:
+    """Series are sorted on construction."""
+
+    def test_unsorted_rows_are_sorted(self):
+        rows = [
+            (START + timedelta(minutes=10), 120),
+            (START, 100),
+            (START + timedelta(minutes=5), 110),
+        ]
+
+        series = ReadingSeries.from_rows(rows)
+
+        assert series.values.tolist() == [100.0, 110.0, 120.0]
+        assert series.timestamps[0] == to_epoch_us(START)
+
+    def test_naive_timestamps_are_utc(self):
+        assert to_epoch_us(START.replace(tzinfo=None)) == to_epoch_us(START)
+
+
+class TestAnalyzeEventWindows:
+    """Vectorized window statistics must match a brute-force scan."""
+
+    @settings(max_examples=200, deadline=None)
+    @given(reading_list=readings, event_list=events, include_start=st.booleans())
+    def test_matches_brute_force(self, reading_list, event_list, include_start):
+        rows = [(START + timedelta(minutes=m), v) for m, v in reading_list]
+        event_times = [START + timedelta(minutes=m) for m, _, _ in event_list]
+        starting_bg = [bg for _, bg, _ in event_list]
+        units = [u for _, _, u in event_list]
+
+        outcomes = analyze_event_windows(
+            ReadingSeries.from_rows(rows),
+            event_times,
+            WINDOW,
+            include_start=include_start,
+            starting_bg=starting_bg,
+            units=units,
+        )
+
+        ordered = sorted(rows)
+        for i, event_time in enumerate(event_times):
+            window = _brute_force(ordered, event_time, include_start)
+            assert outcomes.count[i] == len(window)
+            if not window:
+                assert np.isnan(outcomes.final[i])
+                assert np.isnan(outcomes.peak[i])
+                continue
+            values = [v for _, v in window]
+            peak = max(values)
+            peak_time = window[values.index(peak)][0]
+            assert outcomes.final[i] == values[-1]
+            assert outcomes.peak[i] == peak
+            assert outcomes.minutes_to_peak[i] == pytest.approx(
+                (peak_time - event_time).total_seconds() / 60
+            )
+            assert outcomes.drop[i] == starting_bg[i] - values[-1]
+            assert outcomes.isf[i] == (starting_bg[i] - values[-1]) / units[i]
+
+    def test_no_events(self):
+        series = ReadingSeries.from_rows([(START, 100)])
+
+        outcomes = analyze_event_windows(series, [], WINDOW)
+
+        assert outcomes.count.size == 0
+
+    def test_no_readings(self):
+        outcomes = analyze_event_windows(
+            ReadingSeries.from_rows([]), [START], WINDOW, starting_bg=[200]
+        )
+
+        assert outcomes.count.tolist() == [0]
+        assert np.isnan(outcomes.drop[0])
+
+    def test_missing_units_give_nan_isf(self):
+        series = ReadingSeries.from_rows([(START + timedelta(minutes=30), 150)])
+
+        outcomes = analyze_event_windows(
+            series, [START], WINDOW, starting_bg=[200], units=[None]
+        )
+
+        assert outcomes.drop[0] == 50
+        assert np.isnan(outcomes.isf[0])
@@ -11,6 +11,7 @@ import pytest
 from httpx import ASGITransport, AsyncClient
 
 from src.main import app
+from src.services.embedding import ModelStatus
 
 
 @pytest.fixture
@@ -101,6 +102,31 @@ class TestReadinessProbe:
             data = response.json()
             assert data["status"] == "ready"
             assert data["database"] == "connected"
+            assert data["embedding_model"] in {"cold", "loading", "ready", "failed"}
+
+    @pytest.mark.asyncio
+    async def test_ready_while_embedding_model_loads(self, client):
+        """
+        The embedding model warms up in the background; it's reported but
+        doesn't hold back readiness.
+        """
+        with (
+            patch(
+                "src.routers.health.check_database_connection",
+                new_callable=AsyncMock,
+                return_value=True,
+            ),
+            patch(
+                "src.routers.health.get_model_status",
+                return_value=ModelStatus.LOADING,
+            ),
+        ):
+            response = await client.get("/health/ready")
+
+            assert response.status_code == 200
+            data = response.json()
+            assert data["status"] == "ready"
+            assert data["embedding_model"] == "loading"
 
     @pytest.mark.asyncio
     async def test_returns_not_ready_when_db_disconnected(self, client):
@@ -0,0 +1,129 @@
+"""Tests for the shared outbound HTTP client registry."""
+
+import asyncio
+
+import httpx
+import pytest
+
+from src.services import http_clients
+from src.services.http_clients import (
+    SIDECAR,
+    TELEGRAM,
+    UpstreamConfig,
+    build_http_client,
+    close_http_clients,
+    get_http_client,
+    get_http_client_stats,
+)
+
+_CONFIG = UpstreamConfig(
+    timeout=5.0,
+    max_connections=10,
+    max_keepalive_connections=5,
+    max_concurrency_per_host=2,
+)
+
+
+class TestHostLimitedTransport:
+    """Per-host concurrency caps and request accounting."""
+
+    async def test_caps_concurrent_requests_per_host(self):
+        active = {"a.example": 0, "b.example": 0}
+        peak = {"a.example": 0, "b.example": 0}
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            host = request.url.host
+            active[host] += 1
+            peak[host] = max(peak[host], active[host])
+            await asyncio.sleep(0.01)
+            active[host] -= 1
+            return httpx.Response(200, json={"ok": True})
+
+        client, transport = build_http_client(
+            _CONFIG, transport=httpx.MockTransport(handler)
+        )
+        async with client:
+            responses = await asyncio.gather(
+                *(client.get(f"https://a.example/{i}") for i in range(6)),
+                *(client.get(f"https://b.example/{i}") for i in range(6)),
+            )
+
+        assert all(r.json() == {"ok": True} for r in responses)
+        assert peak == {"a.example": 2, "b.example": 2}
+        stats = transport._stats
+        assert stats.requests_total == 12
+        assert stats.in_flight == 0
+        assert stats.in_flight_by_host == {}
+        assert stats.peak_in_flight == 4
+
+    async def test_slot_released_when_request_fails(self):
+        def handler(request: httpx.Request) -> httpx.Response:
+            raise httpx.ConnectError("refused", request=request)
+
+        client, transport = build_http_client(
+            _CONFIG, transport=httpx.MockTransport(handler)
+        )
+        async with client:
+            for _ in range(3):
+                with pytest.raises(httpx.ConnectError):
+                    await client.get("https://a.example/")
+
+        assert transport._stats.errors_total == 3
+        assert transport._stats.in_flight == 0
+
+    async def test_streamed_response_holds_slot_until_closed(self):
+        client, transport = build_http_client(
+            _CONFIG,
+            transport=httpx.MockTransport(lambda request: httpx.Response(200)),
+        )
+        async with client:
+            async with client.stream("GET", "https://a.example/") as response:
+                assert transport._stats.in_flight_by_host == {"a.example": 1}
+                await response.aread()
+            assert transport._stats.in_flight == 0
+
+
+class TestCookies:
+    """Shared clients must not carry cookies between users."""
+
+    async def test_response_cookies_are_not_sent_on_later_requests(self):
+        seen: list[str | None] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen.append(request.headers.get("cookie"))
+            return httpx.Response(200, headers={"set-cookie": "session=user-a; Path=/"})
+
+        client, _ = build_http_client(_CONFIG, transport=httpx.MockTransport(handler))
+        async with client:
+            await client.get("https://a.example/login")
+            await client.get("https://a.example/data")
+
+        assert seen == [None, None]
+        assert len(client.cookies) == 0
+
+
+class TestRegistry:
+    """One shared client per upstream."""
+
+    async def test_returns_same_client_per_upstream(self):
+        try:
+            telegram = get_http_client(TELEGRAM)
+            assert get_http_client(TELEGRAM) is telegram
+            assert get_http_client(SIDECAR) is not telegram
+            assert set(get_http_client_stats()) >= {TELEGRAM, SIDECAR}
+        finally:
+            await close_http_clients()
+
+        assert get_http_client_stats() == {}
+
+    async def test_stats_report_pool_limits(self):
+        try:
+            get_http_client(TELEGRAM)
+            stats = get_http_client_stats()[TELEGRAM]
+        finally:
+            await close_http_clients()
+
+        config = http_clients.UPSTREAMS[TELEGRAM]
+        assert stats["max_connections"] == config.max_connections
+        assert stats["requests_total"] == 0
+        assert stats["connections"] == 0
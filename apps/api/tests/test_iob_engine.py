@@ -0,0 +1,146 @@
+"""Tests for the vectorized IoB engine.
+
+Property-based tests check the engine against the scalar decay functions
+in ``iob_projection``, which remain the reference implementation.
+"""
+
+from datetime import UTC, datetime, timedelta
+
+import numpy as np
+import pytest
+from hypothesis import given, settings
+from hypothesis import strategies as st
+
+from src.services.iob_engine import (
+    CURVE_BILINEAR,
+    CURVE_PARABOLIC,
+    IoBInputs,
+    compute_iob_curve,
+    compute_iob_curves,
+    decay_table,
+)
+from src.services.iob_projection import (
+    _sum_iob_from_doses,
+    calculate_insulin_remaining,
+    calculate_iob_activity_curve,
+    project_iob,
+)
+
+START = datetime(2026, 3, 1, 12, 0, tzinfo=UTC)
+
+dias = st.sampled_from([2.0, 3.0, 3.5, 4.0, 4.5, 5.0, 6.0, 8.0]) | st.floats(
+    min_value=0.5, max_value=8.0, allow_nan=False
+)
+elapsed_hours = st.floats(min_value=-2.0, max_value=10.0, allow_nan=False)
+units = st.floats(min_value=0.05, max_value=25.0, allow_nan=False)
+# Offsets in seconds relative to START (up to 8h back, 1h ahead)
+offsets = st.integers(min_value=-8 * 3600, max_value=3600)
+doses = st.lists(st.tuples(offsets, units), max_size=20)
+
+
+def _scalar_iob(item: IoBInputs, at_time: datetime) -> float:
+    """Reference IoB, exactly as get_iob_projection computed it per point."""
+    pump_component = 0.0
+    if item.confirmed_iob is not None and item.confirmed_at is not None:
+        pump_component = project_iob(
+            item.confirmed_iob, item.confirmed_at, at_time, item.dia_hours
+        )
+    dose_component = _sum_iob_from_doses(list(item.doses), at_time, item.dia_hours)
+    return max(0.0, pump_component + dose_component)
+
+
+def _inputs(dia, confirmed, dose_list) -> IoBInputs:
+    confirmed_iob, confirmed_at = None, None
+    if confirmed is not None:
+        confirmed_iob = confirmed[1]
+        confirmed_at = START + timedelta(seconds=min(0, confirmed[0]))
+    return IoBInputs(
+        dia_hours=dia,
+        confirmed_iob=confirmed_iob,
+        confirmed_at=confirmed_at,
+        doses=[(START + timedelta(seconds=s), u) for s, u in dose_list],
+    )
+
+
+class TestDecayTable:
+    """Decay tables must reproduce the scalar curve functions."""
+
+    @given(dia=dias, elapsed=elapsed_hours)
+    def test_parabolic_matches_scalar(self, dia, elapsed):
+        expected = calculate_insulin_remaining(elapsed, dia)
+        actual = decay_table(dia, CURVE_PARABOLIC).remaining(np.array([elapsed]))[0]
+        assert actual == pytest.approx(expected, abs=1e-9)
+
+    @given(dia=dias, elapsed=elapsed_hours)
+    def test_bilinear_matches_scalar(self, dia, elapsed):
+        expected = calculate_iob_activity_curve(elapsed, dia)
+        actual = decay_table(dia, CURVE_BILINEAR).remaining(np.array([elapsed]))[0]
+        assert actual == pytest.approx(expected, abs=1e-9)
+
+    def test_tables_are_cached(self):
+        assert decay_table(4.0, CURVE_PARABOLIC) is decay_table(4.0, CURVE_PARABOLIC)
+        assert decay_table(4.0, CURVE_PARABOLIC) is not decay_table(4.0, CURVE_BILINEAR)
+
+    def test_invalid_arguments(self):
+        with pytest.raises(ValueError):
+            decay_table(0.0)
+        with pytest.raises(ValueError):
+            decay_table(4.0, "exponential")
+
+
+class TestComputeIoBCurves:
+    """IoB curves must match per-point scalar dose summation."""
+
+    @settings(max_examples=200, deadline=None)
+    @given(
+        dia=dias,
+        confirmed=st.none() | st.tuples(offsets, units),
+        dose_list=doses,
+    )
+    def test_curve_matches_scalar(self, dia, confirmed, dose_list):
+        item = _inputs(dia, confirmed, dose_list)
+
+        curve = compute_iob_curve(item, START)
+
+        assert curve.times()[0] == START
+        for at_time, value in zip(curve.times(), curve.values, strict=True):
+            assert value == pytest.approx(_scalar_iob(item, at_time), abs=1e-9)
+
+    @settings(max_examples=50, deadline=None)
+    @given(
+        users=st.lists(
+            st.tuples(dias, st.none() | st.tuples(offsets, units), doses),
+            min_size=1,
+            max_size=8,
+        )
+    )
+    def test_batch_matches_individual(self, users):
+        inputs = [_inputs(*user) for user in users]
+
+        curves = compute_iob_curves(inputs, START, horizon_minutes=120)
+
+        assert len(curves) == len(inputs)
+        for item, curve in zip(inputs, curves, strict=True):
+            single = compute_iob_curve(item, START, horizon_minutes=120)
+            np.testing.assert_allclose(curve.values, single.values, atol=1e-12)
+
+    def test_curve_decays_to_zero_by_dia(self):
+        """The default horizon runs until all insulin has decayed."""
+        item = IoBInputs(dia_hours=4.0, doses=[(START, 5.0)])
+
+        curve = compute_iob_curve(item, START)
+
+        assert curve.horizon_minutes == 240
+        assert curve.at_offset(0) == pytest.approx(5.0)
+        assert curve.at_offset(60) == pytest.approx(5.0 * 0.9375)
+        assert curve.at_offset(240) == 0.0
+
+    def test_off_grid_offset_rejected(self):
+        curve = compute_iob_curve(IoBInputs(), START, horizon_minutes=60)
+        with pytest.raises(ValueError):
+            curve.at_offset(7)
+        with pytest.raises(ValueError):
+            curve.at_offset(65)
+
+    def test_empty_batch(self):
+        assert compute_iob_curves([], START) == []
@@ -0,0 +1,140 @@
+"""Tests for the scheduler's bounded per-user fan-out executor."""
+
+import asyncio
+import time
+
+from src.services.job_fanout import (
+    RateBudget,
+    get_fanout_stats,
+    get_rate_budget,
+    run_fanout,
+)
+
+
+class TestRunFanout:
+    """Tests for run_fanout concurrency, isolation and metrics."""
+
+    async def test_processes_all_items(self):
+        """Every item's result is returned."""
+
+        async def worker(n: int) -> int:
+            return n * 2
+
+        outcome = await run_fanout(
+            "test_all", list(range(10)), worker, concurrency=3, timeout_seconds=1
+        )
+
+        assert sorted(outcome.results) == [n * 2 for n in range(10)]
+        assert outcome.stats.succeeded == 10
+        assert outcome.stats.failed == 0
+
+    async def test_respects_concurrency_cap(self):
+        """No more than `concurrency` workers run at the same time."""
+        active = 0
+        peak = 0
+
+        async def worker(_: int) -> None:
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+
+        await run_fanout(
+            "test_cap", list(range(20)), worker, concurrency=4, timeout_seconds=1
+        )
+
+        assert peak == 4
+
+    async def test_runs_concurrently(self):
+        """A cycle takes roughly items / concurrency worker durations."""
+
+        async def worker(_: int) -> None:
+            await asyncio.sleep(0.05)
+
+        start = time.perf_counter()
+        await run_fanout(
+            "test_speed", list(range(10)), worker, concurrency=10, timeout_seconds=1
+        )
+
+        assert time.perf_counter() - start < 0.3
+
+    async def test_isolates_errors(self):
+        """One failing item does not prevent others from completing."""
+
+        async def worker(n: int) -> int:
+            if n == 3:
+                raise RuntimeError("boom")
+            return n
+
+        outcome = await run_fanout(
+            "test_errors", list(range(5)), worker, concurrency=2, timeout_seconds=1
+        )
+
+        assert sorted(outcome.results) == [0, 1, 2, 4]
+        assert outcome.stats.failed == 1
+
+    async def test_per_item_timeout(self):
+        """Slow items are cancelled and counted as timed out."""
+
+        async def worker(n: int) -> int:
+            if n == 0:
+                await asyncio.sleep(5)
+            return n
+
+        outcome = await run_fanout(
+            "test_timeout", [0, 1, 2], worker, concurrency=3, timeout_seconds=0.05
+        )
+
+        assert sorted(outcome.results) == [1, 2]
+        assert outcome.stats.timed_out == 1
+
+    async def test_records_stats(self):
+        """Cycle metrics are exported through get_fanout_stats."""
+
+        async def worker(_: int) -> None:
+            await asyncio.sleep(0.01)
+
+        await run_fanout(
+            "test_stats", list(range(6)), worker, concurrency=2, timeout_seconds=1
+        )
+
+        stats = get_fanout_stats()["test_stats"]
+        assert stats["running"] is False
+        assert stats["users_total"] == 6
+        assert stats["queue_depth"] == 0
+        assert stats["in_flight"] == 0
+        assert stats["queue_wait_max_ms"] > 0
+        assert stats["latency_p95_ms"] >= stats["latency_p50_ms"] > 0
+        assert "latencies_ms" not in stats
+
+
+class TestRateBudget:
+    """Tests for the token-bucket rate budget."""
+
+    async def test_paces_starts(self):
+        """Starts beyond the burst are spaced at the configured rate."""
+        budget = RateBudget(rate_per_second=50, burst=1)
+
+        start = time.perf_counter()
+        for _ in range(6):
+            await budget.acquire()
+
+        # 1 immediate + 5 paced at 20ms each
+        assert time.perf_counter() - start >= 0.09
+
+    async def test_zero_rate_is_unlimited(self):
+        """A rate of 0 never waits."""
+        budget = RateBudget(rate_per_second=0)
+
+        start = time.perf_counter()
+        for _ in range(100):
+            await budget.acquire()
+
+        assert time.perf_counter() - start < 0.05
+
+    def test_shared_budget_per_upstream(self):
+        """The same upstream name returns the same budget until reconfigured."""
+        first = get_rate_budget("test_upstream", 5.0)
+        assert get_rate_budget("test_upstream", 5.0) is first
+        assert get_rate_budget("test_upstream", 2.0) is not first
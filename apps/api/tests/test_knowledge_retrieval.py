@@ -126,25 +126,161 @@ class TestFormatKnowledgeForPrompt:
 
 
 class TestRetrieveKnowledge:
+    @pytest.fixture(autouse=True)
+    def _model_ready(self):
+        with patch(
+            "src.services.knowledge_retrieval.is_model_ready", return_value=True
+        ):
+            yield
+
     @pytest.mark.asyncio
-    @patch("src.services.knowledge_retrieval.embed_text")
+    @patch("src.services.knowledge_retrieval.embed_query", new_callable=AsyncMock)
     async def test_returns_empty_on_embedding_failure(self, mock_embed):
         mock_embed.side_effect = RuntimeError("Model not loaded")
         from src.services.knowledge_retrieval import retrieve_knowledge
 
-        # asyncio.to_thread calls the function -- mock it at module level
-        with patch("src.services.knowledge_retrieval.asyncio") as mock_asyncio:
-            mock_asyncio.to_thread = AsyncMock(side_effect=RuntimeError("fail"))
-            result = await retrieve_knowledge(AsyncMock(), uuid.uuid4(), "test query")
-            assert result == []
+        result = await retrieve_knowledge(AsyncMock(), uuid.uuid4(), "test query")
+        assert result == []
 
     @pytest.mark.asyncio
     async def test_returns_empty_on_db_failure(self):
         from src.services.knowledge_retrieval import retrieve_knowledge
 
-        with patch("src.services.knowledge_retrieval.asyncio") as mock_asyncio:
-            mock_asyncio.to_thread = AsyncMock(return_value=[0.1] * 768)
+        with patch(
+            "src.services.knowledge_retrieval.embed_query",
+            new_callable=AsyncMock,
+            return_value=[0.1] * 768,
+        ):
             db = AsyncMock()
             db.execute.side_effect = Exception("DB error")
             result = await retrieve_knowledge(db, uuid.uuid4(), "test query")
             assert result == []
+
+    @pytest.mark.asyncio
+    async def test_skips_retrieval_until_model_ready(self):
+        from src.services.knowledge_retrieval import retrieve_knowledge
+
+        db = AsyncMock()
+        with (
+            patch(
+                "src.services.knowledge_retrieval.is_model_ready", return_value=False
+            ),
+            patch("src.services.knowledge_retrieval.start_model_warmup") as warm_up,
+            patch(
+                "src.services.knowledge_retrieval.embed_query", new_callable=AsyncMock
+            ) as mock_embed,
+        ):
+            result = await retrieve_knowledge(db, uuid.uuid4(), "test query")
+
+        assert result == []
+        warm_up.assert_called_once()
+        mock_embed.assert_not_awaited()
+        db.execute.assert_not_awaited()
+
+
+# ---------------------------------------------------------------------------
+# build_knowledge_query tests (quantized index modes)
+# ---------------------------------------------------------------------------
+
+
+def _compile(statement) -> str:
+    from sqlalchemy.dialects import postgresql
+
+    return str(statement.compile(dialect=postgresql.dialect()))
+
+
+class TestBuildKnowledgeQuery:
+    def test_full_mode_orders_by_exact_distance(self):
+        from src.services.knowledge_retrieval import build_knowledge_query
+
+        sql = _compile(build_knowledge_query(uuid.uuid4(), [0.1] * 768, mode="full"))
+
+        assert "<=>" in sql
+        assert "halfvec" not in sql.lower()
+        assert "binary_quantize" not in sql
+
+    def test_halfvec_mode_reranks_candidates(self):
+        from src.services.knowledge_retrieval import build_knowledge_query
+
+        sql = _compile(build_knowledge_query(uuid.uuid4(), [0.1] * 768, mode="halfvec"))
+
+        assert "HALFVEC(768)" in sql.upper()
+        # Candidate subquery plus exact re-ranking in the outer query
+        assert sql.count("<=>") >= 2
+        assert sql.count("LIMIT") == 2
+
+    def test_binary_mode_uses_hamming_distance(self):
+        from src.services.knowledge_retrieval import build_knowledge_query
+
+        sql = _compile(build_knowledge_query(uuid.uuid4(), [0.1] * 768, mode="binary"))
+
+        assert "binary_quantize" in sql
+        assert "<~>" in sql
+        assert "<=>" in sql
+
+    def test_candidate_count_scales_with_rerank_factor(self):
+        from src.services.knowledge_retrieval import _candidate_count
+
+        with patch("src.services.knowledge_retrieval.settings") as mock_settings:
+            mock_settings.knowledge_rerank_factor = 8
+            assert _candidate_count(5, "binary") == 40
+            assert _candidate_count(5, "halfvec") == 40
+            assert _candidate_count(5, "full") == 5
+
+    @pytest.mark.asyncio
+    async def test_retrieval_raises_ef_search_to_candidate_count(self):
+        from src.services.knowledge_retrieval import retrieve_knowledge
+
+        db = AsyncMock()
+        db.execute.return_value = MagicMock()
+        with (
+            patch("src.services.knowledge_retrieval.is_model_ready", return_value=True),
+            patch(
+                "src.services.knowledge_retrieval.embed_query",
+                new_callable=AsyncMock,
+                return_value=[0.1] * 768,
+            ),
+            patch("src.services.knowledge_retrieval.settings") as mock_settings,
+        ):
+            mock_settings.knowledge_vector_index = "binary"
+            mock_settings.knowledge_rerank_factor = 20
+            mock_settings.knowledge_hnsw_ef_search = 40
+            await retrieve_knowledge(db, uuid.uuid4(), "test query", top_k=5)
+
+        set_config = db.execute.await_args_list[0].args[0]
+        assert "set_config" in _compile(set_config)
+        assert "100" in set_config.compile().params.values()
+
+
+class TestCheckKnowledgeIndex:
+    @pytest.mark.asyncio
+    async def test_checks_the_configured_modes_index(self):
+        from src.services.knowledge_retrieval import check_knowledge_index
+
+        db = AsyncMock()
+        db.scalar.return_value = True
+        with patch("src.services.knowledge_retrieval.settings") as mock_settings:
+            mock_settings.knowledge_vector_index = "halfvec"
+            assert await check_knowledge_index(db) is True
+
+        assert db.scalar.await_args.args[1] == {
+            "index": "ix_knowledge_embedding_halfvec"
+        }
+
+    @pytest.mark.asyncio
+    async def test_warns_when_index_is_missing(self):
+        from src.services.knowledge_retrieval import check_knowledge_index
+
+        db = AsyncMock()
+        db.scalar.return_value = False
+        with (
+            patch("src.services.knowledge_retrieval.settings") as mock_settings,
+            patch("src.services.knowledge_retrieval.logger") as mock_logger,
+        ):
+            mock_settings.knowledge_vector_index = "binary"
+            assert await check_knowledge_index(db) is False
+
+        mock_logger.warning.assert_called_once()
+        assert mock_logger.warning.call_args.kwargs["index"] == (
+            "ix_knowledge_embedding_binary"
+        )
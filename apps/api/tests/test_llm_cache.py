@@ -0,0 +1,216 @@
+"""Tests for the content-addressed AI response cache."""
+
+import asyncio
+import uuid
+from unittest.mock import patch
+
+import pytest
+
+from src.config import settings
+from src.models.ai_provider import AIProviderType
+from src.schemas.ai_response import AIMessage, AIResponse, AIUsage
+from src.services.ai_client import BaseAIClient
+from src.services.llm_cache import (
+    clear_llm_cache,
+    generate_cached,
+    get_llm_cache_stats,
+    invalidate_llm_cache,
+    llm_cache_key,
+)
+
+
+class _CountingClient(BaseAIClient):
+    """AI client that counts provider calls."""
+
+    def __init__(self, model: str = "gpt-4o", content: str = "Stable overnight."):
+        super().__init__(
+            api_key="sk-test", model=model, provider_type=AIProviderType.OPENAI_API
+        )
+        self.calls = 0
+        self.content = content
+        self.delay = 0.0
+
+    async def generate(self, messages, system_prompt=None, max_tokens=1024):
+        self.calls += 1
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        return AIResponse(
+            content=self.content,
+            model=self.model,
+            provider=AIProviderType.OPENAI_API,
+            usage=AIUsage(input_tokens=300, output_tokens=40),
+        )
+
+
+def _prompt(text: str = "TIR 72%") -> list[AIMessage]:
+    return [AIMessage(role="user", content=text)]
+
+
+@pytest.fixture(autouse=True)
+def _clean_cache():
+    clear_llm_cache()
+    yield
+    clear_llm_cache()
+
+
+class TestCacheKey:
+    """Keys cover everything that changes the provider's answer."""
+
+    def test_same_request_same_key(self):
+        client = _CountingClient()
+        assert llm_cache_key(client, _prompt(), "sys", 1024) == llm_cache_key(
+            _CountingClient(), _prompt(), "sys", 1024
+        )
+
+    @pytest.mark.parametrize(
+        ("client", "messages", "system_prompt", "max_tokens"),
+        [
+            (_CountingClient(model="gpt-4o-mini"), _prompt(), "sys", 1024),
+            (_CountingClient(), _prompt("TIR 73%"), "sys", 1024),
+            (_CountingClient(), _prompt(), "other", 1024),
+            (_CountingClient(), _prompt(), "sys", 512),
+        ],
+    )
+    def test_any_difference_changes_key(
+        self, client, messages, system_prompt, max_tokens
+    ):
+        baseline = llm_cache_key(_CountingClient(), _prompt(), "sys", 1024)
+        assert llm_cache_key(client, messages, system_prompt, max_tokens) != baseline
+
+
+class TestGenerateCached:
+    """Hits, misses, scoping and counters."""
+
+    async def test_repeat_request_served_from_cache(self):
+        client = _CountingClient()
+        user_id = uuid.uuid4()
+
+        first = await generate_cached(client, user_id, "daily_brief", _prompt())
+        second = await generate_cached(client, user_id, "daily_brief", _prompt())
+
+        assert client.calls == 1
+        assert second.content == first.content
+        stats = get_llm_cache_stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["provider_calls_saved"] == 1
+        assert stats["input_tokens_saved"] == 300
+        assert stats["output_tokens_saved"] == 40
+        assert stats["by_kind"]["daily_brief"]["hits"] == 1
+
+    async def test_entries_are_scoped_per_user(self):
+        client = _CountingClient()
+
+        await generate_cached(client, uuid.uuid4(), "daily_brief", _prompt())
+        await generate_cached(client, uuid.uuid4(), "daily_brief", _prompt())
+
+        assert client.calls == 2
+
+    async def test_concurrent_identical_requests_share_one_call(self):
+        client = _CountingClient()
+        client.delay = 0.05
+        user_id = uuid.uuid4()
+
+        results = await asyncio.gather(
+            *(
+                generate_cached(client, user_id, "meal_analysis", _prompt())
+                for _ in range(3)
+            )
+        )
+
+        assert client.calls == 1
+        assert {r.content for r in results} == {"Stable overnight."}
+        assert get_llm_cache_stats()["shared"] == 2
+
+    async def test_expired_entry_is_regenerated(self):
+        client = _CountingClient()
+        user_id = uuid.uuid4()
+
+        with patch("src.services.llm_cache.time.monotonic", return_value=1000.0):
+            await generate_cached(client, user_id, "daily_brief", _prompt())
+        later = 1000.0 + settings.llm_cache_ttl_seconds + 1
+        with patch("src.services.llm_cache.time.monotonic", return_value=later):
+            await generate_cached(client, user_id, "daily_brief", _prompt())
+
+        assert client.calls == 2
+
+    async def test_least_recently_used_entry_is_evicted(self):
+        client = _CountingClient()
+        user_id = uuid.uuid4()
+
+        with patch.object(settings, "llm_cache_max_entries", 2):
+            await generate_cached(client, user_id, "daily_brief", _prompt("a"))
+            await generate_cached(client, user_id, "daily_brief", _prompt("b"))
+            await generate_cached(client, user_id, "daily_brief", _prompt("a"))
+            await generate_cached(client, user_id, "daily_brief", _prompt("c"))
+            assert client.calls == 3
+            await generate_cached(client, user_id, "daily_brief", _prompt("a"))
+            assert client.calls == 3
+            await generate_cached(client, user_id, "daily_brief", _prompt("b"))
+            assert client.calls == 4
+
+    async def test_empty_response_not_cached(self):
+        client = _CountingClient(content="  ")
+        user_id = uuid.uuid4()
+
+        await generate_cached(client, user_id, "daily_brief", _prompt())
+        await generate_cached(client, user_id, "daily_brief", _prompt())
+
+        assert client.calls == 2
+
+    async def test_provider_error_not_cached(self):
+        class _FailingClient(_CountingClient):
+            async def generate(self, messages, system_prompt=None, max_tokens=1024):
+                self.calls += 1
+                raise RuntimeError("provider down")
+
+        client = _FailingClient()
+        user_id = uuid.uuid4()
+
+        for _ in range(2):
+            with pytest.raises(RuntimeError):
+                await generate_cached(client, user_id, "daily_brief", _prompt())
+
+        assert client.calls == 2
+
+    async def test_backend_off_always_calls_provider(self):
+        client = _CountingClient()
+        user_id = uuid.uuid4()
+
+        with patch.object(settings, "llm_cache_backend", "off"):
+            await generate_cached(client, user_id, "daily_brief", _prompt())
+            await generate_cached(client, user_id, "daily_brief", _prompt())
+
+        assert client.calls == 2
+        assert get_llm_cache_stats()["misses"] == 0
+
+
+class TestInvalidation:
+    """Per-user invalidation."""
+
+    async def test_invalidate_drops_only_that_users_entries(self):
+        client = _CountingClient()
+        user_a, user_b = uuid.uuid4(), uuid.uuid4()
+        await generate_cached(client, user_a, "daily_brief", _prompt())
+        await generate_cached(client, user_b, "daily_brief", _prompt())
+
+        await invalidate_llm_cache(user_a)
+        await generate_cached(client, user_a, "daily_brief", _prompt())
+        await generate_cached(client, user_b, "daily_brief", _prompt())
+
+        assert client.calls == 3
+
+    async def test_call_in_flight_during_invalidation_is_not_stored(self):
+        client = _CountingClient()
+        client.delay = 0.05
+        user_id = uuid.uuid4()
+
+        pending = asyncio.create_task(
+            generate_cached(client, user_id, "daily_brief", _prompt())
+        )
+        await asyncio.sleep(0.01)
+        await invalidate_llm_cache(user_id)
+        await pending
+        await generate_cached(client, user_id, "daily_brief", _prompt())
+
+        assert client.calls == 2
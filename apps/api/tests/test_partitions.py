@@ -0,0 +1,66 @@
+"""Tests for monthly partition maintenance of glucose and pump data."""
+
+from datetime import UTC, datetime, timedelta, timezone
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.services.partitions import (
+    add_months,
+    drop_expired_partitions,
+    ensure_partitions,
+    month_start,
+    partition_month,
+    partition_name,
+)
+
+
+class TestMonthHelpers:
+    def test_month_start_uses_utc(self):
+        # 00:30 on March 1st at UTC+2 is still February in UTC
+        moment = datetime(2026, 3, 1, 0, 30, tzinfo=timezone(timedelta(hours=2)))
+        assert month_start(moment) == datetime(2026, 2, 1, tzinfo=UTC)
+
+    def test_add_months_crosses_years(self):
+        december = datetime(2025, 12, 1, tzinfo=UTC)
+        assert add_months(december, 1) == datetime(2026, 1, 1, tzinfo=UTC)
+        assert add_months(december, -12) == datetime(2024, 12, 1, tzinfo=UTC)
+        assert add_months(december, 14) == datetime(2027, 2, 1, tzinfo=UTC)
+
+    def test_partition_name_round_trips(self):
+        month = datetime(2026, 4, 1, tzinfo=UTC)
+        name = partition_name("glucose_readings", month)
+
+        assert name == "glucose_readings_p202604"
+        assert partition_month(name) == month
+
+    def test_default_partition_has_no_month(self):
+        assert partition_month("glucose_readings_default") is None
+
+
+class TestPartitionJobs:
+    @pytest.mark.asyncio
+    async def test_ensure_skips_when_another_worker_holds_the_lock(self):
+        db = AsyncMock()
+        db.scalar.return_value = False
+
+        assert await ensure_partitions(db) == []
+        db.execute.assert_not_awaited()
+        db.commit.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_drop_skips_when_another_worker_holds_the_lock(self):
+        db = AsyncMock()
+        db.scalar.return_value = False
+
+        assert await drop_expired_partitions(db) == []
+        db.execute.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_nothing_expires_without_retention_configs(self):
+        db = AsyncMock()
+        # Lock acquired, then no data_retention_configs rows
+        db.scalar.side_effect = [True, None]
+
+        assert await drop_expired_partitions(db) == []
+        db.commit.assert_awaited_once()
@@ -358,6 +358,102 @@ class TestEvaluateAlertsForUser:
         mock_db.commit.assert_awaited_once()
 
 
+class TestEvaluateAlertsForUsers:
+    """Tests for batch alert evaluation across a cohort."""
+
+    @staticmethod
+    def _thresholds(user_id):
+        thresholds = MagicMock()
+        thresholds.user_id = user_id
+        thresholds.urgent_low = 55.0
+        thresholds.low_warning = 70.0
+        thresholds.high_warning = 180.0
+        thresholds.urgent_high = 250.0
+        thresholds.iob_warning = 3.0
+        return thresholds
+
+    @pytest.mark.asyncio
+    async def test_no_fresh_readings_stops_after_one_query(self):
+        """Users without a fresh reading are skipped with a single query."""
+        from src.services.predictive_alerts import evaluate_alerts_for_users
+
+        readings_result = MagicMock()
+        readings_result.all.return_value = []
+        mock_db = AsyncMock()
+        mock_db.execute.return_value = readings_result
+
+        result = await evaluate_alerts_for_users(mock_db, [uuid.uuid4()])
+
+        assert result == {}
+        mock_db.execute.assert_awaited_once()
+        mock_db.scalars.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_cohort_alerts_inserted_in_one_statement(self):
+        """New alerts for all users go out in one insert, deduplicated."""
+        from src.services.predictive_alerts import evaluate_alerts_for_users
+
+        low_user, high_user, normal_user = uuid.uuid4(), uuid.uuid4(), uuid.uuid4()
+
+        readings_result = MagicMock()
+        readings_result.all.return_value = [
+            (low_user, 50, -1.0),
+            (high_user, 300, 0.0),
+            (normal_user, 120, 0.0),
+        ]
+        thresholds_result = MagicMock()
+        thresholds_result.scalars.return_value.all.return_value = [
+            self._thresholds(u) for u in (low_user, high_user, normal_user)
+        ]
+        # high_user already has an unacknowledged HIGH_URGENT alert
+        recent_result = MagicMock()
+        recent_result.all.return_value = [(high_user, AlertType.HIGH_URGENT)]
+
+        created = MagicMock()
+        created.user_id = low_user
+        created.alert_type = AlertType.LOW_URGENT
+        insert_result = MagicMock()
+        insert_result.all.return_value = [created]
+
+        mock_db = AsyncMock()
+        mock_db.execute.side_effect = [
+            readings_result,
+            thresholds_result,
+            recent_result,
+        ]
+        mock_db.scalars.return_value = insert_result
+
+        with (
+            patch(
+                "src.services.predictive_alerts.get_iob_projections",
+                new_callable=AsyncMock,
+                return_value={},
+            ),
+            patch(
+                "src.services.predictive_alerts.publish_new_alerts",
+                new_callable=AsyncMock,
+            ) as mock_publish,
+            patch(
+                "src.services.predictive_alerts.notify_user_of_alerts",
+                new_callable=AsyncMock,
+            ) as mock_notify,
+        ):
+            result = await evaluate_alerts_for_users(
+                mock_db, [low_user, high_user, normal_user]
+            )
+
+        mock_db.scalars.assert_awaited_once()
+        rows = mock_db.scalars.await_args.args[1]
+        assert [(r["user_id"], r["alert_type"]) for r in rows] == [
+            (low_user, AlertType.LOW_URGENT)
+        ]
+        mock_db.commit.assert_awaited_once()
+        assert result == {low_user: [created]}
+        mock_publish.assert_awaited_once_with(low_user, [created])
+        # Telegram delivery happens outside the batch (scheduler)
+        mock_notify.assert_not_awaited()
+
+
 # ── Deduplication tests ──
 
 
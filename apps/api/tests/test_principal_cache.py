@@ -0,0 +1,148 @@
+"""Tests for the authenticated principal cache."""
+
+import uuid
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from src.config import settings
+from src.core import principal_cache
+from src.core.principal_cache import (
+    cache_principal,
+    clear_principal_cache,
+    get_cached_principal,
+    get_principal_cache_stats,
+    invalidate_token,
+    invalidate_user,
+    principal_cache_generation,
+    principal_cache_key,
+)
+from src.core.token_blacklist import blacklist_token
+from src.models.user import User, UserRole
+
+
+def _user(**overrides) -> User:
+    fields = {
+        "id": uuid.uuid4(),
+        "email": "patient@example.com",
+        "hashed_password": "x",
+        "role": UserRole.DIABETIC,
+        "is_active": True,
+    }
+    fields.update(overrides)
+    return User(**fields)
+
+
+def _db() -> AsyncMock:
+    db = AsyncMock()
+    db.merge.side_effect = lambda user, load=True: user
+    return db
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache():
+    clear_principal_cache()
+    yield
+    clear_principal_cache()
+
+
+class TestPrincipalCache:
+    @pytest.mark.asyncio
+    async def test_hit_merges_snapshot_without_loading(self):
+        user = _user()
+        cache_principal("jti-1", user, principal_cache_generation())
+
+        db = _db()
+        cached = await get_cached_principal(db, "jti-1")
+
+        assert cached is not user  # A detached copy, not the request's row
+        assert cached.id == user.id
+        assert cached.role == UserRole.DIABETIC
+        db.merge.assert_awaited_once()
+        assert db.merge.await_args.kwargs == {"load": False}
+
+    @pytest.mark.asyncio
+    async def test_miss_returns_none(self):
+        assert await get_cached_principal(_db(), "unknown") is None
+
+    @pytest.mark.asyncio
+    async def test_entries_expire(self):
+        with patch.object(settings, "principal_cache_ttl_seconds", 5.0):
+            with patch("src.core.principal_cache.time.monotonic", return_value=100.0):
+                cache_principal("jti-1", _user(), principal_cache_generation())
+            with patch("src.core.principal_cache.time.monotonic", return_value=106.0):
+                assert await get_cached_principal(_db(), "jti-1") is None
+
+    @pytest.mark.asyncio
+    async def test_disabled_with_zero_ttl(self):
+        with patch.object(settings, "principal_cache_ttl_seconds", 0):
+            cache_principal("jti-1", _user(), principal_cache_generation())
+            assert await get_cached_principal(_db(), "jti-1") is None
+
+    @pytest.mark.asyncio
+    async def test_inactive_users_are_not_cached(self):
+        cache_principal("jti-1", _user(is_active=False), principal_cache_generation())
+        assert await get_cached_principal(_db(), "jti-1") is None
+
+    @pytest.mark.asyncio
+    async def test_load_racing_an_invalidation_is_not_cached(self):
+        user = _user()
+        generation = principal_cache_generation()
+        invalidate_user(user.id)  # e.g. a password change commits mid-load
+
+        cache_principal("jti-1", user, generation)
+
+        assert await get_cached_principal(_db(), "jti-1") is None
+
+    @pytest.mark.asyncio
+    async def test_invalidate_user_drops_all_their_tokens(self):
+        user, other = _user(), _user(email="other@example.com")
+        generation = principal_cache_generation()
+        cache_principal("web", user, generation)
+        cache_principal("mobile", user, generation)
+        cache_principal("other", other, generation)
+
+        invalidate_user(user.id)
+
+        db = _db()
+        assert await get_cached_principal(db, "web") is None
+        assert await get_cached_principal(db, "mobile") is None
+        assert await get_cached_principal(db, "other") is not None
+
+    @pytest.mark.asyncio
+    async def test_invalidate_token(self):
+        cache_principal("jti-1", _user(), principal_cache_generation())
+        invalidate_token("jti-1")
+        assert await get_cached_principal(_db(), "jti-1") is None
+
+    @pytest.mark.asyncio
+    async def test_blacklisting_a_token_invalidates_it(self):
+        cache_principal("jti-logout", _user(), principal_cache_generation())
+        await blacklist_token("jti-logout", 60)
+        assert await get_cached_principal(_db(), "jti-logout") is None
+
+    @pytest.mark.asyncio
+    async def test_lru_eviction(self):
+        with patch.object(settings, "principal_cache_max_entries", 2):
+            generation = principal_cache_generation()
+            for key in ("a", "b", "c"):
+                cache_principal(key, _user(), generation)
+
+            assert await get_cached_principal(_db(), "a") is None
+            assert get_principal_cache_stats()["entries"] == 2
+
+    def test_key_prefers_jti(self):
+        assert principal_cache_key("token", "jti-1") == "jti-1"
+        assert principal_cache_key("token", None) == principal_cache_key("token", None)
+        assert principal_cache_key("token", None) != "token"
+
+    def test_commit_hook_invalidates_changed_users(self):
+        user = _user()
+        cache_principal("jti-1", user, principal_cache_generation())
+        session = type("FakeSession", (), {})()
+        session.info = {principal_cache._CHANGED_USERS_KEY: {str(user.id)}}
+
+        principal_cache._invalidate_changed_rows(session)
+
+        assert "jti-1" not in principal_cache._entries
+        assert session.info == {}
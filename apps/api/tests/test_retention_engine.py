@@ -0,0 +1,118 @@
+"""Tests for the set-based, chunked retention engine."""
+
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from src.config import settings
+from src.services import retention_engine
+from src.services.retention_engine import (
+    RETENTION_TARGETS,
+    RetentionReport,
+    build_chunk_delete,
+    enforce_retention,
+)
+
+NOW = datetime(2026, 4, 1, tzinfo=UTC)
+_TARGETS = {target.name: target for target in RETENTION_TARGETS}
+
+
+def _sql(statement) -> str:
+    return str(statement.compile(dialect=postgresql.dialect()))
+
+
+def _result(rowcount: int) -> MagicMock:
+    result = MagicMock()
+    result.rowcount = rowcount
+    return result
+
+
+def _glucose_only(windows: list[int]):
+    async def fake_windows(db, target):
+        return windows if target.name == "glucose_readings" else []
+
+    return fake_windows
+
+
+class TestBuildChunkDelete:
+    def test_partitioned_table_deletes_by_composite_key(self):
+        sql = _sql(build_chunk_delete(_TARGETS["glucose_readings"], 30, NOW, 500))
+
+        assert "(glucose_readings.id, glucose_readings.reading_timestamp) IN" in sql
+        assert "data_retention_configs.glucose_retention_days" in sql
+        assert "LIMIT" in sql
+        assert "FOR UPDATE SKIP LOCKED" in sql
+
+    def test_plain_table_deletes_by_id(self):
+        sql = _sql(build_chunk_delete(_TARGETS["alerts"], 730, NOW, 500))
+
+        assert "alerts.id IN" in sql
+        assert "data_retention_configs.audit_retention_days" in sql
+
+    def test_escalation_events_are_deleted_before_alerts(self):
+        names = [target.name for target in RETENTION_TARGETS]
+        assert names.index("escalation_events") < names.index("alerts")
+
+
+class TestEnforceRetention:
+    @pytest.mark.asyncio
+    async def test_deletes_in_committed_chunks_until_a_short_chunk(self):
+        db = AsyncMock()
+        db.execute.side_effect = [_result(2), _result(2), _result(1)]
+
+        with (
+            patch.object(settings, "data_retention_batch_size", 2),
+            patch.object(settings, "data_retention_batch_pause_seconds", 0),
+            patch.object(retention_engine, "_windows", _glucose_only([30])),
+        ):
+            report = await enforce_retention(db, now=NOW)
+
+        assert report.completed
+        assert report.deleted["glucose_readings"] == 5
+        assert report.total_deleted == 5
+        assert report.remaining == {}
+        assert db.commit.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_each_window_is_pruned(self):
+        db = AsyncMock()
+        db.execute.side_effect = [_result(1), _result(0)]
+
+        with (
+            patch.object(settings, "data_retention_batch_size", 2),
+            patch.object(retention_engine, "_windows", _glucose_only([30, 365])),
+        ):
+            report = await enforce_retention(db, now=NOW)
+
+        assert report.deleted["glucose_readings"] == 1
+        assert db.execute.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_stops_at_time_budget_and_reports_backlog(self):
+        db = AsyncMock()
+        db.execute.return_value = _result(2)
+        db.scalar.return_value = 7
+
+        with (
+            patch.object(settings, "data_retention_batch_size", 2),
+            patch.object(settings, "data_retention_max_runtime_seconds", 1e-9),
+            patch.object(retention_engine, "_windows", _glucose_only([30])),
+        ):
+            report = await enforce_retention(db, now=NOW)
+
+        assert not report.completed
+        assert report.deleted == {"glucose_readings": 2}
+        assert report.remaining["glucose_readings"] == 7
+        # Later tables have no windows here, so nothing left
+        assert report.remaining["alerts"] == 0
+
+
+class TestRetentionReport:
+    def test_rows_per_second(self):
+        report = RetentionReport(deleted={"alerts": 50}, elapsed_seconds=2.0)
+        assert report.rows_per_second == 25.0
+
+    def test_rows_per_second_without_elapsed_time(self):
+        assert RetentionReport(deleted={"alerts": 5}).rows_per_second == 0.0
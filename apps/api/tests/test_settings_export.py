@@ -7,7 +7,10 @@ Tests cover:
 - Structural auth verification
 """
 
+import gzip
+import json
 import uuid
+from datetime import UTC, datetime
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
@@ -15,6 +18,7 @@ from pydantic import ValidationError
 
 from src.config import settings
 from src.schemas.settings_export import (
+    ExportFormat,
     ExportType,
     SettingsExportRequest,
     SettingsExportResponse,
@@ -66,6 +70,14 @@ class TestSettingsExportSchemas:
         with pytest.raises(ValidationError):
             SettingsExportRequest()
 
+    def test_format_defaults_to_json(self):
+        req = SettingsExportRequest(export_type=ExportType.ALL_DATA)
+        assert req.format == ExportFormat.JSON
+
+    def test_invalid_format(self):
+        with pytest.raises(ValidationError):
+            SettingsExportRequest(export_type=ExportType.ALL_DATA, format="csv")
+
     def test_response_schema(self):
         resp = SettingsExportResponse(export_data={"metadata": {}, "settings": {}})
         assert "metadata" in resp.export_data
@@ -223,6 +235,100 @@ class TestExportUserData:
         assert result["settings"]["integrations"] == []
 
 
+class TestStreamUserDataExport:
+    """Tests for the streaming NDJSON export."""
+
+    @staticmethod
+    def _mock_db(records_by_call: list[list]) -> AsyncMock:
+        db = AsyncMock()
+        mock_result = MagicMock()
+        mock_result.scalar_one_or_none.return_value = None
+        mock_result.scalars.return_value.all.return_value = []
+        db.execute.return_value = mock_result
+
+        async def rows(records):
+            for record in records:
+                yield record
+
+        db.stream_scalars = AsyncMock(
+            side_effect=[rows(records) for records in records_by_call]
+        )
+        return db
+
+    @staticmethod
+    async def _collect(chunks) -> list[bytes]:
+        return [chunk async for chunk in chunks]
+
+    @staticmethod
+    def _lines(payload: bytes) -> list[dict]:
+        return [json.loads(line) for line in payload.decode().splitlines()]
+
+    @pytest.mark.asyncio
+    async def test_settings_only_stream(self):
+        from src.services.settings_export import stream_user_data_export
+
+        db = self._mock_db([])
+
+        chunks = await self._collect(
+            stream_user_data_export(uuid.uuid4(), db, include_data=False)
+        )
+
+        lines = self._lines(b"".join(chunks))
+        assert [line["category"] for line in lines] == [
+            "metadata",
+            "settings",
+            "record_counts",
+        ]
+        assert lines[0]["record"]["export_type"] == "settings_only"
+        assert lines[1]["record"]["target_glucose_range"]["low_target"] == 70.0
+        db.stream_scalars.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_all_data_stream_is_chunked_and_counted(self):
+        from src.services.settings_export import stream_user_data_export
+
+        readings = []
+        for i in range(50):
+            reading = MagicMock()
+            reading.value = 100 + i
+            reading.reading_timestamp = datetime(2026, 3, 1, tzinfo=UTC)
+            reading.trend.value = "flat"
+            reading.trend_rate = 0.0
+            reading.source = "dexcom"
+            readings.append(reading)
+        # glucose_readings, then seven empty categories
+        db = self._mock_db([readings] + [[] for _ in range(7)])
+
+        chunks = await self._collect(
+            stream_user_data_export(
+                uuid.uuid4(), db, include_data=True, chunk_bytes=1024
+            )
+        )
+
+        assert len(chunks) > 1
+        lines = self._lines(b"".join(chunks))
+        glucose = [line for line in lines if line["category"] == "glucose_readings"]
+        assert [g["record"]["value"] for g in glucose] == list(range(100, 150))
+        counts = lines[-1]
+        assert counts["category"] == "record_counts"
+        assert counts["record"]["glucose_readings"] == 50
+        assert counts["record"]["alerts"] == 0
+        assert db.stream_scalars.await_count == 8
+
+    @pytest.mark.asyncio
+    async def test_gzip_stream_round_trips(self):
+        from src.services.settings_export import gzip_stream
+
+        async def chunks():
+            for i in range(100):
+                yield f'{{"n": {i}}}\n'.encode()
+
+        compressed = b"".join(await self._collect(gzip_stream(chunks())))
+
+        expected = "".join(f'{{"n": {i}}}\n' for i in range(100)).encode()
+        assert gzip.decompress(compressed) == expected
+
+
 # ── Endpoint tests ──
 
 
@@ -329,6 +435,28 @@ class TestExportEndpoint:
         assert "export_date" in metadata
         assert metadata["version"] == "1.0"
 
+    @pytest.mark.asyncio
+    async def test_ndjson_gzip_export_streams_download(self, client):
+        cookie = await register_and_login(client)
+        cookies = {settings.jwt_cookie_name: cookie}
+
+        response = await client.post(
+            "/api/settings/export",
+            json={"export_type": "all_data", "format": "ndjson_gzip"},
+            cookies=cookies,
+        )
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/gzip"
+        assert ".ndjson.gz" in response.headers["content-disposition"]
+        lines = [
+            json.loads(line)
+            for line in gzip.decompress(response.content).decode().splitlines()
+        ]
+        assert lines[0]["category"] == "metadata"
+        assert lines[0]["record"]["export_type"] == "all_data"
+        assert lines[-1]["category"] == "record_counts"
+        assert lines[-1]["record"]["glucose_readings"] == 0
+
 
 # ── Structural tests ──
 
@@ -44,7 +44,7 @@ class TestGetSidecarHealth:
             {"status": "ok", "claude_auth": True, "codex_auth": False}
         )
 
-        with patch("src.services.sidecar.httpx.AsyncClient") as mock_client_cls:
+        with patch("src.services.sidecar.get_http_client") as mock_client_cls:
             mock_client = AsyncMock()
             mock_client.get.return_value = mock_resp
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
@@ -59,7 +59,7 @@ class TestGetSidecarHealth:
 
     @pytest.mark.asyncio
     async def test_returns_none_on_connection_error(self):
-        with patch("src.services.sidecar.httpx.AsyncClient") as mock_client_cls:
+        with patch("src.services.sidecar.get_http_client") as mock_client_cls:
             mock_client = AsyncMock()
             mock_client.get.side_effect = httpx.ConnectError("Connection refused")
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
@@ -78,7 +78,7 @@ class TestGetSidecarAuthStatus:
             {"claude": {"authenticated": True}, "codex": {"authenticated": False}}
         )
 
-        with patch("src.services.sidecar.httpx.AsyncClient") as mock_client_cls:
+        with patch("src.services.sidecar.get_http_client") as mock_client_cls:
             mock_client = AsyncMock()
             mock_client.get.return_value = mock_resp
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
@@ -94,7 +94,7 @@ class TestGetSidecarAuthStatus:
     async def test_includes_auth_header(self):
         mock_resp = _make_response({"claude": {}, "codex": {}})
 
-        with patch("src.services.sidecar.httpx.AsyncClient") as mock_client_cls:
+        with patch("src.services.sidecar.get_http_client") as mock_client_cls:
             mock_client = AsyncMock()
             mock_client.get.return_value = mock_resp
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
@@ -119,7 +119,7 @@ class TestStartSidecarAuth:
             }
         )
 
-        with patch("src.services.sidecar.httpx.AsyncClient") as mock_client_cls:
+        with patch("src.services.sidecar.get_http_client") as mock_client_cls:
             mock_client = AsyncMock()
             mock_client.post.return_value = mock_resp
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
@@ -138,7 +138,7 @@ class TestSubmitSidecarToken:
     async def test_success(self):
         mock_resp = _make_response({"success": True, "provider": "claude"})
 
-        with patch("src.services.sidecar.httpx.AsyncClient") as mock_client_cls:
+        with patch("src.services.sidecar.get_http_client") as mock_client_cls:
             mock_client = AsyncMock()
             mock_client.post.return_value = mock_resp
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
@@ -154,7 +154,7 @@ class TestSubmitSidecarToken:
     async def test_invalid_token_returns_error(self):
         mock_resp = _make_response({"error": "Token too short"}, status_code=400)
 
-        with patch("src.services.sidecar.httpx.AsyncClient") as mock_client_cls:
+        with patch("src.services.sidecar.get_http_client") as mock_client_cls:
             mock_client = AsyncMock()
             mock_client.post.return_value = mock_resp
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
@@ -171,7 +171,7 @@ class TestSubmitSidecarToken:
     async def test_non_400_error_returns_failure(self):
         mock_resp = _make_response({"error": "Unauthorized"}, status_code=401)
 
-        with patch("src.services.sidecar.httpx.AsyncClient") as mock_client_cls:
+        with patch("src.services.sidecar.get_http_client") as mock_client_cls:
             mock_client = AsyncMock()
             mock_client.post.return_value = mock_resp
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
@@ -190,7 +190,7 @@ class TestRevokeSidecarAuth:
     async def test_success(self):
         mock_resp = _make_response({"revoked": True, "provider": "claude"})
 
-        with patch("src.services.sidecar.httpx.AsyncClient") as mock_client_cls:
+        with patch("src.services.sidecar.get_http_client") as mock_client_cls:
             mock_client = AsyncMock()
             mock_client.post.return_value = mock_resp
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
@@ -0,0 +1,60 @@
+"""Tests for the startup-time profile."""
+
+from unittest.mock import patch
+
+import pytest
+
+from src.services import startup_profile
+from src.services.startup_profile import (
+    get_startup_profile,
+    import_routers,
+    mark_ready,
+    record_background_phase,
+    startup_phase,
+)
+
+
+@pytest.fixture(autouse=True)
+def _fresh_profile():
+    with (
+        patch.object(startup_profile, "_router_imports_ms", {}),
+        patch.object(startup_profile, "_phases_ms", {}),
+        patch.object(startup_profile, "_background_ms", {}),
+        patch.object(startup_profile, "_ready_ms", None),
+        patch.object(startup_profile, "_ready_at", None),
+    ):
+        yield
+
+
+class TestStartupProfile:
+    def test_import_routers_times_each_module_in_order(self):
+        modules = import_routers("src.routers", ["health", "disclaimer"])
+
+        assert [m.__name__ for m in modules] == [
+            "src.routers.health",
+            "src.routers.disclaimer",
+        ]
+        profile = get_startup_profile()
+        assert list(profile["router_imports_ms"]) == ["health", "disclaimer"]
+        assert profile["router_imports_total_ms"] == pytest.approx(
+            sum(profile["router_imports_ms"].values()), abs=0.2
+        )
+
+    def test_phase_is_recorded_even_when_it_raises(self):
+        with pytest.raises(RuntimeError), startup_phase("scheduler"):
+            raise RuntimeError("boom")
+
+        assert "scheduler" in get_startup_profile()["phases_ms"]
+
+    def test_not_ready_until_marked(self):
+        assert get_startup_profile()["ready_at"] is None
+
+        with startup_phase("event_hub"):
+            pass
+        mark_ready()
+        record_background_phase("embedding_model_warmup", 1234.56)
+
+        profile = get_startup_profile()
+        assert profile["ready_at"] is not None
+        assert profile["ready_ms"] >= 0
+        assert profile["background_ms"] == {"embedding_model_warmup": 1234.6}
@@ -366,7 +366,7 @@ class TestBotApiCalls:
 
         with (
             patch("src.services.telegram_bot.settings") as mock_settings,
-            patch("httpx.AsyncClient") as mock_client_cls,
+            patch("src.services.telegram_bot.get_http_client") as mock_client_cls,
         ):
             mock_settings.telegram_bot_token = "fake-token"
             mock_client = AsyncMock()
@@ -399,7 +399,7 @@ class TestBotApiCalls:
 
         with (
             patch("src.services.telegram_bot.settings") as mock_settings,
-            patch("httpx.AsyncClient") as mock_client_cls,
+            patch("src.services.telegram_bot.get_http_client") as mock_client_cls,
         ):
             mock_settings.telegram_bot_token = "fake-token"
             mock_client = AsyncMock()
@@ -420,7 +420,7 @@ class TestBotApiCalls:
 
         with (
             patch("src.services.telegram_bot.settings") as mock_settings,
-            patch("httpx.AsyncClient") as mock_client_cls,
+            patch("src.services.telegram_bot.get_http_client") as mock_client_cls,
         ):
             mock_settings.telegram_bot_token = "fake-token"
             mock_client = AsyncMock()
@@ -1108,3 +1108,185 @@ class TestBuildSystemPromptSafety:
         """Empty context should not produce trailing newlines."""
         prompt = _build_system_prompt("")
         assert not prompt.endswith("\n")
+
+
+class TestWebChatStreaming:
+    """Tests for prepare_chat_web / stream_chat_web and web safety validation."""
+
+    @pytest.fixture(autouse=True)
+    def _mock_chat_dependencies(self):
+        self.store_message = AsyncMock(
+            side_effect=lambda *args, **kwargs: MagicMock(id=uuid.uuid4())
+        )
+        self.log_safety = AsyncMock()
+        self.stream_db = AsyncMock()
+        session = MagicMock()
+        session.__aenter__ = AsyncMock(return_value=self.stream_db)
+        session.__aexit__ = AsyncMock(return_value=None)
+        with (
+            patch(
+                "src.services.telegram_chat.get_or_create_conversation",
+                new_callable=AsyncMock,
+                return_value=uuid.uuid4(),
+            ),
+            patch(
+                "src.services.telegram_chat.get_recent_messages",
+                new_callable=AsyncMock,
+                return_value=[],
+            ),
+            patch("src.services.telegram_chat.store_message", self.store_message),
+            patch("src.services.telegram_chat.log_safety_validation", self.log_safety),
+            patch(
+                "src.services.telegram_chat.build_diabetes_context",
+                new_callable=AsyncMock,
+                return_value="[Glucose]\n- Current: 120 mg/dL",
+            ),
+            patch("src.services.telegram_chat.get_db_session", return_value=session),
+        ):
+            yield
+
+    def _request_db(self) -> AsyncMock:
+        result = MagicMock()
+        result.scalar_one_or_none.return_value = make_user()
+        db = AsyncMock()
+        db.execute.return_value = result
+        return db
+
+    @staticmethod
+    def _streaming_client(*items) -> MagicMock:
+        async def generate_stream(**kwargs):
+            for item in items:
+                if isinstance(item, Exception):
+                    raise item
+                yield item
+
+        client = MagicMock()
+        client.generate_stream = generate_stream
+        return client
+
+    @patch("src.services.telegram_chat.get_ai_client", new_callable=AsyncMock)
+    async def test_streams_tokens_then_result(self, mock_get_client):
+        from src.services.telegram_chat import (
+            ChatResult,
+            prepare_chat_web,
+            stream_chat_web,
+        )
+
+        mock_get_client.return_value = self._streaming_client(
+            "Your glucose ",
+            "looks stable.",
+            make_ai_response("Your glucose looks stable."),
+        )
+        db = self._request_db()
+
+        turn = await prepare_chat_web(db, uuid.uuid4(), "How am I doing?")
+        items = [item async for item in stream_chat_web(turn)]
+
+        # Short replies are held back until they pass validation
+        assert "".join(items[:-1]) == "Your glucose looks stable."
+        result = items[-1]
+        assert isinstance(result, ChatResult)
+        assert result.content == "Your glucose looks stable."
+        assert result.assistant_message_id is not None
+        # Persisted on the stream's own session, not the request's
+        assert self.store_message.await_args_list[1].args[0] is self.stream_db
+        self.stream_db.commit.assert_awaited_once()
+        db.commit.assert_not_awaited()
+        self.log_safety.assert_awaited_once()
+
+    @patch("src.services.telegram_chat.get_ai_client", new_callable=AsyncMock)
+    async def test_dangerous_reply_is_replaced_before_storing(self, mock_get_client):
+        from src.schemas.safety_validation import SafetyStatus
+        from src.services.telegram_chat import prepare_chat_web, stream_chat_web
+
+        reply = "You should double your dose tonight."
+        mock_get_client.return_value = self._streaming_client(
+            reply, make_ai_response(reply)
+        )
+
+        turn = await prepare_chat_web(self._request_db(), uuid.uuid4(), "Hi")
+        items = [item async for item in stream_chat_web(turn)]
+
+        result = items[-1]
+        assert result.safety_status == SafetyStatus.REJECTED
+        assert "blocked by the safety system" in result.content
+        stored = self.store_message.await_args_list[1].args[4]
+        assert stored == result.content
+        assert "double your dose" not in stored
+
+    @patch("src.services.telegram_chat.get_ai_client", new_callable=AsyncMock)
+    async def test_rejected_reply_never_streams_dangerous_text(self, mock_get_client):
+        from src.schemas.safety_validation import SafetyStatus
+        from src.services.telegram_chat import prepare_chat_web, stream_chat_web
+
+        deltas = [
+            "Your readings have been steady overnight and after meals. ",
+            "Since lunch spikes persist, you could ",
+            "double your",
+            " dose at lunch and see how it goes over the next week. ",
+            "Keep logging your meals.",
+        ]
+        mock_get_client.return_value = self._streaming_client(
+            *deltas, make_ai_response("".join(deltas))
+        )
+
+        turn = await prepare_chat_web(self._request_db(), uuid.uuid4(), "Hi")
+        items = [item async for item in stream_chat_web(turn)]
+
+        streamed = "".join(items[:-1])
+        assert streamed  # The safe start of the reply was streamed
+        assert "double" not in streamed
+        assert items[-1].safety_status == SafetyStatus.REJECTED
+
+    @patch("src.services.telegram_chat.get_ai_client", new_callable=AsyncMock)
+    async def test_provider_error_mid_stream_raises_502(self, mock_get_client):
+        from fastapi import HTTPException
+
+        from src.services.telegram_chat import prepare_chat_web, stream_chat_web
+
+        mock_get_client.return_value = self._streaming_client(
+            "Partial", RuntimeError("connection dropped")
+        )
+
+        turn = await prepare_chat_web(self._request_db(), uuid.uuid4(), "Hi")
+        received = []
+        with pytest.raises(HTTPException) as exc_info:
+            async for item in stream_chat_web(turn):
+                received.append(item)
+
+        assert received == []  # "Partial" was still held back
+        assert exc_info.value.status_code == 502
+        self.store_message.assert_not_awaited()
+
+    @patch("src.services.telegram_chat.get_ai_client", new_callable=AsyncMock)
+    async def test_empty_stream_raises_502(self, mock_get_client):
+        from fastapi import HTTPException
+
+        from src.services.telegram_chat import prepare_chat_web, stream_chat_web
+
+        mock_get_client.return_value = self._streaming_client(make_ai_response("  "))
+
+        turn = await prepare_chat_web(self._request_db(), uuid.uuid4(), "Hi")
+        with pytest.raises(HTTPException) as exc_info:
+            async for _ in stream_chat_web(turn):
+                pass
+
+        assert exc_info.value.status_code == 502
+
+    @patch("src.services.telegram_chat.get_ai_client", new_callable=AsyncMock)
+    async def test_non_streaming_web_chat_is_validated(self, mock_get_client):
+        from src.schemas.safety_validation import SafetyStatus
+        from src.services.telegram_chat import handle_chat_web
+
+        client = AsyncMock()
+        client.generate.return_value = make_ai_response(
+            "Consider changing your carb ratio from 1:10 to 1:5."
+        )
+        mock_get_client.return_value = client
+
+        result = await handle_chat_web(self._request_db(), uuid.uuid4(), "Hi")
+
+        assert result.safety_status == SafetyStatus.FLAGGED
+        assert "Safety Warning" in result.content
+        assert "Safety Notice" not in result.content
+        self.log_safety.assert_awaited_once()